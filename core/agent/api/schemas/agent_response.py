@@ -18,6 +18,8 @@ class CotStep(BaseModel):
     action_output: dict[str, Any] = Field(default_factory=dict)
     finished_cot: bool = Field(default=False)
     tool_type: Optional[Literal["workflow", "tool"]] = Field(default=None)
+    # 同一个 Thought 下的第几个 Action
+    action_index: int = Field(default=0)
 
     empty: bool = Field(default=False)
     plugin: Optional[BasePlugin] = Field(default=None)
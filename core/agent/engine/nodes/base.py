@@ -144,8 +144,10 @@ class Scratchpad(BaseModel):
         for step in self.steps:
             action_input_text = json.dumps(step.action_input, ensure_ascii=False)
             action_output_text = json.dumps(step.action_output, ensure_ascii=False)
+            # 同一个 Thought 下并发执行的 Action 只输出一次 Thought
+            thought_text = f"Thought: {step.thought}\n" if not step.action_index else ""
             step_template = (
-                f"Thought: {step.thought}\n"
+                f"{thought_text}"
                 f"Action: {step.action}\n"
                 f"Action Input: {action_input_text}\n"
                 f"Observation: {action_output_text}"
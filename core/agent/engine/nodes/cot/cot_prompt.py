@@ -28,6 +28,7 @@ COT_SYSTEM_TEMPLATE = """# 1. 核心能力
 - 推理格式中的每一项都必须是单独的一行，不允许换行
 - 每次推理必须先返回一个Thought
 - 如果不需要调用工具，请不要输出Action，直接在Thought之后使用Final Answer
+- 如果需要调用多个相互独立的工具（工具的输入不依赖其他工具的返回内容），可以在同一个Thought之后连续输出多组Action/Action Input，这些工具会并发执行，每组Action/Action Input之后会按顺序给出对应的Observation
 
 # 6. 推理格式：
 Previous chat history:
@@ -38,6 +39,12 @@ Action: <当前步骤需要调用的工具，必须是可访问工具中的一
 Action Input: <调用工具的输入，必须符合Action工具的输入要求，必须是一个一行的json，例如 {"key1": "value1", ...}>
 Observation: 工具的返回内容
 ... (其中Thought/Action/Action Input/Observation代表解决问题的一个步骤，一个问题可以由多个步骤解决)
+Thought: <需要同时调用多个相互独立的工具>
+Action: <第一个工具>
+Action Input: <第一个工具的输入>
+Action: <第二个工具>
+Action Input: <第二个工具的输入>
+Observation: 工具的返回内容（每个Action各自对应一个Observation）
 Thought: 思考前面的步骤获取的信息可以回答用户问题了
 Final Answer: 最终回答内容
 
@@ -1,4 +1,6 @@
+import asyncio
 import json
+import os
 import time
 from typing import Any, AsyncIterator, Union
 
@@ -40,6 +42,9 @@ class CotRunner(RunnerBase):
     question: str = Field(default="")
     process_runner: CotProcessRunner
     max_loop: int = Field(default=30)
+    plugin_timeout: float = Field(
+        default_factory=lambda: float(os.getenv("COT_PLUGIN_TIMEOUT", "90"))
+    )
 
     async def create_system_prompt(self) -> str:
         system_prompt = COT_SYSTEM_TEMPLATE.replace("{now}", self.cur_time())
@@ -77,75 +82,62 @@ class CotRunner(RunnerBase):
                 f"无效的插件参数JSON格式: {action_input_raw}"
             )
 
-    async def _parse_action_and_input(
+    async def _parse_actions(
         self, step_content: str, has_thought: bool = False
-    ) -> tuple[str, str, dict[str, Any]]:
-        """解析 action、action_input 和 thought"""
-        if has_thought:
-            thought_raw, right = step_content.split("Action:")
-            thought = thought_raw.split("Thought:")[1].strip()
-        else:
-            thought = ""
-            _, right = step_content.split("Action:")
-
-        action_raw, right = right.split("Action Input:")
-        action = action_raw.strip()
+    ) -> tuple[str, list[tuple[str, dict[str, Any]]]]:
+        """解析 thought 以及一个或多个 action、action_input"""
+        step_content = step_content.split("Observation:")[0]
+        head, *action_parts = step_content.split("Action:")
+        thought = head.split("Thought:")[1].strip() if has_thought else ""
+
+        actions = []
+        for action_part in action_parts:
+            if "Action Input:" not in action_part:
+                raise cot_exc.CotFormatIncorrectExc(
+                    f"插件'{action_part.strip()}'缺少Action Input"
+                )
+            action_raw, action_input_raw = action_part.split("Action Input:", 1)
+            action = action_raw.strip()
 
-        if not await self.is_valid_plugin(action):
-            raise cot_exc.CotFormatIncorrectExc(f"无效的插件名称'{action}'")
+            if not await self.is_valid_plugin(action):
+                raise cot_exc.CotFormatIncorrectExc(f"无效的插件名称'{action}'")
 
-        action_input_raw = right.split("Observation:")[0].strip()
-        action_input = await self._parse_action_input(action_input_raw)
-        return thought, action, action_input
+            actions.append((action, await self._parse_action_input(action_input_raw)))
+        return thought, actions
 
-    async def parse_cot_step(self, step_content: str) -> CotStep:
+    async def parse_cot_steps(self, step_content: str) -> list[CotStep]:
+        """解析推理步骤，一个 Thought 之后可以有多个相互独立的 Action"""
         # 处理包含 Thought 和 Final Answer 的情况
         if all([k in step_content for k in ("Thought:", "Final Answer:")]):
             thought = step_content.split("Final Answer:")[0].split("Thought:")[1]
-            return CotStep(thought=thought, finished_cot=True)
+            return [CotStep(thought=thought, finished_cot=True)]
 
         # 处理只有 Final Answer 的情况
         if "Final Answer:" in step_content:
-            return CotStep(finished_cot=True)
-
-        # 处理包含 Thought、Action、Action Input 和 Observation 的情况
-        if all(
-            [
-                k in step_content
-                for k in ("Thought:", "Action:", "Action Input:", "Observation:")
-            ]
-        ):
-            thought, action, action_input = await self._parse_action_and_input(
-                step_content, has_thought=True
-            )
-            return CotStep(thought=thought, action=action, action_input=action_input)
-
-        # 处理包含 Thought、Action 和 Action Input 的情况
-        if all([k in step_content for k in ("Thought:", "Action:", "Action Input:")]):
-            thought, action, action_input = await self._parse_action_and_input(
-                step_content, has_thought=True
-            )
-            return CotStep(thought=thought, action=action, action_input=action_input)
+            return [CotStep(finished_cot=True)]
 
-        # 处理包含 Action、Action Input 和 Observation 的情况
-        if all(
-            [k in step_content for k in ("Action:", "Action Input:", "Observation:")]
-        ):
-            thought, action, action_input = await self._parse_action_and_input(
-                step_content, has_thought=False
-            )
-            return CotStep(thought=thought, action=action, action_input=action_input)
-
-        # 处理包含 Action 和 Action Input 的情况
+        # 处理包含 Action 和 Action Input 的情况，Thought 和 Observation 可选
         if all([k in step_content for k in ("Action:", "Action Input:")]):
-            thought, action, action_input = await self._parse_action_and_input(
-                step_content, has_thought=False
+            thought, actions = await self._parse_actions(
+                step_content, has_thought="Thought:" in step_content
             )
-            return CotStep(thought=thought, action=action, action_input=action_input)
+            return [
+                CotStep(
+                    thought=thought,
+                    action=action,
+                    action_input=action_input,
+                    action_index=index,
+                )
+                for index, (action, action_input) in enumerate(actions)
+            ]
 
         # 其他情况都视为无效格式
         raise cot_exc.CotFormatIncorrectExc("无效的推理格式，缺少必要的标识字段")
 
+    async def parse_cot_step(self, step_content: str) -> CotStep:
+        """解析推理步骤，只返回第一个 Action"""
+        return (await self.parse_cot_steps(step_content))[0]
+
     async def read_response(
         self,
         messages: LLMMessages,
@@ -247,12 +239,11 @@ class CotRunner(RunnerBase):
             sp.add_info_events({"step-content": answers})
 
             if not final_answer:
-                # 解析 step_content
-                yield AgentResponse(
-                    typ="cot_step",
-                    content=await self.parse_cot_step(step_content),
-                    model=self.model.name,
-                )
+                # 解析 step_content，每个 Action 对应一个 cot_step
+                for cot_step in await self.parse_cot_steps(step_content):
+                    yield AgentResponse(
+                        typ="cot_step", content=cot_step, model=self.model.name
+                    )
 
     async def _process_agent_responses(
         self,
@@ -260,22 +251,26 @@ class CotRunner(RunnerBase):
         first_loop: bool,
         span: Span,
         node_trace_log: NodeTraceLog,
-    ) -> AsyncIterator[tuple[AgentResponse | None, CotStep, bool]]:
-        """处理 agent 响应，yield (agent_response, cot_step, yield_answer)"""
-        cot_step: CotStep = default_cot_step
+    ) -> AsyncIterator[tuple[AgentResponse | None, list[CotStep], bool]]:
+        """处理 agent 响应，yield (agent_response, cot_steps, yield_answer)"""
+        cot_steps: list[CotStep] = [default_cot_step]
         yield_answer = False
 
         async for agent_response in self.read_response(
             msgs, first_loop, span, node_trace_log
         ):
             if agent_response.typ in ["reasoning_content", "log"]:
-                yield agent_response, cot_step, yield_answer
+                yield agent_response, cot_steps, yield_answer
             elif agent_response.typ == "content":
                 yield_answer = True
-                yield agent_response, cot_step, yield_answer
+                yield agent_response, cot_steps, yield_answer
             elif agent_response.typ == "cot_step":
                 cot_step = agent_response.content
-                yield None, cot_step, yield_answer
+                if cot_step.action_index == 0:
+                    cot_steps = [cot_step]
+                else:
+                    cot_steps = [*cot_steps, cot_step]
+                yield None, cot_steps, yield_answer
 
     async def _handle_cot_step(
         self, cot_step: CotStep, span: Span
@@ -296,12 +291,77 @@ class CotRunner(RunnerBase):
             ):
                 yield agent_response
         elif plugin:
-            cot_step.tool_type = "tool"
-            plugin_response = await self.run_plugin(cot_step, span)
-            cot_step.plugin.run_result = plugin_response  # type: ignore[union-attr]
-            cot_step.action_output = plugin_response.result
+            await self._run_tool_step(cot_step, span)
             yield AgentResponse(typ="cot_step", content=cot_step, model=self.model.name)
 
+    async def _run_tool_step(self, cot_step: CotStep, span: Span) -> None:
+        """执行非工作流插件，超时则以错误信息作为 Observation"""
+        cot_step.tool_type = "tool"
+        try:
+            plugin_response = await asyncio.wait_for(
+                self.run_plugin(cot_step, span), timeout=self.plugin_timeout
+            )
+        except asyncio.TimeoutError:
+            timeout_result = {
+                "code": 408,
+                "message": f"{cot_step.action} 调用超时",
+                "data": None,
+            }
+            plugin_response = PluginResponse(
+                result=timeout_result,
+                log=[
+                    {
+                        "name": cot_step.action,
+                        "input": cot_step.action_input,
+                        "output": timeout_result,
+                        "detail": f"plugin timed out after {self.plugin_timeout}s",
+                    }
+                ],
+            )
+        cot_step.plugin.run_result = plugin_response  # type: ignore[union-attr]
+        cot_step.action_output = plugin_response.result
+
+    async def _run_tool_steps(self, cot_steps: list[CotStep], span: Span) -> None:
+        """并发执行多个 Action 中的非工作流插件，结果保存在各自的 Action 中"""
+        for cot_step in cot_steps:
+            plugin = await self.get_plugin(cot_step)
+            # 同一插件可能被并发调用多次，各自保存运行结果
+            cot_step.plugin = plugin.model_copy() if plugin else None
+
+        tasks = [
+            asyncio.create_task(self._run_tool_step(cot_step, span))
+            for cot_step in cot_steps
+            if cot_step.plugin and cot_step.plugin.typ != "workflow"
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def _handle_cot_steps(
+        self, cot_steps: list[CotStep], span: Span
+    ) -> AsyncIterator[AgentResponse]:
+        """处理一个推理步骤中的多个 Action，非工作流插件并发执行，按 Action 顺序返回"""
+        if len(cot_steps) == 1:
+            async for agent_response in self._handle_cot_step(cot_steps[0], span):
+                yield agent_response
+            return
+
+        await self._run_tool_steps(cot_steps, span)
+
+        for cot_step in cot_steps:
+            if cot_step.tool_type == "tool":
+                yield AgentResponse(
+                    typ="cot_step", content=cot_step, model=self.model.name
+                )
+            elif cot_step.plugin:
+                async for agent_response in self.run_workflow_plugin(
+                    cot_step.plugin, cot_step, span
+                ):
+                    yield agent_response
+
     async def run(
         self, span: Span, node_trace_log: NodeTraceLog
     ) -> AsyncIterator[AgentResponse]:
@@ -326,23 +386,24 @@ class CotRunner(RunnerBase):
                     ]
                 )
 
-                cot_step = default_cot_step
+                cot_steps = [default_cot_step]
                 yield_answer = False
                 async for (
                     agent_response,
-                    step,
+                    steps,
                     answer_flag,
                 ) in self._process_agent_responses(
                     msgs, loop_count == 1, sp, node_trace_log
                 ):
                     if agent_response is not None:
                         yield agent_response
-                    cot_step = step
+                    cot_steps = steps
                     yield_answer = answer_flag
 
                 if yield_answer:
                     return
 
+                cot_step = cot_steps[0]
                 if cot_step.finished_cot:
                     self.scratchpad.steps.append(cot_step)
                     async for agent_response in self.process_runner.run(
@@ -351,13 +412,13 @@ class CotRunner(RunnerBase):
                         yield agent_response
                     return
 
-                async for agent_response in self._handle_cot_step(cot_step, span):
+                async for agent_response in self._handle_cot_steps(cot_steps, span):
                     yield agent_response
 
-                if not cot_step.action_output:
+                if not all(step.action_output for step in cot_steps):
                     return
 
-                self.scratchpad.steps.append(cot_step)
+                self.scratchpad.steps.extend(cot_steps)
 
             async for agent_response in self.process_runner.run(
                 self.scratchpad, sp, node_trace_log
@@ -12,6 +12,7 @@ from common.otlp.trace.span import Span
 from pydantic import BaseModel, Field
 
 from agent.exceptions.middleware_exc import AppAuthFailedExc
+from agent.infra.http_session import http_session_pool
 
 
 def http_date(dt: datetime.datetime) -> str:
@@ -117,7 +118,7 @@ class APPAuth:
 
     async def app_detail(self, app_id: str) -> Optional[Dict[str, Any]]:
         headers = self.init_header("")
-        async with aiohttp.ClientSession() as session:
+        async with http_session_pool.acquire() as session:
             timeout = aiohttp.ClientTimeout(total=3)
             async with session.get(
                 self.config.url,
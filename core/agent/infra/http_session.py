@@ -0,0 +1,203 @@
+"""Process-wide aiohttp sessions shared by the agent's outbound HTTP calls."""
+
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+import aiohttp
+from common.otlp.metrics import metric
+from loguru import logger
+
+UTILIZATION_BUCKETS = ((0.5, "0-50"), (0.8, "50-80"), (1.0, "80-100"))
+POOL_EVENT_COUNTER = "agent_http_pool_events_total"
+
+
+class HttpSessionPool:
+    """Keep-alive aiohttp session with connection limits and DNS caching.
+
+    Opening a session per call costs a DNS lookup and a TCP/TLS handshake on
+    every tool invocation. The pool holds one session per event loop, created
+    on first use and closed on application shutdown. Connection creations,
+    reuses and waits for a free connection are counted on a dedicated OTLP
+    counter labelled with the host and the pool utilization.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[int] = None,
+        limit_per_host: Optional[int] = None,
+        keepalive_timeout: Optional[float] = None,
+        dns_cache_ttl: Optional[int] = None,
+        timeout: Optional[float] = None,
+        connect_timeout: Optional[float] = None,
+    ) -> None:
+        """Initialize the pool, unset settings are read from the environment.
+
+        :param limit: Maximum connections, AGENT_HTTP_POOL_LIMIT
+        :param limit_per_host: Maximum connections per host,
+                               AGENT_HTTP_POOL_LIMIT_PER_HOST
+        :param keepalive_timeout: Seconds an idle connection is kept open,
+                                  AGENT_HTTP_KEEPALIVE_TIMEOUT
+        :param dns_cache_ttl: Seconds a resolved host is cached,
+                              AGENT_HTTP_DNS_CACHE_TTL
+        :param timeout: Default total seconds of a request, AGENT_HTTP_TIMEOUT
+        :param connect_timeout: Seconds to acquire a connection,
+                                AGENT_HTTP_CONNECT_TIMEOUT
+        """
+        self._settings = {
+            "limit": limit,
+            "limit_per_host": limit_per_host,
+            "keepalive_timeout": keepalive_timeout,
+            "dns_cache_ttl": dns_cache_ttl,
+            "timeout": timeout,
+            "connect_timeout": connect_timeout,
+        }
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+    def _setting(self, name: str, env: str, default: str) -> float:
+        value = self._settings[name]
+        if value is None:
+            value = self._settings[name] = float(os.getenv(env, default))
+        return float(value)
+
+    def session(self) -> aiohttp.ClientSession:
+        """Get the session of the running event loop, creating it if needed.
+
+        :return: Shared client session, not to be closed by the caller
+        """
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            self._discard_closed_loops()
+            session = self._create_session()
+            self._sessions[loop] = session
+        return session
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Borrow the shared session for a block of requests.
+
+        :return: Shared client session, left open when the block exits
+        """
+        yield self.session()
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=int(self._setting("limit", "AGENT_HTTP_POOL_LIMIT", "200")),
+            limit_per_host=int(
+                self._setting("limit_per_host", "AGENT_HTTP_POOL_LIMIT_PER_HOST", "50")
+            ),
+            keepalive_timeout=self._setting(
+                "keepalive_timeout", "AGENT_HTTP_KEEPALIVE_TIMEOUT", "30"
+            ),
+            ttl_dns_cache=int(
+                self._setting("dns_cache_ttl", "AGENT_HTTP_DNS_CACHE_TTL", "300")
+            ),
+            use_dns_cache=True,
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=self._setting("timeout", "AGENT_HTTP_TIMEOUT", "90"),
+            connect=self._setting(
+                "connect_timeout", "AGENT_HTTP_CONNECT_TIMEOUT", "10"
+            ),
+        )
+        return aiohttp.ClientSession(
+            connector=connector, timeout=timeout, trace_configs=[self._trace_config()]
+        )
+
+    def _discard_closed_loops(self) -> None:
+        """Drop the sessions of event loops that have been closed."""
+        for loop in [loop for loop in self._sessions if loop.is_closed()]:
+            _close_detached(self._sessions.pop(loop))
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(_remember_host)
+        trace_config.on_connection_create_end.append(self._reporter("create"))
+        trace_config.on_connection_reuseconn.append(self._reporter("reuse"))
+        trace_config.on_connection_queued_start.append(self._reporter("queued"))
+        return trace_config
+
+    def _reporter(
+        self, event: str
+    ) -> Callable[[aiohttp.ClientSession, SimpleNamespace, Any], Awaitable[None]]:
+        async def report(
+            session: aiohttp.ClientSession, ctx: SimpleNamespace, _params: Any
+        ) -> None:
+            self.report(event, getattr(ctx, "host", ""), session.connector)
+
+        return report
+
+    @staticmethod
+    def utilization(connector: Optional[aiohttp.BaseConnector]) -> str:
+        """Bucket the share of the connection limit currently in use.
+
+        :param connector: Connector of the session
+        :return: Utilization bucket label, e.g. 50-80
+        """
+        if connector is None or not connector.limit:
+            return "unlimited"
+        in_use = len(getattr(connector, "_acquired", ()))
+        ratio = in_use / connector.limit
+        for bound, label in UTILIZATION_BUCKETS:
+            if ratio <= bound:
+                return label
+        return "80-100"
+
+    def report(
+        self, event: str, host: str, connector: Optional[aiohttp.BaseConnector]
+    ) -> None:
+        """Count a pool event on the pool event counter.
+
+        :param event: create, reuse or queued
+        :param host: Host of the request
+        :param connector: Connector of the session
+        """
+        try:
+            pool_counter = metric.get_counter(
+                POOL_EVENT_COUNTER, "Agent HTTP pool connection events"
+            )
+            if pool_counter is None:
+                return
+            pool_counter.add(
+                1,
+                {
+                    "pool_event": event,
+                    "pool_host": host,
+                    "pool_utilization": self.utilization(connector),
+                },
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logger.warning(f"Failed to report http pool metric: {e}")
+
+    async def close(self) -> None:
+        """Close the sessions of all event loops."""
+        current = asyncio.get_running_loop()
+        sessions, self._sessions = self._sessions, {}
+        for loop, session in sessions.items():
+            if loop is current:
+                await session.close()
+                continue
+            # Sessions of other loops cannot be awaited from this one
+            _close_detached(session)
+
+
+def _close_detached(session: aiohttp.ClientSession) -> None:
+    """Close the connections of a session without awaiting its event loop."""
+    if session.connector is not None:
+        # Closing the transports is synchronous, only the public API is awaitable
+        session.connector._close()
+    session.detach()
+
+
+async def _remember_host(
+    _session: aiohttp.ClientSession,
+    ctx: SimpleNamespace,
+    params: aiohttp.TraceRequestStartParams,
+) -> None:
+    ctx.host = params.url.host or ""
+
+
+http_session_pool = HttpSessionPool()
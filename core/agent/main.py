@@ -25,6 +25,7 @@ from starlette.middleware.cors import CORSMiddleware
 from agent.api import router
 from agent.api.schemas.completion_chunk import ReasonChatCompletionChunk
 from agent.exceptions.agent_exc import AgentExc
+from agent.infra.http_session import http_session_pool
 
 
 def initialize_extensions() -> None:
@@ -143,6 +144,11 @@ def create_app() -> FastAPI:
             logger.info(json.dumps(route_info, ensure_ascii=False))
             print(json.dumps(route_info, ensure_ascii=False))
 
+    @app.on_event("shutdown")
+    async def close_http_sessions() -> None:
+        """Close the shared HTTP sessions of plugins and knowledge retrieval."""
+        await http_session_pool.close()
+
     return app
 
 
@@ -1,8 +1,10 @@
+import asyncio
 import json
 import os
 import ssl
+import time
 from dataclasses import dataclass
-from typing import ClassVar, Sequence, Union, cast
+from typing import Any, Awaitable, ClassVar, Sequence, Union, cast
 
 import httpx
 from common.otlp.trace.span import Span
@@ -17,6 +19,7 @@ from agent.domain.models.base import (
 from agent.engine.nodes.chat.chat_runner import ChatRunner
 from agent.engine.nodes.cot.cot_runner import CotRunner
 from agent.engine.nodes.cot_process.cot_process_runner import CotProcessRunner
+from agent.exceptions.agent_exc import AgentInternalExc
 from agent.infra.app_auth import MaasAuth
 from agent.service.plugin.base import BasePlugin
 from agent.service.plugin.link import LinkPlugin, LinkPluginFactory
@@ -44,6 +47,17 @@ class CotRunnerParams(RunnerParams):
     max_loop: int = 30
 
 
+@dataclass
+class BuildPhase:
+    """Independent step of runner construction, run concurrently with the others"""
+
+    name: str
+    call: Awaitable[Any]
+    # An optional phase falls back to its default instead of failing the build
+    optional: bool = False
+    default: Any = None
+
+
 class BaseApiBuilder(BaseModel):
     model_config = {"arbitrary_types_allowed": True}
     OPENAI_COMPATIBLE_PROVIDERS: ClassVar[set[str]] = {
@@ -61,6 +75,9 @@ class BaseApiBuilder(BaseModel):
     app_id: str
     uid: str = Field(default="")
     span: Span
+    build_timeout: float = Field(
+        default_factory=lambda: float(os.getenv("AGENT_BUILD_TIMEOUT", "90"))
+    )
 
     def _create_http_client(self, sp: Span) -> httpx.AsyncClient:
         ssl_context = ssl.create_default_context()
@@ -92,33 +109,44 @@ class BaseApiBuilder(BaseModel):
         with self.span.start("BuildPlugins") as sp:
             mcp_server_urls = [url for url in mcp_server_urls if url and url.strip()]
 
-            plugins: list[Union[LinkPlugin, McpPlugin, WorkflowPlugin]] = []
+            phases: list[BuildPhase] = []
             if tool_ids:
-                link_tools = await LinkPluginFactory(
-                    app_id=self.app_id, uid=self.uid, tool_ids=tool_ids
-                ).gen(sp)
-                plugins.extend(
-                    cast(list[Union[LinkPlugin, McpPlugin, WorkflowPlugin]], link_tools)
+                phases.append(
+                    BuildPhase(
+                        "link",
+                        LinkPluginFactory(
+                            app_id=self.app_id, uid=self.uid, tool_ids=tool_ids
+                        ).gen(sp),
+                    )
                 )
-
             if mcp_server_ids or mcp_server_urls:
-                mcp_tools = await McpPluginFactory(
-                    app_id=self.app_id,
-                    mcp_server_ids=mcp_server_ids,
-                    mcp_server_urls=mcp_server_urls,
-                ).gen(sp)
-                plugins.extend(
-                    cast(list[Union[LinkPlugin, McpPlugin, WorkflowPlugin]], mcp_tools)
+                phases.append(
+                    BuildPhase(
+                        "mcp",
+                        McpPluginFactory(
+                            app_id=self.app_id,
+                            mcp_server_ids=mcp_server_ids,
+                            mcp_server_urls=mcp_server_urls,
+                        ).gen(sp),
+                    )
                 )
-
             if workflow_ids:
-                workflow_tools = await WorkflowPluginFactory(
-                    app_id=self.app_id, uid=self.uid, workflow_ids=workflow_ids
-                ).gen(sp)
+                phases.append(
+                    BuildPhase(
+                        "workflow",
+                        WorkflowPluginFactory(
+                            app_id=self.app_id, uid=self.uid, workflow_ids=workflow_ids
+                        ).gen(sp),
+                    )
+                )
+
+            results = await self.run_phases(phases, sp)
+            plugins: list[Union[LinkPlugin, McpPlugin, WorkflowPlugin]] = []
+            for phase in phases:
                 plugins.extend(
                     cast(
                         list[Union[LinkPlugin, McpPlugin, WorkflowPlugin]],
-                        workflow_tools,
+                        results[phase.name],
                     )
                 )
 
@@ -140,6 +168,83 @@ class BaseApiBuilder(BaseModel):
 
             return plugins
 
+    async def run_phases(
+        self, phases: Sequence[BuildPhase], sp: Span, timeout: float | None = None
+    ) -> dict[str, Any]:
+        """Run build phases concurrently within a shared deadline.
+
+        A required phase failing or missing the deadline fails the build at once,
+        an optional one falls back to its default. The cost of every phase is
+        recorded on the span.
+
+        :param phases: Phases to run, with unique names
+        :param sp: Span recording the phase costs
+        :param timeout: Seconds all phases must complete in, None waits for them
+        :return: Result of every phase by name
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        costs: dict[str, float] = {}
+        tasks = {
+            asyncio.ensure_future(_timed(phase.name, phase.call, costs)): phase
+            for phase in phases
+        }
+        pending = set(tasks)
+        try:
+            while pending:
+                remaining = None
+                if timeout is not None:
+                    remaining = start + timeout - loop.time()
+                    if remaining <= 0:
+                        break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_EXCEPTION
+                )
+                for task in done:
+                    error = task.exception()
+                    if error is not None and not tasks[task].optional:
+                        raise error
+        finally:
+            for task in pending:
+                task.cancel()
+            if tasks:
+                sp.add_info_events(
+                    {"build-phase-costs": json.dumps(costs, ensure_ascii=False)}
+                )
+        return self._phase_results(tasks, pending, sp, timeout)
+
+    @staticmethod
+    def _phase_results(
+        tasks: dict["asyncio.Task[Any]", BuildPhase],
+        pending: set["asyncio.Task[Any]"],
+        sp: Span,
+        timeout: float | None,
+    ) -> dict[str, Any]:
+        """Collect the phase results, degrading the failed optional phases.
+
+        :param tasks: Phase of every task
+        :param pending: Tasks that missed the deadline
+        :param sp: Span recording the degraded phases
+        :param timeout: Seconds all phases had to complete in
+        :return: Result of every phase by name
+        """
+        results: dict[str, Any] = {}
+        for task, phase in tasks.items():
+            if task in pending:
+                if not phase.optional:
+                    raise AgentInternalExc(
+                        f"Build phase {phase.name} timed out after {timeout}s"
+                    )
+                reason = f"timed out after {timeout}s"
+            elif task.exception() is not None:
+                reason = repr(task.exception())
+            else:
+                results[phase.name] = task.result()
+                continue
+            sp.add_error_events({"degraded-build-phase": phase.name, "reason": reason})
+            results[phase.name] = phase.default
+        return results
+
     async def build_chat_runner(
         self,
         params: RunnerParams,
@@ -318,3 +423,12 @@ class BaseApiBuilder(BaseModel):
                     max_retries=2,
                 ),
             )
+
+
+async def _timed(name: str, call: Awaitable[Any], costs: dict[str, float]) -> Any:
+    """Await a build phase, recording its cost in milliseconds"""
+    start = time.perf_counter()
+    try:
+        return await call
+    finally:
+        costs[name] = round((time.perf_counter() - start) * 1000, 2)
@@ -11,6 +11,7 @@ from agent.api.schemas.workflow_agent_inputs import (
 )
 from agent.service.builder.base_builder import (
     BaseApiBuilder,
+    BuildPhase,
     CotRunnerParams,
     RunnerParams,
 )
@@ -35,23 +36,44 @@ class WorkflowAgentRunnerBuilder(BaseApiBuilder):
     async def build(self) -> WorkflowAgentRunner:
         """构建"""
         with self.span.start("BuildRunner") as sp:
-            model = await self.create_model(
-                app_id=self.app_id,
-                model_name=self.inputs.model_config_inputs.domain,
-                base_url=self.inputs.model_config_inputs.api,
-                provider=self.inputs.model_config_inputs.provider,
-                api_key=self.inputs.model_config_inputs.api_key,
-            )
-
-            plugins = await self.build_plugins(
-                tool_ids=self.inputs.plugin.tools,
-                mcp_server_ids=self.inputs.plugin.mcp_server_ids,
-                mcp_server_urls=self.inputs.plugin.mcp_server_urls,
-                workflow_ids=self.inputs.plugin.workflow_ids,
-            )
-            metadata_list, knowledge = await self.query_knowledge_by_workflow(
-                self.inputs.plugin.knowledge, sp
+            # 模型、插件与知识库相互独立，并发构建
+            results = await self.run_phases(
+                [
+                    BuildPhase(
+                        "model",
+                        self.create_model(
+                            app_id=self.app_id,
+                            model_name=self.inputs.model_config_inputs.domain,
+                            base_url=self.inputs.model_config_inputs.api,
+                            provider=self.inputs.model_config_inputs.provider,
+                            api_key=self.inputs.model_config_inputs.api_key,
+                        ),
+                    ),
+                    BuildPhase(
+                        "plugins",
+                        self.build_plugins(
+                            tool_ids=self.inputs.plugin.tools,
+                            mcp_server_ids=self.inputs.plugin.mcp_server_ids,
+                            mcp_server_urls=self.inputs.plugin.mcp_server_urls,
+                            workflow_ids=self.inputs.plugin.workflow_ids,
+                        ),
+                    ),
+                    # 知识库检索失败时降级为无知识回答
+                    BuildPhase(
+                        "knowledge",
+                        self.query_knowledge_by_workflow(
+                            self.inputs.plugin.knowledge, sp
+                        ),
+                        optional=True,
+                        default=([], ""),
+                    ),
+                ],
+                sp,
+                timeout=self.build_timeout,
             )
+            model = results["model"]
+            plugins = results["plugins"]
+            metadata_list, knowledge = results["knowledge"]
 
             chat_params = RunnerParams(
                 model=model,
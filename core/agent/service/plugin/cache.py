@@ -0,0 +1,159 @@
+"""In-process cache of parsed plugin schemas shared by agent requests."""
+
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from loguru import logger
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    stored_at: float
+
+
+class PluginSchemaCache:
+    """TTL cache with stale-while-revalidate refresh.
+
+    An entry younger than the TTL is served as is. An entry older than the TTL
+    but younger than the stale TTL is still served, and a background refresh
+    replaces it. Older entries are treated as missing and loaded inline. Past
+    max_entries, the least recently used entries are dropped.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        """Initialize the cache, unset settings are read from the environment.
+
+        :param ttl: Seconds an entry is fresh, AGENT_PLUGIN_CACHE_TTL
+        :param stale_ttl: Seconds an entry may be served while being refreshed,
+                          AGENT_PLUGIN_CACHE_STALE_TTL
+        :param max_entries: Maximum number of entries,
+                            AGENT_PLUGIN_CACHE_MAX_ENTRIES
+        """
+        self.ttl = (
+            ttl
+            if ttl is not None
+            else float(os.getenv("AGENT_PLUGIN_CACHE_TTL", "300"))
+        )
+        self.stale_ttl = (
+            stale_ttl
+            if stale_ttl is not None
+            else float(os.getenv("AGENT_PLUGIN_CACHE_STALE_TTL", "3600"))
+        )
+        self.max_entries = (
+            max_entries
+            if max_entries is not None
+            else int(os.getenv("AGENT_PLUGIN_CACHE_MAX_ENTRIES", "10000"))
+        )
+        self._entries: OrderedDict[tuple, CacheEntry] = OrderedDict()
+        self._refreshing: Dict[tuple, asyncio.Task] = {}
+
+    def lookup(self, key: tuple) -> tuple[Any, bool]:
+        """Look up an entry.
+
+        :param key: Cache key
+        :return: Cached value or None when missing or expired, and whether
+                 the value is still fresh
+        """
+        entry = self._entries.get(key)
+        if entry is None or self.ttl <= 0:
+            return None, False
+        age = time.monotonic() - entry.stored_at
+        if age >= max(self.stale_ttl, self.ttl):
+            del self._entries[key]
+            return None, False
+        self._entries.move_to_end(key)
+        return entry.value, age < self.ttl
+
+    def put(self, key: tuple, value: Any) -> None:
+        """Store a value, dropping the least recently used entries past the limit.
+
+        :param key: Cache key
+        :param value: Value to store
+        """
+        self._entries[key] = CacheEntry(value=value, stored_at=time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > max(self.max_entries, 0):
+            self._entries.popitem(last=False)
+
+    def refresh(
+        self,
+        keys: Iterable[tuple],
+        loader: Callable[[list], Awaitable[Dict[tuple, Any]]],
+    ) -> Optional[asyncio.Task]:
+        """Reload stale entries in the background, stale values being kept on failure.
+
+        :param keys: Keys to reload, keys already being reloaded are skipped
+        :param loader: Coroutine function loading the values of the given keys
+        :return: Background task, None when there is nothing to reload
+        """
+        pending = [key for key in keys if key not in self._refreshing]
+        if not pending:
+            return None
+
+        async def reload() -> None:
+            try:
+                for key, value in (await loader(pending)).items():
+                    self.put(key, value)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                logger.warning(f"Failed to refresh plugin schemas {pending}: {e}")
+            finally:
+                for key in pending:
+                    self._refreshing.pop(key, None)
+
+        task = asyncio.create_task(reload())
+        for key in pending:
+            self._refreshing[key] = task
+        return task
+
+    def invalidate(self, match: Callable[[tuple], bool]) -> int:
+        """Drop the entries whose key matches.
+
+        :param match: Predicate on the cache key
+        :return: Number of dropped entries
+        """
+        keys = [key for key in self._entries if match(key)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
+plugin_schema_cache = PluginSchemaCache()
+
+
+def invalidate_link_tool(tool_id: str, version: Optional[str] = None) -> int:
+    """Drop the cached schemas of a Link tool, e.g. after it has been published.
+
+    :param tool_id: Tool id
+    :param version: Tool version, None drops every version
+    :return: Number of dropped entries
+    """
+    return plugin_schema_cache.invalidate(
+        lambda key: key[0] == "link"
+        and key[2] == tool_id
+        and (version is None or key[3] == version)
+    )
+
+
+def invalidate_mcp_server(server: str) -> int:
+    """Drop the cached tool list of an MCP server.
+
+    :param server: Server id or server url
+    :return: Number of dropped entries
+    """
+    return plugin_schema_cache.invalidate(
+        lambda key: key[0] == "mcp" and key[1] == server
+    )
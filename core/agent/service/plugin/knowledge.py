@@ -8,6 +8,7 @@ from common.otlp.trace.span import Span
 from openai import BaseModel
 
 from agent.exceptions.plugin_exc import KnowledgeQueryExc, PluginExc
+from agent.infra.http_session import http_session_pool
 from agent.service.plugin.base import BasePlugin
 
 
@@ -58,7 +59,7 @@ class KnowledgePluginFactory(BaseModel):
                 query_url = os.getenv("CHUNK_QUERY_URL")
                 if not query_url:
                     raise PluginExc(-1, "CHUNK_QUERY_URL is not set")
-                async with aiohttp.ClientSession() as session:
+                async with http_session_pool.acquire() as session:
                     timeout = aiohttp.ClientTimeout(
                         total=int(os.getenv("KNOWLEDGE_CALL_TIMEOUT", "90"))
                     )
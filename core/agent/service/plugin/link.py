@@ -10,7 +10,11 @@ from common.otlp.trace.span import Span
 from pydantic import BaseModel, Field
 
 from agent.exceptions.plugin_exc import GetToolSchemaExc, RunToolExc
+from agent.infra.http_session import http_session_pool
 from agent.service.plugin.base import BasePlugin, PluginResponse
+from agent.service.plugin.cache import invalidate_link_tool, plugin_schema_cache
+
+DEFAULT_TOOL_VERSION = "V1.0"
 
 
 class LinkPluginRunner(BaseModel):
@@ -152,7 +156,7 @@ class LinkPluginRunner(BaseModel):
                 timeout = aiohttp.ClientTimeout(
                     total=int(os.getenv("LINK_CALL_TIMEOUT", "90"))
                 )
-                async with aiohttp.ClientSession() as session:
+                async with http_session_pool.acquire() as session:
                     async with session.post(
                         run_url,
                         data=json.dumps(run_link_payload),
@@ -196,6 +200,9 @@ class LinkPluginRunner(BaseModel):
                     }
                 ],
             )
+            if plugin_response.code != 0:
+                # The tool may have been republished, reload its schema next time
+                invalidate_link_tool(self.tool_id, self.version)
 
             return plugin_response
 
@@ -204,6 +211,17 @@ class LinkPlugin(BasePlugin):
     tool_id: str
 
 
+class LinkToolSchema(BaseModel):
+    """Parsed operation of a Link tool, independent of the calling app and user"""
+
+    tool_id: str
+    version: str
+    operation_id: str
+    description: str
+    schema_template: str
+    method_schema: dict[str, Any]
+
+
 class LinkPluginFactory(BaseModel):
     app_id: str
     uid: str
@@ -212,7 +230,81 @@ class LinkPluginFactory(BaseModel):
     const_headers: dict[str, str] = Field(default={"Content-Type": "application/json"})
 
     async def gen(self, span: Span) -> list[LinkPlugin]:
-        return await self.parse_react_schema_list(span)
+        """Build plugins from cached schemas, loading missing ones from Link"""
+        tools = self.requested_tools()
+        schemas: dict[tuple, list[LinkToolSchema]] = {}
+        missing: list[tuple] = []
+        stale: list[tuple] = []
+        for tool in tools:
+            key = self.cache_key(*tool)
+            value, fresh = plugin_schema_cache.lookup(key)
+            if value is None:
+                missing.append(key)
+                continue
+            schemas[key] = value
+            if not fresh:
+                stale.append(key)
+
+        if missing:
+            loaded = await self.load_tool_schemas(missing, span)
+            for key in missing:
+                schemas[key] = loaded.get(key, [])
+            for key, value in loaded.items():
+                plugin_schema_cache.put(key, value)
+        if stale:
+            plugin_schema_cache.refresh(
+                stale, lambda keys: self.load_tool_schemas(keys, span)
+            )
+        span.add_info_events(
+            attributes={
+                "link-plugin-schema-cache": json.dumps(
+                    {
+                        "hit": len(tools) - len(missing) - len(stale),
+                        "stale": len(stale),
+                        "miss": len(missing),
+                    }
+                )
+            }
+        )
+
+        return [
+            self.build_plugin(schema)
+            for tool in tools
+            for schema in schemas[self.cache_key(*tool)]
+        ]
+
+    def requested_tools(self) -> list[tuple[str, str]]:
+        """Normalize tool_ids into (tool_id, version) pairs"""
+        tools: list[tuple[str, str]] = []
+        for tool_id in self.tool_ids:
+            if isinstance(tool_id, str):
+                tools.append((tool_id, DEFAULT_TOOL_VERSION))
+            elif isinstance(tool_id, dict):
+                tools.append((tool_id.get("tool_id", ""), tool_id.get("version", "")))
+        return tools
+
+    def cache_key(self, tool_id: str, version: str) -> tuple:
+        # Link checks the app's access to the tools, so entries are not shared
+        # across apps
+        return ("link", self.app_id, tool_id, version)
+
+    async def load_tool_schemas(
+        self, keys: list[tuple], span: Span
+    ) -> dict[tuple, list[LinkToolSchema]]:
+        """Query and parse the schemas of the given tools"""
+        requested: List[Union[str, dict[str, Any]]] = [
+            {"tool_id": key[2], "version": key[3]} for key in keys
+        ]
+        tool_schemas = await self.tool_schema_list(span, requested)
+
+        loaded: dict[tuple, list[LinkToolSchema]] = {}
+        for key in keys:
+            tool_id, version = key[2], key[3]
+            candidates = [t for t in tool_schemas if t.get("id") == tool_id]
+            matched = [t for t in candidates if t.get("version") == version]
+            for tool_schema in (matched or candidates)[:1]:
+                loaded[key] = self.parse_tool_schema(tool_schema)
+        return loaded
 
     async def run(
         self, _operation_id: str, _action_input: dict[str, Any], _span: Span
@@ -220,24 +312,30 @@ class LinkPluginFactory(BaseModel):
         # This method appears to be incomplete in the original, return None
         return None
 
-    async def tool_schema_list(self, span: Span) -> list[dict[str, Any]]:
+    async def tool_schema_list(
+        self,
+        span: Span,
+        tool_ids: Optional[List[Union[str, dict[str, Any]]]] = None,
+    ) -> list[dict[str, Any]]:
         """Query protocol list from spark link subsystem"""
         with span.start("ToolSchemaList") as sp:
-            if not self.tool_ids:
+            if tool_ids is None:
+                tool_ids = self.tool_ids
+            if not tool_ids:
                 return []
 
             base_url = os.getenv("VERSIONS_LINK_URL") or ""
             url = base_url + "?" + f"app_id={self.app_id}"
 
-            for tool_id in self.tool_ids:
+            for tool_id in tool_ids:
                 if isinstance(tool_id, str):
-                    url += "&tool_ids=" + tool_id + "&versions=V1.0"
+                    url += "&tool_ids=" + tool_id + "&versions=" + DEFAULT_TOOL_VERSION
                 elif isinstance(tool_id, dict):
                     tl_id = tool_id.get("tool_id", "")
                     tl_version = tool_id.get("version", "")
                     url += "&tool_ids=" + tl_id + "&versions=" + tl_version
             sp.add_info_events(attributes={"link-plugin-tool-schema-list-inputs": url})
-            async with aiohttp.ClientSession() as session:
+            async with http_session_pool.acquire() as session:
                 async with session.get(url) as response:
                     response.raise_for_status()
                     if response.status == 200:
@@ -343,84 +441,101 @@ class LinkPluginFactory(BaseModel):
         """Generate tools and tool_names for ReAct"""
         with span.start("ParseReactSchemaList") as sp:
             tools: list[LinkPlugin] = []
-
             for tool_schema in await self.tool_schema_list(sp):
-                tool_id = tool_schema.get("id")
-                version = tool_schema.get("version")
-                if tool_id is None or version is None:
-                    continue
-
-                tool_schema_data = json.loads(tool_schema.get("schema", "{}"))
-                for _, path_schema in tool_schema_data.get("paths", {}).items():
-                    for _, method_schema in path_schema.items():
-                        action_name = method_schema.get("operationId", "")  # Tool name
-                        action_description = method_schema.get(
-                            "description", ""
-                        )  # Tool description
-
-                        # Parse query
-                        query_schema = method_schema.get("parameters", [])
-                        query_parameters, query_required = (
-                            self.parse_request_query_schema(query_schema)
-                        )
+                for schema in self.parse_tool_schema(tool_schema):
+                    tools.append(self.build_plugin(schema))
+            return tools
 
-                        # Parse body, currently only supports application/json format
-                        request_body_schema = (
-                            method_schema.get("requestBody", {})
-                            .get("content", {})
-                            .get("application/json", {})
-                            .get("schema", {})
-                        )
-                        body_parameters: dict[str, dict[str, Any]] = {}
-                        body_required: set[str] = set()
-                        self.recursive_parse_request_body_schema(
-                            request_body_schema, body_parameters, body_required
-                        )
+    def build_plugin(self, schema: LinkToolSchema) -> LinkPlugin:
+        """Create tool execution object"""
+        return LinkPlugin(
+            tool_id=schema.tool_id,
+            name=schema.operation_id,
+            description=schema.description,
+            schema_template=schema.schema_template,
+            typ="link",
+            run=LinkPluginRunner(
+                app_id=self.app_id,
+                uid=self.uid,
+                tool_id=schema.tool_id,
+                version=schema.version,
+                operation_id=schema.operation_id,
+                method_schema=schema.method_schema,
+            ).run,
+        )
+
+    def parse_tool_schema(self, tool_schema: dict[str, Any]) -> list[LinkToolSchema]:
+        """Parse the operations of a tool's OpenAPI schema"""
+        schemas: list[LinkToolSchema] = []
+        tool_id = tool_schema.get("id")
+        version = tool_schema.get("version")
+        if tool_id is None or version is None:
+            return schemas
+
+        tool_schema_data = json.loads(tool_schema.get("schema", "{}"))
+        for _, path_schema in tool_schema_data.get("paths", {}).items():
+            for _, method_schema in path_schema.items():
+                action_name = method_schema.get("operationId", "")  # Tool name
+                action_description = method_schema.get(
+                    "description", ""
+                )  # Tool description
+
+                # Parse query
+                query_schema = method_schema.get("parameters", [])
+                query_parameters, query_required = self.parse_request_query_schema(
+                    query_schema
+                )
 
-                        # Remove nested keys
-                        delete_required_keys = []
-                        for k in body_required:
-                            if k not in body_parameters:
-                                delete_required_keys.append(k)
-                        for k in delete_required_keys:
-                            body_required.discard(k)
-
-                        # Merge body and query
-                        parameters: dict[str, dict[str, Any]] = {
-                            **query_parameters,
-                            **body_parameters,
-                        }
-                        required = [*query_required, *body_required]
-
-                        property_template = json.dumps(
-                            {
-                                "type": "object",
-                                "properties": parameters,
-                                "required": required,
-                            },
-                            ensure_ascii=False,
-                        )
-                        schema_template = (
-                            f"tool_name:{action_name}, "
-                            f"tool_description:{action_description}, "
-                            f"tool_parameters:{property_template}"
-                        )
+                # Parse body, currently only supports application/json format
+                request_body_schema = (
+                    method_schema.get("requestBody", {})
+                    .get("content", {})
+                    .get("application/json", {})
+                    .get("schema", {})
+                )
+                body_parameters: dict[str, dict[str, Any]] = {}
+                body_required: set[str] = set()
+                self.recursive_parse_request_body_schema(
+                    request_body_schema, body_parameters, body_required
+                )
 
-                        # Create tool execution object
-                        tool = LinkPlugin(
-                            tool_id=tool_id,
-                            name=action_name,
-                            description=action_description,
-                            schema_template=schema_template,
-                            typ="link",
-                            run=LinkPluginRunner(
-                                app_id=self.app_id,
-                                uid=self.uid,
-                                tool_id=tool_id,
-                                version=version,
-                                operation_id=action_name,
-                                method_schema=method_schema,
-                            ).run,
-                        )
-                        tools.append(tool)
-            return tools
+                # Remove nested keys
+                delete_required_keys = []
+                for k in body_required:
+                    if k not in body_parameters:
+                        delete_required_keys.append(k)
+                for k in delete_required_keys:
+                    body_required.discard(k)
+
+                # Merge body and query
+                parameters: dict[str, dict[str, Any]] = {
+                    **query_parameters,
+                    **body_parameters,
+                }
+                required = [*query_required, *body_required]
+
+                property_template = json.dumps(
+                    {
+                        "type": "object",
+                        "properties": parameters,
+                        "required": required,
+                    },
+                    ensure_ascii=False,
+                )
+                schema_template = (
+                    f"tool_name:{action_name}, "
+                    f"tool_description:{action_description}, "
+                    f"tool_parameters:{property_template}"
+                )
+
+                schemas.append(
+                    LinkToolSchema(
+                        tool_id=tool_id,
+                        version=version,
+                        operation_id=action_name,
+                        description=action_description,
+                        schema_template=schema_template,
+                        method_schema=method_schema,
+                    )
+                )
+        return schemas
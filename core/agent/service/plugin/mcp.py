@@ -2,14 +2,16 @@ import asyncio
 import json
 import os
 import time
-from typing import Any, cast
+from typing import Any, Optional, cast
 
 import aiohttp
 from common.otlp.trace.span import Span
 from pydantic import BaseModel, Field
 
 from agent.exceptions.plugin_exc import GetMcpPluginExc, RunMcpPluginExc
+from agent.infra.http_session import http_session_pool
 from agent.service.plugin.base import BasePlugin, PluginResponse
+from agent.service.plugin.cache import invalidate_mcp_server, plugin_schema_cache
 
 
 class McpPlugin(BasePlugin):
@@ -42,7 +44,7 @@ class McpPluginRunner(BaseModel):
                 run_url = os.getenv("RUN_MCP_PLUGIN_URL")
                 if not run_url:
                     raise RunMcpPluginExc("RUN_MCP_PLUGIN_URL is not set")
-                async with aiohttp.ClientSession() as session:
+                async with http_session_pool.acquire() as session:
                     timeout = aiohttp.ClientTimeout(
                         total=int(os.getenv("MCP_CALL_TIMEOUT", "90"))
                     )
@@ -83,6 +85,11 @@ class McpPluginRunner(BaseModel):
                 result=resp,
                 log=[{"name": self.name, "input": action_input, "output": resp}],
             )
+            if plugin_response.code != 0:
+                # The server tools may have changed, reload its tool list next time
+                for server in (self.server_id, self.server_url):
+                    if server:
+                        invalidate_mcp_server(server)
 
             return plugin_response
 
@@ -97,7 +104,7 @@ class McpPluginFactory(BaseModel):
 
     async def build_tools(self, span: Span) -> list[McpPlugin]:
         mcp_plugins: list[McpPlugin] = []
-        servers_list = await self.query_servers(span)
+        servers_list = await self.cached_servers(span)
         for server in servers_list:
             server_status = server.get("server_status")
             server_id = server.get("server_id", "")
@@ -139,12 +146,84 @@ class McpPluginFactory(BaseModel):
                 mcp_plugins.append(mcp_plugin)
         return mcp_plugins
 
-    async def query_servers(self, span: Span) -> list[dict]:
+    async def cached_servers(self, span: Span) -> list[dict]:
+        """Get the tool lists of the servers, querying only uncached servers"""
+        keys = [
+            ("mcp", server) for server in [*self.mcp_server_ids, *self.mcp_server_urls]
+        ]
+        servers: dict[tuple, dict] = {}
+        missing: list[tuple] = []
+        stale: list[tuple] = []
+        for key in keys:
+            server, fresh = plugin_schema_cache.lookup(key)
+            if server is None:
+                missing.append(key)
+                continue
+            servers[key] = server
+            if not fresh:
+                stale.append(key)
+
+        if missing:
+            loaded = await self.load_servers(missing, span)
+            for key, server in loaded.items():
+                servers[key] = server
+                # Failed servers are queried again by the next request
+                if server.get("server_status") == 0:
+                    plugin_schema_cache.put(key, server)
+        if stale:
+            plugin_schema_cache.refresh(
+                stale, lambda keys: self.refresh_servers(keys, span)
+            )
+        span.add_info_events(
+            attributes={
+                "mcp-tool-list-cache": json.dumps(
+                    {
+                        "hit": len(keys) - len(missing) - len(stale),
+                        "stale": len(stale),
+                        "miss": len(missing),
+                    }
+                )
+            }
+        )
+        return list(servers.values())
+
+    async def load_servers(self, keys: list[tuple], span: Span) -> dict[tuple, dict]:
+        """Query the tool lists of the given servers, keyed by server id or url"""
+        server_ids = [key[1] for key in keys if key[1] in self.mcp_server_ids]
+        server_urls = [key[1] for key in keys if key[1] not in server_ids]
+        loaded: dict[tuple, dict] = {}
+        for server in await self.query_servers(span, server_ids, server_urls):
+            server_id = server.get("server_id", "")
+            server_key = (
+                server_id if server_id in server_ids else server.get("server_url", "")
+            )
+            loaded[("mcp", server_key)] = server
+        return loaded
+
+    async def refresh_servers(self, keys: list[tuple], span: Span) -> dict[tuple, dict]:
+        """Reload the tool lists of the given servers, failed servers keep their stale value"""
+        loaded = await self.load_servers(keys, span)
+        return {
+            key: server
+            for key, server in loaded.items()
+            if server.get("server_status") == 0
+        }
+
+    async def query_servers(
+        self,
+        span: Span,
+        mcp_server_ids: Optional[list] = None,
+        mcp_server_urls: Optional[list] = None,
+    ) -> list[dict]:
         with span.start("QueryServers") as sp:
             data = {
                 "sid": sp.sid,
-                "mcp_server_ids": self.mcp_server_ids,
-                "mcp_server_urls": self.mcp_server_urls,
+                "mcp_server_ids": (
+                    self.mcp_server_ids if mcp_server_ids is None else mcp_server_ids
+                ),
+                "mcp_server_urls": (
+                    self.mcp_server_urls if mcp_server_urls is None else mcp_server_urls
+                ),
             }
             sp.add_info_events(
                 attributes={
@@ -155,7 +234,7 @@ class McpPluginFactory(BaseModel):
                 list_url = os.getenv("LIST_MCP_PLUGIN_URL")
                 if not list_url:
                     raise GetMcpPluginExc("LIST_MCP_PLUGIN_URL is not set")
-                async with aiohttp.ClientSession() as session:
+                async with http_session_pool.acquire() as session:
                     timeout = aiohttp.ClientTimeout(total=40)
                     async with session.post(
                         list_url,
@@ -5,13 +5,13 @@ import time
 from dataclasses import dataclass
 from typing import Any, AsyncIterator
 
-import aiohttp
 import httpx
 from common.otlp.trace.span import Span
 from openai import AsyncOpenAI
 from pydantic import BaseModel, Field
 
 from agent.exceptions.plugin_exc import RunWorkflowExc
+from agent.infra.http_session import http_session_pool
 from agent.service.plugin.base import BasePlugin, PluginResponse
 
 
@@ -193,7 +193,7 @@ class WorkflowPluginFactory(BaseModel):
                     )
                 }
             )
-            async with aiohttp.ClientSession() as session:
+            async with http_session_pool.acquire() as session:
                 async with session.post(
                     agent_config.GET_WORKFLOWS_URL, json={"flow_id": workflow_id}
                 ) as response:
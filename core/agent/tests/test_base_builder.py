@@ -1,5 +1,6 @@
 """Test BaseApiBuilder class"""
 
+import asyncio
 import os
 from dataclasses import dataclass
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -13,9 +14,11 @@ from agent.domain.models.base import AnthropicLLMModel, BaseLLMModel, GoogleLLMM
 from agent.engine.nodes.chat.chat_runner import ChatRunner
 from agent.engine.nodes.cot.cot_runner import CotRunner
 from agent.engine.nodes.cot_process.cot_process_runner import CotProcessRunner
+from agent.exceptions.agent_exc import AgentExc
 from agent.infra.app_auth import MaasAuth
 from agent.service.builder.base_builder import (
     BaseApiBuilder,
+    BuildPhase,
     CotRunnerParams,
     RunnerParams,
 )
@@ -138,6 +141,100 @@ class TestBaseApiBuilder:
             assert "" not in mcp_urls
             assert "  " not in mcp_urls
 
+    @pytest.mark.asyncio
+    async def test_build_plugins_concurrently_in_order(
+        self, builder: BaseApiBuilder
+    ) -> None:
+        """Test that plugin sources are resolved concurrently, keeping their order"""
+        started: list[str] = []
+        release = asyncio.Event()
+
+        def gen_of(typ: str) -> AsyncMock:
+            async def gen(_sp: Span) -> list:
+                started.append(typ)
+                await release.wait()
+                plugin = MagicMock(spec=BasePlugin)
+                plugin.typ = typ
+                plugin.schema_template = f"{typ} schema"
+                return [plugin]
+
+            return AsyncMock(side_effect=gen)
+
+        with patch(
+            "agent.service.builder.base_builder.LinkPluginFactory"
+        ) as link_factory, patch(
+            "agent.service.builder.base_builder.McpPluginFactory"
+        ) as mcp_factory, patch(
+            "agent.service.builder.base_builder.WorkflowPluginFactory"
+        ) as workflow_factory:
+            workflow_factory.return_value.gen = gen_of("workflow")
+            mcp_factory.return_value.gen = gen_of("mcp")
+            link_factory.return_value.gen = gen_of("link")
+
+            task = asyncio.create_task(
+                builder.build_plugins(["tool1"], ["mcp1"], [], ["flow1"])
+            )
+            while len(started) < 3:
+                await asyncio.sleep(0.01)
+            release.set()
+            plugins = await task
+
+        assert [plugin.typ for plugin in plugins] == ["link", "mcp", "workflow"]
+
+    @pytest.mark.asyncio
+    async def test_run_phases_degrades_optional_phases(
+        self, builder: BaseApiBuilder, span: Span
+    ) -> None:
+        """Test that failed or late optional phases fall back to their default"""
+
+        async def value() -> str:
+            return "value"
+
+        async def fail() -> str:
+            raise RuntimeError("unavailable")
+
+        async def late() -> str:
+            await asyncio.sleep(10)
+            return "late"
+
+        results = await builder.run_phases(
+            [
+                BuildPhase("required", value()),
+                BuildPhase("failed", fail(), optional=True, default="none"),
+                BuildPhase("late", late(), optional=True, default="none"),
+            ],
+            span,
+            timeout=0.1,
+        )
+
+        assert results == {"required": "value", "failed": "none", "late": "none"}
+
+    @pytest.mark.asyncio
+    async def test_run_phases_fails_on_required_phase(
+        self, builder: BaseApiBuilder, span: Span
+    ) -> None:
+        """Test that a failed required phase fails at once and a late one times out"""
+        cancelled = asyncio.Event()
+
+        async def fail() -> None:
+            raise RuntimeError("model unavailable")
+
+        async def slow() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(RuntimeError, match="model unavailable"):
+            await builder.run_phases(
+                [BuildPhase("model", fail()), BuildPhase("plugins", slow())], span
+            )
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+        with pytest.raises(AgentExc, match="plugins timed out"):
+            await builder.run_phases([BuildPhase("plugins", slow())], span, 0.05)
+
     @pytest.mark.asyncio
     async def test_build_chat_runner(self, builder: BaseApiBuilder) -> None:
         """Test building ChatRunner"""
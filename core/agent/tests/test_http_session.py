@@ -0,0 +1,105 @@
+"""Test HttpSessionPool class"""
+
+import asyncio
+from typing import AsyncIterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from aiohttp import ClientSession, web
+from common.otlp.metrics import metric
+
+from agent.infra.http_session import POOL_EVENT_COUNTER, HttpSessionPool
+
+
+@pytest_asyncio.fixture
+async def server_url() -> AsyncIterator[str]:
+    """Start a local HTTP server answering every request"""
+
+    async def handle(_request: web.Request) -> web.Response:
+        return web.json_response({"code": 0})
+
+    app = web.Application()
+    app.router.add_route("*", "/", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    yield f"http://127.0.0.1:{port}/"
+    await runner.cleanup()
+
+
+class TestHttpSessionPool:
+    """Test HttpSessionPool class"""
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused(self, server_url: str) -> None:
+        """Test that consecutive requests share the session and its connection"""
+        pool = HttpSessionPool(limit=4, limit_per_host=2)
+        events: list[tuple[str, str]] = []
+        pool.report = lambda event, host, _connector: events.append(  # type: ignore
+            (event, host)
+        )
+
+        for _ in range(3):
+            async with pool.acquire() as session:
+                async with session.get(server_url) as response:
+                    assert await response.json() == {"code": 0}
+        shared = pool.session()
+        await pool.close()
+
+        assert session is shared
+        assert shared.closed
+        assert events == [
+            ("create", "127.0.0.1"),
+            ("reuse", "127.0.0.1"),
+            ("reuse", "127.0.0.1"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_session_per_event_loop(self) -> None:
+        """Test that another event loop gets its own session"""
+        pool = HttpSessionPool()
+        session = pool.session()
+
+        other = await asyncio.to_thread(lambda: asyncio.run(_open(pool)))
+
+        assert other is not session
+        assert pool.session() is session
+        await pool.close()
+        assert other.closed and session.closed
+
+    def test_utilization(self) -> None:
+        """Test bucketing of the connections in use"""
+        connector = MagicMock(limit=10, _acquired=set(range(6)))
+
+        assert HttpSessionPool.utilization(connector) == "50-80"
+        connector._acquired = set(range(10))
+        assert HttpSessionPool.utilization(connector) == "80-100"
+        assert HttpSessionPool.utilization(MagicMock(limit=0)) == "unlimited"
+
+    def test_report_uses_pool_counter(self) -> None:
+        """Test that pool events go to their own counter, not the request one"""
+        meter = MagicMock()
+        with patch.object(metric, "meter", meter), patch.dict(
+            metric.named_counters, clear=True
+        ):
+            HttpSessionPool().report("reuse", "h", MagicMock(limit=0))
+            HttpSessionPool().report("create", "h", MagicMock(limit=0))
+
+        meter.create_counter.assert_called_once()
+        assert meter.create_counter.call_args.args == (POOL_EVENT_COUNTER,)
+        meter.create_counter.return_value.add.assert_called_with(
+            1,
+            {"pool_event": "create", "pool_host": "h", "pool_utilization": "unlimited"},
+        )
+
+    def test_report_without_meter_is_ignored(self) -> None:
+        """Test that reporting before metrics are initialized does nothing"""
+        with patch.object(metric, "meter", None):
+            HttpSessionPool().report("reuse", "h", None)
+
+
+async def _open(pool: HttpSessionPool) -> ClientSession:
+    return pool.session()
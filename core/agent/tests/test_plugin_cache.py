@@ -0,0 +1,278 @@
+"""Test the plugin schema cache and its use by the Link and MCP factories"""
+
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterator
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from common.otlp import sid as sid_module
+from common.otlp.trace.span import Span
+
+from agent.service.plugin import cache as cache_module
+from agent.service.plugin.cache import (
+    PluginSchemaCache,
+    invalidate_link_tool,
+    invalidate_mcp_server,
+)
+from agent.service.plugin.link import LinkPluginFactory, LinkPluginRunner
+from agent.service.plugin.mcp import McpPluginFactory, McpPluginRunner
+
+
+@dataclass
+class _DummySidGen:
+    """Simple sid generator for testing environment."""
+
+    value: str = "test-sid"
+
+    def gen(self) -> str:  # pragma: no cover - only for testing environment
+        return self.value
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch: pytest.MonkeyPatch) -> Iterator[PluginSchemaCache]:
+    """Use an empty cache and initialize the sid generator"""
+    if sid_module.sid_generator2 is None:
+        sid_module.sid_generator2 = _DummySidGen()  # type: ignore[assignment]
+    schema_cache = PluginSchemaCache(ttl=60, stale_ttl=600)
+    for module in ("cache", "link", "mcp"):
+        monkeypatch.setattr(
+            f"agent.service.plugin.{module}.plugin_schema_cache", schema_cache
+        )
+    yield schema_cache
+
+
+@pytest.fixture
+def span() -> Span:
+    return Span(app_id="app", uid="u")
+
+
+@pytest_asyncio.fixture
+async def run_url() -> AsyncIterator[str]:
+    """Start a local plugin run service failing every call"""
+
+    async def handle(_request: web.Request) -> web.Response:
+        return web.json_response({"code": 1, "header": {"code": 1}})
+
+    app = web.Application()
+    app.router.add_post("/", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    yield f"http://127.0.0.1:{port}/"
+    await runner.cleanup()
+
+
+def _age(schema_cache: PluginSchemaCache, key: Any, seconds: float) -> None:
+    schema_cache._entries[key].stored_at -= seconds
+
+
+def _tool_schema(tool_id: str, version: str, operation_id: str) -> dict[str, Any]:
+    openapi = {
+        "paths": {
+            "/run": {"post": {"operationId": operation_id, "description": operation_id}}
+        }
+    }
+    return {"id": tool_id, "version": version, "schema": json.dumps(openapi)}
+
+
+class TestPluginSchemaCache:
+    """Test TTL and stale-while-revalidate behavior"""
+
+    def test_lookup_fresh_stale_expired(self, cache: PluginSchemaCache) -> None:
+        cache.put(("k",), 1)
+        assert cache.lookup(("k",)) == (1, True)
+        _age(cache, ("k",), 120)
+        assert cache.lookup(("k",)) == (1, False)
+        _age(cache, ("k",), 600)
+        assert cache.lookup(("k",)) == (None, False)
+        assert ("k",) not in cache._entries
+
+    def test_least_recently_used_entries_are_dropped(self) -> None:
+        cache = PluginSchemaCache(ttl=60, stale_ttl=600, max_entries=2)
+        cache.put(("a",), 1)
+        cache.put(("b",), 2)
+        cache.lookup(("a",))
+        cache.put(("c",), 3)
+
+        assert list(cache._entries) == [("a",), ("c",)]
+
+    @pytest.mark.asyncio
+    async def test_refresh_keeps_stale_value_on_failure(
+        self, cache: PluginSchemaCache
+    ) -> None:
+        cache.put(("k",), 1)
+
+        async def fail(_keys: list) -> dict:
+            raise RuntimeError("down")
+
+        task = cache.refresh([("k",)], fail)
+        assert cache.refresh([("k",)], fail) is None
+        await task  # type: ignore[misc]
+        assert cache.lookup(("k",)) == (1, True)
+
+        async def load(keys: list) -> dict:
+            return {key: 2 for key in keys}
+
+        await cache.refresh([("k",)], load)  # type: ignore[misc]
+        assert cache.lookup(("k",)) == (2, True)
+
+    def test_invalidation_hooks(self, cache: PluginSchemaCache) -> None:
+        cache.put(("link", "app", "t1", "V1.0"), [])
+        cache.put(("link", "app", "t1", "V2.0"), [])
+        cache.put(("link", "app", "t2", "V1.0"), [])
+        cache.put(("mcp", "s1"), {})
+
+        assert invalidate_link_tool("t1", "V2.0") == 1
+        assert invalidate_link_tool("t1") == 1
+        assert invalidate_mcp_server("s1") == 1
+        assert list(cache._entries) == [("link", "app", "t2", "V1.0")]
+        assert cache_module.plugin_schema_cache is cache
+
+
+class TestLinkPluginFactoryCache:
+    """Test that Link schemas are fetched once per tool and version"""
+
+    @pytest.mark.asyncio
+    async def test_gen_queries_only_missing_tools(
+        self, cache: PluginSchemaCache, span: Span, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        requests: list[list] = []
+
+        async def tool_schema_list(
+            _self: LinkPluginFactory, _span: Span, tool_ids: list
+        ) -> list[dict[str, Any]]:
+            requests.append(tool_ids)
+            return [
+                _tool_schema(t["tool_id"], t["version"], f"op_{t['tool_id']}")
+                for t in tool_ids
+            ]
+
+        monkeypatch.setattr(LinkPluginFactory, "tool_schema_list", tool_schema_list)
+
+        first = await LinkPluginFactory(app_id="app", uid="u", tool_ids=["t1"]).gen(
+            span
+        )
+        plugins = await LinkPluginFactory(
+            app_id="app",
+            uid="u2",
+            tool_ids=["t1", {"tool_id": "t2", "version": "V2.0"}],
+        ).gen(span)
+
+        assert [p.name for p in first] == ["op_t1"]
+        assert [p.name for p in plugins] == ["op_t1", "op_t2"]
+        assert requests == [
+            [{"tool_id": "t1", "version": "V1.0"}],
+            [{"tool_id": "t2", "version": "V2.0"}],
+        ]
+        # Runners are bound to the calling user, not to the cached entry
+        assert plugins[0].run.__self__.uid == "u2"  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_gen_serves_stale_schemas_while_refreshing(
+        self, cache: PluginSchemaCache, span: Span, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        operation_ids = iter(["old", "new"])
+
+        async def tool_schema_list(
+            _self: LinkPluginFactory, _span: Span, tool_ids: list
+        ) -> list[dict[str, Any]]:
+            return [_tool_schema("t1", "V1.0", next(operation_ids))]
+
+        monkeypatch.setattr(LinkPluginFactory, "tool_schema_list", tool_schema_list)
+        factory = LinkPluginFactory(app_id="app", uid="u", tool_ids=["t1"])
+
+        await factory.gen(span)
+        _age(cache, ("link", "app", "t1", "V1.0"), 120)
+        stale = await factory.gen(span)
+        await asyncio.sleep(0.01)
+        refreshed = await factory.gen(span)
+
+        assert [p.name for p in stale] == ["old"]
+        assert [p.name for p in refreshed] == ["new"]
+
+
+class TestMcpPluginFactoryCache:
+    """Test that MCP tool lists are cached per server"""
+
+    @pytest.mark.asyncio
+    async def test_failed_servers_are_not_cached(
+        self, span: Span, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        requests: list[tuple] = []
+
+        async def query_servers(
+            _self: McpPluginFactory, _span: Span, server_ids: list, server_urls: list
+        ) -> list[dict]:
+            requests.append((server_ids, server_urls))
+            servers = [
+                {"server_id": s, "server_status": 0, "tools": [{"name": f"t_{s}"}]}
+                for s in server_ids
+            ]
+            servers += [
+                {"server_url": url, "server_status": 1, "server_message": "down"}
+                for url in server_urls
+            ]
+            return servers
+
+        monkeypatch.setattr(McpPluginFactory, "query_servers", query_servers)
+        factory = McpPluginFactory(
+            app_id="app", mcp_server_ids=["s1"], mcp_server_urls=["http://m"]
+        )
+
+        first = await factory.gen(span)
+        second = await factory.gen(span)
+
+        assert [p.name for p in first] == [p.name for p in second] == ["t_s1"]
+        assert requests == [(["s1"], ["http://m"]), ([], ["http://m"])]
+
+
+class TestRunnerInvalidation:
+    """Test that failed plugin calls drop the cached schemas they were built from"""
+
+    @pytest.mark.asyncio
+    async def test_failed_link_call_invalidates_tool(
+        self,
+        cache: PluginSchemaCache,
+        span: Span,
+        run_url: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setenv("RUN_LINK_URL", run_url)
+        cache.put(("link", "app", "t1", "V1.0"), [])
+        cache.put(("link", "app", "t2", "V1.0"), [])
+        runner = LinkPluginRunner(
+            app_id="app",
+            uid="u",
+            tool_id="t1",
+            version="V1.0",
+            operation_id="op",
+            method_schema={},
+        )
+
+        response = await runner.run({}, span)
+
+        assert response.code == 1
+        assert list(cache._entries) == [("link", "app", "t2", "V1.0")]
+
+    @pytest.mark.asyncio
+    async def test_failed_mcp_call_invalidates_server(
+        self,
+        cache: PluginSchemaCache,
+        span: Span,
+        run_url: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setenv("RUN_MCP_PLUGIN_URL", run_url)
+        cache.put(("mcp", "s1"), {})
+        cache.put(("mcp", "s2"), {})
+        runner = McpPluginRunner(server_id="s1", server_url="", sid="", name="t")
+
+        response = await runner.run({}, span)
+
+        assert response.code == 1
+        assert list(cache._entries) == [("mcp", "s2")]
@@ -1,5 +1,7 @@
 """Test engine.nodes.base / chat_runner / cot_runner / cot_process_runner"""
 
+import asyncio
+import time
 from dataclasses import dataclass
 from typing import Any, AsyncIterator, Optional
 from unittest.mock import AsyncMock, MagicMock
@@ -17,7 +19,7 @@ from agent.engine.nodes.chat.chat_runner import ChatRunner
 from agent.engine.nodes.cot.cot_runner import CotRunner
 from agent.engine.nodes.cot_process.cot_process_runner import CotProcessRunner
 from agent.exceptions import cot_exc
-from agent.service.plugin.base import BasePlugin
+from agent.service.plugin.base import BasePlugin, PluginResponse
 
 
 @dataclass
@@ -250,6 +252,39 @@ class TestCotRunnerParseStep:
         with pytest.raises(cot_exc.CotFormatIncorrectExc):
             await cot_runner.parse_cot_step("no action here")
 
+    @pytest.mark.asyncio
+    async def test_parse_cot_steps_multiple_actions(
+        self, cot_runner: CotRunner
+    ) -> None:
+        content = (
+            "Thought: think\n"
+            "Action: tool1\n"
+            'Action Input: {"x": 1}\n'
+            "Action: tool1\n"
+            'Action Input: {"x": 2}\n'
+            "Observation:"
+        )
+        steps = await cot_runner.parse_cot_steps(content)
+        assert [(s.action, s.action_input, s.action_index) for s in steps] == [
+            ("tool1", {"x": 1}, 0),
+            ("tool1", {"x": 2}, 1),
+        ]
+        assert all(s.thought == "think" for s in steps)
+
+    @pytest.mark.asyncio
+    async def test_parse_cot_steps_invalid_second_action(
+        self, cot_runner: CotRunner
+    ) -> None:
+        content = (
+            "Thought: think\n"
+            "Action: tool1\n"
+            'Action Input: {"x": 1}\n'
+            "Action: unknown\n"
+            'Action Input: {"x": 2}\n'
+        )
+        with pytest.raises(cot_exc.CotFormatIncorrectExc):
+            await cot_runner.parse_cot_steps(content)
+
     @pytest.mark.asyncio
     async def test_is_valid_plugin(self, cot_runner: CotRunner) -> None:
         assert await cot_runner.is_valid_plugin("tool1") is True
@@ -264,6 +299,79 @@ class TestCotRunnerParseStep:
         assert await cot_runner.get_plugin(step2) is None
 
 
+class TestCotRunnerParallelActions:
+    """Test concurrent execution of the actions of one cot step"""
+
+    @staticmethod
+    def _plugin(name: str, delay: float) -> DummyPlugin:
+        async def run(action_input: dict, span: Span) -> PluginResponse:
+            await asyncio.sleep(delay)
+            return PluginResponse(result={"name": name, **action_input})
+
+        return DummyPlugin(
+            name=name, description="", schema_template="", typ="tool", run=run
+        )
+
+    @pytest.fixture
+    def cot_runner(self) -> CotRunner:
+        model = DummyLLM.model_construct(name="m", llm=MagicMock())
+        process_runner = CotProcessRunner(
+            model=model, chat_history=[], instruct="", knowledge="", question="q"
+        )
+        return CotRunner(
+            model=model,
+            plugins=[self._plugin("slow", 0.2), self._plugin("fast", 0.01)],
+            chat_history=[],
+            question="q",
+            process_runner=process_runner,
+            plugin_timeout=1,
+        )
+
+    @pytest.mark.asyncio
+    async def test_actions_run_concurrently_in_order(
+        self, cot_runner: CotRunner, span: Span
+    ) -> None:
+        steps = [
+            CotStep(thought="t", action="slow", action_input={"i": 0}),
+            CotStep(action="fast", action_input={"i": 1}, action_index=1),
+            CotStep(action="slow", action_input={"i": 2}, action_index=2),
+        ]
+
+        start = time.perf_counter()
+        responses = [r async for r in cot_runner._handle_cot_steps(steps, span)]
+        cost = time.perf_counter() - start
+
+        assert cost < 0.35
+        assert [r.content.action_output for r in responses] == [
+            {"name": "slow", "i": 0},
+            {"name": "fast", "i": 1},
+            {"name": "slow", "i": 2},
+        ]
+        # Calls of the same plugin keep their own result
+        assert steps[0].plugin.run_result.result == {"name": "slow", "i": 0}
+        assert steps[2].plugin.run_result.result == {"name": "slow", "i": 2}
+
+        cot_runner.scratchpad.steps.extend(steps)
+        tpl = await cot_runner.scratchpad.template()
+        assert tpl.count("Thought:") == 1
+        assert tpl.count("Observation:") == 3
+
+    @pytest.mark.asyncio
+    async def test_action_timeout_becomes_observation(
+        self, cot_runner: CotRunner, span: Span
+    ) -> None:
+        cot_runner.plugin_timeout = 0.05
+        steps = [
+            CotStep(action="slow", action_input={}),
+            CotStep(action="fast", action_input={}, action_index=1),
+        ]
+
+        responses = [r async for r in cot_runner._handle_cot_steps(steps, span)]
+
+        assert responses[0].content.action_output["code"] == 408
+        assert responses[1].content.action_output == {"name": "fast"}
+
+
 class TestCotProcessRunner:
     """Simple test to verify CotProcessRunner's run logic calls underlying stream"""
 
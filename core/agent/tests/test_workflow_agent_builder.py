@@ -131,6 +131,38 @@ class TestWorkflowAgentRunnerBuilder:
                                 assert runner.chat_runner == mock_chat_runner
                                 assert runner.cot_runner == mock_cot_runner
 
+    @pytest.mark.asyncio
+    async def test_build_degrades_failed_knowledge(
+        self, builder: WorkflowAgentRunnerBuilder
+    ) -> None:
+        """Test building without knowledge when the knowledge query fails"""
+        from agent.engine.nodes.chat.chat_runner import ChatRunner
+        from agent.engine.nodes.cot.cot_runner import CotRunner
+
+        with patch.object(
+            WorkflowAgentRunnerBuilder, "create_model", return_value=MagicMock()
+        ), patch.object(
+            WorkflowAgentRunnerBuilder, "build_plugins", return_value=[]
+        ), patch.object(
+            WorkflowAgentRunnerBuilder,
+            "query_knowledge_by_workflow",
+            side_effect=RuntimeError("knowledge unavailable"),
+        ), patch.object(
+            WorkflowAgentRunnerBuilder,
+            "build_chat_runner",
+            return_value=MagicMock(spec=ChatRunner),
+        ) as build_chat_runner, patch.object(
+            WorkflowAgentRunnerBuilder, "build_process_runner"
+        ), patch.object(
+            WorkflowAgentRunnerBuilder,
+            "build_cot_runner",
+            return_value=MagicMock(spec=CotRunner),
+        ):
+            runner = await builder.build()
+
+        assert runner.knowledge_metadata_list == []
+        assert build_chat_runner.call_args[0][0].knowledge == ""
+
     @pytest.mark.asyncio
     async def test_query_knowledge_by_workflow_empty(
         self, builder: WorkflowAgentRunnerBuilder, span: Span
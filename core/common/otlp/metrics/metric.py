@@ -1,8 +1,9 @@
 import os
+from typing import Dict, Optional
 
 from loguru import logger
 from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
-from opentelemetry.metrics import get_meter_provider, set_meter_provider
+from opentelemetry.metrics import Counter, get_meter_provider, set_meter_provider
 from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.resources import SERVICE_NAME, Resource
@@ -17,6 +18,7 @@ from common.otlp.metrics.consts import (
 counter = None
 histogram = None
 meter = None
+named_counters: Dict[str, Counter] = {}
 
 
 def init_metric(
@@ -37,6 +39,7 @@ def init_metric(
     """
 
     global counter, histogram, meter
+    named_counters.clear()
 
     enable_metrics = os.getenv("OTLP_ENABLE", "true").lower() in (
         "true",
@@ -80,3 +83,20 @@ def init_metric(
         SERVER_REQUEST_TIME_MICROSECONDS, description=SERVER_REQUEST_TIME_DESC
     )
     logger.debug("metric init success")
+
+
+def get_counter(name: str, description: str = "") -> Optional[Counter]:
+    """
+    获取独立的计数器，不计入服务入口错误数
+    :param name:            计数器名称
+    :param description:     计数器描述
+    :return:                计数器，metric未初始化时返回None
+    """
+    if meter is None:
+        return None
+    instrument = named_counters.get(name)
+    if instrument is None:
+        instrument = named_counters[name] = meter.create_counter(
+            name, description=description
+        )
+    return instrument
@@ -2,7 +2,10 @@ import os
 from typing import Optional
 
 from common.service.base import ServiceFactory
-from common.service.kafka.kafka_service import KafkaProducerService
+from common.service.kafka.kafka_service import (
+    AsyncKafkaProducerService,
+    KafkaProducerService,
+)
 
 
 class KafkaProducerServiceFactory(ServiceFactory):
@@ -12,6 +15,10 @@ class KafkaProducerServiceFactory(ServiceFactory):
     def create(self, servers: Optional[str] = None, **kwargs: dict) -> KafkaProducerService:  # type: ignore[override, no-untyped-def]
         """
         创建 KafkaProducerService 实例
+
+        默认 (KAFKA_ASYNC_ENABLE=true) 返回 AsyncKafkaProducerService, 其 send 只入队
+        不阻塞, 发送失败不再抛出异常, 只记录日志和指标; 设置为 false 时返回同步的
+        KafkaProducerService, send 在发送失败时抛出异常
         :param servers: Kafka bootstrap.servers
         :return: KafkaProducerService 实例
         """
@@ -27,4 +34,17 @@ class KafkaProducerServiceFactory(ServiceFactory):
             raise ValueError("KAFKA_SERVERS 环境变量未配置")
 
         config = {"bootstrap.servers": servers, **kwargs}
+        if os.getenv("KAFKA_ASYNC_ENABLE", "true").lower() in (
+            "true",
+            "1",
+            "yes",
+            "on",
+        ):
+            return AsyncKafkaProducerService(
+                config,
+                queue_max_size=int(os.getenv("KAFKA_QUEUE_MAX_SIZE", "10000")),
+                batch_size=int(os.getenv("KAFKA_BATCH_SIZE", "500")),
+                linger_ms=int(os.getenv("KAFKA_LINGER_MS", "50")),
+                drain_timeout=int(os.getenv("KAFKA_DRAIN_TIMEOUT", "10")),
+            )
         return KafkaProducerService(config)
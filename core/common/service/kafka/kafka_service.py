@@ -1,9 +1,16 @@
+import asyncio
+import atexit
 import os
-from typing import Any, Optional
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 from confluent_kafka import Producer  # type: ignore[import-untyped]
 from loguru import logger
+from opentelemetry.metrics import CallbackOptions, Observation
 
+from common.otlp.metrics import metric
 from common.service.base import Service, ServiceType
 
 
@@ -65,3 +72,289 @@ class KafkaProducerService(Service):
             logger.info(
                 "Message delivered to {} [{}]".format(msg.topic(), msg.partition())
             )
+
+
+# 队列中的待发送消息: (topic, value, callback)
+KafkaMessage = Tuple[str, str, Optional[Any]]
+
+KAFKA_PRODUCER_COUNTER = "kafka_producer_messages_total"
+KAFKA_QUEUE_DEPTH_GAUGE = "kafka_producer_queue_depth"
+
+
+class AsyncKafkaProducerService(KafkaProducerService):
+    """
+    非阻塞的批量 Kafka 生产者服务
+
+    send 只将消息放入有界内存队列, 由后台线程按 batch_size / linger_ms 批量
+    produce 并 poll, 请求处理路径上不再同步等待 Kafka。队列满时丢弃消息并计数,
+    send_async 则在超时时间内等待队列空位 (背压) 后再丢弃。
+    后台使用线程而非事件循环任务, 因为调用方既有协程也有工作线程。
+
+    与 KafkaProducerService 不同, send 不会因发送或投递失败抛出异常: 失败只记录
+    日志, 并计入 stats() 及 kafka_producer_messages_total 指标 (outcome 标签为
+    sent / failed / dropped / backpressure), 队列深度上报为
+    kafka_producer_queue_depth 指标。需要在调用方感知失败时, 设置
+    KAFKA_ASYNC_ENABLE=false 使用同步生产者。
+    """
+
+    def __init__(
+        self,
+        config: dict,
+        queue_max_size: int = 10000,
+        batch_size: int = 500,
+        linger_ms: int = 50,
+        drain_timeout: int = 10,
+    ):
+        """
+        :param config: Kafka 配置
+        :param queue_max_size: 内存队列最大长度
+        :param batch_size: 每批最多发送的消息数
+        :param linger_ms: 凑批的最长等待时间 (毫秒)
+        :param drain_timeout: 关闭时等待剩余消息投递的时间 (秒)
+        """
+        super().__init__(config)
+        self.batch_size = batch_size
+        self.linger = linger_ms / 1000
+        self.drain_timeout = drain_timeout
+        self.queue: "queue.Queue[KafkaMessage]" = queue.Queue(maxsize=queue_max_size)
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._counts = {"sent": 0, "failed": 0, "dropped": 0, "backpressure": 0}
+        self._queue_gauge_meter: Optional[Any] = None
+
+    @staticmethod
+    def _enabled() -> bool:
+        """
+        是否启用 Kafka
+        :return: KAFKA_ENABLE 是否开启
+        """
+        return os.getenv("KAFKA_ENABLE", "false").lower() in (
+            "true",
+            "1",
+            "yes",
+            "on",
+        )
+
+    def send(
+        self,
+        topic: str,
+        value: str,
+        callback: Optional[Any] = None,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        将消息放入发送队列, 不阻塞调用方, 也不会因发送失败抛出异常
+        :param topic: Kafka topic
+        :param value: 消息内容（已序列化的 JSON 字符串）
+        :param callback: 回调函数
+        :param timeout: 兼容参数, 不再等待 poll
+        """
+        if not self._enabled() or self._stop_event.is_set():
+            return
+        self._start()
+        try:
+            self.queue.put_nowait((topic, value, callback))
+        except queue.Full:
+            self._drop(topic)
+
+    async def send_async(
+        self,
+        topic: str,
+        value: str,
+        callback: Optional[Any] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        将消息放入发送队列, 队列满时在超时时间内等待空位
+        :param topic: Kafka topic
+        :param value: 消息内容（已序列化的 JSON 字符串）
+        :param callback: 回调函数
+        :param timeout: 等待队列空位的最长时间 (秒), 默认 KAFKA_TIMEOUT
+        :return: 消息是否入队
+        """
+        if not self._enabled() or self._stop_event.is_set():
+            return False
+        self._start()
+        message = (topic, value, callback)
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except queue.Full:
+            self._count("backpressure", topic)
+
+        if timeout is None:
+            timeout = int(os.getenv("KAFKA_TIMEOUT", 10))
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(min(self.linger or 0.01, 0.1))
+            try:
+                self.queue.put_nowait(message)
+                return True
+            except queue.Full:
+                continue
+        self._drop(topic)
+        return False
+
+    def _count(self, outcome: str, topic: str) -> int:
+        """
+        记录一条消息的发送结果, 并上报到 kafka_producer_messages_total 指标
+        :param outcome: sent, failed, dropped 或 backpressure
+        :param topic: Kafka topic
+        :return: 该结果的累计次数
+        """
+        with self._lock:
+            self._counts[outcome] += 1
+            total = self._counts[outcome]
+        try:
+            producer_counter = metric.get_counter(
+                KAFKA_PRODUCER_COUNTER, "Kafka producer messages by outcome"
+            )
+            if producer_counter is not None:
+                producer_counter.add(1, {"topic": topic, "outcome": outcome})
+        except Exception as e:
+            logger.warning(f"Failed to report kafka producer metric: {e}")
+        return total
+
+    def _drop(self, topic: str) -> None:
+        """
+        记录一条被丢弃的消息
+        :param topic: Kafka topic
+        """
+        dropped = self._count("dropped", topic)
+        # 避免队列持续满时刷屏
+        if dropped == 1 or dropped % 1000 == 0:
+            logger.warning(f"Kafka send queue full, {dropped} messages dropped")
+
+    def _observe_queue_depth(self, options: CallbackOptions) -> List[Observation]:
+        """
+        上报队列深度的回调
+        :param options: 采集参数
+        :return: 当前队列深度
+        """
+        return [Observation(self.queue.qsize())]
+
+    def _register_queue_gauge(self) -> None:
+        """
+        在 metric 初始化后的 meter 上注册队列深度指标, 每个 meter 只注册一次
+        """
+        meter = metric.meter
+        if meter is None or meter is self._queue_gauge_meter:
+            return
+        with self._lock:
+            if meter is self._queue_gauge_meter:
+                return
+            self._queue_gauge_meter = meter
+        try:
+            meter.create_observable_gauge(
+                KAFKA_QUEUE_DEPTH_GAUGE,
+                callbacks=[self._observe_queue_depth],
+                description="Messages waiting in the Kafka producer queue",
+            )
+        except Exception as e:
+            logger.warning(f"Failed to register kafka queue depth metric: {e}")
+
+    def _start(self) -> None:
+        """
+        启动后台发送线程, 并注册队列深度指标
+        """
+        self._register_queue_gauge()
+        if self._flush_thread is not None or self._stop_event.is_set():
+            return
+        with self._lock:
+            if self._flush_thread is None:
+                self._flush_thread = threading.Thread(
+                    target=self._flush_loop, name="kafka-producer", daemon=True
+                )
+                self._flush_thread.start()
+                # 进程退出时发送完剩余消息
+                atexit.register(self.teardown)
+
+    def _next_batch(self) -> List[KafkaMessage]:
+        """
+        从队列中取出一批消息
+        :return: 最多 batch_size 条消息, 停止且队列为空时返回空列表
+        """
+        batch: List[KafkaMessage] = []
+        try:
+            batch.append(self.queue.get(timeout=0.1))
+        except queue.Empty:
+            return batch
+        deadline = time.monotonic() + self.linger
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    batch.append(self.queue.get(timeout=remaining))
+                else:
+                    batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _produce_batch(self, batch: List[KafkaMessage]) -> None:
+        """
+        批量写入 producer 并触发投递回调
+        :param batch: 待发送消息
+        """
+        for topic, value, callback in batch:
+            callback = callback or self._delivery_report
+            try:
+                try:
+                    self.producer.produce(topic=topic, value=value, callback=callback)
+                except BufferError:
+                    # librdkafka 本地队列已满, 先等待部分消息投递
+                    self.producer.poll(1)
+                    self.producer.produce(topic=topic, value=value, callback=callback)
+                self._count("sent", topic)
+            except Exception as e:
+                self._count("failed", topic)
+                logger.error(f"Kafka message send failed: {e}")
+        self.producer.poll(0)
+
+    def _flush_loop(self) -> None:
+        """
+        后台发送循环, 停止后发送完队列中剩余的消息
+        任何异常都只记录日志, 避免后台线程退出后消息只进不出
+        """
+        while not self._stop_event.is_set() or not self.queue.empty():
+            try:
+                batch = self._next_batch()
+                if batch:
+                    self._produce_batch(batch)
+                else:
+                    self.producer.poll(0)
+            except Exception as e:
+                logger.error(f"Kafka producer flush failed: {e}")
+                # 避免 producer 持续异常时空转
+                time.sleep(0.1)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        获取发送统计
+        :return: 队列深度、已发送、失败、丢弃及背压等待次数
+        """
+        with self._lock:
+            return {"queue_depth": self.queue.qsize(), **self._counts}
+
+    def teardown(self) -> None:
+        """
+        停止后台线程, 发送队列中剩余消息并等待投递完成
+        """
+        if self._stop_event.is_set():
+            return
+        self._stop_event.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join(self.drain_timeout)
+        remaining = self.producer.flush(self.drain_timeout)
+        if remaining or not self.queue.empty():
+            logger.warning(
+                f"Kafka producer closed with {remaining + self.queue.qsize()} "
+                f"undelivered messages"
+            )
+
+    async def stop(self) -> None:
+        """
+        在事件循环中关闭服务, 不阻塞事件循环
+        """
+        await asyncio.to_thread(self.teardown)
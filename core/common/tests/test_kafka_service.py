@@ -0,0 +1,175 @@
+"""
+Tests for the batched Kafka producer service
+"""
+
+import asyncio
+import threading
+from typing import Any, List, Optional
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from common.otlp.metrics import metric
+from common.service.kafka.factory import KafkaProducerServiceFactory
+from common.service.kafka.kafka_service import (
+    KAFKA_PRODUCER_COUNTER,
+    KAFKA_QUEUE_DEPTH_GAUGE,
+    AsyncKafkaProducerService,
+    KafkaProducerService,
+)
+
+
+class FakeProducer:
+    """Producer recording produced messages"""
+
+    def __init__(self, gate: Optional[threading.Event] = None) -> None:
+        self.messages: List[str] = []
+        self.polls = 0
+        self.gate = gate
+
+    def produce(self, topic: str, value: str, callback: Any) -> None:
+        if self.gate:
+            self.gate.wait(5)
+        self.messages.append(value)
+
+    def poll(self, timeout: float) -> int:
+        self.polls += 1
+        return 0
+
+    def flush(self, timeout: float) -> int:
+        return 0
+
+
+def _service(producer: FakeProducer, **kwargs: Any) -> AsyncKafkaProducerService:
+    """Create a service backed by a fake producer"""
+    with patch("common.service.kafka.kafka_service.Producer"):
+        service = AsyncKafkaProducerService({}, **kwargs)
+    service.producer = producer
+    return service
+
+
+@patch.dict("os.environ", {"KAFKA_ENABLE": "true"})
+class TestAsyncKafkaProducerService:
+    """Test AsyncKafkaProducerService"""
+
+    def test_send_is_batched_and_drained_on_teardown(self) -> None:
+        """Test messages are delivered in order and drained on shutdown"""
+        producer = FakeProducer()
+        service = _service(producer, batch_size=10, linger_ms=5)
+
+        for i in range(25):
+            service.send("topic", f"m{i}")
+        service.teardown()
+
+        assert producer.messages == [f"m{i}" for i in range(25)]
+        assert service.stats()["sent"] == 25
+        assert service.stats()["queue_depth"] == 0
+        assert producer.polls < 25
+
+    def test_full_queue_drops_without_blocking(self) -> None:
+        """Test send drops messages instead of blocking when the queue is full"""
+        gate = threading.Event()
+        producer = FakeProducer(gate)
+        service = _service(producer, queue_max_size=2, batch_size=1, linger_ms=0)
+
+        for i in range(10):
+            service.send("topic", f"m{i}")
+        stats = service.stats()
+        gate.set()
+        service.teardown()
+
+        assert stats["dropped"] >= 7
+        assert stats["queue_depth"] <= 2
+        assert len(producer.messages) + stats["dropped"] == 10
+
+    @pytest.mark.asyncio
+    async def test_send_async_waits_for_queue_space(self) -> None:
+        """Test send_async applies backpressure before dropping"""
+        gate = threading.Event()
+        producer = FakeProducer(gate)
+        service = _service(producer, queue_max_size=1, batch_size=1, linger_ms=0)
+
+        service.send("topic", "m0")
+        await asyncio.sleep(0.05)
+        service.send("topic", "m1")
+        asyncio.get_running_loop().call_later(0.05, gate.set)
+        accepted = await service.send_async("topic", "m2", timeout=2)
+        await service.stop()
+
+        assert accepted
+        assert producer.messages == ["m0", "m1", "m2"]
+        assert service.stats()["backpressure"] == 1
+        assert service.stats()["dropped"] == 0
+
+    def test_flush_loop_survives_poll_errors(self) -> None:
+        """Test the flusher logs poll errors and keeps sending"""
+        producer = FakeProducer()
+        failures = [RuntimeError("broker gone")]
+
+        def poll(timeout: float) -> int:
+            if failures:
+                raise failures.pop()
+            return 0
+
+        with patch.object(producer, "poll", side_effect=poll):
+            service = _service(producer, batch_size=1, linger_ms=0)
+            service.send("topic", "m0")
+            service.send("topic", "m1")
+            service.teardown()
+
+        assert not failures
+        assert "m1" in producer.messages
+
+    def test_outcomes_are_exported_to_meter(self) -> None:
+        """Test sent and dropped messages are counted on the producer counter"""
+        meter = MagicMock()
+        gate = threading.Event()
+        producer = FakeProducer(gate)
+        with patch.object(metric, "meter", meter), patch.dict(
+            metric.named_counters, clear=True
+        ):
+            service = _service(producer, queue_max_size=1, batch_size=1, linger_ms=0)
+            for i in range(5):
+                service.send("topic", f"m{i}")
+            gate.set()
+            service.teardown()
+
+        meter.create_observable_gauge.assert_called_once()
+        gauge_call = meter.create_observable_gauge.call_args
+        assert gauge_call.args == (KAFKA_QUEUE_DEPTH_GAUGE,)
+        (observe,) = gauge_call.kwargs["callbacks"]
+        assert [o.value for o in observe(None)] == [0]
+        meter.create_counter.assert_called_once()
+        assert meter.create_counter.call_args.args == (KAFKA_PRODUCER_COUNTER,)
+        outcomes = [
+            call.args[1]["outcome"]
+            for call in meter.create_counter.return_value.add.call_args_list
+        ]
+        stats = service.stats()
+        assert outcomes.count("sent") == stats["sent"] == len(producer.messages)
+        assert outcomes.count("dropped") == stats["dropped"] >= 1
+
+    def test_disabled_kafka_ignores_messages(self) -> None:
+        """Test nothing is queued when Kafka is disabled"""
+        service = _service(FakeProducer())
+        with patch.dict("os.environ", {"KAFKA_ENABLE": "false"}):
+            service.send("topic", "m0")
+
+        assert service.stats()["queue_depth"] == 0
+
+
+class TestKafkaProducerServiceFactory:
+    """Test KafkaProducerServiceFactory"""
+
+    @patch("common.service.kafka.kafka_service.Producer")
+    def test_factory_selects_producer_mode(self, _producer: Any) -> None:
+        """Test the async producer is the default and can be disabled"""
+        factory = KafkaProducerServiceFactory()
+        with patch.dict("os.environ", {"KAFKA_BATCH_SIZE": "7"}):
+            service = factory.create("localhost:9092")
+        with patch.dict("os.environ", {"KAFKA_ASYNC_ENABLE": "false"}):
+            sync_service = factory.create("localhost:9092")
+
+        assert isinstance(service, AsyncKafkaProducerService)
+        assert service.batch_size == 7
+        assert type(sync_service) is KafkaProducerService
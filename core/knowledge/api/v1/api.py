@@ -6,7 +6,8 @@ including document splitting, knowledge chunk saving, updating, deleting, queryi
 """
 
 import json
-from typing import Any, Callable, List, Optional, Tuple, Union, cast
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
 from common.otlp.metrics.meter import Meter
 from common.otlp.trace.span import Span
@@ -25,6 +26,7 @@ from knowledge.domain.entity.chunk_dto import (
     FileSplitReq,
     QueryDocReq,
     RAGType,
+    SplitJobQueryReq,
 )
 from knowledge.domain.response import ErrorResponse, SuccessDataResponse
 from knowledge.exceptions.exception import (
@@ -33,7 +35,9 @@ from knowledge.exceptions.exception import (
     ThirdPartyException,
 )
 from knowledge.service.rag_strategy_factory import RAGStrategyFactory
+from knowledge.service.retrieval_cache import retrieval_cache
 from knowledge.service.rq.rewrite_query import rewrite_query
+from knowledge.service.split_job import split_jobs
 
 rag_router = APIRouter(prefix="/knowledge/v1")
 
@@ -142,6 +146,40 @@ async def handle_rag_operation(
         )
 
 
+async def run_split_job(operation: Callable[..., Any], **operation_kwargs: Any) -> Any:
+    """Run a split operation as a job and wait for its result."""
+    return await split_jobs.run(operation, **operation_kwargs)
+
+
+async def submit_split_job(
+    operation: Callable[..., Any],
+    app_id: str,
+    span: Optional[Span] = None,
+    **operation_kwargs: Any,
+) -> Dict[str, Any]:
+    """Submit a split operation as a background job and return its status."""
+    # Jobs are kept by the worker running them, another worker cannot answer
+    if int(os.getenv("WORKERS", "1")) > 1:
+        raise CustomException(
+            CodeEnum.SplitJobRejected,
+            "Split jobs require a single worker, use /document/split instead",
+        )
+    # The job outlives the request, it must not use the request span
+    return split_jobs.submit(operation, app_id=app_id, **operation_kwargs).to_dict()
+
+
+async def get_split_job(
+    jobId: str, app_id: str, wait: float = 0, span: Optional[Span] = None
+) -> Dict[str, Any]:
+    """Get the status of a split job, waiting up to wait seconds for its end."""
+    job = await split_jobs.wait(jobId, app_id=app_id, timeout=wait)
+    if job is None:
+        raise CustomException(
+            CodeEnum.ParameterInvalid, f"Split job {jobId} not found or expired"
+        )
+    return job.to_dict()
+
+
 # --- Route Handler Functions ---
 @rag_router.post("/document/split")
 async def file_split(
@@ -150,6 +188,9 @@ async def file_split(
     """
     Parse the text provided by the user first, then perform chunking.
 
+    Runs as a split job and waits for its result, see /document/split/submit
+    for the non-blocking variant.
+
     Args:
         split_request: File splitting request parameters
         app_id: Application identifier
@@ -166,12 +207,16 @@ async def file_split(
             {"usr_input": json.dumps(request_dict, ensure_ascii=False)}
         )
         strategy = RAGStrategyFactory.get_strategy(split_request.ragType)
+        split = retrieval_cache.invalidating_split(
+            split_request.ragType, strategy.split
+        )
 
         # Use helper function to handle core operations and exceptions
         return await handle_rag_operation(
             span_context=span_context,
             metric=metric,
-            operation_callable=strategy.split,
+            operation_callable=run_split_job,
+            operation=split,
             fileUrl=split_request.file,
             resourceType=split_request.resourceType,
             lengthRange=split_request.lengthRange,
@@ -182,6 +227,77 @@ async def file_split(
         )
 
 
+@rag_router.post("/document/split/submit")
+async def file_split_submit(
+    split_request: FileSplitReq, app_id: str = Depends(get_app_id)
+) -> Union[SuccessDataResponse, ErrorResponse]:
+    """
+    Submit a file splitting job and return its ID without waiting for the result.
+
+    Args:
+        split_request: File splitting request parameters
+        app_id: Application identifier
+
+    Returns:
+        Status of the submitted job
+    """
+    span, metric = get_span_and_metric(app_id=app_id, function_name="file_split_submit")
+    request_dict = split_request.model_dump()
+
+    with span.start(func_name="file_split_submit") as span_context:
+        span_context.add_info_events(
+            {"usr_input": json.dumps(request_dict, ensure_ascii=False)}
+        )
+        strategy = RAGStrategyFactory.get_strategy(split_request.ragType)
+        split = retrieval_cache.invalidating_split(
+            split_request.ragType, strategy.split
+        )
+
+        return await handle_rag_operation(
+            span_context=span_context,
+            metric=metric,
+            operation_callable=submit_split_job,
+            operation=split,
+            app_id=app_id,
+            fileUrl=split_request.file,
+            resourceType=split_request.resourceType,
+            lengthRange=split_request.lengthRange,
+            overlap=split_request.overlap,
+            separator=split_request.separator,
+            titleSplit=split_request.titleSplit,
+            cutOff=split_request.cutOff,
+        )
+
+
+@rag_router.post("/document/split/status")
+async def file_split_status(
+    status_request: SplitJobQueryReq, app_id: str = Depends(get_app_id)
+) -> Union[SuccessDataResponse, ErrorResponse]:
+    """
+    Get the status of a file splitting job, with its chunks once finished.
+
+    Args:
+        status_request: Split job status query parameters
+        app_id: Application identifier
+
+    Returns:
+        Status of the job
+    """
+    span, metric = get_span_and_metric(app_id=app_id, function_name="file_split_status")
+
+    with span.start(func_name="file_split_status") as span_context:
+        span_context.add_info_events({"job_id": status_request.jobId})
+
+        return await handle_rag_operation(
+            span_context=span_context,
+            metric=metric,
+            operation_callable=get_split_job,
+            jobId=status_request.jobId,
+            app_id=app_id,
+            wait=status_request.wait,
+        )
+
+
 async def parse_length_range(lengthRange: Optional[str]) -> Optional[List[int]]:
     parsed_length_range = None
     if lengthRange:
@@ -261,6 +377,7 @@ async def file_upload(
             }
         )
         strategy = RAGStrategyFactory.get_strategy(ragType)
+        split = retrieval_cache.invalidating_split(ragType, strategy.split)
 
         try:
             # Use a unified parameter parsing function
@@ -280,7 +397,8 @@ async def file_upload(
         return await handle_rag_operation(
             span_context=span_context,
             metric=metric,
-            operation_callable=strategy.split,
+            operation_callable=run_split_job,
+            operation=split,
             file=file,
             lengthRange=parsed_length_range,
             separator=parsed_separator,
@@ -310,15 +428,21 @@ async def chunk_save(
         )
         strategy = RAGStrategyFactory.get_strategy(save_request.ragType)
 
-        return await handle_rag_operation(
-            span_context=span_context,
-            metric=metric,
-            operation_callable=strategy.chunks_save,
-            docId=save_request.docId,
-            group=save_request.group,
-            uid=save_request.uid,
-            chunks=save_request.chunks,
-        )
+        try:
+            return await handle_rag_operation(
+                span_context=span_context,
+                metric=metric,
+                operation_callable=strategy.chunks_save,
+                docId=save_request.docId,
+                group=save_request.group,
+                uid=save_request.uid,
+                chunks=save_request.chunks,
+            )
+        finally:
+            # Also after failures, some chunks may have been written
+            retrieval_cache.invalidate_document(
+                save_request.ragType, save_request.docId
+            )
 
 
 @rag_router.post("/chunk/update")
@@ -344,15 +468,21 @@ async def chunk_update(
         )
         strategy = RAGStrategyFactory.get_strategy(update_request.ragType)
 
-        return await handle_rag_operation(
-            span_context=span_context,
-            metric=metric,
-            operation_callable=strategy.chunks_update,
-            docId=update_request.docId,
-            group=update_request.group,
-            uid=update_request.uid,
-            chunks=update_request.chunks,
-        )
+        try:
+            return await handle_rag_operation(
+                span_context=span_context,
+                metric=metric,
+                operation_callable=strategy.chunks_update,
+                docId=update_request.docId,
+                group=update_request.group,
+                uid=update_request.uid,
+                chunks=update_request.chunks,
+            )
+        finally:
+            # Also after failures, some chunks may have been written
+            retrieval_cache.invalidate_document(
+                update_request.ragType, update_request.docId
+            )
 
 
 @rag_router.post("/chunk/delete")
@@ -378,13 +508,18 @@ async def chunk_delete(
         )
         strategy = RAGStrategyFactory.get_strategy(delete_request.ragType)
 
-        return await handle_rag_operation(
-            span_context=span_context,
-            metric=metric,
-            operation_callable=strategy.chunks_delete,
-            docId=delete_request.docId,
-            chunkIds=delete_request.chunkIds,
-        )
+        try:
+            return await handle_rag_operation(
+                span_context=span_context,
+                metric=metric,
+                operation_callable=strategy.chunks_delete,
+                docId=delete_request.docId,
+                chunkIds=delete_request.chunkIds,
+            )
+        finally:
+            retrieval_cache.invalidate_document(
+                delete_request.ragType, delete_request.docId
+            )
 
 
 @rag_router.post("/chunk/query")
@@ -417,7 +552,9 @@ async def chunk_query(
         return await handle_rag_operation(
             span_context=span_context,
             metric=metric,
-            operation_callable=strategy.query,
+            operation_callable=retrieval_cache.cached_query(
+                query_request.ragType, strategy.query
+            ),
             query=new_query,
             doc_ids=query_request.match.docIds,
             repo_ids=query_request.match.repoId,
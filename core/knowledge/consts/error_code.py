@@ -32,6 +32,7 @@ class CodeEnum(Enum):
     CBG_RAGError = (10026, "Xinghuo knowledge base request failed")
     AIUI_RAGError = (10027, "AIUI knowledge base request failed")
     DESK_RAGError = (10028, "DESK knowledge base request failed")
+    SplitJobRejected = (10029, "Split job rejected")
 
     ThirdPartyServiceFailed = (11111, "Third Party Service Failed")
     ServiceException = (14999, "Service Exception")
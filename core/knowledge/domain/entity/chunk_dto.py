@@ -51,6 +51,21 @@ class FileSplitReq(BaseModel):
     )
 
 
+class SplitJobQueryReq(BaseModel):
+    """
+    Split job status query request model
+
+    Attributes:
+        jobId: Split job ID, required
+        wait: Seconds to wait for the job to finish before answering, range 0~60
+    """
+
+    jobId: str = Field(..., min_length=1, description="Required, minimum length 1")
+    wait: float = Field(
+        default=0, ge=0, le=60, description="Long-poll wait in seconds, range 0~60"
+    )
+
+
 class ChunkSaveReq(BaseModel):
     """
     Chunk save request model
@@ -0,0 +1,282 @@
+"""
+RAGFlow parsing poller module.
+
+A single background task tracks the parsing status of every document waiting for
+RAGFlow, instead of one polling loop per request. Each tick checks all documents
+that are due, grouped by dataset, and each document backs off from
+RAGFLOW_PARSE_POLL_MIN_INTERVAL to RAGFLOW_PARSE_POLL_MAX_INTERVAL seconds while
+its status and progress do not change.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from knowledge.infra.ragflow import ragflow_client
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[str, float], None]
+
+
+@dataclass
+class ParsingWatch:
+    """A document waiting for its parsing to complete."""
+
+    dataset_id: str
+    doc_id: str
+    future: "asyncio.Future[str]"
+    interval: float
+    next_check: float
+    on_progress: Optional[ProgressCallback] = None
+    last_state: Optional[Tuple[str, float, int]] = field(default=None)
+
+
+class ParsingPoller:
+    """Shared poller resolving a future per document once its parsing completes."""
+
+    def __init__(
+        self,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        backoff: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the poller, unset settings are read from the environment.
+
+        Args:
+            min_interval: First and post-progress check delay in seconds,
+                RAGFLOW_PARSE_POLL_MIN_INTERVAL
+            max_interval: Upper bound of the check delay in seconds,
+                RAGFLOW_PARSE_POLL_MAX_INTERVAL
+            backoff: Factor applied to the delay when nothing changed,
+                RAGFLOW_PARSE_POLL_BACKOFF
+        """
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._watches: Dict[Tuple[str, str], ParsingWatch] = {}
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def min_interval(self) -> float:
+        """Delay before the first check and after a progress change."""
+        if self._min_interval is not None:
+            return self._min_interval
+        return float(os.getenv("RAGFLOW_PARSE_POLL_MIN_INTERVAL", "0.5"))
+
+    @property
+    def max_interval(self) -> float:
+        """Upper bound of the delay between two checks of a document."""
+        if self._max_interval is not None:
+            return self._max_interval
+        return float(os.getenv("RAGFLOW_PARSE_POLL_MAX_INTERVAL", "5"))
+
+    @property
+    def backoff(self) -> float:
+        """Factor applied to the delay of a document whose status is unchanged."""
+        if self._backoff is not None:
+            return self._backoff
+        return float(os.getenv("RAGFLOW_PARSE_POLL_BACKOFF", "1.5"))
+
+    @property
+    def pending(self) -> int:
+        """Number of documents being watched."""
+        return len(self._watches)
+
+    async def wait(
+        self,
+        dataset_id: str,
+        doc_id: str,
+        max_wait_time: float = 300,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> str:
+        """
+        Wait for document parsing completion
+
+        Args:
+            dataset_id: Dataset ID
+            doc_id: Document ID
+            max_wait_time: Maximum wait time (seconds)
+            on_progress: Called with the status and progress (0 to 1) of the
+                document whenever they change
+
+        Returns:
+            "DONE", or the last seen status (or "TIMEOUT") when the wait expired
+
+        Raises:
+            Exception: Raised when parsing fails
+        """
+        key = (dataset_id, doc_id)
+        watch = self._watches.get(key)
+        if watch is None:
+            loop = asyncio.get_running_loop()
+            watch = ParsingWatch(
+                dataset_id=dataset_id,
+                doc_id=doc_id,
+                future=loop.create_future(),
+                interval=self.min_interval,
+                next_check=time.monotonic() + self.min_interval,
+                on_progress=on_progress,
+            )
+            self._watches[key] = watch
+        self._ensure_running()
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(watch.future), max_wait_time)
+        except asyncio.TimeoutError:
+            last_status = watch.last_state[0] if watch.last_state else None
+            logger.warning(
+                "Document parsing timeout after %s seconds, last status: %s",
+                max_wait_time,
+                last_status,
+            )
+            return last_status or "TIMEOUT"
+        finally:
+            self._forget(watch)
+
+    async def close(self) -> None:
+        """Stop the background task, pending waits keep their own timeout."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    def _forget(self, watch: ParsingWatch) -> None:
+        """Stop checking a document."""
+        key = (watch.dataset_id, watch.doc_id)
+        if self._watches.get(key) is watch:
+            del self._watches[key]
+
+    def _ensure_running(self) -> None:
+        """Start the background task if needed, or wake it up for a new watch."""
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        elif self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        """Check the due documents until no document is left."""
+        assert self._wakeup is not None
+        while self._watches:
+            now = time.monotonic()
+            due = [w for w in self._watches.values() if w.next_check <= now]
+            if due:
+                await self._check(due)
+                continue
+
+            delay = min(w.next_check for w in self._watches.values()) - now
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _check(self, due: List[ParsingWatch]) -> None:
+        """Fetch the status of the due documents, one batch per dataset."""
+        by_dataset: Dict[str, List[ParsingWatch]] = {}
+        for watch in due:
+            by_dataset.setdefault(watch.dataset_id, []).append(watch)
+
+        batches = await asyncio.gather(
+            *(
+                self._fetch_documents(dataset_id, [w.doc_id for w in watches])
+                for dataset_id, watches in by_dataset.items()
+            ),
+            return_exceptions=True,
+        )
+        for watches, docs in zip(by_dataset.values(), batches):
+            for watch in watches:
+                if isinstance(docs, BaseException):
+                    logger.warning("Error checking parsing status: %s", docs)
+                    self._update(watch, None)
+                else:
+                    self._update(watch, docs.get(watch.doc_id))
+
+    @staticmethod
+    async def _fetch_documents(
+        dataset_id: str, doc_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the documents of a dataset by ID.
+
+        RAGFlow filters the document list by a single ID, so the documents of a
+        dataset are requested concurrently within the same tick.
+
+        Args:
+            dataset_id: Dataset ID
+            doc_ids: Document IDs
+
+        Returns:
+            Found documents keyed by ID
+        """
+        responses = await asyncio.gather(
+            *(
+                ragflow_client.list_documents_in_dataset(dataset_id, doc_id)
+                for doc_id in doc_ids
+            )
+        )
+        docs: Dict[str, Dict[str, Any]] = {}
+        for response in responses:
+            if response.get("code") != 0:
+                continue
+            for doc in response.get("data", {}).get("docs", []):
+                if doc.get("id") in doc_ids:
+                    docs[doc["id"]] = doc
+        return docs
+
+    def _update(self, watch: ParsingWatch, doc: Optional[Dict[str, Any]]) -> None:
+        """Resolve a watch or schedule its next check."""
+        if watch.future.done():
+            return
+
+        if doc is None:
+            state = ("NOT_FOUND", 0.0, 0) if watch.last_state is None else None
+        else:
+            state = (
+                doc.get("run", "UNSTART"),
+                float(doc.get("progress") or 0.0),
+                int(doc.get("token_count") or 0),
+            )
+
+        if state is not None and state != watch.last_state:
+            run_status, progress, token_count = state
+            logger.info(
+                "Document %s status: %s, progress: %.2f, tokens: %d",
+                watch.doc_id,
+                run_status,
+                progress,
+                token_count,
+            )
+            watch.last_state = state
+            watch.interval = self.min_interval
+            if watch.on_progress is not None:
+                try:
+                    watch.on_progress(run_status, progress)
+                except Exception as e:  # pylint: disable=broad-except
+                    logger.warning("Parsing progress callback failed: %s", e)
+
+            if run_status == "DONE" and token_count > 0:
+                watch.future.set_result(run_status)
+            elif run_status == "FAIL":
+                watch.future.set_exception(
+                    Exception(f"Document {watch.doc_id} parsing failed")
+                )
+            if watch.future.done():
+                self._forget(watch)
+                return
+        else:
+            watch.interval = min(watch.interval * self.backoff, self.max_interval)
+
+        watch.next_check = time.monotonic() + watch.interval
+
+
+parsing_poller = ParsingPoller()
@@ -11,16 +11,16 @@ import logging
 import os
 import time
 import urllib.parse
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import aiohttp
 from fastapi import UploadFile
 
+from knowledge.infra.ragflow.parsing_poller import ProgressCallback, parsing_poller
 from knowledge.infra.ragflow.ragflow_client import (
     create_dataset,
     list_datasets,
     list_document_chunks,
-    list_documents_in_dataset,
 )
 
 logger = logging.getLogger(__name__)
@@ -29,6 +29,9 @@ logger = logging.getLogger(__name__)
 _dataset_locks: Dict[str, asyncio.Lock] = {}
 _locks_lock = asyncio.Lock()
 
+# Resolved dataset IDs per dataset name: (expire_at, dataset_id)
+_dataset_id_cache: Dict[str, Tuple[float, str]] = {}
+
 
 class RagflowUtils:
     """RAGFlow utility class providing document processing helper methods"""
@@ -40,11 +43,40 @@ class RagflowUtils:
         """
         return os.getenv("RAGFLOW_DEFAULT_GROUP", "Stellar Knowledge Base")
 
+    @staticmethod
+    def _cached_dataset_id(dataset_name: str) -> Optional[str]:
+        """
+        Get a memoized dataset ID, None when unknown or expired
+        """
+        cached = _dataset_id_cache.get(dataset_name)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        return None
+
+    @staticmethod
+    def _remember_dataset_id(dataset_name: str, dataset_id: Optional[str]) -> None:
+        """
+        Memoize a resolved dataset ID for RAGFLOW_DATASET_ID_CACHE_TTL seconds
+        """
+        ttl = float(os.getenv("RAGFLOW_DATASET_ID_CACHE_TTL", "3600"))
+        if dataset_id and ttl > 0:
+            _dataset_id_cache[dataset_name] = (time.monotonic() + ttl, dataset_id)
+
+    @staticmethod
+    def forget_dataset_id(dataset_name: str) -> None:
+        """
+        Drop the memoized ID of a dataset, e.g. after it has been deleted
+        """
+        _dataset_id_cache.pop(dataset_name, None)
+
     @staticmethod
     async def get_dataset_id_by_name(dataset_name: str) -> Optional[str]:
         """
         Get dataset ID by dataset name
         """
+        cached_id = RagflowUtils._cached_dataset_id(dataset_name)
+        if cached_id:
+            return cached_id
         try:
             from knowledge.infra.ragflow import ragflow_client
 
@@ -53,6 +85,9 @@ class RagflowUtils:
                 datasets = datasets_response.get("data", [])
                 for dataset in datasets:
                     if dataset.get("name") == dataset_name:
+                        RagflowUtils._remember_dataset_id(
+                            dataset_name, dataset.get("id")
+                        )
                         return dataset.get("id")
             return None
         except Exception as e:
@@ -110,6 +145,10 @@ class RagflowUtils:
         Returns:
             Dataset ID
         """
+        cached_id = RagflowUtils._cached_dataset_id(group)
+        if cached_id:
+            return cached_id
+
         # Get or create a lock for this specific dataset name
         async with _locks_lock:
             if group not in _dataset_locks:
@@ -130,6 +169,7 @@ class RagflowUtils:
                             logger.info(
                                 f"Found existing dataset: {group}, ID: {dataset_id}"
                             )
+                            RagflowUtils._remember_dataset_id(group, dataset_id)
                             return dataset_id
 
                 # 2. Dataset doesn't exist, create new dataset
@@ -145,6 +185,7 @@ class RagflowUtils:
                     logger.info(
                         f"Dataset created successfully: {group}, ID: {dataset_id}"
                     )
+                    RagflowUtils._remember_dataset_id(group, dataset_id)
                     return dataset_id
                 else:
                     raise Exception(f"Dataset creation failed: {create_response}")
@@ -377,77 +418,21 @@ class RagflowUtils:
 
         return result
 
-    @staticmethod
-    async def _check_document_status(dataset_id: str, doc_id: str) -> tuple[str, int]:
-        """
-        Check parsing status of a single document
-
-        Args:
-            dataset_id: Dataset ID
-            doc_id: Document ID
-
-        Returns:
-            (status, token count)
-        """
-        response = await list_documents_in_dataset(dataset_id, doc_id)
-
-        if response.get("code") != 0:
-            return "UNKNOWN", 0
-
-        docs = response.get("data", {}).get("docs", [])
-        for doc in docs:
-            if doc.get("id") == doc_id:
-                run_status = doc.get("run", "UNSTART")
-                token_count = doc.get("token_count", 0)
-                return run_status, token_count
-
-        logger.warning(f"Document {doc_id} not found in list")
-        return "NOT_FOUND", 0
-
-    @staticmethod
-    def _handle_parsing_status(
-        doc_id: str, run_status: str, token_count: int
-    ) -> Optional[str]:
-        """
-        Handle parsing status
-
-        Args:
-            doc_id: Document ID
-            run_status: Running status
-            token_count: Token count
-
-        Returns:
-            Processed status, returns None if need to continue waiting
-        """
-        if run_status == "DONE":
-            if token_count > 0:
-                logger.info(
-                    f"Document {doc_id} parsing completed with {token_count} tokens"
-                )
-                return run_status
-            else:
-                logger.warning(
-                    f"Document {doc_id} status is DONE but token_count is 0, will continue waiting..."
-                )
-                return None
-        elif run_status == "FAIL":
-            raise Exception(f"Document {doc_id} parsing failed")
-        elif run_status == "RUNNING":
-            logger.info(f"Document {doc_id} is being parsed...")
-
-        return None  # Continue waiting
-
     @staticmethod
     async def wait_for_parsing(
-        dataset_id: str, doc_id: str, max_wait_time: int = 300
+        dataset_id: str,
+        doc_id: str,
+        max_wait_time: int = 300,
+        on_progress: Optional[ProgressCallback] = None,
     ) -> str:
         """
-        Wait for document parsing completion
+        Wait for document parsing completion through the shared parsing poller
 
         Args:
             dataset_id: Dataset ID
             doc_id: Document ID
             max_wait_time: Maximum wait time (seconds)
+            on_progress: Called with the status and progress of the document
 
         Returns:
             Final parsing status
@@ -455,38 +440,9 @@ class RagflowUtils:
         Raises:
             Exception: Raised when parsing fails
         """
-        start_time = time.time()
-        last_status = None
-
-        while time.time() - start_time < max_wait_time:
-            try:
-                run_status, token_count = await RagflowUtils._check_document_status(
-                    dataset_id, doc_id
-                )
-
-                if run_status != last_status:
-                    logger.info(
-                        f"Document {doc_id} status: {run_status}, tokens: {token_count}"
-                    )
-                    last_status = run_status
-
-                # Handle status, if returns non-None value, parsing is complete or failed
-                result = RagflowUtils._handle_parsing_status(
-                    doc_id, run_status, token_count
-                )
-                if result:
-                    return result
-
-                await asyncio.sleep(1)
-
-            except Exception as e:
-                logger.warning(f"Error checking parsing status: {e}")
-                await asyncio.sleep(1)
-
-        logger.warning(
-            f"Document parsing timeout after {max_wait_time} seconds, last status: {last_status}"
+        return await parsing_poller.wait(
+            dataset_id, doc_id, max_wait_time=max_wait_time, on_progress=on_progress
         )
-        return last_status or "TIMEOUT"
 
     @staticmethod
     def build_parser_config(
@@ -90,6 +90,15 @@ def create_app() -> FastAPI:
         except Exception as e:
             logger.warning(f"Failed to cleanup RAGFlow session: {e}")
 
+        try:
+            from knowledge.infra.ragflow.parsing_poller import parsing_poller
+            from knowledge.service.split_job import split_jobs
+
+            await split_jobs.close()
+            await parsing_poller.close()
+        except Exception as e:
+            logger.warning(f"Failed to stop split jobs: {e}")
+
         print("🧹 Final shutdown hook executed.")
 
     return app
@@ -6,6 +6,7 @@ RAGFlow Strategy Implementation Module
 Provides document processing and knowledge management strategy based on RAGFlow
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -17,10 +18,14 @@ from knowledge.exceptions.exception import CustomException
 from knowledge.infra.ragflow import ragflow_client
 from knowledge.infra.ragflow.ragflow_utils import RagflowUtils
 from knowledge.service.rag_strategy import RAGStrategy
+from knowledge.service.split_job import report_split_progress
 from knowledge.utils.verification import check_not_empty
 
 logger = logging.getLogger(__name__)
 
+# Page size used when listing the existing chunks of a document
+EXISTING_CHUNKS_PAGE_SIZE = 1000
+
 
 class RagflowRAGStrategy(RAGStrategy):
     """RAGFlow RAG strategy implementation."""
@@ -173,7 +178,10 @@ class RagflowRAGStrategy(RAGStrategy):
             logger.info("Document parsing triggered successfully")
             try:
                 final_status = await RagflowUtils.wait_for_parsing(
-                    dataset_id, doc_id, max_wait_time=300
+                    dataset_id,
+                    doc_id,
+                    max_wait_time=300,
+                    on_progress=report_split_progress,
                 )
                 logger.info(
                     "Document parsing completed, final status: %s", final_status
@@ -264,12 +272,14 @@ class RagflowRAGStrategy(RAGStrategy):
             logger.info("Using dataset: %s, name: %s", dataset_id, group)
 
             # Step 2-3: Process document upload
+            report_split_progress("UPLOADING", 0.0)
             doc_id = await self._process_document_upload(file_input, dataset_id)
 
             # Step 4-5: Handle document parsing
             await self._handle_document_parsing(dataset_id, doc_id)
 
             # Step 6: Get chunk content
+            report_split_progress("CHUNKING", 1.0)
             chunks_data = await RagflowUtils.get_document_chunks(dataset_id, doc_id)
 
             # Step 7: Convert to standard format
@@ -355,39 +365,54 @@ class RagflowRAGStrategy(RAGStrategy):
                 f"Error occurred while checking document existence: {str(e)}",
             )
 
+    @staticmethod
+    def _index_existing_chunks(
+        chunk_list: List[Dict[str, Any]], existing_chunks: Dict[str, Dict]
+    ) -> None:
+        """Add the chunks of a listed page to the existing chunk mapping"""
+        for chunk in chunk_list:
+            # Get various identifiers of chunk
+            data_index = str(chunk.get("dataIndex", ""))
+            chunk_id = chunk.get("id") or chunk.get("chunk_id")
+
+            if chunk_id:
+                # Use chunk_id as primary key (corresponding to dataIndex in split results)
+                existing_chunks[str(chunk_id)] = chunk
+
+                # If dataIndex exists, also use as backup key
+                if data_index:
+                    existing_chunks[data_index] = chunk
+
     async def _get_existing_chunks(
         self, dataset_id: str, doc_id: str
     ) -> Dict[str, Dict]:
-        """Get mapping of existing chunks"""
-        existing_chunks = {}
+        """Get mapping of existing chunks, listed from RAGFlow on every save"""
+        existing_chunks: Dict[str, Dict] = {}
         try:
-            chunks_response = await ragflow_client.list_document_chunks(
-                dataset_id, doc_id, page=1, page_size=1000
-            )
-            if chunks_response.get("code") == 0:
+            existing_chunk_count = 0
+            page = 1
+            while True:
+                chunks_response = await ragflow_client.list_document_chunks(
+                    dataset_id, doc_id, page=page, page_size=EXISTING_CHUNKS_PAGE_SIZE
+                )
+                if chunks_response.get("code") != 0:
+                    logger.info(
+                        f"Unable to get existing chunks or document does not exist: {chunks_response}"
+                    )
+                    break
+
                 chunks_data = chunks_response.get("data", {})
                 existing_chunk_list = chunks_data.get("chunks", [])
-
-                for chunk in existing_chunk_list:
-                    # Get various identifiers of chunk
-                    data_index = str(chunk.get("dataIndex", ""))
-                    chunk_id = chunk.get("id") or chunk.get("chunk_id")
-
-                    if chunk_id:
-                        # Use chunk_id as primary key (corresponding to dataIndex in split results)
-                        existing_chunks[str(chunk_id)] = chunk
-
-                        # If dataIndex exists, also use as backup key
-                        if data_index:
-                            existing_chunks[data_index] = chunk
-
-                logger.info(
-                    f"Document {doc_id} already has {len(existing_chunk_list)} chunks, established {len(existing_chunks)} mappings"
-                )
-            else:
-                logger.info(
-                    f"Unable to get existing chunks or document does not exist: {chunks_response}"
-                )
+                existing_chunk_count += len(existing_chunk_list)
+                self._index_existing_chunks(existing_chunk_list, existing_chunks)
+
+                # Documents with more chunks than one page need further pages
+                if len(existing_chunk_list) < EXISTING_CHUNKS_PAGE_SIZE:
+                    logger.info(
+                        f"Document {doc_id} already has {existing_chunk_count} chunks, established {len(existing_chunks)} mappings"
+                    )
+                    break
+                page += 1
         except Exception as e:
             logger.warning(f"Error checking existing chunks: {e}")
 
@@ -518,26 +543,51 @@ class RagflowRAGStrategy(RAGStrategy):
         existing_chunks: Dict[str, Any],
         current_time: str,
     ) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
-        """Process chunks in batch and return results"""
+        """Process chunks with bounded concurrency and return results in input order"""
+        # RAGFlow only supports adding one chunk per request
+        concurrency = max(1, int(os.getenv("RAGFLOW_CHUNK_SAVE_CONCURRENCY", "16")))
+        semaphore = asyncio.Semaphore(concurrency)
+        total = len(chunks)
+        # Log progress roughly every 10 percent
+        progress_step = max(1, total // 10)
+        completed = 0
+
+        async def save(i: int, chunk: Dict[str, Any]) -> Dict[str, Any]:
+            nonlocal completed
+            async with semaphore:
+                try:
+                    result = await self._process_single_chunk(
+                        i, chunk, dataset_id, docId, existing_chunks, current_time
+                    )
+                    return result
+                finally:
+                    completed += 1
+                    if completed % progress_step == 0 or completed == total:
+                        logger.info(
+                            f"Chunk save progress: docId={docId}, {completed}/{total}"
+                        )
+
+        results = await asyncio.gather(
+            *(save(i, chunk) for i, chunk in enumerate(chunks)),
+            return_exceptions=True,
+        )
+
         saved_chunks = []
         failed_chunks = []
-
-        for i, chunk in enumerate(chunks):
-            try:
-                result = await self._process_single_chunk(
-                    i, chunk, dataset_id, docId, existing_chunks, current_time
-                )
-                if result:  # Successfully processed
-                    saved_chunks.append(result)
-            except CustomException as e:
+        for i, (chunk, result) in enumerate(zip(chunks, results)):
+            if isinstance(result, CustomException):
                 failed_chunks.append(
                     {
                         "index": i,
-                        "error": str(e),
+                        "error": str(result),
                         "chunk": chunk.get("dataIndex", f"chunk_{i}"),
                     }
                 )
-                logger.error(f"Failed to process chunk {i}: {e}")
+                logger.error(f"Failed to process chunk {i}: {result}")
+            elif isinstance(result, BaseException):
+                raise result
+            elif result:  # Successfully processed
+                saved_chunks.append(result)
 
         return saved_chunks, failed_chunks
 
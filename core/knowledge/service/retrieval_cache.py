@@ -0,0 +1,315 @@
+"""
+Retrieval cache module.
+
+This module caches the results of RAG strategy queries in process memory, so that
+the same question asked against the same knowledge bases is answered without a
+backend round trip until the entry expires or a chunk of a matching document is
+saved, updated or deleted.
+
+Invalidation only reaches the cache of the worker handling the write. When the
+service runs more than one worker, the entries of the other workers live at most
+KNOWLEDGE_RETRIEVAL_CACHE_MULTI_WORKER_TTL seconds, so that a write is seen by
+every worker within that delay.
+"""
+
+import functools
+import json
+import os
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from loguru import logger
+
+# Trailing punctuation ignored when comparing queries, after NFKC normalization
+_TRAILING_PUNCTUATION = "?!.。？！~～ "
+_WHITESPACE = re.compile(r"\s+")
+
+CacheKey = Tuple[Any, ...]
+
+
+@dataclass
+class CacheEntry:
+    """Cached query result with the documents it depends on."""
+
+    result: Dict[str, Any]
+    expire_at: float
+    doc_ids: FrozenSet[str] = field(default_factory=frozenset)
+    result_doc_ids: FrozenSet[str] = field(default_factory=frozenset)
+
+
+class RetrievalCache:
+    """LRU cache of query results with TTL and per-document invalidation."""
+
+    def __init__(
+        self, ttl: Optional[float] = None, max_entries: Optional[int] = None
+    ) -> None:
+        """
+        Initialize the cache, unset settings are read from the environment.
+
+        Args:
+            ttl: Lifetime of an entry in seconds, KNOWLEDGE_RETRIEVAL_CACHE_TTL,
+                capped at KNOWLEDGE_RETRIEVAL_CACHE_MULTI_WORKER_TTL when WORKERS
+                is above 1, 0 disables the cache
+            max_entries: Maximum number of entries,
+                KNOWLEDGE_RETRIEVAL_CACHE_MAX_ENTRIES
+        """
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+
+    @property
+    def ttl(self) -> float:
+        """Lifetime of an entry in seconds."""
+        if self._ttl is not None:
+            return self._ttl
+        ttl = float(os.getenv("KNOWLEDGE_RETRIEVAL_CACHE_TTL", "300"))
+        if int(os.getenv("WORKERS", "1")) > 1:
+            # Writes handled by other workers do not invalidate this cache
+            multi_worker_ttl = os.getenv("KNOWLEDGE_RETRIEVAL_CACHE_MULTI_WORKER_TTL")
+            ttl = min(ttl, float(multi_worker_ttl or "30"))
+        return ttl
+
+    @property
+    def max_entries(self) -> int:
+        """Maximum number of entries."""
+        if self._max_entries is None:
+            return int(os.getenv("KNOWLEDGE_RETRIEVAL_CACHE_MAX_ENTRIES", "10000"))
+        return self._max_entries
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """
+        Normalize a query so that trivially different spellings share an entry.
+
+        Args:
+            query: Query text
+
+        Returns:
+            Query folded to NFKC lower case, with collapsed whitespace and
+            without trailing punctuation
+        """
+        normalized = unicodedata.normalize("NFKC", query).lower()
+        normalized = _WHITESPACE.sub(" ", normalized).strip()
+        return normalized.rstrip(_TRAILING_PUNCTUATION) or normalized
+
+    def make_key(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        rag_type: str,
+        query: str,
+        doc_ids: Optional[List[str]],
+        repo_ids: Optional[List[str]],
+        top_k: Optional[int],
+        threshold: Optional[float],
+        **kwargs: Any,
+    ) -> CacheKey:
+        """
+        Build the cache key of a query.
+
+        Args:
+            rag_type: RAG type
+            query: Query text
+            doc_ids: Document IDs filter
+            repo_ids: Knowledge base IDs
+            top_k: Number of results
+            threshold: Similarity threshold
+            **kwargs: Other query parameters passed to the strategy
+
+        Returns:
+            Hashable cache key
+        """
+        extra = json.dumps(kwargs, sort_keys=True, ensure_ascii=False, default=str)
+        return (
+            rag_type,
+            self.normalize_query(query),
+            tuple(sorted(doc_ids or [])),
+            tuple(sorted(repo_ids or [])),
+            top_k,
+            threshold,
+            extra,
+        )
+
+    def get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached result.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached result, None when missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expire_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry.result
+
+    def put(self, key: CacheKey, result: Dict[str, Any]) -> None:
+        """
+        Store a result, evicting the least recently used entries beyond the limit.
+
+        Args:
+            key: Cache key built by make_key
+            result: Query result
+        """
+        ttl = self.ttl
+        if ttl <= 0:
+            return
+        result_doc_ids = frozenset(
+            str(item.get("docId"))
+            for item in result.get("results", [])
+            if isinstance(item, dict) and item.get("docId")
+        )
+        self._entries[key] = CacheEntry(
+            result=result,
+            expire_at=time.monotonic() + ttl,
+            doc_ids=frozenset(key[2]),
+            result_doc_ids=result_doc_ids,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate_document(self, rag_type: str, doc_id: str) -> int:
+        """
+        Drop the entries whose result may change with the chunks of a document.
+
+        Entries filtered on other documents, which do not contain the document
+        in their results, are kept.
+
+        Args:
+            rag_type: RAG type of the document
+            doc_id: Document ID
+
+        Returns:
+            Number of dropped entries
+        """
+        keys = [
+            key
+            for key, entry in self._entries.items()
+            if key[0] == rag_type
+            and (
+                not entry.doc_ids
+                or doc_id in entry.doc_ids
+                or doc_id in entry.result_doc_ids
+            )
+        ]
+        for key in keys:
+            del self._entries[key]
+        if keys:
+            logger.info(
+                f"Retrieval cache dropped {len(keys)} entries of document {doc_id}"
+            )
+        return len(keys)
+
+    def invalidate_unfiltered(self, rag_type: str) -> int:
+        """
+        Drop the entries not filtered on documents, which a new document may change.
+
+        Args:
+            rag_type: RAG type of the new document
+
+        Returns:
+            Number of dropped entries
+        """
+        keys = [
+            key
+            for key, entry in self._entries.items()
+            if key[0] == rag_type and not entry.doc_ids
+        ]
+        for key in keys:
+            del self._entries[key]
+        if keys:
+            logger.info(f"Retrieval cache dropped {len(keys)} unfiltered entries")
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def cached_query(
+        self, rag_type: str, query_callable: Callable[..., Awaitable[Dict[str, Any]]]
+    ) -> Callable[..., Awaitable[Dict[str, Any]]]:
+        """
+        Wrap a strategy query method with the cache.
+
+        Empty results are not cached, as strategies also return them when the
+        backend fails.
+
+        Args:
+            rag_type: RAG type of the strategy
+            query_callable: Bound query method of the strategy
+
+        Returns:
+            Query method served from the cache when possible
+        """
+
+        @functools.wraps(query_callable)
+        async def query(
+            query: str,
+            doc_ids: Optional[List[str]] = None,
+            repo_ids: Optional[List[str]] = None,
+            top_k: Optional[int] = None,
+            threshold: Optional[float] = 0,
+            **kwargs: Any,
+        ) -> Dict[str, Any]:
+            span = kwargs.pop("span", None)
+            key = self.make_key(
+                rag_type, query, doc_ids, repo_ids, top_k, threshold, **kwargs
+            )
+            cached = self.get(key)
+            if span is not None:
+                span.add_info_events({"retrieval_cache": "hit" if cached else "miss"})
+            if cached is not None:
+                # Echo the caller's spelling of the query, not the cached one
+                return {**cached, "query": query} if "query" in cached else cached
+
+            if span is not None:
+                kwargs["span"] = span
+            result = await query_callable(
+                query=query,
+                doc_ids=doc_ids,
+                repo_ids=repo_ids,
+                top_k=top_k,
+                threshold=threshold,
+                **kwargs,
+            )
+            if isinstance(result, dict) and result.get("results"):
+                self.put(key, result)
+            return result
+
+        return query
+
+    def invalidating_split(
+        self, rag_type: str, split_callable: Callable[..., Awaitable[Any]]
+    ) -> Callable[..., Awaitable[Any]]:
+        """
+        Wrap a strategy split method to drop the entries a new document may change.
+
+        Args:
+            rag_type: RAG type of the strategy
+            split_callable: Bound split method of the strategy
+
+        Returns:
+            Split method invalidating the unfiltered entries once it ends
+        """
+
+        @functools.wraps(split_callable)
+        async def split(**kwargs: Any) -> Any:
+            try:
+                return await split_callable(**kwargs)
+            finally:
+                # Also after failures, the document may have been stored
+                self.invalidate_unfiltered(rag_type)
+
+        return split
+
+
+retrieval_cache = RetrievalCache()
@@ -0,0 +1,281 @@
+"""
+Split job module.
+
+This module runs document split operations as background jobs of the current
+process, so that a caller can submit a split, get a job ID back at once and poll
+or long-poll the job status instead of holding a request open until the backend
+has parsed the document. The synchronous split endpoints run on the same jobs
+and simply wait for their completion.
+
+Jobs only live in the memory of the worker that runs them, a status query
+answered by another worker would not find the job. Submitting background jobs
+is therefore refused when the service runs more than one worker.
+"""
+
+import asyncio
+import contextvars
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from loguru import logger
+
+from knowledge.consts.error_code import CodeEnum
+from knowledge.exceptions.exception import BaseCustomException, CustomException
+
+
+class SplitJobStatus(str, Enum):
+    """Split job status enumeration"""
+
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    SUCCESS = "SUCCESS"
+    FAILED = "FAILED"
+
+
+@dataclass
+class SplitJob:
+    """Split job state and result."""
+
+    job_id: str
+    app_id: str = ""
+    status: SplitJobStatus = SplitJobStatus.PENDING
+    stage: str = ""
+    progress: float = 0.0
+    result: Any = None
+    error: Optional[BaseException] = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    task: Optional["asyncio.Task[Any]"] = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job succeeded or failed."""
+        return self.status in (SplitJobStatus.SUCCESS, SplitJobStatus.FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the job to its API representation."""
+        data: Dict[str, Any] = {
+            "jobId": self.job_id,
+            "status": self.status.value,
+            "stage": self.stage,
+            "progress": round(self.progress, 4),
+        }
+        if self.status == SplitJobStatus.SUCCESS:
+            data["result"] = self.result
+        elif self.status == SplitJobStatus.FAILED:
+            if isinstance(self.error, BaseCustomException):
+                data["code"] = self.error.code
+                data["message"] = self.error.message
+            else:
+                data["code"] = CodeEnum.FileSplitFailed.code
+                data["message"] = str(self.error)
+        return data
+
+
+_current_job: contextvars.ContextVar[Optional[SplitJob]] = contextvars.ContextVar(
+    "current_split_job", default=None
+)
+
+
+def report_split_progress(stage: str, progress: float) -> None:
+    """
+    Report the progress of the split job running in the current task.
+
+    Does nothing when called outside of a split job.
+
+    Args:
+        stage: Current processing stage, such as the backend parsing status
+        progress: Progress from 0 to 1
+    """
+    job = _current_job.get()
+    if job is not None and not job.finished:
+        job.stage = stage
+        job.progress = max(0.0, min(float(progress), 1.0))
+
+
+class SplitJobManager:
+    """Registry of the split jobs of this process."""
+
+    def __init__(
+        self, ttl: Optional[float] = None, max_running: Optional[int] = None
+    ) -> None:
+        """
+        Initialize the manager, unset settings are read from the environment.
+
+        Args:
+            ttl: Seconds a finished job is kept for status queries,
+                KNOWLEDGE_SPLIT_JOB_TTL
+            max_running: Maximum number of unfinished jobs,
+                KNOWLEDGE_SPLIT_JOB_MAX_RUNNING
+        """
+        self._ttl = ttl
+        self._max_running = max_running
+        self._jobs: Dict[str, SplitJob] = {}
+
+    @property
+    def ttl(self) -> float:
+        """Seconds a finished job is kept for status queries."""
+        if self._ttl is not None:
+            return self._ttl
+        return float(os.getenv("KNOWLEDGE_SPLIT_JOB_TTL", "3600"))
+
+    @property
+    def max_running(self) -> int:
+        """Maximum number of unfinished jobs."""
+        if self._max_running is not None:
+            return self._max_running
+        return int(os.getenv("KNOWLEDGE_SPLIT_JOB_MAX_RUNNING", "50"))
+
+    @property
+    def running(self) -> int:
+        """Number of unfinished jobs."""
+        return sum(1 for job in self._jobs.values() if not job.finished)
+
+    def submit(
+        self,
+        operation: Callable[..., Awaitable[Any]],
+        app_id: str = "",
+        **operation_kwargs: Any,
+    ) -> SplitJob:
+        """
+        Start a split operation as a background job.
+
+        Args:
+            operation: Split function of a RAG strategy
+            app_id: Application owning the job, the only one allowed to query it
+            **operation_kwargs: Parameters passed to the operation
+
+        Returns:
+            The submitted job
+
+        Raises:
+            CustomException: When max_running jobs are already unfinished
+        """
+        self._purge()
+        if self.running >= self.max_running:
+            raise CustomException(
+                CodeEnum.SplitJobRejected,
+                f"Too many running split jobs, limit is {self.max_running}",
+            )
+        job = SplitJob(job_id=uuid.uuid4().hex, app_id=app_id)
+        self._jobs[job.job_id] = job
+        job.task = asyncio.create_task(self._execute(job, operation, operation_kwargs))
+        # The outcome is kept on the job, do not report it as never retrieved
+        job.task.add_done_callback(lambda task: task.cancelled() or task.exception())
+        return job
+
+    async def run(
+        self, operation: Callable[..., Awaitable[Any]], **operation_kwargs: Any
+    ) -> Any:
+        """
+        Run a split operation as a job and wait for its result.
+
+        Args:
+            operation: Split function of a RAG strategy
+            **operation_kwargs: Parameters passed to the operation
+
+        Returns:
+            Result of the operation
+
+        Raises:
+            CustomException: When max_running jobs are already unfinished
+            Exception: The exception raised by the operation
+        """
+        job = self.submit(operation, **operation_kwargs)
+        assert job.task is not None
+        try:
+            return await job.task
+        finally:
+            # Nobody polls a job run synchronously, do not keep its result
+            self._jobs.pop(job.job_id, None)
+
+    def get(self, job_id: str, app_id: str = "") -> Optional[SplitJob]:
+        """
+        Get a job by ID.
+
+        Args:
+            job_id: Job ID
+            app_id: Application querying the job
+
+        Returns:
+            The job, None if unknown, expired or owned by another application
+        """
+        self._purge()
+        job = self._jobs.get(job_id)
+        if job is None or job.app_id != app_id:
+            return None
+        return job
+
+    async def wait(
+        self, job_id: str, app_id: str = "", timeout: float = 0
+    ) -> Optional[SplitJob]:
+        """
+        Get a job by ID, waiting up to timeout seconds for it to finish.
+
+        Args:
+            job_id: Job ID
+            app_id: Application querying the job
+            timeout: Maximum wait time (seconds), 0 returns at once
+
+        Returns:
+            The job, None if unknown, expired or owned by another application
+        """
+        job = self.get(job_id, app_id)
+        if job is None or job.finished or timeout <= 0 or job.task is None:
+            return job
+        await asyncio.wait({job.task}, timeout=timeout)
+        return job
+
+    async def close(self) -> None:
+        """Cancel the unfinished jobs."""
+        tasks = [
+            job.task
+            for job in self._jobs.values()
+            if job.task is not None and not job.task.done()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._jobs.clear()
+
+    def _purge(self) -> None:
+        """Drop the finished jobs older than the TTL."""
+        expire_before = time.time() - self.ttl
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < expire_before
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    @staticmethod
+    async def _execute(
+        job: SplitJob,
+        operation: Callable[..., Awaitable[Any]],
+        operation_kwargs: Dict[str, Any],
+    ) -> Any:
+        """Run the operation, recording its outcome on the job."""
+        _current_job.set(job)
+        job.status = SplitJobStatus.RUNNING
+        try:
+            job.result = await operation(**operation_kwargs)
+        except BaseException as e:
+            job.error = e
+            job.status = SplitJobStatus.FAILED
+            if not isinstance(e, asyncio.CancelledError):
+                logger.error(f"Split job {job.job_id} failed: {e}")
+            raise
+        else:
+            job.status = SplitJobStatus.SUCCESS
+            job.progress = 1.0
+            return job.result
+        finally:
+            job.finished_at = time.time()
+
+
+split_jobs = SplitJobManager()
@@ -0,0 +1,113 @@
+import asyncio
+from typing import Any, Dict, List, Tuple
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from knowledge.infra.ragflow.parsing_poller import ParsingPoller
+
+
+def _doc_list(doc_id: str, run: str, progress: float, tokens: int) -> Dict[str, Any]:
+    """Build a RAGFlow document list response"""
+    return {
+        "code": 0,
+        "data": {
+            "docs": [
+                {
+                    "id": doc_id,
+                    "run": run,
+                    "progress": progress,
+                    "token_count": tokens,
+                }
+            ]
+        },
+    }
+
+
+class TestParsingPoller:
+    """RAGFlow parsing poller unit tests"""
+
+    @pytest.mark.asyncio
+    async def test_documents_share_one_poller(self) -> None:
+        """Test that concurrent waits are resolved by the same background task"""
+        calls: List[Tuple[str, str]] = []
+        done_after = {"doc-a": 2, "doc-b": 3}
+
+        async def list_documents(dataset_id: str, doc_id: str) -> Dict[str, Any]:
+            calls.append((dataset_id, doc_id))
+            seen = sum(1 for call in calls if call[1] == doc_id)
+            if seen >= done_after[doc_id]:
+                return _doc_list(doc_id, "DONE", 1.0, 42)
+            return _doc_list(doc_id, "RUNNING", seen / 10, 0)
+
+        poller = ParsingPoller(min_interval=0.01, max_interval=0.05, backoff=2)
+        progress: List[Tuple[str, float]] = []
+        with patch(
+            "knowledge.infra.ragflow.parsing_poller.ragflow_client"
+        ) as mock_client:
+            mock_client.list_documents_in_dataset = AsyncMock(
+                side_effect=list_documents
+            )
+            results = await asyncio.gather(
+                poller.wait(
+                    "ds",
+                    "doc-a",
+                    max_wait_time=5,
+                    on_progress=lambda s, p: progress.append((s, p)),
+                ),
+                poller.wait("ds", "doc-b", max_wait_time=5),
+            )
+
+        assert results == ["DONE", "DONE"]
+        assert progress == [("RUNNING", 0.1), ("DONE", 1.0)]
+        assert sorted(calls) == [("ds", "doc-a")] * 2 + [("ds", "doc-b")] * 3
+        assert poller.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_unchanged_status_backs_off(self) -> None:
+        """Test that the check delay grows while the status does not change"""
+        poller = ParsingPoller(min_interval=0.01, max_interval=0.04, backoff=2)
+        with patch(
+            "knowledge.infra.ragflow.parsing_poller.ragflow_client"
+        ) as mock_client:
+            mock_client.list_documents_in_dataset = AsyncMock(
+                return_value=_doc_list("doc", "RUNNING", 0.5, 0)
+            )
+            status = await poller.wait("ds", "doc", max_wait_time=0.2)
+
+        # Delays of 0.01, 0.02 then 0.04 seconds instead of a check every 0.01
+        assert status == "RUNNING"
+        assert 3 <= mock_client.list_documents_in_dataset.await_count <= 8
+        assert poller.pending == 0
+        await poller.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_parsing_raises(self) -> None:
+        """Test that a failed parsing is raised to the waiter"""
+        poller = ParsingPoller(min_interval=0.01, max_interval=0.01, backoff=1)
+        with patch(
+            "knowledge.infra.ragflow.parsing_poller.ragflow_client"
+        ) as mock_client:
+            mock_client.list_documents_in_dataset = AsyncMock(
+                return_value=_doc_list("doc", "FAIL", 0.3, 0)
+            )
+            with pytest.raises(Exception, match="parsing failed"):
+                await poller.wait("ds", "doc", max_wait_time=5)
+
+    @pytest.mark.asyncio
+    async def test_done_without_tokens_keeps_waiting(self) -> None:
+        """Test that a DONE status without tokens is not reported as complete"""
+        responses = [
+            _doc_list("doc", "DONE", 1.0, 0),
+            _doc_list("doc", "DONE", 1.0, 0),
+            _doc_list("doc", "DONE", 1.0, 7),
+        ]
+        poller = ParsingPoller(min_interval=0.01, max_interval=0.01, backoff=1)
+        with patch(
+            "knowledge.infra.ragflow.parsing_poller.ragflow_client"
+        ) as mock_client:
+            mock_client.list_documents_in_dataset = AsyncMock(side_effect=responses)
+            status = await poller.wait("ds", "doc", max_wait_time=5)
+
+        assert status == "DONE"
+        assert mock_client.list_documents_in_dataset.await_count == 3
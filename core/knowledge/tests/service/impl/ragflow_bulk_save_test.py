@@ -0,0 +1,96 @@
+import asyncio
+import os
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from knowledge.service.impl import ragflow_strategy
+from knowledge.service.impl.ragflow_strategy import RagflowRAGStrategy
+
+
+class TestRagflowChunkBulkSave:
+    """RAGFlow bulk chunk saving unit tests"""
+
+    @pytest.fixture
+    def strategy(self) -> RagflowRAGStrategy:
+        """Create test strategy instance"""
+        return RagflowRAGStrategy()
+
+    @pytest.fixture
+    def mock_client(self) -> Any:
+        """Mock ragflow_client module"""
+        with patch("knowledge.service.impl.ragflow_strategy.ragflow_client") as mock:
+            yield mock
+
+    @pytest.mark.asyncio
+    async def test_chunks_saved_concurrently_in_order(
+        self, strategy: RagflowRAGStrategy, mock_client: Any
+    ) -> None:
+        """Test that chunks are saved with bounded concurrency keeping input order"""
+        running = 0
+        peak = 0
+
+        async def add_chunk(**kwargs: Any) -> Dict[str, Any]:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            content = kwargs["content"]
+            # Later chunks finish first
+            await asyncio.sleep(0.01 if content == "c0" else 0)
+            running -= 1
+            if content == "c3":
+                return {"code": 102, "message": "boom"}
+            return {"code": 0, "data": {"chunk": {"id": f"id-{content}"}}}
+
+        mock_client.add_chunk = AsyncMock(side_effect=add_chunk)
+        chunks: List[Dict[str, Any]] = [
+            {"content": f"c{i}", "dataIndex": i} for i in range(6)
+        ]
+
+        with patch.dict(os.environ, {"RAGFLOW_CHUNK_SAVE_CONCURRENCY": "2"}):
+            saved, failed = await strategy._process_chunks_batch(
+                chunks, "ds", "doc", {}, "now"
+            )
+
+        assert [chunk["id"] for chunk in saved] == [
+            "id-c0",
+            "id-c1",
+            "id-c2",
+            "id-c4",
+            "id-c5",
+        ]
+        assert len(failed) == 1
+        assert failed[0]["index"] == 3
+        assert failed[0]["chunk"] == 3
+        assert "boom" in failed[0]["error"]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_existing_chunks_paginated_and_listed_per_save(
+        self, strategy: RagflowRAGStrategy, mock_client: Any
+    ) -> None:
+        """Test that every page is listed, and listed again for the next save"""
+        page_size = ragflow_strategy.EXISTING_CHUNKS_PAGE_SIZE
+        pages = {
+            1: [{"id": f"a{i}"} for i in range(page_size)],
+            2: [{"id": "b0", "dataIndex": 7}],
+        }
+
+        async def list_document_chunks(
+            dataset_id: str, doc_id: str, page: int, page_size: int
+        ) -> Dict[str, Any]:
+            return {"code": 0, "data": {"chunks": pages.get(page, [])}}
+
+        mock_client.list_document_chunks = AsyncMock(side_effect=list_document_chunks)
+
+        existing = await strategy._get_existing_chunks("ds", "doc")
+        assert len(existing) == page_size + 2
+        assert existing["7"]["id"] == "b0"
+        assert mock_client.list_document_chunks.await_count == 2
+
+        # A chunk deleted in between, possibly by another worker, is not reported
+        pages[2] = []
+        existing = await strategy._get_existing_chunks("ds", "doc")
+        assert "b0" not in existing
+        assert mock_client.list_document_chunks.await_count == 4
@@ -0,0 +1,146 @@
+import asyncio
+import os
+from typing import Any, Dict, List, Optional
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from knowledge.infra.ragflow import ragflow_utils
+from knowledge.infra.ragflow.ragflow_utils import RagflowUtils
+from knowledge.service.retrieval_cache import RetrievalCache
+
+
+class FakeStrategy:
+    """Strategy counting the backend queries"""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def query(
+        self,
+        query: str,
+        doc_ids: Optional[List[str]] = None,
+        repo_ids: Optional[List[str]] = None,
+        top_k: Optional[int] = None,
+        threshold: Optional[float] = 0,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        self.calls += 1
+        doc_id = doc_ids[0] if doc_ids else "doc-1"
+        return {"query": query, "count": 1, "results": [{"docId": doc_id}]}
+
+
+class TestRetrievalCache:
+    """Retrieval cache unit tests"""
+
+    @pytest.mark.asyncio
+    async def test_normalized_queries_share_an_entry(self) -> None:
+        """Test that spelling variants of a query are served from the cache"""
+        cache = RetrievalCache(ttl=60, max_entries=10)
+        strategy = FakeStrategy()
+        query = cache.cached_query("CBG-RAG", strategy.query)
+
+        first = await query(query="How to reset?", repo_ids=["r"], top_k=3)
+        second = await query(query="  how  to RESET？", repo_ids=["r"], top_k=3)
+        await query(query="how to reset", repo_ids=["r"], top_k=4)
+
+        assert strategy.calls == 2
+        assert second["results"] == first["results"]
+        assert second["query"] == "  how  to RESET？"
+
+    @pytest.mark.asyncio
+    async def test_empty_results_are_not_cached(self) -> None:
+        """Test that empty results, also returned on backend errors, are retried"""
+        cache = RetrievalCache(ttl=60, max_entries=10)
+        backend = AsyncMock(return_value={"query": "q", "count": 0, "results": []})
+        query = cache.cached_query("CBG-RAG", backend)
+
+        await query(query="q")
+        await query(query="q")
+
+        assert backend.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_document(self) -> None:
+        """Test that writes to a document drop the entries depending on it"""
+        cache = RetrievalCache(ttl=60, max_entries=10)
+        strategy = FakeStrategy()
+        query = cache.cached_query("CBG-RAG", strategy.query)
+
+        await query(query="q", doc_ids=["doc-1"])
+        await query(query="q", doc_ids=["doc-2"])
+        await query(query="q")
+
+        assert cache.invalidate_document("AIUI-RAG2", "doc-1") == 0
+        assert cache.invalidate_document("CBG-RAG", "doc-1") == 2
+        await query(query="q", doc_ids=["doc-2"])
+        assert strategy.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_split_drops_unfiltered_entries(self) -> None:
+        """Test that a split drops the entries a new document may change"""
+        cache = RetrievalCache(ttl=60, max_entries=10)
+        strategy = FakeStrategy()
+        query = cache.cached_query("CBG-RAG", strategy.query)
+        split_backend = AsyncMock(side_effect=ValueError("parse failed"))
+        split = cache.invalidating_split("CBG-RAG", split_backend)
+
+        await query(query="q", doc_ids=["doc-1"])
+        await query(query="q")
+        with pytest.raises(ValueError):
+            await split(fileUrl="a.pdf")
+        await query(query="q", doc_ids=["doc-1"])
+        await query(query="q")
+
+        split_backend.assert_awaited_once_with(fileUrl="a.pdf")
+        assert strategy.calls == 3
+
+    def test_ttl_is_capped_with_several_workers(self) -> None:
+        """Test that entries live shorter when other workers may write"""
+        cache = RetrievalCache()
+        env = {
+            "KNOWLEDGE_RETRIEVAL_CACHE_TTL": "300",
+            "KNOWLEDGE_RETRIEVAL_CACHE_MULTI_WORKER_TTL": "20",
+        }
+        with patch.dict(os.environ, {**env, "WORKERS": "1"}):
+            assert cache.ttl == 300
+        with patch.dict(os.environ, {**env, "WORKERS": "4"}):
+            assert cache.ttl == 20
+
+    @pytest.mark.asyncio
+    async def test_ttl_and_lru_eviction(self) -> None:
+        """Test that entries expire and the least recently used is evicted"""
+        cache = RetrievalCache(ttl=0.05, max_entries=2)
+        strategy = FakeStrategy()
+        query = cache.cached_query("CBG-RAG", strategy.query)
+
+        for text in ("a", "b", "a", "c", "a"):
+            await query(query=text)
+        assert strategy.calls == 3
+
+        await asyncio.sleep(0.06)
+        await query(query="a")
+        assert strategy.calls == 4
+
+
+class TestDatasetIdMemoization:
+    """RAGFlow dataset ID resolution memoization tests"""
+
+    @pytest.mark.asyncio
+    async def test_dataset_id_resolved_once(self) -> None:
+        """Test that the dataset list is queried once per dataset name"""
+        ragflow_utils._dataset_id_cache.clear()
+        list_datasets = AsyncMock(
+            return_value={"code": 0, "data": [{"name": "kb", "id": "ds-1"}]}
+        )
+        with patch(
+            "knowledge.infra.ragflow.ragflow_client.list_datasets", list_datasets
+        ), patch.dict(os.environ, {"RAGFLOW_DATASET_ID_CACHE_TTL": "60"}):
+            assert await RagflowUtils.get_dataset_id_by_name("kb") == "ds-1"
+            assert await RagflowUtils.get_dataset_id_by_name("kb") == "ds-1"
+            assert await RagflowUtils.ensure_dataset("kb") == "ds-1"
+            RagflowUtils.forget_dataset_id("kb")
+            assert await RagflowUtils.get_dataset_id_by_name("kb") == "ds-1"
+
+        assert list_datasets.await_count == 2
+        ragflow_utils._dataset_id_cache.clear()
@@ -0,0 +1,139 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from knowledge.consts.error_code import CodeEnum
+from knowledge.exceptions.exception import CustomException
+from knowledge.service.split_job import (
+    SplitJobManager,
+    SplitJobStatus,
+    report_split_progress,
+)
+
+
+class TestSplitJobManager:
+    """Split job manager unit tests"""
+
+    @pytest.mark.asyncio
+    async def test_submitted_job_reports_progress_and_result(self) -> None:
+        """Test that a job can be polled while running and long-polled to its end"""
+        release = asyncio.Event()
+
+        async def split(**kwargs: Any) -> List[Dict[str, Any]]:
+            report_split_progress("RUNNING", 0.4)
+            await release.wait()
+            return [{"docId": "doc", "content": kwargs["fileUrl"]}]
+
+        manager = SplitJobManager(ttl=60)
+        job = manager.submit(split, fileUrl="a.pdf")
+        assert job.to_dict()["status"] == "PENDING"
+
+        running = await manager.wait(job.job_id, timeout=0.05)
+        assert running is job
+        assert job.to_dict() == {
+            "jobId": job.job_id,
+            "status": "RUNNING",
+            "stage": "RUNNING",
+            "progress": 0.4,
+        }
+
+        release.set()
+        finished = await manager.wait(job.job_id, timeout=5)
+        assert finished is not None
+        assert finished.status == SplitJobStatus.SUCCESS
+        assert finished.to_dict()["result"] == [{"docId": "doc", "content": "a.pdf"}]
+        assert finished.progress == 1.0
+
+    @pytest.mark.asyncio
+    async def test_failed_job_keeps_error_code(self) -> None:
+        """Test that a failed job reports the error code of its exception"""
+
+        async def split(**kwargs: Any) -> List[Dict[str, Any]]:
+            raise CustomException(CodeEnum.CBG_RAGError, "backend down")
+
+        async def broken(**kwargs: Any) -> List[Dict[str, Any]]:
+            raise ValueError("File chunking processing failed: boom")
+
+        manager = SplitJobManager(ttl=60)
+        custom = await manager.wait(manager.submit(split).job_id, timeout=5)
+        generic = await manager.wait(manager.submit(broken).job_id, timeout=5)
+
+        assert custom is not None and generic is not None
+        assert custom.to_dict()["code"] == CodeEnum.CBG_RAGError.code
+        assert "backend down" in custom.to_dict()["message"]
+        assert generic.to_dict()["code"] == CodeEnum.FileSplitFailed.code
+        assert generic.to_dict()["message"] == "File chunking processing failed: boom"
+
+    @pytest.mark.asyncio
+    async def test_run_returns_result_and_forgets_job(self) -> None:
+        """Test that a synchronous run returns the result without keeping the job"""
+
+        async def split(**kwargs: Any) -> List[Dict[str, Any]]:
+            return [{"docId": "doc"}]
+
+        async def broken(**kwargs: Any) -> List[Dict[str, Any]]:
+            raise ValueError("boom")
+
+        manager = SplitJobManager(ttl=60)
+        assert await manager.run(split) == [{"docId": "doc"}]
+        with pytest.raises(ValueError, match="boom"):
+            await manager.run(broken)
+        assert manager._jobs == {}
+
+    @pytest.mark.asyncio
+    async def test_finished_jobs_expire(self) -> None:
+        """Test that finished jobs are dropped after the TTL, unknown IDs give None"""
+
+        async def split(**kwargs: Any) -> List[Dict[str, Any]]:
+            return []
+
+        manager = SplitJobManager(ttl=0.01)
+        job = manager.submit(split)
+        assert job.task is not None
+        await job.task
+        assert manager.get(job.job_id) is job
+        await asyncio.sleep(0.02)
+
+        assert manager.get(job.job_id) is None
+        assert await manager.wait("unknown", timeout=1) is None
+
+    @pytest.mark.asyncio
+    async def test_job_is_only_visible_to_its_app(self) -> None:
+        """Test that a job cannot be queried by another application"""
+
+        async def split(**kwargs: Any) -> List[Dict[str, Any]]:
+            return []
+
+        manager = SplitJobManager(ttl=60)
+        job = manager.submit(split, app_id="app-1")
+
+        assert manager.get(job.job_id, "app-1") is job
+        assert manager.get(job.job_id, "app-2") is None
+        assert await manager.wait(job.job_id, "app-2", timeout=1) is None
+
+    @pytest.mark.asyncio
+    async def test_submit_is_rejected_over_running_limit(self) -> None:
+        """Test that no job is started once max_running jobs are unfinished"""
+        release = asyncio.Event()
+
+        async def split(**kwargs: Any) -> List[Dict[str, Any]]:
+            await release.wait()
+            return []
+
+        manager = SplitJobManager(ttl=60, max_running=1)
+        job = manager.submit(split)
+        with pytest.raises(CustomException) as exc_info:
+            manager.submit(split)
+        assert exc_info.value.code == CodeEnum.SplitJobRejected.code
+        assert manager.running == 1
+
+        release.set()
+        assert job.task is not None
+        await job.task
+        assert manager.submit(split).job_id != job.job_id
+        await manager.close()
+
+    def test_progress_outside_job_is_ignored(self) -> None:
+        """Test that reporting progress outside of a job does nothing"""
+        report_split_progress("RUNNING", 0.5)
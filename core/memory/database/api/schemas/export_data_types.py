@@ -5,7 +5,7 @@ It defines the required fields and their constraints for exporting data
 from database tables.
 """
 
-from typing import Literal
+from typing import Literal, Optional
 
 from memory.database.api.schemas.common_types import DidUidCommon
 from pydantic import Field
@@ -20,6 +20,9 @@ class ExportDataInput(DidUidCommon):  # pylint: disable=too-few-public-methods
         uid (str): User ID (required, 1-64 chars, no Chinese/special characters)
         table_name (str): Name of the table to export data from (required)
         env (Literal["prod", "test"]): Environment (required, either 'prod' or 'test')
+        compress (bool): Whether to gzip the exported CSV (optional, default False)
+        max_rows (Optional[int]): Maximum number of exported rows, bounded by
+            EXPORT_DATA_MAX_ROWS (optional)
     """
 
     # app_id: Required, cannot contain Chinese and special characters
@@ -35,3 +38,9 @@ class ExportDataInput(DidUidCommon):  # pylint: disable=too-few-public-methods
     env: Literal["prod", "test"] = Field(
         ..., description="Required, can only be prod or test"
     )
+    # compress: Optional, gzip the exported file
+    compress: bool = Field(default=False, description="Optional, gzip the export")
+    # max_rows: Optional, at least 1
+    max_rows: Optional[int] = Field(
+        default=None, ge=1, description="Optional, maximum number of exported rows"
+    )
@@ -21,6 +21,7 @@ from memory.database.domain.entity.database_meta import (
     get_uid_by_space_id,
     update_database_meta_by_did_uid,
 )
+from memory.database.domain.entity.schema_catalog import schema_catalog_cache
 from memory.database.domain.entity.schema_meta import (
     del_schema_meta_by_did,
     get_schema_name_by_did,
@@ -185,6 +186,10 @@ async def clone_db(
                 await db.execute(text(copy_table_structures_sql))  # type: ignore[call-overload]
                 await db.execute(text(copy_data_sql))  # type: ignore[call-overload]
             await db.commit()
+            schema_catalog_cache.invalidate(
+                new_database_info.database_id,
+                [new_database_info.prod_schema, new_database_info.test_schema],
+            )
             m.in_success_count(lables={"uid": uid})
             return format_response(  # type: ignore[no-any-return]
                 CodeEnum.Successes.code,
@@ -404,6 +409,9 @@ async def drop_db(
                 drop_sql = safe_drop_schema_sql(schema[0])
                 await db.exec(drop_sql)  # type: ignore[call-overload]
             await db.commit()
+            schema_catalog_cache.invalidate(
+                database_id, [schema[0] for schema in schema_list or []]
+            )
             m.in_success_count(lables={"uid": uid})
             return format_response(  # type: ignore[no-any-return]
                 CodeEnum.Successes.code,
@@ -17,6 +17,7 @@ from memory.database.api.v1.common import (
 )
 from memory.database.domain.entity.general import exec_sql_statement
 from memory.database.domain.entity.schema import set_search_path_by_schema
+from memory.database.domain.entity.schema_catalog import schema_catalog_cache
 from memory.database.domain.entity.views.http_resp import format_response
 from memory.database.exceptions.e import CustomException
 from memory.database.exceptions.error_code import CodeEnum
@@ -441,6 +442,9 @@ async def exec_ddl(
         try:
             await _execute_ddl_statements(db, schema_list, ddls, span_context)  # type: ignore[arg-type]
             await db.commit()
+            schema_catalog_cache.invalidate(
+                database_id, [schema[0] for schema in schema_list or []]
+            )
             m.in_success_count(lables={"uid": uid})
             return format_response(  # type: ignore[no-any-return]
                 CodeEnum.Successes.code,
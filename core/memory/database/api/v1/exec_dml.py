@@ -2,13 +2,25 @@
 
 import datetime
 import decimal
+import os
 import re
 import string
 import time
 import uuid
-from typing import Any, Dict, List, Optional, Union
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-import sqlglot
 import sqlparse
 from common.service import get_otlp_metric_service, get_otlp_span_service
 from common.utils.snowfake import get_id
@@ -22,6 +34,10 @@ from memory.database.api.v1.common import (
 )
 from memory.database.domain.entity.general import exec_sql_statement, parse_and_exec_sql
 from memory.database.domain.entity.schema import set_search_path_by_schema
+from memory.database.domain.entity.schema_catalog import (
+    SchemaCatalog,
+    schema_catalog_cache,
+)
 from memory.database.domain.entity.views.http_resp import format_response
 from memory.database.exceptions.e import CustomException
 from memory.database.exceptions.error_code import CodeEnum
@@ -35,6 +51,250 @@ exec_dml_router = APIRouter(tags=["EXEC_DML"])
 
 INSERT_EXTRA_COLUMNS = ["id", "uid", "create_time", "update_time"]
 
+COMPARISON_TYPES = (exp.EQ, exp.NEQ, exp.GT, exp.LT, exp.GTE, exp.LTE)
+
+SQLGLOT_FUNC_KEY_MAP = {
+    "currentuser": "current_user",
+    "sessionuser": "session_user",
+    "currentdate": "current_date",
+    "currenttime": "current_time",
+    "currenttimestamp": "current_timestamp",
+    "currentschema": "current_schema",
+    "currentcatalog": "current_catalog",
+    "currentdatabase": "current_database",
+    "currentrole": "current_role",
+    "localtime": "localtime",
+    "localtimestamp": "localtimestamp",
+    "user": "user",
+    "systemuser": "system_user",
+}
+
+# Meta key marking the literals injected by the rewrite whose value depends on
+# the caller, so that a cached rewrite can be bound to another uid
+BOUND_VALUE_META = "bound_value"
+
+# Characters after which whitespace may be significant, statements containing
+# them are not whitespace-normalized
+_UNSAFE_TO_COLLAPSE = re.compile(r"['\"$]|--|/\*")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class DMLFacts:
+    """Facts about a statement gathered in a single walk of its AST."""
+
+    tables: List[str] = field(default_factory=list)
+    table_refs: List[str] = field(default_factory=list)
+    alias_map: Dict[str, str] = field(default_factory=dict)
+    functions: List[str] = field(default_factory=list)
+    columns: List[str] = field(default_factory=list)
+    insert_keys: List[str] = field(default_factory=list)
+    update_keys: List[str] = field(default_factory=list)
+    illegal_comparison: Optional[exp.Expression] = None
+    update_key_error: Optional[str] = None
+
+
+@dataclass
+class ParsedDML:
+    """Statement parsed once and shared by splitting, validation and rewriting.
+
+    The AST is never modified in place, the rewrite works on a copy.
+    """
+
+    ast: exp.Expression
+    facts: DMLFacts
+
+
+@dataclass
+class RewrittenDML:
+    """Cached rewrite result, with the caller dependent values left unbound."""
+
+    sql: str
+    params: Dict[str, Any]
+    bound_params: Dict[str, str]
+
+    def bind(self, app_id: str, uid: str) -> Dict[str, Any]:
+        """Build the parameters of the rewritten statement for a caller."""
+        params = dict(self.params)
+        for name, kind in self.bound_params.items():
+            params[name] = uid if kind == "uid" else f"{app_id}:{uid}"
+        return params
+
+
+class StatementCache:
+    """LRU cache keyed by statement, sized by DML_STATEMENT_CACHE_SIZE."""
+
+    def __init__(self) -> None:
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    @property
+    def max_entries(self) -> int:
+        """Maximum number of entries, 0 disables the cache."""
+        return int(os.getenv("DML_STATEMENT_CACHE_SIZE", "1024"))
+
+    def get(self, key: Hashable) -> Any:
+        """Get an entry, None when missing."""
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store an entry, evicting the least recently used ones beyond the limit."""
+        max_entries = self.max_entries
+        if max_entries <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+parsed_dml_cache = StatementCache()
+rewritten_dml_cache = StatementCache()
+
+
+def _normalize_dml(statement: str) -> str:
+    """Normalize a statement into a cache key.
+
+    Surrounding whitespace and trailing semicolons are dropped. Inner whitespace
+    is collapsed unless the statement contains quotes or comments, where it may
+    be significant.
+    """
+    normalized = statement.strip().rstrip(";").strip()
+    if not _UNSAFE_TO_COLLAPSE.search(normalized):
+        normalized = _WHITESPACE.sub(" ", normalized)
+    return normalized
+
+
+def _function_name(node: exp.Func) -> str:
+    """Get the SQL name of a function node."""
+    func_name = node.name
+    if not func_name:
+        key = getattr(node, "key", None) or type(node).__name__.lower()
+        func_name = SQLGLOT_FUNC_KEY_MAP.get(key, "")
+    return func_name
+
+
+def _visit_table(node: exp.Table, facts: DMLFacts) -> None:
+    """Collect the name, reference and aliases of a table node."""
+    facts.tables.append(node.name)
+    facts.table_refs.append(node.alias_or_name)
+    if node.name:
+        facts.alias_map[node.name] = node.name
+        if node.alias:
+            facts.alias_map[node.alias] = node.name
+
+
+def _visit_func(node: exp.Func, facts: DMLFacts) -> None:
+    """Collect the SQL name of a function node."""
+    func_name = _function_name(node)
+    if func_name:
+        facts.functions.append(func_name)
+
+
+def _visit_column(node: Column, facts: DMLFacts) -> None:
+    """Collect the name of a column node."""
+    if node.name:
+        facts.columns.append(node.name)
+
+
+def _visit_insert_keys(node: exp.Insert, facts: DMLFacts) -> None:
+    """Collect the column keys of an INSERT node."""
+    if node.this and hasattr(node.this, "expressions"):
+        facts.insert_keys.extend(
+            col.name for col in node.this.expressions if isinstance(col, Column)
+        )
+
+
+def _visit_update_keys(node: exp.Update, facts: DMLFacts) -> None:
+    """Collect the SET keys of an UPDATE node."""
+    for set_expr in node.expressions:
+        if not isinstance(set_expr, exp.EQ):
+            continue
+        if isinstance(set_expr.left, Column):
+            facts.update_keys.append(set_expr.left.name)
+        elif facts.update_key_error is None:
+            facts.update_key_error = (
+                f"Column names must be used in UPDATE SET clause: {set_expr}"
+            )
+
+
+def _visit_comparison(node: Any, facts: DMLFacts) -> None:
+    """Record the first comparison whose left side is not a column or literal."""
+    if (
+        isinstance(node, COMPARISON_TYPES)
+        and facts.illegal_comparison is None
+        and not isinstance(node.left, (Column, Literal))
+    ):
+        facts.illegal_comparison = node
+
+
+# Node visitors in match order, a node is handled by the first matching type
+_DML_VISITORS: Tuple[Tuple[type, Callable[[Any, DMLFacts], None]], ...] = (
+    (exp.Table, _visit_table),
+    (exp.Func, _visit_func),
+    (Column, _visit_column),
+    (exp.Insert, _visit_insert_keys),
+    (exp.Update, _visit_update_keys),
+)
+
+
+def _visit_dml(parsed: Any) -> DMLFacts:
+    """
+    Gather tables, functions, columns, keys and illegal comparisons in one walk.
+
+    Args:
+        parsed: Parsed SQL expression
+
+    Returns:
+        DMLFacts: Facts about the statement, in walk order
+    """
+    facts = DMLFacts()
+    for node in parsed.walk():
+        for node_type, visit in _DML_VISITORS:
+            if isinstance(node, node_type):
+                visit(node, facts)
+                break
+        _visit_comparison(node, facts)
+    return facts
+
+
+def _parse_dml(statement: str) -> ParsedDML:
+    """
+    Parse a statement once, reusing the AST of an identical earlier statement.
+
+    Args:
+        statement: Single DML statement
+
+    Returns:
+        ParsedDML: Shared AST and its facts, which must not be modified
+
+    Raises:
+        sqlglot.errors.ParseError: When the statement cannot be parsed
+    """
+    key = _normalize_dml(statement)
+    prepared = parsed_dml_cache.get(key)
+    if prepared is None:
+        ast = parse_one(statement, dialect="postgres")
+        prepared = ParsedDML(ast=ast, facts=_visit_dml(ast))
+        parsed_dml_cache.put(key, prepared)
+    return prepared
+
+
+def _schema_version(
+    column_types: Optional[Dict[str, str]],
+) -> Optional[FrozenSet[Tuple[str, str]]]:
+    """Version of the table schemas a rewrite depends on."""
+    return frozenset(column_types.items()) if column_types else None
+
 
 def _build_insert_literal_map(
     parsed: exp.Insert, table_name: str, literal_column_map: Dict[int, str]
@@ -196,13 +456,7 @@ def _resolve_table_name(
 
 def _build_table_alias_map(parsed: Any) -> Dict[str, str]:
     """Build mapping from table alias to actual table name."""
-    alias_map: Dict[str, str] = {}
-    for table in parsed.find_all(exp.Table):
-        if table.name:
-            alias_map[table.name] = table.name
-            if table.alias:
-                alias_map[table.alias] = table.name
-    return alias_map
+    return _visit_dml(parsed).alias_map
 
 
 def _build_literal_column_map(
@@ -282,6 +536,7 @@ def _parameterize_literals(
     parsed: Any,
     literal_column_map: Dict[int, str],
     column_types: Optional[Dict[str, str]],
+    bound_params: Optional[Dict[str, str]] = None,
 ) -> dict[str, Any]:
     """
     Parameterize literal values in SQL statements.
@@ -290,6 +545,8 @@ def _parameterize_literals(
         parsed: Parsed SQL expression
         literal_column_map: Mapping from literal node IDs to column names
         column_types: Column type mapping
+        bound_params: Filled with the parameters of the literals injected by the
+            rewrite, mapped to the kind of their caller dependent value
 
     Returns:
         dict: Parameter dictionary mapping parameter names to values
@@ -300,7 +557,10 @@ def _parameterize_literals(
             continue
 
         value = node.this
-        if _is_numeric_value(value):
+        # Injected uid literals are always bound, even when numeric, so that the
+        # cached statement never keeps the value of the caller that built it
+        bound_value = node.meta.get(BOUND_VALUE_META)
+        if bound_value is None and _is_numeric_value(value):
             continue
 
         if not isinstance(value, str):
@@ -315,6 +575,8 @@ def _parameterize_literals(
 
         # Generate unique parameter name and replace literal with placeholder
         param_name = f"param_{len(params_dict)}"
+        if bound_params is not None and bound_value is not None:
+            bound_params[param_name] = bound_value
         node.replace(exp.Placeholder(this=param_name))
         params_dict[param_name] = converted_value
 
@@ -331,6 +593,10 @@ def rewrite_dml_with_uid_and_limit(
     """
     Rewrite DML with UID and limit expressions.
 
+    SELECT, UPDATE and DELETE rewrites are cached by normalized statement, limit
+    and column types, only their uid parameters are bound per call. INSERT
+    rewrites are not cached, as every row gets a fresh id.
+
     Args:
         dml: Original DML statement
         app_id: Application ID
@@ -341,10 +607,16 @@ def rewrite_dml_with_uid_and_limit(
     Returns:
         tuple: (rewritten_sql, insert_ids, params_dict)
     """
-    parsed = parse_one(dml)
+    cache_key = (_normalize_dml(dml), limit_num, _schema_version(column_types))
+    cached = rewritten_dml_cache.get(cache_key)
+    if cached is not None:
+        return cached.sql, [], cached.bind(app_id, uid)
+
+    prepared = _parse_dml(dml)
+    parsed = prepared.ast.copy()
     insert_ids: List[int] = []
 
-    tables = [table.alias_or_name for table in parsed.find_all(exp.Table)]
+    tables = prepared.facts.table_refs
 
     if isinstance(parsed, (exp.Update, exp.Delete, exp.Select)):
         _dml_add_where(parsed, tables, app_id, uid)
@@ -363,16 +635,23 @@ def rewrite_dml_with_uid_and_limit(
         # Use first table as default, but functions will get actual table name
         # from Column nodes
         default_table_name = tables[0]
-        # Build alias map to resolve table aliases to actual table names
-        alias_map = _build_table_alias_map(parsed)
+        # The rewrite adds no table, so the aliases of the original statement apply
         _build_literal_column_map(
-            parsed, default_table_name, literal_column_map, alias_map
+            parsed, default_table_name, literal_column_map, prepared.facts.alias_map
         )
 
     # Parameterize values in SQL statements
-    params_dict = _parameterize_literals(parsed, literal_column_map, column_types)
+    bound_params: Dict[str, str] = {}
+    params_dict = _parameterize_literals(
+        parsed, literal_column_map, column_types, bound_params
+    )
+    rewritten_sql = parsed.sql(dialect="postgres")
 
-    return parsed.sql(dialect="postgres"), insert_ids, params_dict
+    if not isinstance(parsed, exp.Insert):
+        rewritten_dml_cache.put(
+            cache_key, RewrittenDML(rewritten_sql, dict(params_dict), bound_params)
+        )
+    return rewritten_sql, insert_ids, params_dict
 
 
 def _dml_add_where(parsed: Any, tables: List[str], app_id: str, uid: str) -> None:
@@ -382,13 +661,11 @@ def _dml_add_where(parsed: Any, tables: List[str], app_id: str, uid: str) -> Non
 
     for table in tables:
         uid_col = exp.Column(this="uid", table=table)
-        condition = exp.In(
-            this=uid_col,
-            expressions=[
-                exp.Literal.string(f"{uid}"),
-                exp.Literal.string(f"{app_id}:{uid}"),
-            ],
-        )
+        uid_value = exp.Literal.string(f"{uid}")
+        uid_value.meta[BOUND_VALUE_META] = "uid"
+        app_uid_value = exp.Literal.string(f"{app_id}:{uid}")
+        app_uid_value.meta[BOUND_VALUE_META] = "app_uid"
+        condition = exp.In(this=uid_col, expressions=[uid_value, app_uid_value])
         uid_conditions.append(condition)
 
     final_condition = uid_conditions[0]
@@ -463,127 +740,52 @@ def _collect_functions_names(parsed: Any) -> list:
     """
     Collect function names from parsed SQL AST.
     """
-    functions_to_validate = []
-    sqlglot_func_key_map = {
-        "currentuser": "current_user",
-        "sessionuser": "session_user",
-        "currentdate": "current_date",
-        "currenttime": "current_time",
-        "currenttimestamp": "current_timestamp",
-        "currentschema": "current_schema",
-        "currentcatalog": "current_catalog",
-        "currentdatabase": "current_database",
-        "currentrole": "current_role",
-        "localtime": "localtime",
-        "localtimestamp": "localtimestamp",
-        "user": "user",
-        "systemuser": "system_user",
-    }
-
-    for node in parsed.walk():
-        if not isinstance(node, exp.Func):
-            continue
-
-        func_name = node.name
-        if not func_name:
-            key = getattr(node, "key", None) or type(node).__name__.lower()
-            func_name = sqlglot_func_key_map.get(key, "")
-
-        if func_name:
-            functions_to_validate.append(func_name)
-
-    return functions_to_validate
+    return _visit_dml(parsed).functions
 
 
 def _collect_column_names(parsed: Any) -> list:
     """Collect column names."""
-    columns_to_validate = []
-    for node in parsed.walk():
-        if not isinstance(node, Column):
-            continue
-
-        column_name = node.name
-        if not column_name:
-            continue
-
-        columns_to_validate.append(column_name)
-    return columns_to_validate
+    return _visit_dml(parsed).columns
 
 
 def _collect_insert_keys(parsed: Any) -> list:
     """Collect key names from INSERT statements."""
-    keys_to_validate = []
-    for node in parsed.walk():
-        if not isinstance(node, exp.Insert):
-            continue
-
-        if not (node.this and hasattr(node.this, "expressions")):
-            continue
-
-        for col in node.this.expressions:
-            if isinstance(col, Column):
-                keys_to_validate.append(col.name)
-    return keys_to_validate
+    return _visit_dml(parsed).insert_keys
 
 
 def _collect_update_keys(parsed: Any) -> list:
     """Collect key names from UPDATE statements."""
-    keys_to_validate = []
-    for node in parsed.walk():
-        if not isinstance(node, exp.Update):
-            continue
-
-        for set_expr in node.expressions:
-            if not isinstance(set_expr, exp.EQ):
-                continue
-
-            left = set_expr.left
-            if isinstance(left, Column):
-                keys_to_validate.append(left.name)
-            elif not isinstance(left, Column):
-                raise ValueError(
-                    f"Column names must be used in UPDATE SET clause: {set_expr}"
-                )
-    return keys_to_validate
+    facts = _visit_dml(parsed)
+    if facts.update_key_error:
+        raise ValueError(facts.update_key_error)
+    return facts.update_keys
 
 
-def _collect_columns_and_keys(parsed: Any) -> tuple[list, list, list]:
+def _collect_columns_and_keys(
+    parsed: Any, facts: Optional[DMLFacts] = None
+) -> tuple[list, list, list]:
     """Collect column names and key names that need validation."""
-    functions_to_validate = _collect_functions_names(parsed)
-    columns_to_validate = _collect_column_names(parsed)
-    insert_keys = _collect_insert_keys(parsed)
-    update_keys = _collect_update_keys(parsed)
-    keys_to_validate = insert_keys + update_keys
-    return functions_to_validate, columns_to_validate, keys_to_validate
+    facts = facts or _visit_dml(parsed)
+    if facts.update_key_error:
+        raise ValueError(facts.update_key_error)
+    keys_to_validate = facts.insert_keys + facts.update_keys
+    return facts.functions, facts.columns, keys_to_validate
 
 
-def _validate_comparison_nodes(parsed: Any, uid: str, span_context: Any) -> Any:
+def _validate_comparison_nodes(
+    parsed: Any, uid: str, span_context: Any, facts: Optional[DMLFacts] = None
+) -> Any:
     """Validate comparison operation nodes."""
-    for node in parsed.walk():
-        # Check keys in WHERE conditions
-        if (
-            isinstance(node, exp.EQ)
-            or isinstance(node, exp.NEQ)
-            or isinstance(node, exp.GT)
-            or isinstance(node, exp.LT)
-            or isinstance(node, exp.GTE)
-            or isinstance(node, exp.LTE)
-        ):
-            # Get left side (usually column name)
-            left = node.left
-            if isinstance(left, Column):
-                # These column names will be collected in _collect_columns_and_keys
-                continue
-            elif not isinstance(left, (Column, Literal)):
-                span_context.add_error_event(
-                    f"DML statement contains illegal expression: {node}"
-                )
-                return format_response(
-                    code=CodeEnum.DMLNotAllowed.code,
-                    message=f"DML statement contains illegal expression: {node}",
-                    sid=span_context.sid,
-                )
-    return None
+    # Columns on the left are validated with the other collected columns
+    node = (facts or _visit_dml(parsed)).illegal_comparison
+    if node is None:
+        return None
+    span_context.add_error_event(f"DML statement contains illegal expression: {node}")
+    return format_response(
+        code=CodeEnum.DMLNotAllowed.code,
+        message=f"DML statement contains illegal expression: {node}",
+        sid=span_context.sid,
+    )
 
 
 def _validate_name_pattern(names: list, name_type: str, span_context: Any) -> Any:
@@ -647,16 +849,18 @@ def _validate_name_pattern(names: list, name_type: str, span_context: Any) -> An
 
 async def _validate_dml_legality(dml: str, uid: str, span_context: Any) -> Any:
     try:
-        parsed = sqlglot.parse_one(dml, dialect="postgres")
+        prepared = _parse_dml(dml)
 
         # Validate comparison operation nodes
-        error_result = _validate_comparison_nodes(parsed, uid, span_context)
+        error_result = _validate_comparison_nodes(
+            prepared.ast, uid, span_context, prepared.facts
+        )
         if error_result:
             return error_result
 
         # Collect column names and keys that need validation
         functions_to_validate, columns_to_validate, keys_to_validate = (
-            _collect_columns_and_keys(parsed)
+            _collect_columns_and_keys(prepared.ast, prepared.facts)
         )
         # Validate reserved function
         error_result = await validate_reserved_functions(
@@ -737,8 +941,53 @@ async def _validate_and_prepare_dml(db: Any, dml_input: Any, span_context: Any)
     return (app_id, uid, database_id, dml, env, schema_list), None
 
 
+async def _load_schema_catalog(db: AsyncSession, schema: str) -> SchemaCatalog:
+    """
+    Query the tables of a schema and the types of their columns in one query.
+
+    Args:
+        db: Database session
+        schema: Schema name
+
+    Returns:
+        SchemaCatalog: Table names and column types of the schema
+    """
+    sql = """
+        SELECT t.tablename, c.column_name, c.data_type, c.udt_name
+        FROM pg_tables t
+        LEFT JOIN information_schema.columns c
+            ON c.table_schema = t.schemaname AND c.table_name = t.tablename
+        WHERE t.schemaname = :schema
+    """
+    result = await parse_and_exec_sql(db, sql, {"schema": schema})
+    tables = set()
+    column_types: Dict[str, str] = {}
+    for table, col_name, data_type, udt_name in result.fetchall():
+        tables.add(table)
+        if col_name:
+            # Use udt_name (e.g. 'timestamp', 'varchar') for more accuracy,
+            # data_type (e.g. 'timestamp without time zone') if empty
+            column_types[f"{table}.{col_name}"] = udt_name if udt_name else data_type
+    return SchemaCatalog(tables=frozenset(tables), column_types=column_types)
+
+
+async def _get_schema_catalog(
+    db: AsyncSession,
+    database_id: Optional[int],
+    schema: str,
+    refresh: bool = False,
+) -> SchemaCatalog:
+    """Get the cached catalog of a schema, shared by validation and rewriting."""
+    return await schema_catalog_cache.get(
+        database_id, schema, lambda: _load_schema_catalog(db, schema), refresh
+    )
+
+
 async def _get_table_column_types(
-    db: AsyncSession, schema: str, tables: List[str]
+    db: AsyncSession,
+    schema: str,
+    tables: List[str],
+    database_id: Optional[int] = None,
 ) -> Dict[str, str]:
     """
     Query table column type information.
@@ -747,32 +996,14 @@ async def _get_table_column_types(
         db: Database session
         schema: Schema name
         tables: List of table names
+        database_id: Database ID of the schema, part of the catalog cache key
 
     Returns:
         dict: Column type mapping, key is "table.column", value is data type
-        (e.g., 'timestamp without time zone', 'character varying', etc.)
+        (e.g., 'timestamp', 'varchar', etc.)
     """
-    column_types: Dict[str, str] = {}
-    for table in tables:
-        sql = """
-            SELECT column_name, data_type, udt_name
-            FROM information_schema.columns
-            WHERE table_name = :table_name AND table_schema = :table_schema
-        """
-        result = await parse_and_exec_sql(
-            db, sql, {"table_name": table, "table_schema": schema}
-        )
-        for row in result.fetchall():
-            col_name = row[0]
-            # Standard data type, such as 'timestamp without time zone',
-            # 'character varying'
-            data_type = row[1]
-            # PostgreSQL specific type, such as 'timestamp', 'varchar'
-            udt_name = row[2]
-            key = f"{table}.{col_name}"
-            # Use udt_name for more accuracy, use data_type if empty
-            column_types[key] = udt_name if udt_name else data_type
-    return column_types
+    catalog = await _get_schema_catalog(db, database_id, schema)
+    return catalog.table_column_types(tables)
 
 
 async def _process_dml_statements(
@@ -782,6 +1013,7 @@ async def _process_dml_statements(
     span_context: Any,
     db: AsyncSession,
     schema: str,
+    database_id: Optional[int] = None,
 ) -> Any:
     """Process and rewrite DML statements."""
     rewrite_dmls = []
@@ -793,11 +1025,12 @@ async def _process_dml_statements(
         # Query column type information (if database connection and schema are provided)
         column_types: Optional[Dict[str, str]] = None
         try:
-            parsed = parse_one(statement)
             # Use actual table names (not aliases) for database query
-            tables = [table.name for table in parsed.find_all(exp.Table)]
+            tables = _parse_dml(statement).facts.tables
             if tables:
-                column_types = await _get_table_column_types(db, schema, tables)
+                column_types = await _get_table_column_types(
+                    db, schema, tables, database_id
+                )
                 span_context.add_info_event(
                     f"Column types for tables {tables}: {column_types}"
                 )
@@ -870,12 +1103,14 @@ async def exec_dml(
             if error_search:
                 return error_search  # type: ignore[no-any-return]
 
-            dmls, error_split = await _dml_split(dml, db, schema, uid, span_context)
+            dmls, error_split = await _dml_split(
+                dml, db, schema, uid, span_context, database_id
+            )
             if error_split:
                 return error_split  # type: ignore[no-any-return]
 
             rewrite_dmls, error_legality = await _process_dml_statements(
-                dmls, app_id, uid, span_context, db, schema
+                dmls, app_id, uid, span_context, db, schema, database_id
             )
             if error_legality:
                 return error_legality  # type: ignore[no-any-return]
@@ -996,17 +1231,23 @@ async def _set_search_path(
 
 
 async def _dml_split(
-    dml: str, db: Any, schema: str, uid: str, span_context: Any
+    dml: str,
+    db: Any,
+    schema: str,
+    uid: str,
+    span_context: Any,
+    database_id: Optional[int] = None,
 ) -> Any:
     """Split and validate DML statements."""
     dml = dml.strip()
     dmls = sqlparse.split(dml)
     span_context.add_info_event(f"Split DML statements: {dmls}")
 
+    catalog: Optional[SchemaCatalog] = None
+    refreshed = False
     for statement in dmls:
         try:
-            parsed = parse_one(statement)
-            tables = {table.name for table in parsed.find_all(exp.Table)}
+            tables = set(_parse_dml(statement).facts.tables)
         except Exception as parse_error:  # pylint: disable=broad-except
             span_context.record_exception(parse_error)
             return None, format_response(
@@ -1015,13 +1256,14 @@ async def _dml_split(
                 sid=span_context.sid,
             )
 
-        result = await parse_and_exec_sql(
-            db,
-            "SELECT tablename FROM pg_tables WHERE schemaname = :schema",
-            {"schema": schema},
-        )
-        valid_tables = {row[0] for row in result.fetchall()}
-        not_found = tables - valid_tables
+        if catalog is None:
+            catalog = await _get_schema_catalog(db, database_id, schema)
+        not_found = tables - catalog.tables
+        if not_found and not refreshed:
+            # The table may have been created through another worker
+            catalog = await _get_schema_catalog(db, database_id, schema, True)
+            refreshed = True
+            not_found = tables - catalog.tables
 
         if not_found:
             span_context.add_error_event(
@@ -2,37 +2,126 @@
 
 import csv
 import io
-from typing import Generator, Union
+import os
+import zlib
+from typing import Any, AsyncGenerator, AsyncIterator, Sequence, Union
 
 from common.otlp.trace.span import Span
 from common.service import get_otlp_metric_service, get_otlp_span_service
 from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
+from loguru import logger
 from memory.database.api.schemas.export_data_types import ExportDataInput
 from memory.database.domain.entity.views.http_resp import format_response
 from memory.database.exceptions.e import CustomException
 from memory.database.exceptions.error_code import CodeEnum
-from memory.database.repository.middleware.getters import get_session
+from memory.database.repository.middleware.getters import get_stream_session
 from sqlalchemy import text
 from sqlalchemy.sql import quoted_name
 from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.background import BackgroundTask
 from starlette.responses import JSONResponse
 
 export_data_router = APIRouter(tags=["EXPORT_DATA"])
 
 
+def _export_chunk_rows() -> int:
+    """Number of rows fetched from the cursor and written per CSV chunk."""
+    return max(int(os.getenv("EXPORT_DATA_CHUNK_ROWS", "1000")), 1)
+
+
+def _export_row_cap(requested: Union[int, None]) -> int:
+    """
+    Maximum number of exported rows, 0 meaning unlimited.
+
+    Args:
+        requested: Cap asked for by the caller, None for the configured one
+
+    Returns:
+        int: The requested cap bounded by EXPORT_DATA_MAX_ROWS
+    """
+    configured = max(int(os.getenv("EXPORT_DATA_MAX_ROWS", "0")), 0)
+    if requested is None:
+        return configured
+    return min(requested, configured) if configured else requested
+
+
+async def generate_csv(
+    rows: AsyncIterator[Sequence[Sequence[Any]]],
+    columns: Sequence[str],
+    compress: bool = False,
+) -> AsyncGenerator[bytes, None]:
+    """
+    Encode row partitions as CSV, one bounded chunk per partition.
+
+    Args:
+        rows: Partitions of rows read from the cursor
+        columns: Column names written as header
+        compress: Whether to gzip the chunks
+
+    Yields:
+        bytes: CSV chunk, gzip compressed when requested
+    """
+    compressor = zlib.compressobj(wbits=31) if compress else None
+    stream = io.StringIO()
+    writer = csv.writer(stream)
+
+    def flush() -> bytes:
+        data = stream.getvalue().encode("utf-8")
+        stream.seek(0)
+        stream.truncate()
+        return compressor.compress(data) if compressor else data
+
+    writer.writerow(columns)
+    yield flush()
+    async for partition in rows:
+        for row in partition:
+            writer.writerow([str(v) if v is not None else "" for v in row])
+        chunk = flush()
+        if chunk:
+            yield chunk
+    if compressor:
+        yield compressor.flush()
+
+
+async def _stream_export(
+    chunks: AsyncGenerator[bytes, None], db: AsyncSession, table_name: str
+) -> AsyncGenerator[bytes, None]:
+    """Stream the export chunks.
+
+    The export session is closed by a background task of the response, which
+    also runs when the client disconnects before the body is read. A failing
+    stream aborts the response before that task runs, so it closes the
+    session itself.
+    """
+    try:
+        async for chunk in chunks:
+            yield chunk
+    except Exception as stream_error:  # pylint: disable=broad-except
+        # The response has started, abort it rather than sending a truncated file
+        logger.error(f"Export of {table_name} failed while streaming: {stream_error}")
+        await db.close()
+        raise
+    finally:
+        await chunks.aclose()
+
+
 @export_data_router.post(
     "/export_data", response_class=JSONResponse, response_model=None
 )
 async def export_data(
-    export_input: ExportDataInput, db: AsyncSession = Depends(get_session)
+    export_input: ExportDataInput, db: AsyncSession = Depends(get_stream_session)
 ) -> Union[JSONResponse, StreamingResponse]:
     """
     Export data from specified database table to CSV format.
 
+    Rows are read through a server-side cursor and streamed in chunks of
+    EXPORT_DATA_CHUNK_ROWS rows, so memory use does not grow with the table.
+    The response owns the database session and closes it once streamed.
+
     Args:
         export_input: Input parameters for data export
-        db: Database session
+        db: Database session, closed by this endpoint
 
     Returns:
         StreamingResponse: CSV file download response
@@ -48,6 +137,7 @@ async def export_data(
     span_service = get_otlp_span_service()
     span = span_service.get_span()(uid=uid)
 
+    streaming = False
     with span.start(
         func_name="export_data",
         add_source_function_name=True,
@@ -63,29 +153,32 @@ async def export_data(
             }
             span_context.add_info_events(need_check)
 
+            max_rows = _export_row_cap(export_input.max_rows)
             rows, columns, error_response = await _set_search_path_and_exec(
-                db, database_id, table_name, env, uid, span_context
+                db, database_id, table_name, env, uid, span_context, max_rows
             )
             if error_response:
                 return error_response  # type: ignore[no-any-return]
 
-            def generate_csv() -> Generator[str, None, None]:
-                """Generate CSV data from query results."""
-                stream = io.StringIO()
-                writer = csv.writer(stream)
-                writer.writerow(columns)
-                for row in rows:
-                    writer.writerow([str(v) if v is not None else "" for v in row])
-                stream.seek(0)
-                yield stream.read()
-
             filename = f"{table_name}_export.csv"
+            media_type = "text/csv"
+            if export_input.compress:
+                filename = f"{filename}.gz"
+                media_type = "application/gzip"
+
             m.in_success_count(lables={"uid": uid})
-            return StreamingResponse(
-                generate_csv(),
-                media_type="text/csv",
+            response = StreamingResponse(
+                _stream_export(
+                    generate_csv(rows, columns, export_input.compress),
+                    db,
+                    table_name,
+                ),
+                media_type=media_type,
                 headers={"Content-Disposition": f"attachment; filename={filename}"},
+                background=BackgroundTask(db.close),
             )
+            streaming = True
+            return response
         except CustomException as custom_error:
             m.in_error_count(custom_error.code, lables={"uid": uid}, span=span_context)
             return format_response(  # type: ignore[no-any-return]
@@ -103,6 +196,9 @@ async def export_data(
             return format_response(  # type: ignore[no-any-return]
                 code="-1", message="Export data failed", sid=span_context.sid
             )
+        finally:
+            if not streaming:
+                await db.close()
 
 
 async def _set_search_path_and_exec(
@@ -112,9 +208,10 @@ async def _set_search_path_and_exec(
     env: str,
     uid: str,
     span_context: Span,
+    max_rows: int = 0,
 ) -> tuple:
     """
-    Set search path and execute query to fetch data.
+    Set search path and open a server-side cursor over the data.
 
     Args:
         db: Database session
@@ -123,10 +220,10 @@ async def _set_search_path_and_exec(
         env: Environment (prod/test)
         uid: User ID
         span_context: Span context for tracing
-        m: Meter for metrics
+        max_rows: Maximum number of rows, 0 for all of them
 
     Returns:
-        tuple: (rows, columns, error_response)
+        tuple: (row partitions, columns, error_response)
     """
     schema = f"{env}_{uid}_{database_id}"
     span_context.add_info_event(f"schema: {schema}")
@@ -150,11 +247,16 @@ async def _set_search_path_and_exec(
     try:
         # Use SQLAlchemy's quoted_name to safely escape table identifier
         safe_table = quoted_name(table_name, quote=True)
-        result = await db.execute(  # type: ignore[call-overload]
-            text(f'SELECT * FROM "{safe_table}" WHERE uid = :uid'), {"uid": uid}
+        sql = f'SELECT * FROM "{safe_table}" WHERE uid = :uid'
+        params: dict = {"uid": uid}
+        if max_rows:
+            sql = f"{sql} LIMIT :max_rows"
+            params["max_rows"] = max_rows
+        chunk_rows = _export_chunk_rows()
+        result = await db.stream(
+            text(sql).execution_options(yield_per=chunk_rows), params
         )
-        rows = result.fetchall()
-        columns = result.keys()
+        columns = list(result.keys())
     except Exception as query_error:  # pylint: disable=broad-except
         span_context.record_exception(query_error)
         return (
@@ -167,7 +269,4 @@ async def _set_search_path_and_exec(
             ),
         )
 
-    if not rows:
-        span_context.add_info_event(f"No data in {schema}.{table_name} table")
-
-    return rows, columns, None
+    return result.partitions(chunk_rows), columns, None
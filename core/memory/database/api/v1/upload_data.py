@@ -1,8 +1,24 @@
 """API endpoints for uploading data to database tables."""
 
+import asyncio
+import csv
+import datetime
+import decimal
 import io
-from typing import Dict, List, Tuple
-
+import itertools
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import openpyxl
 import pandas as pd
 from common.otlp.trace.span import Span
 from common.service import get_otlp_metric_service, get_otlp_span_service
@@ -22,13 +38,78 @@ upload_data_router = APIRouter(tags=["UPLOAD_DATA"])
 
 SUPPORT_DATA_FILE_TYPES = ("csv", "xls", "xlsx")
 INSERT_EXTRA_COLUMNS = ["id", "uid"]
+UPLOAD_BATCH_SIZE = 500
+
+INTEGER_TYPES = ("smallint", "integer", "bigint")
+FLOAT_TYPES = ("real", "double precision")
+TRUE_VALUES = ("true", "t", "yes", "y", "1")
+FALSE_VALUES = ("false", "f", "no", "n", "0")
+
+
+def _is_blank_row(row: List[Any]) -> bool:
+    """Check whether a row has no value, such rows are skipped like pandas does."""
+    return all(value is None or str(value).strip() == "" for value in row)
+
+
+def _iter_csv_rows(stream: BinaryIO) -> Iterator[List[Any]]:
+    """Read the rows of a CSV stream one at a time."""
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        for row in csv.reader(text_stream):
+            if not _is_blank_row(row):
+                yield row
+    finally:
+        # Leave the upload stream open, it is closed with the upload
+        text_stream.detach()
+
+
+def _iter_xlsx_rows(stream: BinaryIO) -> Iterator[List[Any]]:
+    """Read the rows of the first sheet of an XLSX stream one at a time."""
+    workbook = openpyxl.load_workbook(stream, read_only=True, data_only=True)
+    try:
+        for row in workbook.active.iter_rows(values_only=True):
+            if not _is_blank_row(list(row)):
+                yield list(row)
+    finally:
+        workbook.close()
+
+
+def _iter_xls_rows(stream: BinaryIO) -> Iterator[List[Any]]:
+    """Read the rows of an XLS stream, legacy sheets have no incremental reader."""
+    df = pd.read_excel(stream, header=None, dtype=object)
+    for row in df.itertuples(index=False):
+        values = [None if pd.isna(value) else value for value in row]
+        if not _is_blank_row(values):
+            yield values
+
+
+def _iter_file_rows(stream: BinaryIO, ext: str) -> Iterator[List[Any]]:
+    """Read the rows of an uploaded file, header included."""
+    if ext == "csv":
+        return _iter_csv_rows(stream)
+    if ext == "xlsx":
+        return _iter_xlsx_rows(stream)
+    return _iter_xls_rows(stream)
 
 
-async def parse_upload_file(
+async def _next_rows(rows: Iterator[List[Any]], count: int) -> List[List[Any]]:
+    """Read the next rows of a file off the event loop."""
+    try:
+        return await asyncio.to_thread(lambda: list(itertools.islice(rows, count)))
+    except Exception as parse_error:  # pylint: disable=broad-except
+        raise CustomException(
+            CodeEnum.ParseFileError, err_msg=str(parse_error)
+        ) from parse_error
+
+
+async def open_upload_file(
     file: UploadFile,
-) -> Tuple[List[str], List[Dict], List[int]]:
+) -> Tuple[List[str], Iterator[List[Any]]]:
     """
-    Parse the uploaded file and return columns, records and line numbers.
+    Open the uploaded file for incremental reading.
+
+    The file is read from its spooled upload stream, so that it is never held
+    in memory as a whole.
 
     Args:
         file: Uploaded file to parse
@@ -36,40 +117,283 @@ async def parse_upload_file(
     Returns:
         Tuple containing:
         - List of column names
-        - List of record dictionaries
-        - List of line numbers
+        - Iterator over the remaining rows, as lists of cell values
 
     Raises:
-        CustomException: If file type is not supported or parsing fails
+        CustomException: If file type is not supported, parsing fails or the
+        file has no header
     """
-    content = await file.read()
-
     if not file.filename or not file.filename.endswith(SUPPORT_DATA_FILE_TYPES):
         raise CustomException(
-            CodeEnum.UploadFileTypeError.code,
-            message="Data file type only supports csv, xls or xlsx",
+            CodeEnum.UploadFileTypeError,
+            err_msg="Data file type only supports csv, xls or xlsx",
         )
 
     ext = file.filename.lower().split(".")[-1]
+    await file.seek(0)
+    rows = _iter_file_rows(file.file, ext)
+    header = await _next_rows(rows, 1)
+    if not header:
+        raise CustomException(CodeEnum.FileEmptyError)
+
+    columns = [str(column).strip() for column in header[0]]
+    return columns, rows
+
+
+async def iter_upload_records(
+    columns: List[str],
+    rows: Iterator[List[Any]],
+    batch_size: int = UPLOAD_BATCH_SIZE,
+) -> AsyncIterator[Tuple[List[Dict], List[int]]]:
+    """
+    Read the records of an opened upload file in batches.
+
+    Args:
+        columns: Column names of the file
+        rows: Row iterator returned by open_upload_file
+        batch_size: Number of records per batch
+
+    Yields:
+        Tuple containing:
+        - List of record dictionaries
+        - List of line numbers, the header being line 1
+
+    Raises:
+        CustomException: If parsing fails or the file has no record
+    """
+    line_no = 2
+    while True:
+        batch = await _next_rows(rows, batch_size)
+        if not batch:
+            break
+        records = [
+            dict(itertools.zip_longest(columns, row[: len(columns)])) for row in batch
+        ]
+        yield records, list(range(line_no, line_no + len(batch)))
+        line_no += len(batch)
+
+    if line_no == 2:
+        raise CustomException(CodeEnum.FileEmptyError)
+
+
+def _to_decimal(value: Any) -> decimal.Decimal:
+    """Parse a number cell exactly."""
     try:
-        if ext == "csv":
-            df = pd.read_csv(io.BytesIO(content))
-        elif ext in ["xls", "xlsx"]:
-            df = pd.read_excel(io.BytesIO(content))
-    except Exception as parse_error:  # pylint: disable=broad-except
-        raise CustomException(
-            CodeEnum.ParseFileError.code,
-            message=f"File parsing failed: {str(parse_error)}",
-        ) from parse_error
+        return decimal.Decimal(str(value).strip())
+    except decimal.InvalidOperation as decimal_error:
+        raise ValueError(f"invalid number: {value}") from decimal_error
+
+
+def _coerce_integer(value: Any) -> int:
+    """Parse an integer cell, accepting integral decimals such as 3.0."""
+    number = _to_decimal(value)
+    if number != number.to_integral_value():
+        raise ValueError(f"invalid integer: {value}")
+    return int(number)
+
+
+def _coerce_boolean(value: Any) -> bool:
+    """Parse a boolean cell with the literals PostgreSQL accepts."""
+    if isinstance(value, bool):
+        return value
+    lowered = str(value).strip().lower()
+    if lowered in TRUE_VALUES:
+        return True
+    if lowered in FALSE_VALUES:
+        return False
+    raise ValueError(f"invalid boolean: {value}")
+
+
+def _parse_datetime(value: Any) -> datetime.datetime:
+    """
+    Parse a date or time cell as leniently as PostgreSQL does.
+
+    ISO 8601 strings are parsed directly, other layouts such as
+    2024/01/02 10:00:00 or Jan 2 2024 go through the pandas parser.
+
+    Args:
+        value: Cell value
+
+    Returns:
+        Parsed datetime, today's date for a time-only value
+
+    Raises:
+        ValueError: If the value is not a date or time
+    """
+    text_value = str(value).strip()
+    try:
+        return datetime.datetime.fromisoformat(text_value)
+    except ValueError:
+        pass
+    try:
+        parsed = pd.to_datetime(text_value)
+    except (ValueError, OverflowError) as parse_error:
+        raise ValueError(f"invalid date/time: {value}") from parse_error
+    if pd.isna(parsed):
+        raise ValueError(f"invalid date/time: {value}")
+    return parsed.to_pydatetime()
+
+
+def _coerce_timestamp(value: Any) -> datetime.datetime:
+    """Parse a timestamp cell."""
+    if isinstance(value, datetime.datetime):
+        return value
+    return _parse_datetime(value)
+
+
+def _coerce_date(value: Any) -> datetime.date:
+    """Parse a date cell."""
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return _parse_datetime(value).date()
+
+
+def _coerce_time(value: Any) -> datetime.time:
+    """Parse a time cell."""
+    if isinstance(value, datetime.time):
+        return value
+    try:
+        return datetime.time.fromisoformat(str(value).strip())
+    except ValueError:
+        return _parse_datetime(value).timetz()
+
+
+COLUMN_COERCERS: Dict[str, Callable[[Any], Any]] = {
+    **{data_type: _coerce_integer for data_type in INTEGER_TYPES},
+    **{data_type: float for data_type in FLOAT_TYPES},
+    **{data_type: str for data_type in ("text", "character varying", "character")},
+    "numeric": _to_decimal,
+    "decimal": _to_decimal,
+    "boolean": _coerce_boolean,
+    "date": _coerce_date,
+}
+
+
+def _column_coercer(data_type: str) -> Optional[Callable[[Any], Any]]:
+    """Get the converter of a column type, None keeps values unchanged."""
+    data_type = data_type.lower()
+    if data_type.startswith("timestamp"):
+        return _coerce_timestamp
+    if data_type.startswith("time"):
+        return _coerce_time
+    return COLUMN_COERCERS.get(data_type)
+
+
+def _coerce_value(value: Any, data_type: str) -> Any:
+    """
+    Convert a cell value to the Python type of its target column.
+
+    Args:
+        value: Cell value, a string for CSV files
+        data_type: information_schema data type of the column
+
+    Returns:
+        Converted value, None for empty cells
+
+    Raises:
+        ValueError: If the value does not fit the column type
+    """
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    if isinstance(value, float) and pd.isna(value):
+        return None
+
+    coercer = _column_coercer(data_type)
+    return value if coercer is None else coercer(value)
+
+
+def _coerce_record(record: Dict, column_types: Dict[str, str]) -> Dict:
+    """Convert every value of a record to the type of its column."""
+    coerced = {}
+    for key, value in record.items():
+        try:
+            coerced[key] = _coerce_value(value, column_types.get(key, ""))
+        except (TypeError, ValueError) as coerce_error:
+            raise ValueError(
+                f"Column {key} expects {column_types.get(key)}: {coerce_error}"
+            ) from coerce_error
+    return coerced
+
+
+def _prepare_batch(
+    records: List[Dict],
+    line_numbers: List[int],
+    uid: str,
+    column_types: Optional[Dict[str, str]],
+    failed_rows: List[Dict],
+) -> Tuple[List[Dict], List[int]]:
+    """
+    Convert the records of a batch and add their generated columns.
+
+    Args:
+        records: Records of the batch
+        line_numbers: Corresponding line numbers
+        uid: User ID
+        column_types: Data type of the table columns, None keeps the values
+        failed_rows: Receives the records that do not fit their column types
 
-    if df.empty:
-        raise CustomException(CodeEnum.FileEmptyError.code, message="File is empty")
+    Returns:
+        Tuple of the records to insert and their line numbers
+    """
+    items: List[Dict] = []
+    item_lines: List[int] = []
+    for item, line_no in zip(records, line_numbers):
+        try:
+            if column_types:
+                item = _coerce_record(item, column_types)
+        except ValueError as coerce_error:
+            failed_rows.append({"line": line_no, "error": str(coerce_error)})
+            continue
+        item.update({"id": get_id(), "uid": uid})
+        items.append(item)
+        item_lines.append(line_no)
+    return items, item_lines
+
+
+async def _insert_batch(
+    db: AsyncSession,
+    sql: Any,
+    items: List[Dict],
+    item_lines: List[int],
+    failed_rows: List[Dict],
+    span_context: Optional[Span] = None,
+) -> List[int]:
+    """
+    Insert a batch with one statement, falling back to one row at a time.
 
-    columns = df.columns.tolist()
-    records = df.to_dict(orient="records")
-    line_numbers = [i + 2 for i in df.index.to_list()]
+    Args:
+        db: Database session
+        sql: Insert statement
+        items: Records to insert
+        item_lines: Corresponding line numbers
+        failed_rows: Receives the rows that could not be inserted
+        span_context: Span context for tracing
 
-    return columns, records, line_numbers
+    Returns:
+        IDs of the inserted rows
+    """
+    try:
+        async with db.begin_nested():
+            await db.execute(sql, items)  # type: ignore[call-overload]
+        return [item["id"] for item in items]
+    except Exception as batch_error:  # pylint: disable=broad-except
+        if span_context:
+            span_context.add_info_event(
+                f"batch of lines {item_lines[0]}-{item_lines[-1]} failed, "
+                f"retrying row by row: {str(batch_error)}"
+            )
+
+    success_rows: List[int] = []
+    for item, line_no in zip(items, item_lines):
+        try:
+            async with db.begin_nested():
+                await db.execute(sql, item)  # type: ignore[call-overload]
+            success_rows.append(item["id"])
+        except Exception as insert_error:  # pylint: disable=broad-except
+            failed_rows.append({"line": line_no, "error": str(insert_error)})
+    return success_rows
 
 
 async def insert_in_batches(
@@ -78,12 +402,17 @@ async def insert_in_batches(
     records: List[Dict],
     line_numbers: List[int],
     uid: str,
-    batch_size: int = 500,
+    batch_size: int = UPLOAD_BATCH_SIZE,
     span_context: Span = None,
+    column_types: Optional[Dict[str, str]] = None,
 ) -> Tuple[List[int], List[Dict]]:
     """
     Insert records into database table in batches.
 
+    Every batch is inserted with a single multi-row statement in a savepoint.
+    When it fails, its rows are inserted one by one in their own savepoints, so
+    that only the failing lines are reported and the others are kept.
+
     Args:
         db: Database session
         table_name: Target table name
@@ -92,6 +421,8 @@ async def insert_in_batches(
         uid: User ID
         batch_size: Batch size for insertion
         span_context: Span context for tracing
+        column_types: Data type of the table columns, records are converted to
+            them when given
 
     Returns:
         Tuple containing:
@@ -113,21 +444,23 @@ async def insert_in_batches(
     if span_context:
         span_context.add_info_events({"insert_in_batches exec sql": sql_text})
 
-    success_rows = []
-    failed_rows = []
+    success_rows: List[int] = []
+    failed_rows: List[Dict] = []
 
     for i in range(0, len(records), batch_size):
-        batch = records[i : i + batch_size]
-        batch_lines = line_numbers[i : i + batch_size]
-
-        for item, line_no in zip(batch, batch_lines):
-            try:
-                row_id = get_id()
-                item.update({"id": row_id, "uid": uid})
-                await db.execute(sql, item)  # type: ignore[call-overload]
-                success_rows.append(row_id)
-            except Exception as insert_error:  # pylint: disable=broad-except
-                failed_rows.append({"line": line_no, "error": str(insert_error)})
+        items, item_lines = _prepare_batch(
+            records[i : i + batch_size],
+            line_numbers[i : i + batch_size],
+            uid,
+            column_types,
+            failed_rows,
+        )
+        if items:
+            success_rows.extend(
+                await _insert_batch(
+                    db, sql, items, item_lines, failed_rows, span_context
+                )
+            )
 
     return success_rows, failed_rows
 
@@ -192,7 +525,7 @@ async def upload_data(
 
             sql = text(
                 """
-                SELECT column_name
+                SELECT column_name, data_type
                 FROM information_schema.columns
                 WHERE table_name = :table_name AND table_schema = :table_schema
             """
@@ -200,9 +533,10 @@ async def upload_data(
             result = await db.execute(  # type: ignore[call-overload]
                 sql, {"table_name": table_name, "table_schema": schema}
             )
-            table_columns = [row[0] for row in result.fetchall()]
+            column_types = {row[0]: row[1] for row in result.fetchall()}
+            table_columns = list(column_types)
 
-            columns, records, line_numbers = await parse_upload_file(file)
+            columns, rows = await open_upload_file(file)
 
             span_context.add_info_event(f"upload file columns: {columns}")
             span_context.add_info_event(f"target table columns: {table_columns}")
@@ -215,9 +549,20 @@ async def upload_data(
                     "please check",
                 )
 
-            success_rows, failed_rows = await insert_in_batches(
-                db, table_name, records, line_numbers, uid, span_context=span_context
-            )
+            success_rows: List[int] = []
+            failed_rows: List[Dict] = []
+            async for records, line_numbers in iter_upload_records(columns, rows):
+                batch_success, batch_failed = await insert_in_batches(
+                    db,
+                    table_name,
+                    records,
+                    line_numbers,
+                    uid,
+                    span_context=span_context,
+                    column_types=column_types,
+                )
+                success_rows.extend(batch_success)
+                failed_rows.extend(batch_failed)
 
             span_context.add_info_event(f"insert successful rows: {success_rows}")
             span_context.add_info_event(f"insert failing rows: {failed_rows}")
@@ -0,0 +1,112 @@
+"""Module caching the table catalog of tenant schemas."""
+
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+
+CatalogKey = Tuple[Optional[int], str]
+
+
+@dataclass(frozen=True)
+class SchemaCatalog:
+    """Tables of a schema and the data types of their columns.
+
+    Attributes:
+        tables: Table names of the schema
+        column_types: Column data types, key is "table.column"
+    """
+
+    tables: FrozenSet[str] = frozenset()
+    column_types: Dict[str, str] = field(default_factory=dict)
+
+    def table_column_types(self, tables: Iterable[str]) -> Dict[str, str]:
+        """Get the column data types of the given tables.
+
+        Args:
+            tables: Table names
+
+        Returns:
+            Column data types of these tables, key is "table.column"
+        """
+        prefixes = tuple(f"{table}." for table in set(tables))
+        return {
+            key: data_type
+            for key, data_type in self.column_types.items()
+            if key.startswith(prefixes)
+        }
+
+
+class SchemaCatalogCache:
+    """In-process cache of schema catalogs keyed by (database_id, schema).
+
+    Entries are dropped when DDL, clone or drop operations change a database of
+    this process, and expire after DML_CATALOG_CACHE_TTL seconds to bound the
+    staleness left by changes made through other workers.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[CatalogKey, Tuple[float, SchemaCatalog]] = {}
+
+    @property
+    def ttl(self) -> float:
+        """Lifetime of an entry in seconds, 0 disables the cache."""
+        return float(os.getenv("DML_CATALOG_CACHE_TTL", "300"))
+
+    async def get(
+        self,
+        database_id: Optional[int],
+        schema: str,
+        loader: Callable[[], Awaitable[SchemaCatalog]],
+        refresh: bool = False,
+    ) -> SchemaCatalog:
+        """Get the catalog of a schema, loading it when missing or expired.
+
+        Args:
+            database_id: Database ID
+            schema: Schema name
+            loader: Coroutine function loading the catalog
+            refresh: Whether to reload the catalog even if cached
+
+        Returns:
+            Catalog of the schema
+        """
+        key = (database_id, schema)
+        entry = self._entries.get(key)
+        if entry is not None and not refresh and entry[0] > time.monotonic():
+            return entry[1]
+
+        catalog = await loader()
+        ttl = self.ttl
+        if ttl > 0:
+            self._entries[key] = (time.monotonic() + ttl, catalog)
+        return catalog
+
+    def invalidate(
+        self, database_id: Optional[int] = None, schemas: Iterable[str] = ()
+    ) -> int:
+        """Drop the catalogs of a database or of some schemas.
+
+        Args:
+            database_id: Database ID whose catalogs are dropped
+            schemas: Schema names whose catalogs are dropped
+
+        Returns:
+            Number of dropped entries
+        """
+        schemas = set(schemas)
+        keys = [
+            key
+            for key in self._entries
+            if (database_id is not None and key[0] == database_id) or key[1] in schemas
+        ]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
+schema_catalog_cache = SchemaCatalogCache()
@@ -153,6 +153,17 @@ class DatabaseService(Service):
         async with self.engine.begin() as conn:
             await conn.run_sync(SQLModel.metadata.create_all)
 
+    def create_session(self) -> AsyncSession:
+        """Create a session whose lifetime is managed by the caller.
+
+        Returns:
+            AsyncSession: Database session instance, to be closed by the caller
+        """
+        if self._async_session is None:
+            raise RuntimeError("Database service not properly initialized")
+        session: AsyncSession = self._async_session()
+        return session
+
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         """Get an async database session with transaction management.
 
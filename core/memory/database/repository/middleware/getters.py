@@ -28,3 +28,24 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             yield session
         finally:
             await session.close()
+
+
+async def get_stream_session() -> AsyncSession:
+    """Get an async database session that outlives the request handler.
+
+    Returns:
+        AsyncSession: An async database session instance
+
+    Note:
+        Sessions of dependencies with yield are closed before a streaming
+        response body is sent, so streaming endpoints own this session and
+        must close it once the response has been streamed.
+    """
+    db_service = await service_manager.get(ServiceType.DATABASE_SERVICE)
+    session = db_service.create_session()
+    try:
+        await set_search_path_by_schema(session, "sparkdb_manager")
+    except Exception:
+        await session.close()
+        raise
+    return session
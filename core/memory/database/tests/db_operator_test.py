@@ -19,6 +19,10 @@ from memory.database.api.v1.db_operator import (
     generate_copy_table_structures_sql,
     modify_db_description,
 )
+from memory.database.domain.entity.schema_catalog import (
+    SchemaCatalog,
+    schema_catalog_cache,
+)
 from memory.database.domain.models.database_meta import DatabaseMeta
 from memory.database.domain.models.schema_meta import SchemaMeta
 from memory.database.exceptions.error_code import CodeEnum
@@ -358,6 +362,11 @@ async def test_drop_db_success() -> None:
                     ) as mock_del_schema_meta:
                         mock_del_schema_meta.return_value = None
 
+                        catalog_loader = AsyncMock(return_value=SchemaCatalog())
+                        await schema_catalog_cache.get(
+                            123, "prod_u1_123", catalog_loader
+                        )
+
                         response = await drop_db(test_input, mock_db)
 
                         response_body = json.loads(response.body)
@@ -367,6 +376,12 @@ async def test_drop_db_success() -> None:
                         assert response_body["sid"] == "drop-sid"
                         assert "data" not in response_body
 
+                        # Cached catalogs of the dropped schemas are invalidated
+                        await schema_catalog_cache.get(
+                            123, "prod_u1_123", catalog_loader
+                        )
+                        assert catalog_loader.await_count == 2
+
 
 @pytest.mark.asyncio
 async def test_modify_db_description_success() -> None:
@@ -32,14 +32,23 @@ from memory.database.api.v1.exec_dml import (
     _validate_dml_legality,
     _validate_name_pattern,
     exec_dml,
+    parsed_dml_cache,
     rewrite_dml_with_uid_and_limit,
+    rewritten_dml_cache,
     to_jsonable,
 )
+from memory.database.domain.entity.schema_catalog import schema_catalog_cache
 from memory.database.exceptions.error_code import CodeEnum
 from sqlglot import parse_one
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 
+@pytest.fixture(autouse=True)
+def clear_schema_catalog_cache() -> None:
+    """Start every test without cached schema catalogs."""
+    schema_catalog_cache.clear()
+
+
 def test_rewrite_dml_with_uid_and_limit() -> None:
     """Test SQL rewrite function (add WHERE conditions and LIMIT)."""
     test_dml = "SELECT * FROM users WHERE age > 18"
@@ -153,7 +162,7 @@ async def test_dml_split_success() -> None:
     mock_span_context = MagicMock()
 
     mock_result = MagicMock()
-    mock_result.fetchall.return_value = [("users",)]
+    mock_result.fetchall.return_value = [("users", "id", "bigint", "int8")]
     with patch(
         "memory.database.api.v1.exec_dml.parse_and_exec_sql", new_callable=AsyncMock
     ) as mock_parse_exec:
@@ -1026,3 +1035,177 @@ def test_rewrite_dml_with_complex_where() -> None:
     assert isinstance(params_dict, dict)
     # Check that literals are parameterized
     assert "John" in params_dict.values() or "Jane" in params_dict.values()
+
+
+@pytest.mark.asyncio
+async def test_process_dml_statements_parses_each_statement_once() -> None:
+    """Validation, column type lookup and rewrite share one parse per statement."""
+    parsed_dml_cache.clear()
+    rewritten_dml_cache.clear()
+    dmls = ["SELECT name FROM users WHERE age > 18"]
+    span_context = MagicMock()
+    mock_db = AsyncMock(spec=AsyncSession)
+
+    with patch(
+        "memory.database.api.v1.exec_dml.parse_one", wraps=parse_one
+    ) as mock_parse, patch(
+        "memory.database.api.v1.exec_dml._get_table_column_types",
+        new_callable=AsyncMock,
+    ) as mock_get_types:
+        mock_get_types.return_value = {}
+
+        result, error = await _process_dml_statements(
+            dmls, "app123", "u1", span_context, mock_db, "prod_u1_1001"
+        )
+
+    assert error is None
+    assert result is not None
+    assert "users.uid IN (:param_0, :param_1)" in result[0]["rewrite_dml"]
+    mock_parse.assert_called_once()
+    mock_get_types.assert_awaited_once_with(mock_db, "prod_u1_1001", ["users"], None)
+
+
+def test_rewrite_dml_cache_binds_caller() -> None:
+    """A cached rewrite is reused for another uid with its own parameters."""
+    rewritten_dml_cache.clear()
+    first = rewrite_dml_with_uid_and_limit(
+        dml="SELECT * FROM users WHERE age > 18",
+        app_id="app123",
+        uid="user456",
+        limit_num=100,
+    )
+    second = rewrite_dml_with_uid_and_limit(
+        dml="  SELECT *   FROM users\nWHERE age > 18;",
+        app_id="app789",
+        uid="user000",
+        limit_num=100,
+    )
+
+    assert len(rewritten_dml_cache) == 1
+    assert second[0] == first[0]
+    assert first[2] == {"param_0": "user456", "param_1": "app123:user456"}
+    assert second[2] == {"param_0": "user000", "param_1": "app789:user000"}
+
+
+@pytest.mark.parametrize(
+    "dml",
+    [
+        "SELECT * FROM t WHERE a = 1",
+        "UPDATE t SET a = 2 WHERE a = 1",
+        "DELETE FROM t WHERE a = 1",
+    ],
+)
+def test_rewrite_dml_cache_binds_numeric_uid(dml: str) -> None:
+    """A numeric uid is bound, never inlined into the cached statement."""
+    rewritten_dml_cache.clear()
+    first_sql, _, first = rewrite_dml_with_uid_and_limit(dml, "app", "111", 100)
+    second_sql, _, second = rewrite_dml_with_uid_and_limit(dml, "app", "222", 100)
+
+    assert len(rewritten_dml_cache) == 1
+    assert second_sql == first_sql
+    assert "111" not in first_sql
+    assert "t.uid IN (:param_0, :param_1)" in first_sql
+    assert first == {"param_0": "111", "param_1": "app:111"}
+    assert second == {"param_0": "222", "param_1": "app:222"}
+
+
+def test_rewrite_dml_cache_keyed_by_schema_version() -> None:
+    """A change of column types misses the cache, INSERT is never cached."""
+    rewritten_dml_cache.clear()
+    test_dml = "UPDATE users SET create_time = '2025-11-14 14:56:36'"
+    _, _, as_text = rewrite_dml_with_uid_and_limit(
+        dml=test_dml, app_id="app123", uid="user456", limit_num=100
+    )
+    _, _, as_timestamp = rewrite_dml_with_uid_and_limit(
+        dml=test_dml,
+        app_id="app123",
+        uid="user456",
+        limit_num=100,
+        column_types={"users.create_time": "timestamp"},
+    )
+
+    assert "2025-11-14 14:56:36" in as_text.values()
+    assert datetime.datetime(2025, 11, 14, 14, 56, 36) in as_timestamp.values()
+    assert len(rewritten_dml_cache) == 2
+
+    insert_dml = "INSERT INTO users (name) VALUES ('test')"
+    _, first_ids, _ = rewrite_dml_with_uid_and_limit(
+        dml=insert_dml, app_id="app123", uid="user456", limit_num=100
+    )
+    _, second_ids, _ = rewrite_dml_with_uid_and_limit(
+        dml=insert_dml, app_id="app123", uid="user456", limit_num=100
+    )
+    assert first_ids != second_ids
+    assert len(rewritten_dml_cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_schema_catalog_shared_by_split_and_rewrite() -> None:
+    """One catalog query serves table validation and column types of all statements."""
+    mock_db = AsyncMock(spec=AsyncSession)
+    span_context = MagicMock()
+    catalog_result = MagicMock()
+    catalog_result.fetchall.return_value = [
+        ("users", "name", "character varying", "varchar"),
+        ("users", "create_time", "timestamp without time zone", "timestamp"),
+        ("orders", "id", "bigint", "int8"),
+        ("empty_table", None, None, None),
+    ]
+    dml = (
+        "SELECT name FROM users;"
+        "UPDATE users SET create_time = '2025-11-14 14:56:36' WHERE name = 'a';"
+    )
+
+    with patch(
+        "memory.database.api.v1.exec_dml.parse_and_exec_sql", new_callable=AsyncMock
+    ) as mock_parse_exec:
+        mock_parse_exec.return_value = catalog_result
+
+        dmls, error = await _dml_split(
+            dml, mock_db, "prod_u1_1001", "u1", span_context, 1001
+        )
+        assert error is None
+        result, error = await _process_dml_statements(
+            dmls, "app123", "u1", span_context, mock_db, "prod_u1_1001", 1001
+        )
+
+    assert error is None
+    mock_parse_exec.assert_awaited_once()
+    assert "pg_tables" in mock_parse_exec.call_args[0][1]
+    assert datetime.datetime(2025, 11, 14, 14, 56, 36) in result[1]["params"].values()
+
+
+@pytest.mark.asyncio
+async def test_dml_split_refreshes_catalog_for_unknown_table() -> None:
+    """A cached catalog missing a table is reloaded once before rejecting it."""
+    mock_db = AsyncMock(spec=AsyncSession)
+    span_context = MagicMock()
+    span_context.sid = "test-sid"
+    before = MagicMock()
+    before.fetchall.return_value = [("users", "id", "bigint", "int8")]
+    after = MagicMock()
+    after.fetchall.return_value = [
+        ("users", "id", "bigint", "int8"),
+        ("orders", "id", "bigint", "int8"),
+    ]
+
+    with patch(
+        "memory.database.api.v1.exec_dml.parse_and_exec_sql", new_callable=AsyncMock
+    ) as mock_parse_exec:
+        mock_parse_exec.side_effect = [before, after, after]
+
+        _, error = await _dml_split(
+            "SELECT * FROM users", mock_db, "prod_u1_1001", "u1", span_context, 1001
+        )
+        assert error is None
+        _, error = await _dml_split(
+            "SELECT * FROM orders", mock_db, "prod_u1_1001", "u1", span_context, 1001
+        )
+        assert error is None
+        _, error = await _dml_split(
+            "SELECT * FROM missing", mock_db, "prod_u1_1001", "u1", span_context, 1001
+        )
+
+    assert mock_parse_exec.await_count == 3
+    body = json.loads(error.body)
+    assert body["code"] == CodeEnum.NoAuthorityError.code
@@ -1,14 +1,36 @@
 """Unit tests for data export functionality."""
 
+import gzip
+from typing import Any, AsyncGenerator, AsyncIterator, List
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.responses import StreamingResponse
 from memory.database.api.schemas.export_data_types import ExportDataInput
-from memory.database.api.v1.export_data import _set_search_path_and_exec, export_data
+from memory.database.api.v1.export_data import (
+    _set_search_path_and_exec,
+    _stream_export,
+    export_data,
+    generate_csv,
+)
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 
+async def _partitions(*partitions: List[Any]) -> AsyncIterator[List[Any]]:
+    """Yield row partitions like a server-side cursor."""
+    for partition in partitions:
+        yield partition
+
+
+async def _read_body(response: StreamingResponse) -> bytes:
+    """Consume a streaming response body."""
+    chunks: List[bytes] = []
+    async for chunk in response.body_iterator:
+        assert isinstance(chunk, bytes)
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
 @pytest.mark.asyncio
 async def test_set_search_path_and_exec_success() -> None:
     """Test _set_search_path_and_exec function (success scenario)."""
@@ -20,14 +42,14 @@ async def test_set_search_path_and_exec_success() -> None:
         if "SET search_path" in str(sql):
             return None
         mock_result = MagicMock()
-        mock_result.fetchall.return_value = [
-            (1, "u1", "test_data"),
-            (2, "u1", "demo_data"),
-        ]
+        mock_result.partitions.return_value = _partitions(
+            [(1, "u1", "test_data"), (2, "u1", "demo_data")]
+        )
         mock_result.keys.return_value = ["id", "uid", "content"]
         return mock_result
 
     mock_db.execute = AsyncMock(side_effect=mock_execute)
+    mock_db.stream = AsyncMock(side_effect=mock_execute)
 
     database_id = 2001
     table_name = "user_data"
@@ -52,8 +74,8 @@ async def test_set_search_path_and_exec_success() -> None:
     )
 
     assert error_resp is None
-    assert len(rows) == 2
-    assert rows == [(1, "u1", "test_data"), (2, "u1", "demo_data")]
+    partitions = [partition async for partition in rows]
+    assert partitions == [[(1, "u1", "test_data"), (2, "u1", "demo_data")]]
     assert columns == ["id", "uid", "content"]
 
     assert len(executed_calls) == 2
@@ -69,6 +91,7 @@ async def test_set_search_path_and_exec_success() -> None:
     assert expected_select_table in select_call_sql
     assert expected_select_where in select_call_sql
     assert select_call_params == {"uid": uid}
+    mock_db.stream.assert_awaited_once()
 
     fake_span_context.add_info_event.assert_called_once_with(
         f"schema: {expected_schema}"
@@ -103,7 +126,7 @@ async def test_export_data_success() -> None:
 
     mock_set_exec = AsyncMock()
     mock_set_exec.return_value = (
-        [(1, "u1", "test_data"), (2, "u1", "demo_data")],
+        _partitions([(1, "u1", "test_data")], [(2, "u1", None)]),
         ["id", "uid", "content"],
         None,
     )
@@ -160,8 +183,70 @@ async def test_export_data_success() -> None:
                     test_input.env,
                     test_input.uid,
                     fake_span_context,
+                    0,
                 )
 
+                # The session stays open until the response has been sent
+                body = await _read_body(response)
+                assert body == b"id,uid,content\r\n1,u1,test_data\r\n2,u1,\r\n"
+                mock_db.close.assert_not_called()
+                assert response.background is not None
+                await response.background()
+                mock_db.close.assert_awaited_once()
+
                 mock_meter_instance.in_success_count.assert_called_once_with(
                     lables={"uid": test_input.uid}
                 )
+
+
+@pytest.mark.asyncio
+async def test_generate_csv_gzip() -> None:
+    """Test CSV chunks are gzip compressed into a single valid stream."""
+    chunks = [
+        chunk
+        async for chunk in generate_csv(
+            _partitions([(1, "a")], [(2, "b")]), ["id", "name"], compress=True
+        )
+    ]
+
+    assert len(chunks) > 1
+    assert gzip.decompress(b"".join(chunks)) == b"id,name\r\n1,a\r\n2,b\r\n"
+
+
+@pytest.mark.asyncio
+async def test_stream_export_failure_closes_session() -> None:
+    """Test a failing stream closes the session its response task would close."""
+
+    async def failing_chunks() -> AsyncGenerator[bytes, None]:
+        yield b"id\r\n"
+        raise ValueError("cursor lost")
+
+    mock_db = AsyncMock(spec=AsyncSession)
+    stream = _stream_export(failing_chunks(), mock_db, "test_table")
+
+    assert await stream.__anext__() == b"id\r\n"
+    with pytest.raises(ValueError, match="cursor lost"):
+        await stream.__anext__()
+    mock_db.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_set_search_path_and_exec_row_cap() -> None:
+    """Test the row cap is pushed down to the query."""
+    mock_db = AsyncMock(spec=AsyncSession)
+    mock_db.execute = AsyncMock(return_value=None)
+    mock_result = MagicMock()
+    mock_result.keys.return_value = ["id"]
+    mock_db.stream = AsyncMock(return_value=mock_result)
+
+    with patch.dict("os.environ", {"EXPORT_DATA_CHUNK_ROWS": "50"}):
+        _, columns, error_resp = await _set_search_path_and_exec(
+            mock_db, 2001, "user_data", "prod", "u1", MagicMock(), max_rows=10
+        )
+
+    assert error_resp is None
+    assert columns == ["id"]
+    sql, params = mock_db.stream.call_args[0]
+    assert str(sql).endswith("LIMIT :max_rows")
+    assert params == {"uid": "u1", "max_rows": 10}
+    mock_result.partitions.assert_called_once_with(50)
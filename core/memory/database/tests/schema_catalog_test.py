@@ -0,0 +1,63 @@
+"""Unit tests for the schema catalog cache."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from memory.database.domain.entity.schema_catalog import (
+    SchemaCatalog,
+    SchemaCatalogCache,
+)
+
+
+@pytest.mark.asyncio
+async def test_schema_catalog_cache_get_and_invalidate() -> None:
+    """Test catalogs are cached per (database_id, schema) until invalidated."""
+    cache = SchemaCatalogCache()
+    catalog = SchemaCatalog(
+        tables=frozenset({"users", "orders"}),
+        column_types={"users.name": "varchar", "orders.id": "int8"},
+    )
+    loader = AsyncMock(return_value=catalog)
+
+    assert await cache.get(1001, "prod_u1_1001", loader) is catalog
+    assert await cache.get(1001, "prod_u1_1001", loader) is catalog
+    await cache.get(1001, "test_u1_1001", loader)
+    await cache.get(1002, "prod_u1_1002", loader)
+    assert loader.await_count == 3
+
+    assert cache.invalidate(1001) == 2
+    await cache.get(1001, "prod_u1_1001", loader)
+    assert loader.await_count == 4
+
+    assert cache.invalidate(schemas=["prod_u1_1002"]) == 1
+    await cache.get(1002, "prod_u1_1002", loader)
+    assert loader.await_count == 5
+
+    await cache.get(1002, "prod_u1_1002", loader, refresh=True)
+    assert loader.await_count == 6
+
+
+@pytest.mark.asyncio
+async def test_schema_catalog_cache_disabled() -> None:
+    """Test a TTL of 0 loads the catalog on every call."""
+    cache = SchemaCatalogCache()
+    loader = AsyncMock(return_value=SchemaCatalog())
+
+    with patch.dict("os.environ", {"DML_CATALOG_CACHE_TTL": "0"}):
+        await cache.get(1001, "prod_u1_1001", loader)
+        await cache.get(1001, "prod_u1_1001", loader)
+
+    assert loader.await_count == 2
+
+
+def test_schema_catalog_table_column_types() -> None:
+    """Test column types are filtered by table name, not by name prefix."""
+    catalog = SchemaCatalog(
+        tables=frozenset({"user", "users"}),
+        column_types={"user.id": "int8", "users.id": "int8", "users.name": "text"},
+    )
+
+    assert catalog.table_column_types(["users"]) == {
+        "users.id": "int8",
+        "users.name": "text",
+    }
@@ -1,32 +1,49 @@
 """Unit tests for data upload functionality."""
 
+import datetime
 import io
 import json
+from typing import Any, Dict, List, Tuple
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import openpyxl
 import pytest
+from fastapi import UploadFile
 from memory.database.api.schemas.upload_data_types import UploadDataInput
 from memory.database.api.v1.upload_data import (
     insert_in_batches,
-    parse_upload_file,
+    iter_upload_records,
+    open_upload_file,
     upload_data,
 )
+from memory.database.exceptions.e import CustomException
 from memory.database.exceptions.error_code import CodeEnum
 from sqlmodel.ext.asyncio.session import AsyncSession
 from starlette.responses import JSONResponse
 
 
+async def _read_upload(
+    file: UploadFile, batch_size: int = 500
+) -> Tuple[List[str], List[Dict[str, Any]], List[int]]:
+    """Read every record of an upload file."""
+    columns, rows = await open_upload_file(file)
+    records: List[Dict[str, Any]] = []
+    line_numbers: List[int] = []
+    async for batch, batch_lines in iter_upload_records(columns, rows, batch_size):
+        records.extend(batch)
+        line_numbers.extend(batch_lines)
+    return columns, records, line_numbers
+
+
 @pytest.mark.asyncio
 async def test_parse_upload_file_success_csv() -> None:
-    """Test parse_upload_file function (success scenario: CSV file)."""
-    csv_content = "name,age,city\nAlice,25,Beijing\nBob,30,Shanghai"
-    mock_file = MagicMock()
-    mock_file.filename = "test_data.csv"
-    mock_file.read = AsyncMock(
-        return_value=io.BytesIO(csv_content.encode("utf-8")).read()
+    """Test streaming upload parsing (success scenario: CSV file)."""
+    csv_content = "name,age,city\nAlice,25,Beijing\n\nBob,30,Shanghai"
+    upload = UploadFile(
+        file=io.BytesIO(csv_content.encode("utf-8")), filename="test_data.csv"
     )
 
-    columns, records, line_numbers = await parse_upload_file(file=mock_file)
+    columns, records, line_numbers = await _read_upload(upload, batch_size=1)
 
     assert columns == ["name", "age", "city"]
     expected_records = [
@@ -42,6 +59,38 @@ async def test_parse_upload_file_success_csv() -> None:
     assert line_numbers == [2, 3]
 
 
+@pytest.mark.asyncio
+async def test_parse_upload_file_success_xlsx() -> None:
+    """Test streaming upload parsing (success scenario: XLSX file)."""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["name", "age"])
+    sheet.append(["Alice", 25])
+    sheet.append(["Bob", 30])
+    content = io.BytesIO()
+    workbook.save(content)
+    content.seek(0)
+
+    columns, records, line_numbers = await _read_upload(
+        UploadFile(file=content, filename="test_data.xlsx")
+    )
+
+    assert columns == ["name", "age"]
+    assert records == [{"name": "Alice", "age": 25}, {"name": "Bob", "age": 30}]
+    assert line_numbers == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_parse_upload_file_header_only() -> None:
+    """Test streaming upload parsing of a file without records."""
+    upload = UploadFile(file=io.BytesIO(b"name,age\n"), filename="empty.csv")
+
+    with pytest.raises(CustomException) as exc_info:
+        await _read_upload(upload)
+
+    assert exc_info.value.code == CodeEnum.FileEmptyError.code
+
+
 @pytest.mark.asyncio
 async def test_insert_in_batches_success() -> None:
     """Test insert_in_batches function (success scenario)."""
@@ -72,32 +121,106 @@ async def test_insert_in_batches_success() -> None:
         assert len(success_rows) == 2
         assert success_rows == [10001, 10002]
         assert len(failed_rows) == 0
-        assert mock_db.execute.call_count == 2
-
-        first_call_args = mock_db.execute.call_args_list[0][0]
-        first_sql = first_call_args[0]
-        first_params = first_call_args[1]
-        assert 'INSERT INTO "user_info"' in str(first_sql)
-        assert first_params == {
-            "name": "Alice",
-            "age": 25,
-            "id": 10001,
-            "uid": "u1",
-        }
-
-        second_call_args = mock_db.execute.call_args_list[1][0]
-        second_params = second_call_args[1]
-        assert second_params == {
-            "name": "Bob",
-            "age": 30,
-            "id": 10002,
-            "uid": "u1",
-        }
+        assert mock_db.execute.call_count == 1
+
+        call_args = mock_db.execute.call_args_list[0][0]
+        sql = call_args[0]
+        params = call_args[1]
+        assert 'INSERT INTO "user_info"' in str(sql)
+        assert params == [
+            {"name": "Alice", "age": 25, "id": 10001, "uid": "u1"},
+            {"name": "Bob", "age": 30, "id": 10002, "uid": "u1"},
+        ]
 
         assert mock_get_id.call_count == 2
         fake_span_context.add_info_events.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_insert_in_batches_falls_back_to_rows() -> None:
+    """A failing batch is retried row by row, reporting only the failing lines."""
+    mock_db = AsyncMock(spec=AsyncSession)
+
+    async def execute(sql: Any, params: Any) -> None:
+        if isinstance(params, list) or params["name"] == "Bob":
+            raise ValueError("duplicate key")
+
+    mock_db.execute = AsyncMock(side_effect=execute)
+
+    with patch("memory.database.api.v1.upload_data.get_id") as mock_get_id:
+        mock_get_id.side_effect = [10001, 10002, 10003]
+
+        success_rows, failed_rows = await insert_in_batches(
+            db=mock_db,
+            table_name="user_info",
+            records=[
+                {"name": "Alice", "age": "25", "birthday": "2000-01-02"},
+                {"name": "Bob", "age": "30", "birthday": ""},
+                {"name": "Carol", "age": "old", "birthday": ""},
+            ],
+            line_numbers=[2, 3, 4],
+            uid="u1",
+            column_types={"name": "text", "age": "integer", "birthday": "date"},
+        )
+
+    assert success_rows == [10001]
+    assert [row["line"] for row in failed_rows] == [4, 3]
+    assert "age" in failed_rows[0]["error"]
+    assert failed_rows[1]["error"] == "duplicate key"
+    assert mock_db.execute.call_count == 3
+    assert mock_db.execute.call_args_list[1][0][1] == {
+        "name": "Alice",
+        "age": 25,
+        "birthday": datetime.date(2000, 1, 2),
+        "id": 10001,
+        "uid": "u1",
+    }
+
+
+@pytest.mark.asyncio
+async def test_insert_in_batches_parses_non_iso_dates() -> None:
+    """Date and time cells in layouts PostgreSQL accepts are parsed too."""
+    mock_db = AsyncMock(spec=AsyncSession)
+    mock_db.execute = AsyncMock(return_value=None)
+
+    with patch("memory.database.api.v1.upload_data.get_id", return_value=10001):
+        success_rows, failed_rows = await insert_in_batches(
+            db=mock_db,
+            table_name="events",
+            records=[
+                {
+                    "at": "2024/01/02 10:00:00",
+                    "on": "Jan 2 2024",
+                    "time": "10:30 PM",
+                    "flag": "yes",
+                },
+                {"at": "not a date", "on": "", "time": "", "flag": ""},
+            ],
+            line_numbers=[2, 3],
+            uid="u1",
+            column_types={
+                "at": "timestamp without time zone",
+                "on": "date",
+                "time": "time without time zone",
+                "flag": "boolean",
+            },
+        )
+
+    assert success_rows == [10001]
+    assert [row["line"] for row in failed_rows] == [3]
+    assert "at expects timestamp" in failed_rows[0]["error"]
+    assert mock_db.execute.call_args[0][1] == [
+        {
+            "at": datetime.datetime(2024, 1, 2, 10, 0),
+            "on": datetime.date(2024, 1, 2),
+            "time": datetime.time(22, 30),
+            "flag": True,
+            "id": 10001,
+            "uid": "u1",
+        }
+    ]
+
+
 @pytest.mark.asyncio
 async def test_upload_data_success() -> None:
     """Test upload_data endpoint (success scenario)."""
@@ -113,10 +236,8 @@ async def test_upload_data_success() -> None:
         env="prod",
     )
 
-    mock_file = MagicMock()
-    mock_file.filename = "valid_user_data.csv"
-    mock_file.read = AsyncMock(
-        return_value=io.BytesIO(b"name,age\nAlice,25\nBob,30").read()
+    mock_file = UploadFile(
+        file=io.BytesIO(b"name,age\nAlice,25\nBob,30"), filename="valid_user_data.csv"
     )
 
     fake_span_context = MagicMock()
@@ -128,13 +249,6 @@ async def test_upload_data_success() -> None:
     mock_span_instance = MagicMock()
     mock_span_instance.start.return_value.__enter__.return_value = fake_span_context
 
-    mock_parse_file = AsyncMock()
-    mock_parse_file.return_value = (
-        ["name", "age"],
-        [{"name": "Alice", "age": 25}, {"name": "Bob", "age": 30}],
-        [2, 3],
-    )
-
     mock_insert = AsyncMock()
     mock_insert.return_value = ([90001, 90002], [])
 
@@ -143,7 +257,12 @@ async def test_upload_data_success() -> None:
             None,
             MagicMock(
                 fetchall=MagicMock(
-                    return_value=[("name",), ("age",), ("id",), ("uid",)]
+                    return_value=[
+                        ("name", "text"),
+                        ("age", "integer"),
+                        ("id", "bigint"),
+                        ("uid", "character varying"),
+                    ]
                 )
             ),
         ]
@@ -176,9 +295,9 @@ async def test_upload_data_success() -> None:
             mock_span_service_func.return_value = mock_span_service
 
             with patch(
-                "memory.database.api.v1.upload_data.parse_upload_file",
-                new=mock_parse_file,
-            ):
+                "memory.database.api.v1.upload_data.open_upload_file",
+                new=AsyncMock(wraps=open_upload_file),
+            ) as mock_open_file:
                 with patch(
                     "memory.database.api.v1.upload_data.insert_in_batches",
                     new=mock_insert,
@@ -204,15 +323,21 @@ async def test_upload_data_success() -> None:
                         assert response_body["data"]["failed_rows"] == []
 
                         # Test completed successfully
-                        mock_parse_file.assert_called_once_with(mock_file)
+                        mock_open_file.assert_called_once_with(mock_file)
 
                     mock_insert.assert_called_once_with(
                         mock_db,
                         test_input.table_name,
-                        [{"name": "Alice", "age": 25}, {"name": "Bob", "age": 30}],
+                        [{"name": "Alice", "age": "25"}, {"name": "Bob", "age": "30"}],
                         [2, 3],
                         test_input.uid,
                         span_context=fake_span_context,
+                        column_types={
+                            "name": "text",
+                            "age": "integer",
+                            "id": "bigint",
+                            "uid": "character varying",
+                        },
                     )
 
                     expected_schema = (
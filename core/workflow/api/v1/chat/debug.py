@@ -78,7 +78,7 @@ async def chat_debug(
                 uid=chat_vo.uid,
                 chat_id=chat_vo.chat_id,
             )
-            EventRegistry().init_event(event)
+            await EventRegistry().init_event_async(event)
             app_audit_policy = (
                 AppAuditPolicy.DEFAULT
                 if app_info.audit_policy == AppAuditPolicy.DEFAULT.value
@@ -139,7 +139,9 @@ async def resume_debug(request: ResumeVo) -> Union[StreamingResponse, JSONRespon
     ) as span_context:
 
         try:
-            event: Optional[Event] = EventRegistry().get_event(event_id=event_id)
+            event: Optional[Event] = await EventRegistry().get_event_async(
+                event_id=event_id
+            )
             if event is None:
                 raise CustomException(
                     CodeEnum.EVENT_REGISTRY_NOT_FOUND_ERROR,
@@ -5,7 +5,6 @@ This module provides open API endpoints for chat completions and resume function
 including platform-specific publishing validation and audit policies.
 """
 
-import asyncio
 import json
 from typing import Annotated, Optional, Union
 
@@ -70,7 +69,7 @@ async def chat_open(
                 chat_id=chat_vo.chat_id,
                 is_stream=chat_vo.stream,
             )
-            await asyncio.to_thread(EventRegistry().init_event, event)
+            await EventRegistry().init_event_async(event)
             return await Streaming.send(
                 await chat_service.event_stream(
                     app_id,
@@ -125,7 +124,9 @@ async def resume_open(request: ResumeVo) -> Union[StreamingResponse, JSONRespons
     ) as span_context:
 
         try:
-            event: Optional[Event] = EventRegistry().get_event(event_id=event_id)
+            event: Optional[Event] = await EventRegistry().get_event_async(
+                event_id=event_id
+            )
             if event is None:
                 raise CustomException(
                     CodeEnum.EVENT_REGISTRY_NOT_FOUND_ERROR,
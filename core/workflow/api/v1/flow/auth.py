@@ -11,6 +11,7 @@ from fastapi import APIRouter, Depends, Header
 from fastapi.responses import JSONResponse
 from sqlmodel import Session  # type: ignore
 
+from workflow.cache.engine import del_engine_by_flow_id
 from workflow.cache.flow import del_flow_by_flow_id_latest_version, del_flow_by_id
 from workflow.domain.entities.flow import AuthInput, PublishInput
 from workflow.domain.entities.response import Resp
@@ -50,6 +51,7 @@ async def publish(
         # Delete flow protocol from Redis cache
         del_flow_by_id(publish_input.flow_id)
         del_flow_by_flow_id_latest_version(publish_input.flow_id)
+        del_engine_by_flow_id(publish_input.flow_id)
 
         try:
             await publish_service.handle(
@@ -5,6 +5,7 @@ This module provides caching functionality for application information,
 including retrieval and storage operations for app data.
 """
 
+from workflow.cache.local import local_cache
 from workflow.domain.models.ai_app import App
 from workflow.extensions.middleware.getters import get_cache_service
 
@@ -21,8 +22,7 @@ def get_app_by_app_id(app_id: str) -> App | None:
     """
     key = f"{REDIS_APP_INFO_HEAD}:{app_id}"
     cache_service = get_cache_service()
-    app = cache_service[key]
-    return app
+    return local_cache.get(key, lambda: cache_service[key])
 
 
 def set_app_by_app_id(app_id: str, app: App) -> None:
@@ -36,3 +36,4 @@ def set_app_by_app_id(app_id: str, app: App) -> None:
     key = f"{REDIS_APP_INFO_HEAD}:{app_id}"
     cache_service = get_cache_service()
     cache_service.set(key=key, value=app)
+    local_cache.set(key, app)
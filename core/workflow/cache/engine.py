@@ -0,0 +1,251 @@
+"""
+Workflow engine cache management module.
+
+This module keeps compiled workflow engines in process memory so that hot flows
+are not rebuilt from their DSL on every chat request. Each entry stores a
+serialized engine template; every request receives its own clone with fresh
+node running status, variable pool values and asyncio events.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from workflow.engine.dsl_engine import WorkflowEngine
+from workflow.extensions.otlp.metric.meter import Meter
+from workflow.extensions.otlp.trace.span import Span
+
+
+class EngineCacheKey(NamedTuple):
+    """
+    Identity of a compiled workflow engine.
+
+    The DSL update time acts as the DSL version, so a flow that has been
+    updated or republished never matches a stale template.
+    """
+
+    flow_id: str
+    version: str
+    app_id: str
+    is_release: bool
+    dsl_update_time: str
+
+
+class EngineCacheStats(NamedTuple):
+    """
+    Snapshot of engine cache counters.
+    """
+
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+    builds: int
+    build_time_ms: float
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Ratio of cache hits over all lookups.
+
+        :return: Hit rate between 0 and 1
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class WorkflowEngineCache:
+    """
+    LRU cache of compiled workflow engine templates.
+    """
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        """
+        Initialize the engine cache.
+
+        :param max_size: Maximum number of engine templates kept in memory,
+                         0 disables caching, None reads WORKFLOW_ENGINE_CACHE_SIZE
+        """
+        self._max_size = max_size
+        self._templates: OrderedDict[EngineCacheKey, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._builds = 0
+        self._build_time_ms = 0.0
+
+    @property
+    def max_size(self) -> int:
+        """
+        Maximum number of engine templates kept in memory.
+
+        Resolved lazily because the configuration is loaded after import.
+
+        :return: Cache capacity
+        """
+        if self._max_size is None:
+            self._max_size = int(os.getenv("WORKFLOW_ENGINE_CACHE_SIZE", "256"))
+        return self._max_size
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether the cache stores any engine templates.
+
+        :return: True if caching is enabled, False otherwise
+        """
+        return self.max_size > 0
+
+    def get(self, key: EngineCacheKey, span: Span) -> Optional[WorkflowEngine]:
+        """
+        Get a per-run clone of the cached engine template.
+
+        :param key: Engine cache key
+        :param span: Tracing span for observability
+        :return: Fresh WorkflowEngine clone if cached, None otherwise
+        """
+        m = Meter(app_id=key.app_id, func="workflow_engine_cache")
+        m.set_label("flow_id", key.flow_id)
+        with self._lock:
+            template = self._templates.get(key)
+            if template is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._templates.move_to_end(key)
+
+        if template is None:
+            m.in_success_count(labels={"cache_result": "miss"})
+            return None
+
+        engine, _ = WorkflowEngine.loads(template, span)
+        if engine is None:
+            # Template cannot be restored anymore, drop it and rebuild
+            self.delete(key)
+            m.in_success_count(labels={"cache_result": "miss"})
+            return None
+
+        m.in_success_count(labels={"cache_result": "hit"})
+        return engine
+
+    def set(
+        self,
+        key: EngineCacheKey,
+        engine: WorkflowEngine,
+        build_time_ms: float,
+        span: Span,
+    ) -> None:
+        """
+        Store a freshly built engine as template for later requests.
+
+        The engine must not have been run yet, otherwise per-run state would
+        leak into subsequent clones.
+
+        :param key: Engine cache key
+        :param engine: Freshly built workflow engine
+        :param build_time_ms: Time spent building the engine in milliseconds
+        :param span: Tracing span for observability
+        """
+        with self._lock:
+            self._builds += 1
+            self._build_time_ms += build_time_ms
+
+        if not self.enabled:
+            return
+
+        # Engines holding non-serializable node state are not cached
+        template = engine.dumps(span)
+        if not template:
+            return
+
+        with self._lock:
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while len(self._templates) > self.max_size:
+                self._templates.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: EngineCacheKey) -> None:
+        """
+        Delete a single engine template.
+
+        :param key: Engine cache key
+        """
+        with self._lock:
+            self._templates.pop(key, None)
+
+    def delete_by_flow_id(self, flow_id: str) -> None:
+        """
+        Delete all engine templates of a flow, regardless of version.
+
+        :param flow_id: Flow ID whose templates should be dropped
+        """
+        with self._lock:
+            for key in [k for k in self._templates if k.flow_id == flow_id]:
+                del self._templates[key]
+
+    def clear(self) -> None:
+        """
+        Drop all engine templates.
+        """
+        with self._lock:
+            self._templates.clear()
+
+    def stats(self) -> EngineCacheStats:
+        """
+        Get a snapshot of the cache counters.
+
+        :return: Current engine cache statistics
+        """
+        with self._lock:
+            return EngineCacheStats(
+                size=len(self._templates),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                builds=self._builds,
+                build_time_ms=self._build_time_ms,
+            )
+
+
+# Process-wide engine cache
+engine_cache = WorkflowEngineCache()
+
+
+def gen_engine_cache_key(
+    flow_id: str,
+    version: str,
+    app_id: str,
+    is_release: bool,
+    dsl_update_time: Optional[datetime],
+) -> EngineCacheKey:
+    """
+    Generate the engine cache key for a flow DSL.
+
+    :param flow_id: Flow ID
+    :param version: Requested flow version
+    :param app_id: Application ID, credentials in the DSL depend on it
+    :param is_release: Whether the published DSL is used
+    :param dsl_update_time: Last update time of the DSL
+    :return: Engine cache key
+    """
+    return EngineCacheKey(
+        flow_id=str(flow_id),
+        version=version or "",
+        app_id=app_id,
+        is_release=is_release,
+        dsl_update_time=dsl_update_time.isoformat() if dsl_update_time else "",
+    )
+
+
+def del_engine_by_flow_id(flow_id: str) -> None:
+    """
+    Delete all compiled engines of a flow from the cache.
+
+    :param flow_id: Flow ID to delete
+    :return: None
+    """
+    engine_cache.delete_by_flow_id(str(flow_id))
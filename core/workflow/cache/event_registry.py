@@ -7,8 +7,9 @@ and resume data management.
 """
 
 import asyncio
+import os
 import time
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel
 
@@ -16,7 +17,10 @@ from workflow.consts.engine.chat_status import ChatStatus
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.graceful_shutdown.base_shutdown_event import BaseShutdownEvent
-from workflow.extensions.middleware.getters import get_cache_service
+from workflow.extensions.middleware.getters import (
+    get_async_cache_service,
+    get_cache_service,
+)
 from workflow.infra.audit_system.strategy.base_strategy import AuditStrategy
 
 # Redis key prefix for event-related data
@@ -103,6 +107,20 @@ class EventRegistry(BaseShutdownEvent):
             expire_time=event.timeout,
         )
 
+    @classmethod
+    async def save_event_async(cls, event: Event) -> None:
+        """
+        Save event to cache service with per-event TTL without blocking the loop.
+
+        :param cls: Class itself
+        :param event: Event object to save
+        """
+        await get_async_cache_service().set_ex(
+            key=cls._event_key(event.event_id),
+            value=cls._encode(event),
+            expire_time=event.timeout,
+        )
+
     @classmethod
     def init_event(cls, event: Event) -> None:
         """
@@ -117,6 +135,16 @@ class EventRegistry(BaseShutdownEvent):
         except Exception as e:
             raise e
 
+    @classmethod
+    async def init_event_async(cls, event: Event) -> None:
+        """
+        Initialize event and save it to cache without blocking the loop.
+
+        :param cls: Class itself
+        :param event: Event object to initialize
+        """
+        await cls.save_event_async(event)
+
     @classmethod
     def lock_event(cls, event_id: str, sid: str, timeout: int = 180) -> None:
         get_cache_service().set_ex(
@@ -152,6 +180,20 @@ class EventRegistry(BaseShutdownEvent):
             raise CustomException(err_code=CodeEnum.EVENT_REGISTRY_NOT_FOUND_ERROR)
         return cls._decode(data)
 
+    @classmethod
+    async def get_event_async(cls, event_id: str) -> Event:
+        """
+        Get event information by event ID without blocking the loop.
+
+        :param cls: Class itself
+        :param event_id: Event ID string
+        :return: Decoded event object if found, raises exception otherwise
+        """
+        data = await get_async_cache_service().get(key=cls._event_key(event_id))
+        if not data:
+            raise CustomException(err_code=CodeEnum.EVENT_REGISTRY_NOT_FOUND_ERROR)
+        return cls._decode(data)
+
     @classmethod
     def del_event(cls, event_id: str) -> None:
         """
@@ -223,6 +265,27 @@ class EventRegistry(BaseShutdownEvent):
         """
         cls.del_event(event_id)
 
+    @classmethod
+    async def on_interrupt_async(cls, event_id: str) -> None:
+        """
+        Handle event interruption without blocking the loop.
+
+        :param event_id: Unique identifier of the event
+        """
+        event = await cls.get_event_async(event_id)
+        event.status = ChatStatus.INTERRUPT.value
+        await cls.save_event_async(event)
+
+    @classmethod
+    async def on_finished_async(cls, event_id: str) -> None:
+        """
+        Called when event is finished, without blocking the loop.
+
+        :param cls: Class itself
+        :param event_id: Unique identifier of the event
+        """
+        await get_async_cache_service().delete(cls._event_key(event_id))
+
     @classmethod
     def on_interrupt_node_start(cls, event_id: str, node_id: str, timeout: int) -> None:
         """
@@ -264,33 +327,43 @@ class EventRegistry(BaseShutdownEvent):
         :param expire_time: Expiration time in seconds, default 180
         :return: True if successful, False otherwise
         """
-        try:
-            message_key = f"{queue_name}"
-            metadata_key = f"{queue_name}:metadata"
-            current_time = int(time.time())
+        await cls.push_resume_data(queue_name, [data], expire_time)
 
-            with get_cache_service().pipeline() as pipe:
-                # Check if retries field exists
-                pipe.hexists(metadata_key, "retries")
-                result = pipe.execute()
+    @classmethod
+    async def push_resume_data(
+        cls, queue_name: str, data: List[str], expire_time: int = 180
+    ) -> None:
+        """
+        Write several resume data entries to specified queue in one round trip.
 
-                # Reopen pipeline to wrap all operations
-                pipe = get_cache_service().pipeline()
-                if not result[0]:
-                    pipe.hset(metadata_key, "retries", 0)
-                else:
-                    pipe.hincrby(metadata_key, "retries", 1)
+        :param queue_name: Queue name
+        :param data: Data entries to write, in order
+        :param expire_time: Expiration time in seconds, default 180
+        """
+        if not data:
+            return
+        message_key = f"{queue_name}"
+        metadata_key = f"{queue_name}:metadata"
+        current_time = int(time.time())
+        cache = get_async_cache_service()
 
-                pipe.hset(metadata_key, "timestamp", current_time)
-                pipe.rpush(message_key, data)
+        def write(pipe: Any) -> None:
+            # Retries start at 0 for the first entry and count every further
+            # entry, without checking whether the field exists beforehand
+            pipe.hsetnx(metadata_key, "retries", -1)
+            pipe.hincrby(metadata_key, "retries", len(data))
 
-                # Set expiration time
-                pipe.expire(message_key, expire_time)
-                pipe.expire(metadata_key, expire_time)
+            pipe.hset(metadata_key, "timestamp", current_time)
+            pipe.rpush(message_key, *data)
 
-                pipe.execute()
-        except Exception as e:
-            raise e
+            # Set expiration time
+            pipe.expire(message_key, expire_time)
+            pipe.expire(metadata_key, expire_time)
+
+        await cache.pipeline(write)
+
+        # Wake up the coroutine waiting for this queue, whichever worker runs it
+        await cache.notify(message_key)
 
     @classmethod
     async def fetch_resume_data(cls, queue_name: str, timeout: int = 180) -> dict:
@@ -302,18 +375,18 @@ class EventRegistry(BaseShutdownEvent):
         :return: Dictionary containing message and metadata
         """
         try:
-            cache = get_cache_service()
+            cache = get_async_cache_service()
             message_key = f"{queue_name}"
             metadata_key = f"{queue_name}:metadata"
 
-            # Execute synchronous blpop in thread
-            result = await asyncio.to_thread(cache.blpop, message_key, timeout)
+            # Waits without holding a thread until the queue is written
+            result = await cache.blpop(message_key, timeout)
 
             if result and len(result) == 2:
                 _, message = result
                 message_str = message.decode()
 
-                meta_result = await asyncio.to_thread(cache.hgetall_str, metadata_key)
+                meta_result = await cache.hgetall_str(metadata_key)
 
                 return {"message": message_str, "metadata": meta_result}
 
@@ -324,3 +397,105 @@ class EventRegistry(BaseShutdownEvent):
             )
         except Exception as e:
             raise e
+
+
+class ResumeStreamWriter:
+    """
+    Batched writer of the workflow resume queue of one run.
+
+    The event is loaded once per run instead of once per frame. Frames
+    written within a short window are pushed together with a single pipeline,
+    frames the reader must not wait for are flushed immediately.
+    """
+
+    def __init__(
+        self,
+        event_id: str,
+        linger: Optional[float] = None,
+        batch_size: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the resume stream writer.
+
+        :param event_id: Event ID of the run
+        :param linger: Seconds a frame may wait for further frames,
+                       None reads WORKFLOW_RESUME_WRITE_LINGER_MS
+        :param batch_size: Number of frames flushed at the latest,
+                           None reads WORKFLOW_RESUME_WRITE_BATCH_SIZE
+        """
+        self.event_id = event_id
+        self.linger = (
+            linger
+            if linger is not None
+            else int(os.getenv("WORKFLOW_RESUME_WRITE_LINGER_MS", "20")) / 1000
+        )
+        self.batch_size = batch_size or int(
+            os.getenv("WORKFLOW_RESUME_WRITE_BATCH_SIZE", "64")
+        )
+        self._event: Optional[Event] = None
+        self._buffer: List[str] = []
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
+
+    def reload_event(self) -> None:
+        """
+        Reload the event on the next flush, e.g. after its timeout changed.
+        """
+        self._event = None
+
+    async def write(self, data: str, flush: bool = False) -> None:
+        """
+        Buffer a frame for the resume queue.
+
+        :param data: Serialized frame
+        :param flush: Whether to push the buffered frames immediately
+        :raises Exception: If a previous background flush failed
+        """
+        if self._error is not None:
+            raise self._error
+        self._buffer.append(data)
+        if flush or len(self._buffer) >= self.batch_size or self.linger <= 0:
+            await self.flush()
+        elif self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> None:
+        """
+        Push the buffered frames to the resume queue in order.
+        """
+        async with self._lock:
+            if not self._buffer:
+                return
+            data, self._buffer = self._buffer, []
+            if self._event is None:
+                self._event = await EventRegistry.get_event_async(self.event_id)
+            await EventRegistry.push_resume_data(
+                queue_name=self._event.get_workflow_q_name(),
+                data=data,
+                expire_time=self._event.timeout,
+            )
+
+    async def close(self) -> None:
+        """
+        Push the remaining frames and stop the flush timer.
+
+        :raises Exception: If a background flush failed
+        """
+        # Flushing first waits for a background push in progress
+        await self.flush()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._error is not None:
+            raise self._error
+
+    async def _flush_later(self) -> None:
+        """
+        Flush the buffered frames once the linger window has passed.
+        """
+        await asyncio.sleep(self.linger)
+        try:
+            await self.flush()
+        except Exception as e:
+            self._error = e
@@ -5,6 +5,7 @@ This module provides caching functionality for workflow flow information,
 including retrieval, storage, and deletion operations for flow data.
 """
 
+from workflow.cache.local import local_cache
 from workflow.domain.models.flow import Flow
 from workflow.extensions.middleware.getters import get_cache_service
 
@@ -21,8 +22,7 @@ def get_flow_by_id(flow_id: str) -> Flow | None:
     """
     key = f"{REDIS_FLOW_INFO_HEAD}:{flow_id}"
     cache_service = get_cache_service()
-    app = cache_service[key]
-    return app
+    return local_cache.get(key, lambda: cache_service[key])
 
 
 def set_flow_by_id(flow_id: str, flow: Flow) -> None:
@@ -36,6 +36,7 @@ def set_flow_by_id(flow_id: str, flow: Flow) -> None:
     key = f"{REDIS_FLOW_INFO_HEAD}:{flow_id}"
     cache_service = get_cache_service()
     cache_service.set(key=key, value=flow)
+    local_cache.set(key, flow)
 
 
 def del_flow_by_id(flow_id: str) -> None:
@@ -48,6 +49,7 @@ def del_flow_by_id(flow_id: str) -> None:
     key = f"{REDIS_FLOW_INFO_HEAD}:{flow_id}"
     cache_service = get_cache_service()
     cache_service.delete(key=key)
+    local_cache.invalidate(key)
 
 
 def get_flow_by_flow_id_version(flow_id: int, version: str) -> Flow | None:
@@ -60,8 +62,7 @@ def get_flow_by_flow_id_version(flow_id: int, version: str) -> Flow | None:
     """
     key = f"{REDIS_FLOW_INFO_HEAD}:{flow_id}:{version}"
     cache_service = get_cache_service()
-    app = cache_service[key]
-    return app
+    return local_cache.get(key, lambda: cache_service[key])
 
 
 def set_flow_by_flow_id_version(flow_id: str, version: str, flow: Flow) -> None:
@@ -76,6 +77,7 @@ def set_flow_by_flow_id_version(flow_id: str, version: str, flow: Flow) -> None:
     key = f"{REDIS_FLOW_INFO_HEAD}:{flow_id}:{version}"
     cache_service = get_cache_service()
     cache_service.set(key=key, value=flow)
+    local_cache.set(key, flow)
 
 
 def get_flow_by_flow_id_latest(flow_id: str) -> Flow | None:
@@ -87,8 +89,7 @@ def get_flow_by_flow_id_latest(flow_id: str) -> Flow | None:
     """
     key = f"{REDIS_FLOW_INFO_HEAD}:{flow_id}:latest"
     cache_service = get_cache_service()
-    app = cache_service[key]
-    return app
+    return local_cache.get(key, lambda: cache_service[key])
 
 
 def set_flow_by_flow_id_latest(flow_id: str, flow: Flow) -> None:
@@ -102,6 +103,7 @@ def set_flow_by_flow_id_latest(flow_id: str, flow: Flow) -> None:
     key = f"{REDIS_FLOW_INFO_HEAD}:{flow_id}:latest"
     cache_service = get_cache_service()
     cache_service.set(key=key, value=flow)
+    local_cache.set(key, flow)
 
 
 def del_flow_by_flow_id_latest_version(flow_id: str) -> None:
@@ -114,3 +116,4 @@ def del_flow_by_flow_id_latest_version(flow_id: str) -> None:
     key = f"{REDIS_FLOW_INFO_HEAD}:{flow_id}:latest"
     cache_service = get_cache_service()
     cache_service.delete(key=key)
+    local_cache.invalidate(key)
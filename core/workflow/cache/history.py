@@ -0,0 +1,155 @@
+"""
+Conversation history cache management module.
+
+This module keeps the most recent chat records of each (flow, user) pair in
+process memory so that consecutive chat requests do not reload them from the
+database. The cache is disabled by default because entries are only refreshed
+by writes of the same process; the TTL bounds staleness when several workers
+serve the same user.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+# Serialized (raw_question, raw_answer) pair of a history record
+HistoryRecord = Tuple[str, str]
+
+
+class HistoryCache:
+    """
+    LRU cache of recent history records per (flow, user).
+
+    Records of each node are stored newest first, up to ``depth`` entries.
+    """
+
+    def __init__(
+        self,
+        depth: int,
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the history cache.
+
+        :param depth: Maximum number of records kept per node
+        :param max_size: Maximum number of (flow, user) entries kept in memory,
+                         0 disables caching, None reads WORKFLOW_HISTORY_CACHE_SIZE
+        :param ttl: Entry lifetime in seconds, None reads WORKFLOW_HISTORY_CACHE_TTL
+        """
+        self.depth = depth
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[
+            Tuple[str, str], Tuple[float, Dict[str, List[HistoryRecord]]]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        """
+        Maximum number of (flow, user) entries kept in memory.
+
+        Resolved lazily because the configuration is loaded after import.
+
+        :return: Cache capacity
+        """
+        if self._max_size is None:
+            self._max_size = int(os.getenv("WORKFLOW_HISTORY_CACHE_SIZE", "0"))
+        return self._max_size
+
+    @property
+    def ttl(self) -> float:
+        """
+        Lifetime of a cache entry in seconds.
+
+        :return: Entry lifetime
+        """
+        if self._ttl is None:
+            self._ttl = float(os.getenv("WORKFLOW_HISTORY_CACHE_TTL", "60"))
+        return self._ttl
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether the cache stores any history.
+
+        :return: True if caching is enabled, False otherwise
+        """
+        return self.max_size > 0
+
+    def get(self, flow_id: str, uid: str) -> Optional[Dict[str, List[HistoryRecord]]]:
+        """
+        Get the cached records of a (flow, user) pair.
+
+        :param flow_id: Flow ID
+        :param uid: User ID
+        :return: Copy of the records per node, newest first, None on miss
+        """
+        key = (flow_id, uid)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expire_at, records = entry
+            if expire_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return {node_id: list(rows) for node_id, rows in records.items()}
+
+    def set(
+        self, flow_id: str, uid: str, records: Dict[str, List[HistoryRecord]]
+    ) -> None:
+        """
+        Store the records loaded from the database.
+
+        :param flow_id: Flow ID
+        :param uid: User ID
+        :param records: Records per node, newest first
+        """
+        if not self.enabled:
+            return
+        key = (flow_id, uid)
+        with self._lock:
+            self._entries[key] = (
+                time.monotonic() + self.ttl,
+                {
+                    node_id: list(rows[: self.depth])
+                    for node_id, rows in records.items()
+                },
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def append(
+        self, flow_id: str, uid: str, node_id: str, record: HistoryRecord
+    ) -> None:
+        """
+        Add a newly stored record to a cached entry.
+
+        Pairs that are not cached are left alone, the next read loads them
+        from the database including the new record.
+
+        :param flow_id: Flow ID
+        :param uid: User ID
+        :param node_id: Node ID the record belongs to
+        :param record: Serialized question and answer
+        """
+        with self._lock:
+            entry = self._entries.get((flow_id, uid))
+            if entry is None:
+                return
+            rows = entry[1].setdefault(node_id, [])
+            rows.insert(0, record)
+            del rows[self.depth :]
+
+    def clear(self) -> None:
+        """
+        Drop all cached history.
+        """
+        with self._lock:
+            self._entries.clear()
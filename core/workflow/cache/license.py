@@ -5,6 +5,7 @@ This module provides caching functionality for license information,
 including retrieval and storage operations for license data.
 """
 
+from workflow.cache.local import local_cache
 from workflow.domain.models.license import License
 from workflow.extensions.middleware.getters import get_cache_service
 
@@ -22,8 +23,7 @@ def get_license_by_app_id_group_id(app_id: str, group_id: str) -> License | None
     """
     key = f"{REDIS_LICENSE_INFO_HEAD}:{app_id}:{group_id}"
     cache_service = get_cache_service()
-    app = cache_service[key]
-    return app
+    return local_cache.get(key, lambda: cache_service[key])
 
 
 def set_license_by_app_id_group_id(app_id: str, group_id: str, app: License) -> None:
@@ -38,3 +38,4 @@ def set_license_by_app_id_group_id(app_id: str, group_id: str, app: License) ->
     key = f"{REDIS_LICENSE_INFO_HEAD}:{app_id}:{group_id}"
     cache_service = get_cache_service()
     cache_service.set(key=key, value=app)
+    local_cache.set(key, app)
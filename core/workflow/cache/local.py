@@ -0,0 +1,304 @@
+"""
+In-process cache layer module.
+
+This module keeps rarely changing objects such as apps, flows, licenses and
+API key mappings in process memory (L1) in front of the shared Redis cache (L2).
+Entries are stored pickled, so every read returns a fresh object exactly like
+a Redis read. Deleting a key publishes its name on a Redis channel, every
+worker listening on that channel drops its local copy.
+"""
+
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from loguru import logger
+
+from workflow.extensions.middleware.getters import (
+    get_async_cache_service,
+    get_cache_service,
+)
+from workflow.extensions.otlp.metric.meter import Meter
+
+
+class LocalCache:
+    """
+    LRU cache with TTL in front of the shared cache service.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        channel: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the local cache.
+
+        :param max_size: Maximum number of entries kept in memory,
+                         0 disables caching, None reads WORKFLOW_LOCAL_CACHE_SIZE
+        :param ttl: Entry lifetime in seconds, None reads WORKFLOW_LOCAL_CACHE_TTL
+        :param channel: Invalidation channel, None reads
+                        WORKFLOW_CACHE_INVALIDATE_CHANNEL
+        """
+        self._max_size = max_size
+        self._ttl = ttl
+        self._channel = channel
+        self._entries: OrderedDict[str, Tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._l1_hits = 0
+        self._l2_hits = 0
+        self._misses = 0
+        self._listener: Optional[threading.Thread] = None
+        self._pubsub: Any = None
+        self._stopped = threading.Event()
+
+    @property
+    def max_size(self) -> int:
+        """
+        Maximum number of entries kept in memory.
+
+        Resolved lazily because the configuration is loaded after import.
+
+        :return: Cache capacity
+        """
+        if self._max_size is None:
+            self._max_size = int(os.getenv("WORKFLOW_LOCAL_CACHE_SIZE", "1024"))
+        return self._max_size
+
+    @property
+    def ttl(self) -> float:
+        """
+        Lifetime of a cache entry in seconds.
+
+        :return: Entry lifetime
+        """
+        if self._ttl is None:
+            self._ttl = float(os.getenv("WORKFLOW_LOCAL_CACHE_TTL", "30"))
+        return self._ttl
+
+    @property
+    def channel(self) -> str:
+        """
+        Redis channel carrying the keys to invalidate.
+
+        :return: Channel name
+        """
+        if self._channel is None:
+            self._channel = os.getenv(
+                "WORKFLOW_CACHE_INVALIDATE_CHANNEL", "workflow:cache:invalidate"
+            )
+        return self._channel
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether the cache stores any entries.
+
+        :return: True if caching is enabled, False otherwise
+        """
+        return self.max_size > 0
+
+    def get(self, key: str, load: Callable[[], Any]) -> Any:
+        """
+        Get a value from memory, falling back to the shared cache.
+
+        :param key: Cache key
+        :param load: Function reading the key from the shared cache
+        :return: Cached value, None if not found in either layer
+        """
+        value = self.get_local(key)
+        if value is not None:
+            return value
+        return self._load(key, load)
+
+    async def get_async(self, key: str, load: Callable[[], Any]) -> Any:
+        """
+        Get a value from memory without leaving the event loop on a hit.
+
+        The blocking shared cache read only runs on the cache executor on a miss.
+
+        :param key: Cache key
+        :param load: Function reading the key from the shared cache
+        :return: Cached value, None if not found in either layer
+        """
+        value = self.get_local(key)
+        if value is not None:
+            return value
+        return await get_async_cache_service().run(self._load, key, load)
+
+    def get_local(self, key: str) -> Any:
+        """
+        Get a value from memory only.
+
+        :param key: Cache key
+        :return: Fresh copy of the cached value, None on miss
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self._l1_hits += 1
+        self._report(key, "l1_hit")
+        return pickle.loads(entry[1])
+
+    def _load(self, key: str, load: Callable[[], Any]) -> Any:
+        """
+        Read a value from the shared cache and keep it in memory.
+
+        :param key: Cache key
+        :param load: Function reading the key from the shared cache
+        :return: Cached value, None if not found
+        """
+        value = load()
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._l2_hits += 1
+        if value is None:
+            self._report(key, "miss")
+            return None
+        self._report(key, "l2_hit")
+        self.set(key, value)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Keep a value in memory, the caller stores it in the shared cache.
+
+        :param key: Cache key
+        :param value: Value to cache, must be picklable
+        """
+        if not self.enabled or value is None:
+            return
+        data = pickle.dumps(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Drop a key from memory on every worker.
+
+        The caller deletes the key from the shared cache beforehand, so a
+        worker reloading it concurrently cannot restore the stale value.
+
+        :param key: Cache key
+        """
+        self.discard(key)
+        try:
+            get_cache_service().publish(self.channel, key)
+        except Exception as e:
+            # Other workers still expire the entry after the TTL
+            logger.warning(f"Failed to publish cache invalidation of {key}: {e}")
+
+    def discard(self, key: str) -> None:
+        """
+        Drop a key from the memory of this process.
+
+        :param key: Cache key
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Drop all entries of this process.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def start_listener(self) -> None:
+        """
+        Start listening for invalidations published by other workers.
+        """
+        if not self.enabled or self._listener is not None:
+            return
+        self._stopped.clear()
+        self._listener = threading.Thread(
+            target=self._listen, name="workflow-cache-invalidation", daemon=True
+        )
+        self._listener.start()
+
+    def stop_listener(self) -> None:
+        """
+        Stop listening for invalidations.
+        """
+        self._stopped.set()
+        pubsub, self._pubsub = self._pubsub, None
+        if pubsub is not None:
+            try:
+                pubsub.close()
+            except Exception:
+                pass
+        self._listener = None
+
+    def _listen(self) -> None:
+        """
+        Drop keys received on the invalidation channel until stopped.
+        """
+        while not self._stopped.is_set():
+            try:
+                self._pubsub = get_cache_service().subscribe(self.channel)
+                for message in self._pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    key = message.get("data")
+                    if isinstance(key, bytes):
+                        key = key.decode("utf-8")
+                    self.discard(key)
+            except Exception as e:
+                if not self._stopped.is_set():
+                    logger.warning(f"Cache invalidation listener error: {e}")
+            if self._stopped.is_set():
+                break
+            # Invalidations may have been missed while disconnected
+            self.clear()
+            self._stopped.wait(1)
+
+    def _report(self, key: str, result: str) -> None:
+        """
+        Export a lookup result through the meter.
+
+        :param key: Cache key, its first two segments name the cached object
+        :param result: Lookup result, one of l1_hit, l2_hit and miss
+        """
+        m = Meter(func="workflow_local_cache")
+        m.in_success_count(
+            labels={
+                "cache_name": ":".join(key.split(":")[:2]),
+                "cache_result": result,
+            }
+        )
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get a snapshot of the cache counters.
+
+        :return: Dictionary of cache counters including the memory hit rate
+        """
+        with self._lock:
+            total = self._l1_hits + self._l2_hits + self._misses
+            return {
+                "size": len(self._entries),
+                "l1_hits": self._l1_hits,
+                "l2_hits": self._l2_hits,
+                "misses": self._misses,
+                "l1_hit_rate": self._l1_hits / total if total else 0.0,
+            }
+
+
+# Process-wide local cache
+local_cache = LocalCache()
@@ -18,3 +18,14 @@ class ErrorHandler(Enum):
     Interrupted = 0
     CustomReturn = 1
     FailBranch = 2
+
+
+class IterationErrorStrategy(Enum):
+    """
+    Iteration item error handling strategy enumeration.
+
+    Defines how an iteration node reacts when a single batch item fails.
+    """
+
+    FailFast = 0
+    Continue = 1
@@ -108,18 +108,12 @@ class ChatCallBacks:
         Progress calculation rules:
         - If a simple path is marked as inactive, all nodes in that path are considered completed
         - Otherwise, count the number of executed nodes in each simple path
+        - Both counts are derived from the chain graph index without enumerating paths
 
         :param current_execute_node_id: ID of the currently executing node
         :return: Progress value between 0.0 and 1.0
         """
-        completed_node_cnt = 0
-        for simple_path in self.chains.master_chains:
-            if simple_path.inactive.is_set():
-                completed_node_cnt += len(simple_path.node_id_list)
-            else:
-                completed_node_cnt += simple_path.every_node_index.get(
-                    current_execute_node_id, 0
-                )
+        completed_node_cnt = self.chains.get_completed_node_cnt(current_execute_node_id)
         return completed_node_cnt / self.all_simple_paths_node_cnt
 
     async def on_sparkflow_start(self) -> None:
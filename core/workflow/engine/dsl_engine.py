@@ -21,7 +21,7 @@ from workflow.consts.engine.model_provider import ModelProviderEnum
 from workflow.consts.engine.value_type import ValueType
 from workflow.domain.entities.chat import HistoryItem
 from workflow.engine.callbacks.callback_handler import ChatCallBacks
-from workflow.engine.entities.chains import Chains, SimplePath
+from workflow.engine.entities.chains import Chains
 from workflow.engine.entities.msg_or_end_dep_info import MsgOrEndDepInfo
 from workflow.engine.entities.node_entities import (
     CONTINUE_ON_ERROR_NOT_STREAM_NODE_TYPE,
@@ -1638,15 +1638,10 @@ class WorkflowEngine(BaseModel):
     ) -> None:
         with span.start("deactivate_branch_paths") as span_context:
             for node_id in node_ids:
-                node_chains = self.engine_ctx.chains.get_branch_chains(
-                    current_node_id, node_id
-                )
-                for simple_path in node_chains:
-                    if not simple_path.inactive.is_set():
-                        simple_path.inactive.set()
-                        await span_context.add_info_events_async(
-                            {"inactive": simple_path.node_id_list}
-                        )
+                if self.engine_ctx.chains.deactivate_branch(current_node_id, node_id):
+                    await span_context.add_info_events_async(
+                        {"inactive": [current_node_id, node_id]}
+                    )
 
     async def _set_nodes_logical_run_status(
         self, not_run_node_ids: List[str], span: Span
@@ -1659,19 +1654,8 @@ class WorkflowEngine(BaseModel):
         :return: None
         """
         for not_run_node_id in not_run_node_ids:
-            # Get chains that the current node belongs to
-            chains_of_node = self.engine_ctx.chains.get_node_chains(
-                not_run_node_id
-            ) or self.engine_ctx.chains.get_node_chains_with_node_id(not_run_node_id)
-
-            # Check if there are any active chains
-            node_should_not_run = True
-            for chain in chains_of_node:
-                if not chain.inactive.is_set():
-                    node_should_not_run = False
-                    break
-
-            if node_should_not_run:
+            # A node runs as long as at least one active chain contains it
+            if not self.engine_ctx.chains.has_active_path(not_run_node_id):
                 # Set node status
                 node_status = self.engine_ctx.node_run_status[not_run_node_id]
                 node_status.not_run.set()
@@ -1719,23 +1703,14 @@ class WorkflowEngine(BaseModel):
         if node_type in [NodeType.START.value, NodeType.ITERATION_START.value]:
             return
 
-        node_chains = self.engine_ctx.chains.get_node_chains(node.node_id)
-
-        for simple_path in node_chains:
-            if simple_path.inactive.is_set():
+        chains = self.engine_ctx.chains
+        for pre_node_id in chains.get_predecessors(node.node_id):
+            # Skip predecessors that are only reachable via inactive branches
+            if not chains.is_edge_active(pre_node_id, node.node_id):
                 continue
 
             # Create waiting tasks for each predecessor node
-            for i in range(len(simple_path.node_id_list) - 1):
-                pre_node_id, current_node_id = (
-                    simple_path.node_id_list[i],
-                    simple_path.node_id_list[i + 1],
-                )
-
-                if current_node_id == node.node_id:
-                    await self._create_predecessor_wait_tasks(
-                        node, pre_node_id, simple_path
-                    )
+            await self._create_predecessor_wait_tasks(node, pre_node_id)
 
     async def _wait_at_least_one_task_completed(self, tasks: list[Task]) -> None:
         """
@@ -1752,14 +1727,12 @@ class WorkflowEngine(BaseModel):
         self,
         node: SparkFlowEngineNode,
         pre_node_id: str,
-        simple_path: SimplePath,
     ) -> None:
         """
         Create waiting tasks for predecessor nodes.
 
         :param node: The current node
         :param pre_node_id: The ID of the predecessor node
-        :param simple_path: The simple path containing the nodes
         :return: List of asyncio tasks for waiting
         """
         pre_nodes = node.get_pre_nodes()
@@ -1988,24 +1961,11 @@ class WorkflowEngineBuilder:
 
         :return: Self for method chaining
         """
-        msg_or_end_node_deps_list = []
-
-        # Get main chain message dependencies
-        for chain in self.chains.master_chains:
-            msg_or_end_node_dep: Dict[str, MsgOrEndDepInfo] = {}
-            for node_id in reversed(chain.node_id_list):
-                self._build_node_message_dependency(node_id, msg_or_end_node_dep)
-            msg_or_end_node_deps_list.append(msg_or_end_node_dep)
-
-        # Handle iteration chain message dependencies
-        for iteration_chain in self.chains.iteration_chains.values():
-            for chain in iteration_chain.master_chains:
-                msg_or_end_node_dep_iter: Dict[str, MsgOrEndDepInfo] = {}
-                for node_id in reversed(chain.node_id_list):
-                    self._build_node_message_dependency(
-                        node_id, msg_or_end_node_dep_iter
-                    )
-                msg_or_end_node_deps_list.append(msg_or_end_node_dep_iter)
+        # Get main chain and iteration chain message dependencies
+        msg_or_end_node_deps_list = [
+            self._build_chain_message_dependencies(chains)
+            for chains in [self.chains, *self.chains.iteration_chains.values()]
+        ]
 
         # Merge message dependencies
         self._merge_message_dependencies(msg_or_end_node_deps_list)
@@ -2263,14 +2223,14 @@ class WorkflowEngineBuilder:
                 graph[src] = []
             graph[src].append({"target": tgt, "handle": edge.sourceHandle})
 
-        visited = set()
-
-        def dfs(node: str) -> bool:
+        # Reachability only, every node is expanded at most once
+        visited = {source}
+        stack = [source]
+        while stack:
+            node = stack.pop()
             if node == target:
                 return True
 
-            visited.add(node)
-
             for edge in graph.get(node, []):
                 next_node = edge["target"]
                 if next_node in visited:
@@ -2280,13 +2240,10 @@ class WorkflowEngineBuilder:
                 if edge.get("handle") and "fail_one_of" in edge.get("handle", ""):
                     continue
 
-                if dfs(next_node):
-                    return True
-
-            visited.remove(node)
-            return False
+                visited.add(next_node)
+                stack.append(next_node)
 
-        return dfs(source)
+        return False
 
     def _merge_message_dependencies(
         self, msg_or_end_node_deps_list: List[Dict]
@@ -2306,32 +2263,55 @@ class WorkflowEngineBuilder:
                         node_dep_info.node_dep
                     )
 
-    def _build_node_message_dependency(
-        self, node_id: str, msg_or_end_node_dep: Dict
-    ) -> None:
+    def _build_chain_message_dependencies(
+        self, chains: Chains
+    ) -> Dict[str, MsgOrEndDepInfo]:
+        """
+        Build message dependencies for all nodes of a chain.
+
+        Every message dependency node depends on all message dependency nodes
+        before it on any path of the chain.
+
+        :param chains: The chains to build message dependencies for
+        :return: Dictionary mapping node IDs to their message dependencies
+        """
+        dep_node_ids = {
+            node_id
+            for node_id in chains.node_ids
+            if self._is_message_dependency_node(node_id)
+        }
+
+        msg_or_end_node_dep: Dict[str, MsgOrEndDepInfo] = {}
+        for node_id in chains.node_ids:
+            if node_id not in dep_node_ids:
+                continue
+            msg_or_end_node_dep[node_id] = MsgOrEndDepInfo(
+                node_dep={
+                    ancestor_id
+                    for ancestor_id in chains.get_ancestors(node_id)
+                    if ancestor_id in dep_node_ids
+                },
+                data_dep=set(),
+                data_dep_path_info={},
+            )
+        return msg_or_end_node_dep
+
+    def _is_message_dependency_node(self, node_id: str) -> bool:
         """
-        Build message dependency for a single node.
+        Check whether a node takes part in message dependencies.
 
         :param node_id: The ID of the node
-        :param msg_or_end_node_dep: Dictionary to store message dependencies
-        :return: None
+        :return: True if the node takes part in message dependencies, False otherwise
         """
         node_fail_branch = self._check_node_fail_branch(node_id)
 
-        if self._should_build_message_dependency(node_id, node_fail_branch):
-            # Handle special logic for iteration nodes
-            if node_id.split("::")[0] == NodeType.ITERATION.value:
-                if not self._iteration_chain_has_message(node_id):
-                    return
-
-            # Add current node to existing message dependencies
-            for existing_dep in msg_or_end_node_dep.values():
-                existing_dep.node_dep.add(node_id)
+        if not self._should_build_message_dependency(node_id, node_fail_branch):
+            return False
 
-            # Create new dependency information for current node
-            msg_or_end_node_dep[node_id] = MsgOrEndDepInfo(
-                node_dep=set(), data_dep=set(), data_dep_path_info={}
-            )
+        # Iteration nodes only matter when their chain outputs messages
+        if node_id.split("::")[0] == NodeType.ITERATION.value:
+            return self._iteration_chain_has_message(node_id)
+        return True
 
     def _check_node_fail_branch(self, node_id: str) -> bool:
         """
@@ -2357,11 +2337,10 @@ class WorkflowEngineBuilder:
         :return: True if iteration chain has message nodes, False otherwise
         """
         iteration_chain = self.chains.iteration_chains[node_id]
-        for master_chain in iteration_chain.master_chains:
-            for iteration_node_id in master_chain.node_id_list:
-                if iteration_node_id.startswith(NodeType.MESSAGE.value):
-                    return True
-        return False
+        return any(
+            iteration_node_id.startswith(NodeType.MESSAGE.value)
+            for iteration_node_id in iteration_chain.node_ids
+        )
 
     def _should_build_message_dependency(
         self, node_id: str, node_fail_branch: bool
@@ -1,35 +1,210 @@
-from asyncio import Event
-from typing import Dict, List
+import copy
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, PrivateAttr
 
 from workflow.engine.entities.workflow_dsl import Node, WorkflowDSL
 
 
-class SimplePath(BaseModel):
+def _iter_bits(bitset: int) -> Iterator[int]:
     """
-    Represents a simple execution path in the workflow.
-    A simple path is a linear sequence of nodes that can be executed in order.
+    Iterate the indexes of the set bits of a bitset in ascending order.
+
+    :param bitset: Bitset encoded as integer
+    :return: Iterator of bit indexes
     """
+    while bitset:
+        low_bit = bitset & -bitset
+        yield low_bit.bit_length() - 1
+        bitset ^= low_bit
 
-    class Config:
-        arbitrary_types_allowed = True
 
-    node_id_list: list[str]
-    # Records the number of nodes before each node in this simple path
-    every_node_index: Dict[str, int]
-    # Currently executing node in this simple path
-    inactive: Event = Field(default_factory=Event)
+class ChainGraph:
+    """
+    Immutable DAG index of every execution path starting at a root node.
+
+    Instead of enumerating each simple path, the graph keeps adjacency and
+    reverse adjacency lists of the nodes reachable from the root, ancestor and
+    descendant bitsets and per node path counters. Node indexes follow a
+    topological order, so ascending bit iteration walks the graph in order.
+    """
+
+    def __init__(self, root_node_id: str, edge_dict: Dict[str, List[str]]) -> None:
+        """
+        Build the index of all paths from the root node to the sink nodes.
+
+        :param root_node_id: ID of the node every path starts with
+        :param edge_dict: Dictionary mapping nodes to their next nodes
+        :raises ValueError: If the nodes reachable from the root form a cycle
+        """
+        self.root_node_id = root_node_id
+        # Node IDs in topological order
+        self.node_ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.successors: Dict[str, List[str]] = {}
+        self.predecessors: Dict[str, List[str]] = {}
+        # Bitsets of all nodes before / after a node on any path
+        self.ancestors: Dict[str, int] = {}
+        self.descendants: Dict[str, int] = {}
+        # Number of paths from the root to a node and from a node to a sink
+        self.prefix_cnt: Dict[str, int] = {}
+        self.suffix_cnt: Dict[str, int] = {}
+        # Sum over all prefixes of the number of nodes before a node
+        self.prefix_len: Dict[str, int] = {}
+        # Sum of the node counts of all paths
+        self.total_node_cnt = 0
+
+        # A root without next nodes produces no path at all
+        if not edge_dict.get(root_node_id):
+            return
+
+        self._build_topological_order(edge_dict)
+        for node_id in self.node_ids:
+            self.successors[node_id] = list(edge_dict.get(node_id, []))
+            self.predecessors.setdefault(node_id, [])
+            for next_node_id in self.successors[node_id]:
+                self.predecessors.setdefault(next_node_id, []).append(node_id)
+
+        for node_id in self.node_ids:
+            ancestors = 0
+            for pre_node_id in self.predecessors[node_id]:
+                ancestors |= self.ancestors[pre_node_id] | (
+                    1 << self.index[pre_node_id]
+                )
+            self.ancestors[node_id] = ancestors
+        for node_id in reversed(self.node_ids):
+            descendants = 0
+            for next_node_id in self.successors[node_id]:
+                descendants |= self.descendants[next_node_id] | (
+                    1 << self.index[next_node_id]
+                )
+            self.descendants[node_id] = descendants
+
+        edges = self.edges()
+        for node_id in self.node_ids:
+            self.prefix_cnt[node_id], self.prefix_len[node_id] = self.count_prefixes(
+                node_id, self.prefix_cnt, self.prefix_len, edges
+            )
+        for node_id in reversed(self.node_ids):
+            self.suffix_cnt[node_id] = self.count_suffixes(
+                node_id, self.suffix_cnt, edges
+            )
+        self.total_node_cnt = sum(
+            self.prefix_cnt[node_id] * self.suffix_cnt[node_id]
+            for node_id in self.node_ids
+        )
+
+    def _build_topological_order(self, edge_dict: Dict[str, List[str]]) -> None:
+        """
+        Order the nodes reachable from the root topologically.
+
+        :param edge_dict: Dictionary mapping nodes to their next nodes
+        :raises ValueError: If the reachable nodes form a cycle
+        """
+        post_order: List[str] = []
+        visiting: Set[str] = set()
+        visited: Set[str] = set()
+        stack: List[Tuple[str, Iterator[str]]] = [
+            (self.root_node_id, iter(edge_dict.get(self.root_node_id, [])))
+        ]
+        visiting.add(self.root_node_id)
+        while stack:
+            node_id, next_node_ids = stack[-1]
+            next_node_id = next(next_node_ids, None)
+            if next_node_id is None:
+                stack.pop()
+                visiting.discard(node_id)
+                visited.add(node_id)
+                post_order.append(node_id)
+            elif next_node_id in visiting:
+                raise ValueError(f"Workflow contains a cycle at node {next_node_id}")
+            elif next_node_id not in visited:
+                visiting.add(next_node_id)
+                stack.append((next_node_id, iter(edge_dict.get(next_node_id, []))))
+
+        self.node_ids = list(reversed(post_order))
+        self.index = {node_id: i for i, node_id in enumerate(self.node_ids)}
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self.index
+
+    def edges(self) -> Set[Tuple[str, str]]:
+        """
+        Get all edges between the indexed nodes.
+
+        :return: Set of (source node ID, target node ID) tuples
+        """
+        return {
+            (node_id, next_node_id)
+            for node_id in self.node_ids
+            for next_node_id in self.successors[node_id]
+        }
+
+    def node_ids_of(self, bitset: int) -> List[str]:
+        """
+        Decode a node bitset in topological order.
+
+        :param bitset: Bitset of node indexes
+        :return: List of node IDs
+        """
+        return [self.node_ids[i] for i in _iter_bits(bitset)]
+
+    def count_prefixes(
+        self,
+        node_id: str,
+        prefix_cnt: Dict[str, int],
+        prefix_len: Dict[str, int],
+        edges: Set[Tuple[str, str]],
+    ) -> Tuple[int, int]:
+        """
+        Count the paths from the root to a node using only the given edges.
+
+        :param node_id: ID of the node
+        :param prefix_cnt: Prefix counts of the predecessors
+        :param prefix_len: Prefix length sums of the predecessors
+        :param edges: Edges that may be used
+        :return: Tuple of (number of prefixes, sum of nodes before the node)
+        """
+        if node_id == self.root_node_id:
+            return 1, 0
+        cnt, length = 0, 0
+        for pre_node_id in self.predecessors[node_id]:
+            if (pre_node_id, node_id) in edges:
+                cnt += prefix_cnt[pre_node_id]
+                length += prefix_len[pre_node_id] + prefix_cnt[pre_node_id]
+        return cnt, length
+
+    def count_suffixes(
+        self, node_id: str, suffix_cnt: Dict[str, int], edges: Set[Tuple[str, str]]
+    ) -> int:
+        """
+        Count the paths from a node to a sink using only the given edges.
+
+        :param node_id: ID of the node
+        :param suffix_cnt: Suffix counts of the successors
+        :param edges: Edges that may be used
+        :return: Number of suffixes
+        """
+        if not self.successors[node_id]:
+            return 1
+        return sum(
+            suffix_cnt[next_node_id]
+            for next_node_id in self.successors[node_id]
+            if (node_id, next_node_id) in edges
+        )
 
 
 class Chains(BaseModel):
     """
     Represents the execution chains of a workflow.
     Contains both master chains and iteration chains for complex workflow execution.
+
+    A chain is a path from the start node to a sink node. Paths are not
+    materialized; the graph index answers path questions per node and edge,
+    while branch edges deactivated at runtime make every path through them
+    inactive.
     """
 
-    # Main execution chains
-    master_chains: List[SimplePath] = []
     # Internal chains for iteration nodes, key: iteration node ID, value: chains
     iteration_chains: Dict[str, "Chains"] = {}
     workflow_schema: WorkflowDSL
@@ -37,64 +212,190 @@ class Chains(BaseModel):
     # Edge mapping relationships
     edge_dict: Dict[str, List[str]] = {}
 
+    # Static graph index, shared between copies
+    _graph: ChainGraph = PrivateAttr(default_factory=lambda: ChainGraph("", {}))
+    # Runtime state: active edges and active path counters
+    _active_edges: Set[Tuple[str, str]] = PrivateAttr(default_factory=set)
+    _active_prefix_cnt: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _active_prefix_len: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _active_suffix_cnt: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _active_node_cnt: int = PrivateAttr(default=0)
+
     class Config:
         arbitrary_types_allowed = True  # Allow arbitrary types
 
+    def __deepcopy__(self, memo: Optional[dict] = None) -> "Chains":
+        """
+        Copy the runtime state while sharing the immutable graph index.
+
+        :param memo: Deepcopy memo dictionary
+        :return: Chains copy with independent path activity
+        """
+        new_chains = self.model_copy()
+        new_chains.iteration_chains = {
+            node_id: copy.deepcopy(chains, memo)
+            for node_id, chains in self.iteration_chains.items()
+        }
+        new_chains._active_edges = set(self._active_edges)
+        new_chains._active_prefix_cnt = dict(self._active_prefix_cnt)
+        new_chains._active_prefix_len = dict(self._active_prefix_len)
+        new_chains._active_suffix_cnt = dict(self._active_suffix_cnt)
+        return new_chains
+
+    @property
+    def node_ids(self) -> List[str]:
+        """
+        Get all node IDs on the chains in topological order.
+
+        :return: List of node IDs
+        """
+        return self._graph.node_ids
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._graph
+
     def get_all_simple_paths_node_cnt(self) -> int:
         """
         Get the total number of nodes in all simple paths.
 
         :return: Total count of nodes across all simple paths
         """
-        cnt = 0
-        for one_simple_chain in self.master_chains:
-            cnt += len(one_simple_chain.node_id_list)
-        return cnt
+        return self._graph.total_node_cnt
 
-    def get_node_chains(self, node_id: str) -> List[SimplePath]:
+    def get_completed_node_cnt(self, node_id: str) -> int:
         """
-        Get all simple paths that contain the specified node.
+        Get the number of completed nodes over all simple paths.
+
+        Nodes of inactive paths count as completed, on active paths the nodes
+        before the currently executing node count as completed.
 
-        :param node_id: The ID of the node to search for
-        :return: List of simple paths containing the node
+        :param node_id: The ID of the currently executing node
+        :return: Number of completed nodes across all simple paths
         """
-        node_chains = []
-        for simple_path in self.master_chains:
-            if node_id in simple_path.node_id_list:
-                node_chains.append(simple_path)
-        return node_chains
+        completed_node_cnt = self._graph.total_node_cnt - self._active_node_cnt
+        if node_id in self._graph:
+            completed_node_cnt += (
+                self._active_prefix_len[node_id] * self._active_suffix_cnt[node_id]
+            )
+        return completed_node_cnt
+
+    def get_ancestors(self, node_id: str) -> List[str]:
+        """
+        Get all nodes that come before the specified node on any path.
+
+        :param node_id: The ID of the node
+        :return: List of ancestor node IDs in topological order
+        """
+        return self._graph.node_ids_of(self._graph.ancestors.get(node_id, 0))
+
+    def get_predecessors(self, node_id: str) -> List[str]:
+        """
+        Get the nodes directly before the specified node on any path.
+
+        :param node_id: The ID of the node
+        :return: List of predecessor node IDs
+        """
+        return self._graph.predecessors.get(node_id, [])
+
+    def is_edge_active(self, node_id: str, next_node_id: str) -> bool:
+        """
+        Check whether at least one active path contains the given edge.
 
-    def get_node_chains_with_node_id(self, node_id: str) -> List[SimplePath]:
+        :param node_id: The source node ID
+        :param next_node_id: The target node ID
+        :return: True if an active path contains the edge, False otherwise
+        """
+        return (
+            (node_id, next_node_id) in self._active_edges
+            and self._active_prefix_cnt[node_id] > 0
+            and self._active_suffix_cnt[next_node_id] > 0
+        )
+
+    def has_active_path(self, node_id: str) -> bool:
         """
-        Get all simple paths containing the specified node from iteration chains.
+        Check whether at least one active path contains the specified node.
 
-        :param node_id: The ID of the node to search for
-        :return: List of simple paths containing the node from iteration chains
+        Nodes that are not on the master chains are looked up in the
+        iteration chains.
+
+        :param node_id: The ID of the node
+        :return: True if an active path contains the node, False otherwise
+        """
+        if node_id in self._graph:
+            return self._is_node_active(node_id)
+        return any(
+            chains._is_node_active(node_id)
+            for chains in self.iteration_chains.values()
+            if node_id in chains
+        )
+
+    def _is_node_active(self, node_id: str) -> bool:
         """
-        node_chains = []
-        for iter_node_id, chains in self.iteration_chains.items():
-            node_chain = chains.get_node_chains(node_id)
-            node_chains.extend(node_chain)
-        return node_chains
+        Check whether an active path of this chain contains the node.
 
-    def get_branch_chains(self, node_id: str, branch_node_id: str) -> List[SimplePath]:
+        :param node_id: The ID of an indexed node
+        :return: True if an active path contains the node, False otherwise
         """
-        Get simple paths that contain a specific branch from one node to another.
+        return (
+            self._active_prefix_cnt[node_id] > 0
+            and self._active_suffix_cnt[node_id] > 0
+        )
+
+    def deactivate_branch(self, node_id: str, branch_node_id: str) -> bool:
+        """
+        Deactivate all simple paths that take a branch from one node to another.
+
+        Only the path counters of the nodes after the branch target and
+        before the branch source are updated.
 
         :param node_id: The source node ID
         :param branch_node_id: The target branch node ID
-        :return: List of simple paths containing the specified branch
-        """
-        node_chains = []
-        for simple_path in self.master_chains:
-            for i in range(len(simple_path.node_id_list) - 1):
-                pre_node_id, cur_node_id = (
-                    simple_path.node_id_list[i],
-                    simple_path.node_id_list[i + 1],
+        :return: True if the branch was active before, False otherwise
+        """
+        edge = (node_id, branch_node_id)
+        if edge not in self._active_edges:
+            return False
+        self._active_edges.discard(edge)
+
+        graph = self._graph
+        forward = graph.descendants[branch_node_id] | (1 << graph.index[branch_node_id])
+        backward = graph.ancestors[node_id] | (1 << graph.index[node_id])
+        affected = graph.node_ids_of(forward | backward)
+        self._active_node_cnt -= sum(
+            self._active_prefix_cnt[n] * self._active_suffix_cnt[n] for n in affected
+        )
+
+        for n in graph.node_ids_of(forward):
+            self._active_prefix_cnt[n], self._active_prefix_len[n] = (
+                graph.count_prefixes(
+                    n,
+                    self._active_prefix_cnt,
+                    self._active_prefix_len,
+                    self._active_edges,
                 )
-                if pre_node_id == node_id and cur_node_id == branch_node_id:
-                    node_chains.append(simple_path)
-        return node_chains
+            )
+        for n in reversed(graph.node_ids_of(backward)):
+            self._active_suffix_cnt[n] = graph.count_suffixes(
+                n, self._active_suffix_cnt, self._active_edges
+            )
+
+        self._active_node_cnt += sum(
+            self._active_prefix_cnt[n] * self._active_suffix_cnt[n] for n in affected
+        )
+        return True
+
+    def _build_index(self, root_node_id: str) -> None:
+        """
+        Build the graph index and reset all paths to active.
+
+        :param root_node_id: ID of the node every path starts with
+        """
+        self._graph = ChainGraph(root_node_id, self.edge_dict)
+        self._active_edges = self._graph.edges()
+        self._active_prefix_cnt = dict(self._graph.prefix_cnt)
+        self._active_prefix_len = dict(self._graph.prefix_len)
+        self._active_suffix_cnt = dict(self._graph.suffix_cnt)
+        self._active_node_cnt = self._graph.total_node_cnt
 
     def _deal_edges(self) -> tuple[str, str, Dict[str, List[str]], Dict[str, str]]:
         """
@@ -142,74 +443,21 @@ class Chains(BaseModel):
 
         return start_node_id, end_node_id, edge_dict, iteration_dict
 
-    def _get_next_node(
-        self, node_id: str, edge_dict: Dict[str, List[str]]
-    ) -> List[List[str]]:
-        """
-        Recursively get all possible paths starting from the given node.
-
-        :param node_id: The starting node ID
-        :param edge_dict: Dictionary mapping nodes to their next nodes
-        :return: List of all possible paths from the starting node
-        """
-        result: List[List[str]] = []
-
-        next_node_ids = edge_dict.get(node_id, [])
-        for next_node_id in next_node_ids:
-            one = [next_node_id]
-            next_result = self._get_next_node(next_node_id, edge_dict)
-
-            if len(next_result) > 0:
-                for nr in next_result:
-                    oo = one + nr
-                    result.append(oo)
-            else:
-                result.append(one)
-        return result
-
-    def _get_every_node_index(self, node_id_list: List[str]) -> Dict[str, int]:
-        """
-        Get the index of each node in the node list.
-
-        :param node_id_list: List of node IDs
-        :return: Dictionary mapping node ID to its index in the list
-        """
-        node_id_pre_node_cnt: Dict[str, int] = {}
-        for node_id in node_id_list:
-            node_id_pre_node_cnt[node_id] = len(node_id_pre_node_cnt)
-        return node_id_pre_node_cnt
-
     def gen(self) -> None:
         """
         Generate execution chains from the workflow schema.
-        This method processes the workflow graph and creates both master chains and iteration chains.
+        This method processes the workflow graph and indexes both master chains and iteration chains.
         """
         start_node_id, end_node_id, self.edge_dict, iteration_dict = self._deal_edges()
 
-        next_root_results = self._get_next_node(start_node_id, self.edge_dict)
-
         # Process iteration node chains
         for iteration_node_id, iteration_node_id_start_id in iteration_dict.items():
-            next_results = self._get_next_node(
-                iteration_node_id_start_id, self.edge_dict
-            )
             if iteration_node_id not in self.iteration_chains:
                 self.iteration_chains[iteration_node_id] = Chains(
                     workflow_schema=self.workflow_schema
                 )
-            for next_result in next_results:
-                node_id_list = [iteration_node_id_start_id, *next_result]
-                sp = SimplePath(
-                    node_id_list=node_id_list,
-                    every_node_index=self._get_every_node_index(node_id_list),
-                )
-                self.iteration_chains[iteration_node_id].master_chains.append(sp)
-                self.iteration_chains[iteration_node_id].edge_dict = self.edge_dict
-
-        for next_root_result in next_root_results:
-            node_id_list = [start_node_id, *next_root_result]
-            sp = SimplePath(
-                node_id_list=node_id_list,
-                every_node_index=self._get_every_node_index(node_id_list),
-            )
-            self.master_chains.append(sp)
+            iteration_chains = self.iteration_chains[iteration_node_id]
+            iteration_chains.edge_dict = self.edge_dict
+            iteration_chains._build_index(iteration_node_id_start_id)
+
+        self._build_index(start_node_id)
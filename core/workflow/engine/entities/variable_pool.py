@@ -2,8 +2,9 @@ import ast
 import asyncio
 import copy
 import re
+from collections import ChainMap
 from enum import Enum, unique
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, MutableMapping, Optional, cast
 
 from common.utils.json_schema.json_schema_cn import CNValidator
 
@@ -241,9 +242,28 @@ class SystemParams:
         return self
 
 
+def overlay_mapping(mapping: MutableMapping[str, Any]) -> ChainMap:
+    """
+    Create a copy-on-write layer on top of a mapping.
+
+    Reads fall through to the underlying mapping, writes only touch the new layer.
+
+    :param mapping: Mapping to read through to
+    :return: ChainMap with an empty writable layer in front
+    """
+    if isinstance(mapping, ChainMap):
+        return mapping.new_child()
+    return ChainMap({}, mapping)
+
+
 class VariablePool:
     """
     Variable pool system for managing workflow variables and their values.
+
+    A pool can be layered with overlay(): the child reads through to its
+    parent and stores only the variables it writes, so discarding it leaves
+    the parent untouched. Mutable values read from a child are copies, so
+    mutating them cannot reach the parent either.
     """
 
     node_protocol: list[Node] = []
@@ -259,12 +279,12 @@ class VariablePool:
 
         :param protocol: List of nodes defining the workflow protocol
         """
-        self.input_variable_mapping: Dict[str, Any] = {}
-        self.output_variable_mapping: Dict[str, Any] = {}
+        self.input_variable_mapping: MutableMapping[str, Any] = {}
+        self.output_variable_mapping: MutableMapping[str, Any] = {}
         self.nodes = protocol
         self.protocol_inputs_parser()
         self.protocol_outputs_parser()
-        self.history_mapping: Dict[str, Any] = {}
+        self.history_mapping: MutableMapping[str, Any] = {}
         self.stream_data: Dict[str, Dict[str, asyncio.Queue]] = {}
         self.chat_id: str = ""
         self.history_v2: Optional[History] = None
@@ -272,6 +292,7 @@ class VariablePool:
             {}
         )  # Mark whether the streaming output node (LLM node, agent node) sends the first frame
         self.system_params = SystemParams()
+        self.is_overlay = False
 
     def __deepcopy__(self, memo: dict) -> "VariablePool":
         return self.__class__.deepcopy(self)
@@ -288,9 +309,11 @@ class VariablePool:
         new_vp = cls(copy.deepcopy(src.nodes))
 
         # Copy each attribute (can decide between deep copy or shallow copy as needed)
-        new_vp.input_variable_mapping = copy.deepcopy(src.input_variable_mapping)
-        new_vp.output_variable_mapping = copy.deepcopy(src.output_variable_mapping)
-        new_vp.history_mapping = copy.deepcopy(src.history_mapping)
+        new_vp.input_variable_mapping = copy.deepcopy(dict(src.input_variable_mapping))
+        new_vp.output_variable_mapping = copy.deepcopy(
+            dict(src.output_variable_mapping)
+        )
+        new_vp.history_mapping = copy.deepcopy(dict(src.history_mapping))
         new_vp.stream_data = src.stream_data
         new_vp.chat_id = src.chat_id
         new_vp.history_v2 = copy.deepcopy(src.history_v2)
@@ -298,6 +321,56 @@ class VariablePool:
 
         return new_vp
 
+    def overlay(self) -> "VariablePool":
+        """
+        Create a copy-on-write child of the variable pool.
+
+        The child shares nodes, history, stream data and system parameters with
+        this pool. Variable mappings read through to this pool while writes are
+        kept in the child, so creating and discarding a child costs O(1).
+        Mutable values are copied when they are read from the child instead.
+
+        :return: Child variable pool
+        """
+        child = self.__class__.__new__(self.__class__)
+        child.nodes = self.nodes
+        child.input_variable_mapping = overlay_mapping(self.input_variable_mapping)
+        child.output_variable_mapping = overlay_mapping(self.output_variable_mapping)
+        child.history_mapping = overlay_mapping(self.history_mapping)
+        child.stream_data = self.stream_data
+        child.chat_id = self.chat_id
+        child.history_v2 = self.history_v2
+        child.stream_node_has_sent_first_token = {}
+        child.system_params = self.system_params
+        child.is_overlay = True
+        return child
+
+    def _copy_on_read(self, value: Any) -> Any:
+        """
+        Copy a mutable value read from an overlay, which may share it with its parent.
+
+        :param value: Value read from the variable mappings
+        :return: Deep copy of dict and list values of an overlay, else the value
+        """
+        if self.is_overlay and isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
+        return value
+
+    @staticmethod
+    def _set_mapping_value(
+        mapping: MutableMapping[str, Any], mapping_key: str, value: Any
+    ) -> None:
+        """
+        Set the value of a mapping entry without mutating the entry in place.
+
+        Entries may be shared with a parent pool, so a new entry is written.
+
+        :param mapping: Variable mapping to write to
+        :param mapping_key: Key of the entry
+        :param value: New value of the entry
+        """
+        mapping[mapping_key] = {**mapping[mapping_key], "value": value}
+
     def set_stream_node_has_sent_first_token(self, node_id: str) -> None:
         """
         Mark that a streaming node has sent its first token.
@@ -506,7 +579,9 @@ class VariablePool:
                     is_update = True
                     break
             if is_update:
-                mapping_value.update({"value": input_value_content})
+                self._set_mapping_value(
+                    self.output_variable_mapping, mapping_key, input_value_content
+                )
 
     def get_output_schema(self, node_id: str, key_name: str) -> Dict[str, Any]:
         """
@@ -574,6 +649,21 @@ class VariablePool:
         :param first_only: If True, extract only the first element for array object
         :return: Value of the output variable
         """
+        return self._copy_on_read(
+            self._read_output_variable(node_id, key_name, first_only=first_only)
+        )
+
+    def _read_output_variable(
+        self, node_id: str, key_name: str, *, first_only: bool = False
+    ) -> Any:
+        """
+        Read an output variable value from the mappings without copying it.
+
+        :param node_id: ID of the node
+        :param key_name: Name of the variable (supports nested access with dot notation)
+        :param first_only: If True, extract only the first element for array object
+        :return: Value of the output variable
+        """
         key_name_list = key_name.split(".")
         if len(key_name_list) == 1:
             mapping_key = assemble_mapping_key(node_id, key_name)
@@ -727,7 +817,7 @@ class VariablePool:
                 input_value = self.input_variable_mapping[mapping_key]
                 input_schema: InputSchema = input_value.get("schema")
                 if input_schema.value.type == ValueType.LITERAL.value:
-                    return input_value.get("value")
+                    return self._copy_on_read(input_value.get("value"))
                 else:
                     ref_content = input_schema.value.content
                     node_id = (
@@ -777,8 +867,8 @@ class VariablePool:
         output_value = value.outputs
         for key in key_name_list:
             key_mapping = assemble_mapping_key(node_id, key)
-            self.input_variable_mapping[key_mapping].update(
-                {"value": output_value.get(key)}
+            self._set_mapping_value(
+                self.input_variable_mapping, key_mapping, output_value.get(key)
             )
 
     def do_validate(
@@ -841,8 +931,8 @@ class VariablePool:
             if mapping_key not in self.output_variable_mapping:
                 continue
             if key in output_value:
-                self.output_variable_mapping[mapping_key].update(
-                    {"value": output_value.get(key)}
+                self._set_mapping_value(
+                    self.output_variable_mapping, mapping_key, output_value.get(key)
                 )
             else:
                 await span.add_info_event_async(
@@ -3,7 +3,7 @@ import copy
 import json
 import os
 import time
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 
 import aiohttp
 from aiohttp import ClientTimeout
@@ -11,6 +11,7 @@ from pydantic import Field
 
 from workflow.consts.engine.chat_status import ChatStatus
 from workflow.consts.runtime_env import RuntimeEnv
+from workflow.domain.entities.chat import ChatVo
 from workflow.domain.models.ai_app import App
 from workflow.engine.callbacks.openai_types_sse import GenerateUsage
 from workflow.engine.entities.history import EnableChatHistoryV2, History
@@ -93,20 +94,34 @@ class FlowNode(BaseNode):
             outputs: dict[Any, Any] = {}
             token_usage: dict[Any, Any] = {}
 
-            # Get the workflow SSE endpoint URL
-            sparkflow_url_sse = (
-                f"{os.getenv('WORKFLOW_BASE_URL')}/workflow/v1/chat/completions"
-            )
+            local_result = None
+            if os.getenv("WORKFLOW_SUBFLOW_LOCAL_ENABLE", "1") == "1":
+                # Run flows of this deployment in-process
+                local_result = await self.req_flow_local(
+                    inputs,
+                    variable_pool,
+                    span,
+                    event_log_node_trace=event_log_node_trace,
+                    msg_or_end_node_deps=msg_or_end_node_deps,
+                )
 
-            # Execute the nested workflow via SSE API
-            outputs, token_usage = await self.req_flow_api_with_see(
-                sparkflow_url_sse,
-                inputs,
-                variable_pool,
-                span,
-                event_log_node_trace=event_log_node_trace,
-                msg_or_end_node_deps=msg_or_end_node_deps,
-            )
+            if local_result is not None:
+                outputs, token_usage = local_result
+            else:
+                # Get the workflow SSE endpoint URL
+                sparkflow_url_sse = (
+                    f"{os.getenv('WORKFLOW_BASE_URL')}/workflow/v1/chat/completions"
+                )
+
+                # Execute the nested workflow via SSE API
+                outputs, token_usage = await self.req_flow_api_with_see(
+                    sparkflow_url_sse,
+                    inputs,
+                    variable_pool,
+                    span,
+                    event_log_node_trace=event_log_node_trace,
+                    msg_or_end_node_deps=msg_or_end_node_deps,
+                )
 
             # Order outputs according to the defined output identifiers
             order_outputs = {}
@@ -158,6 +173,86 @@ class FlowNode(BaseNode):
                 ),
             )
 
+    async def req_flow_local(
+        self,
+        inputs: dict,
+        variable_pool: VariablePool,
+        span: Span,
+        msg_or_end_node_deps: Dict[str, MsgOrEndDepInfo],
+        event_log_node_trace: NodeLog | None = None,
+    ) -> Optional[Tuple[dict, dict]]:
+        """
+        Execute nested workflow in-process.
+
+        The nested flow is built (or taken from the engine cache) by this
+        worker and its response frames are consumed directly, without the
+        HTTP round trip and SSE serialization of the chat completions API.
+
+        :param inputs: Input parameters for the target workflow
+        :param variable_pool: Variable pool for workflow context
+        :param span: Tracing span for observability
+        :param msg_or_end_node_deps: Message dependencies for streaming output
+        :param event_log_node_trace: Optional node trace logging
+        :return: Tuple containing (outputs_dict, token_usage_dict), or None if
+                 the flow is not found in this deployment
+        :raises CustomException: When the app is not found, or when workflow
+                                 execution fails or times out
+        """
+        from workflow.service import chat_service
+
+        # The app must exist whether the flow runs locally or over HTTP
+        await self._get_app_authorization(span)
+        output_mode = self._get_output_mode(variable_pool)
+        # Keep the inputs untouched until the flow is known to run locally
+        local_inputs = dict(inputs)
+        req_body = self._assemble_request_body(local_inputs, variable_pool)
+        if event_log_node_trace:
+            event_log_node_trace.append_config_data(
+                {
+                    "mode": "local",
+                    "req_body": json.dumps(req_body, ensure_ascii=False),
+                }
+            )
+
+        try:
+            frames = await chat_service.subflow_frames(
+                self.appId, ChatVo.model_validate(req_body), span
+            )
+        except CustomException as err:
+            if err.code != CodeEnum.FLOW_NOT_FOUND_ERROR.code:
+                raise
+            # Flows of other deployments are only reachable over HTTP
+            await span.add_info_event_async(
+                f"Flow {self.flowId} not found locally, falling back to HTTP"
+            )
+            return None
+        inputs.update(local_inputs)
+
+        interval_timeout = self._get_interval_timeout()
+        try:
+            result_content, result_reasoning_content, token_usage = (
+                await self._read_frames(
+                    self._with_frame_timeout(frames, interval_timeout),
+                    output_mode,
+                    variable_pool,
+                    msg_or_end_node_deps,
+                )
+            )
+        except asyncio.TimeoutError as e:
+            raise CustomException(
+                err_code=CodeEnum.WORKFLOW_EXECUTION_ERROR,
+                err_msg=f"Flow node response timeout ({interval_timeout}s)",
+                cause_error=f"Flow node response timeout ({interval_timeout}s)",
+            ) from e
+        finally:
+            # Stops the nested engine if the frames were not fully consumed
+            await frames.aclose()
+
+        outputs = self._handle_outputs(
+            output_mode, result_content, result_reasoning_content
+        )
+        return outputs, token_usage
+
     async def req_flow_api_with_see(
         self,
         url: str,
@@ -184,36 +279,17 @@ class FlowNode(BaseNode):
         :raises CustomException: When workflow execution fails or times out
         """
         # Get the output mode configuration for the flow
-        output_mode = variable_pool.system_params.get(
-            ParamKey.FlowOutputMode, node_id=self.node_id
-        )
-        if output_mode is None:
-            raise CustomException(
-                err_code=CodeEnum.WORKFLOW_EXECUTION_ERROR,
-                cause_error=f"Flow output mode not configured for flow_id: {self.flowId}",
-            )
+        output_mode = self._get_output_mode(variable_pool)
 
         # Assemble request headers and body
         headers, req_body = await self._assemble_request(
             url, inputs, variable_pool, span, event_log_node_trace
         )
 
-        # Initialize response containers
-        outputs = {}
-        token_usage = {}
+        # Configure timeout based on retry settings
+        interval_timeout = self._get_interval_timeout()
 
         try:
-            # Initialize content accumulators for streaming response
-            result_content = ""
-            result_reasoning_content = ""
-
-            # Configure timeout based on retry settings
-            interval_timeout = (
-                self.retry_config.timeout
-                if self.retry_config.should_retry
-                else self._private_config.timeout
-            )
-
             # Establish SSE connection with appropriate timeouts
             async with aiohttp.ClientSession(
                 timeout=ClientTimeout(
@@ -224,58 +300,14 @@ class FlowNode(BaseNode):
                 async with session.post(
                     url=url, headers=headers, json=req_body
                 ) as response:
-                    # Process streaming response line by line
-                    async for line in response.content:
-                        line_str = line.decode("utf-8")
-                        if line_str == "\n":
-                            continue
-
-                        # Log received data for debugging
-                        await span.add_info_event_async(f"recv: {line_str}")
-
-                        # Parse SSE data format
-                        msg: dict[str, Any] = json.loads(line_str.removeprefix("data:"))
-
-                        # Check for API errors
-                        if msg.get("code", 0) != 0:
-                            raise CustomException(
-                                err_code=CodeEnum.WORKFLOW_EXECUTION_ERROR,
-                                err_msg=msg.get("message", ""),
-                                cause_error=json.dumps(msg, ensure_ascii=False),
-                            )
-
-                        # Extract choices from response
-                        choices = msg.get("choices", ())
-                        if not choices:
-                            break
-
-                        # Process content delta
-                        delta = choices[0].get("delta", {})
-                        content, reasoning_content = delta.get(
-                            "content", ""
-                        ), delta.get("reasoning_content", "")
-
-                        # Accumulate content for final output
-                        result_content += content
-                        result_reasoning_content += reasoning_content
-
-                        # Stream content to dependent nodes if in prompt mode
-                        if output_mode == EndNodeOutputModeEnum.PROMPT_MODE.value:
-                            await self.put_stream_content(
-                                self.node_id,
-                                variable_pool,
-                                msg_or_end_node_deps,
-                                NodeType.FLOW.value,
-                                msg,
-                            )
-
-                        # Check for completion
-                        if (
-                            choices[0].get("finish_reason")
-                            == ChatStatus.FINISH_REASON.value
-                        ):
-                            token_usage = msg.get("usage", {})
-                            break
+                    result_content, result_reasoning_content, token_usage = (
+                        await self._read_frames(
+                            self._parse_sse_frames(response.content, span),
+                            output_mode,
+                            variable_pool,
+                            msg_or_end_node_deps,
+                        )
+                    )
         except asyncio.TimeoutError as e:
             # Handle timeout errors with detailed information
             raise CustomException(
@@ -290,6 +322,171 @@ class FlowNode(BaseNode):
         )
         return outputs, token_usage
 
+    def _get_output_mode(self, variable_pool: VariablePool) -> int:
+        """
+        Get the output mode configured for the target flow.
+
+        :param variable_pool: Variable pool for workflow context
+        :return: Output mode of the target flow
+        :raises CustomException: When the output mode is not configured
+        """
+        output_mode = variable_pool.system_params.get(
+            ParamKey.FlowOutputMode, node_id=self.node_id
+        )
+        if output_mode is None:
+            raise CustomException(
+                err_code=CodeEnum.WORKFLOW_EXECUTION_ERROR,
+                cause_error=f"Flow output mode not configured for flow_id: {self.flowId}",
+            )
+        return output_mode
+
+    def _get_interval_timeout(self) -> float:
+        """
+        Get the maximum wait between two response frames.
+
+        :return: Timeout in seconds based on retry settings
+        """
+        return (
+            self.retry_config.timeout
+            if self.retry_config.should_retry
+            else self._private_config.timeout
+        )
+
+    @staticmethod
+    async def _parse_sse_frames(
+        content: aiohttp.StreamReader, span: Span
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Parse the server-sent events of the chat completions API.
+
+        :param content: Response body stream
+        :param span: Tracing span for observability
+        :return: AsyncIterator yielding response frame dictionaries
+        """
+        # Process streaming response line by line
+        async for line in content:
+            line_str = line.decode("utf-8")
+            if line_str == "\n":
+                continue
+
+            # Log received data for debugging
+            await span.add_info_event_async(f"recv: {line_str}")
+
+            # Parse SSE data format
+            yield json.loads(line_str.removeprefix("data:"))
+
+    @staticmethod
+    async def _with_frame_timeout(
+        frames: AsyncIterator[Dict[str, Any]], interval_timeout: float
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Bound the wait for each in-process response frame.
+
+        :param frames: Response frames of the nested flow
+        :param interval_timeout: Maximum wait between two frames in seconds
+        :return: AsyncIterator yielding response frame dictionaries
+        :raises asyncio.TimeoutError: When a frame does not arrive in time
+        """
+        while True:
+            try:
+                yield await asyncio.wait_for(anext(frames), interval_timeout)
+            except StopAsyncIteration:
+                return
+
+    async def _read_frames(
+        self,
+        frames: AsyncIterator[Dict[str, Any]],
+        output_mode: int,
+        variable_pool: VariablePool,
+        msg_or_end_node_deps: Dict[str, MsgOrEndDepInfo],
+    ) -> Tuple[str, str, dict]:
+        """
+        Consume the response frames of the nested workflow.
+
+        Content is accumulated for the final outputs and, in prompt mode,
+        streamed to the dependent message and end nodes.
+
+        :param frames: Response frames of the nested flow
+        :param output_mode: Configured output mode for the workflow
+        :param variable_pool: Variable pool for workflow context
+        :param msg_or_end_node_deps: Message dependencies for streaming output
+        :return: Tuple containing (content, reasoning_content, token_usage)
+        :raises CustomException: When the nested workflow reports an error
+        """
+        # Initialize content accumulators for streaming response
+        result_content = ""
+        result_reasoning_content = ""
+        token_usage: dict = {}
+
+        async for msg in frames:
+            # Check for API errors
+            if msg.get("code", 0) != 0:
+                raise CustomException(
+                    err_code=CodeEnum.WORKFLOW_EXECUTION_ERROR,
+                    err_msg=msg.get("message", ""),
+                    cause_error=json.dumps(msg, ensure_ascii=False),
+                )
+
+            # Extract choices from response
+            choices = msg.get("choices", ())
+            if not choices:
+                break
+
+            # Process content delta
+            delta = choices[0].get("delta", {})
+            content, reasoning_content = delta.get("content", ""), delta.get(
+                "reasoning_content", ""
+            )
+
+            # Accumulate content for final output
+            result_content += content
+            result_reasoning_content += reasoning_content
+
+            # Stream content to dependent nodes if in prompt mode
+            if output_mode == EndNodeOutputModeEnum.PROMPT_MODE.value:
+                await self.put_stream_content(
+                    self.node_id,
+                    variable_pool,
+                    msg_or_end_node_deps,
+                    NodeType.FLOW.value,
+                    msg,
+                )
+
+            # Check for completion
+            if choices[0].get("finish_reason") == ChatStatus.FINISH_REASON.value:
+                token_usage = msg.get("usage", {})
+                break
+
+        return result_content, result_reasoning_content, token_usage
+
+    async def _get_app_authorization(self, span: Span) -> str:
+        """
+        Query the application of the nested workflow and build its credentials.
+
+        :param span: Tracing span for observability
+        :return: Bearer authorization of the application
+        :raises CustomException: When the application is not found
+        """
+        with session_getter() as session:
+            start_time = time.time() * 1000
+            app = session.query(App).filter_by(alias_id=self.appId).first()
+
+            # Log database query performance
+            await span.add_info_events_async(
+                {
+                    "flow_node_get_appid_from_database": f"{time.time() * 1000 - start_time}"
+                }
+            )
+
+            # Validate app existence
+            if not app or app.id == 0:
+                raise CustomException(
+                    err_code=CodeEnum.APP_NOT_FOUND_ERROR,
+                    err_msg=f"App not found for nested workflow execution: {self.appId}",
+                )
+
+            return f"Bearer {app.api_key}:{app.api_secret}"
+
     async def _assemble_request(
         self,
         url: str,
@@ -315,7 +512,43 @@ class FlowNode(BaseNode):
         """
         # Initialize request headers
         headers = {"Content-Type": "application/json"}
+        req_body = self._assemble_request_body(inputs, variable_pool)
+
+        # Log request details for debugging
+        if event_log_node_trace:
+            event_log_node_trace.append_config_data(
+                {
+                    "url": url,
+                    "req_headers": headers,
+                    "req_body": json.dumps(req_body, ensure_ascii=False),
+                }
+            )
+
+        authorization = await self._get_app_authorization(span)
+
+        # Set authentication headers based on runtime environment
+        if not os.getenv("RUNTIME_ENV", RuntimeEnv.Local.value) in [
+            RuntimeEnv.Dev.value,
+            RuntimeEnv.Test.value,
+        ]:
+            # Use bearer token for production environments
+            headers["Authorization"] = authorization
+        else:
+            # Use consumer username for local environments
+            headers["X-Consumer-Username"] = self.appId
 
+        return headers, req_body
+
+    def _assemble_request_body(self, inputs: dict, variable_pool: VariablePool) -> dict:
+        """
+        Assemble the chat request body of the nested workflow.
+
+        Chat history, if enabled, is added to the request and to the inputs.
+
+        :param inputs: Input parameters for the workflow
+        :param variable_pool: Variable pool containing workflow context
+        :return: Request body dictionary
+        """
         chat_id: str = variable_pool.system_params.get(ParamKey.ChatId, default="")
         uid: str = variable_pool.system_params.get(ParamKey.Uid, default="")
 
@@ -352,51 +585,7 @@ class FlowNode(BaseNode):
         # Add version if specified
         if self.version:
             req_body.update({"version": self.version})
-
-        # Log request details for debugging
-        if event_log_node_trace:
-            event_log_node_trace.append_config_data(
-                {
-                    "url": url,
-                    "req_headers": headers,
-                    "req_body": json.dumps(req_body, ensure_ascii=False),
-                }
-            )
-
-        # Query application credentials from database
-        with session_getter() as session:
-            start_time = time.time() * 1000
-            app = session.query(App).filter_by(alias_id=self.appId).first()
-
-            # Log database query performance
-            await span.add_info_events_async(
-                {
-                    "flow_node_get_appid_from_database": f"{time.time() * 1000 - start_time}"
-                }
-            )
-
-            # Validate app existence
-            if not app or app.id == 0:
-                raise CustomException(
-                    err_code=CodeEnum.APP_NOT_FOUND_ERROR,
-                    err_msg=f"App not found for nested workflow execution: {self.appId}",
-                )
-
-            # Construct authorization header
-            authorization = f"Bearer {app.api_key}:{app.api_secret}"
-
-        # Set authentication headers based on runtime environment
-        if not os.getenv("RUNTIME_ENV", RuntimeEnv.Local.value) in [
-            RuntimeEnv.Dev.value,
-            RuntimeEnv.Test.value,
-        ]:
-            # Use bearer token for production environments
-            headers["Authorization"] = authorization
-        else:
-            # Use consumer username for local environments
-            headers["X-Consumer-Username"] = self.appId
-
-        return headers, req_body
+        return req_body
 
     def _handle_outputs(
         self, output_mode: int, result_content: str, result_reasoning_content: str
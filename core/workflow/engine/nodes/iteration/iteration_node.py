@@ -1,15 +1,18 @@
 import asyncio
 import copy
-from typing import Any, Dict
+import time
+from typing import Any, Coroutine, Dict, List, Set
 
-from pydantic import PrivateAttr
+from pydantic import Field, PrivateAttr
 
+from workflow.consts.engine.error_handler import IterationErrorStrategy
 from workflow.engine.callbacks.callback_handler import ChatCallBacks
 from workflow.engine.entities.chains import Chains
 from workflow.engine.entities.node_entities import NodeType
 from workflow.engine.entities.node_running_status import NodeRunningStatus
 from workflow.engine.entities.private_config import PrivateConfig
 from workflow.engine.entities.variable_pool import VariablePool
+from workflow.engine.node import SparkFlowEngineNode
 from workflow.engine.nodes.base_node import BaseNode
 from workflow.engine.nodes.entities.node_run_result import (
     NodeRunResult,
@@ -28,10 +31,20 @@ class IterationNode(BaseNode):
 
     This node processes batch data by running a complete workflow iteration
     for each item in the input batch, collecting and aggregating results.
+    Items run one after another unless parallel mode is enabled, in which case
+    up to parallelCount items run concurrently on isolated engine copies.
     """
 
     # Node ID of the first node in the workflow subgraph within this iteration
     IterationStartNodeId: str
+    # Whether batch items are executed concurrently
+    isParallel: bool = False
+    # Maximum number of batch items executed at the same time in parallel mode
+    parallelCount: int = Field(default=5, ge=1, le=50)
+    # Reaction to a failed batch item, see IterationErrorStrategy
+    itemErrorStrategy: int = Field(
+        default=IterationErrorStrategy.FailFast.value, ge=0, le=1
+    )
     _private_config: PrivateConfig = PrivateAttr(
         default_factory=lambda: PrivateConfig(timeout=None)
     )
@@ -47,7 +60,8 @@ class IterationNode(BaseNode):
         Asynchronously execute the iteration node by processing batch data.
 
         This method processes each item in the input batch by running a complete
-        workflow iteration, then aggregates the results from all iterations.
+        workflow iteration, then aggregates the results from all iterations in
+        input order.
 
         :param variable_pool: Pool of variables for the workflow execution
         :param span: Tracing span for monitoring and debugging
@@ -69,6 +83,7 @@ class IterationNode(BaseNode):
                 "node_run_status", {}
             )
             node_run_status[self.node_id].processing.set()
+            inputs: dict = {}
             try:
                 iteration_one_engine = kwargs.get("iteration_engine", {})[
                     self.IterationStartNodeId
@@ -78,7 +93,6 @@ class IterationNode(BaseNode):
                         self.node_id
                     ]
                 )
-                # built_nodes = copy.deepcopy(iteration_one_engine.engine_ctx.built_nodes)
 
                 batch_datas = variable_pool.get_variable(
                     node_id=self.node_id,
@@ -88,12 +102,10 @@ class IterationNode(BaseNode):
                 inputs = {self.input_identifier[0]: batch_datas}
                 await span_context.add_info_events_async({"inputs": f"{inputs}"})
 
-                batch_result_dict: dict[str, list] = {}
-                temp_variable_pool = copy.deepcopy(variable_pool)
-                for batch_data in batch_datas:
-                    # iteration_one_engine.engine_ctx.built_nodes = built_nodes
-                    res = await self._process_single_batch(
-                        batch_data,
+                temp_variable_pool = variable_pool.overlay()
+                if self.isParallel:
+                    batch_results = await self._process_parallel_batches(
+                        batch_datas,
                         temp_variable_pool,
                         source_iteration_chains,
                         span_context,
@@ -101,8 +113,36 @@ class IterationNode(BaseNode):
                         variable_pool,
                         callbacks,
                         event_log_trace,
+                        event_log_node_trace,
+                    )
+                else:
+                    batch_results = []
+                    for index, batch_data in enumerate(batch_datas):
+                        res = await self._run_batch_item(
+                            index,
+                            self._process_single_batch(
+                                batch_data,
+                                temp_variable_pool,
+                                source_iteration_chains,
+                                span_context,
+                                iteration_one_engine,
+                                variable_pool,
+                                callbacks,
+                                event_log_trace,
+                            ),
+                            span_context,
+                            event_log_node_trace,
+                        )
+                        batch_results.append(res)
+
+                batch_result_dict: dict[str, list] = {}
+                for res in batch_results:
+                    # Failed items keep their position with empty outputs
+                    cur_batch_res = (
+                        res.outputs
+                        if res is not None
+                        else {key: None for key in self.output_identifier}
                     )
-                    cur_batch_res = res.outputs
                     for res_k, res_v in cur_batch_res.items():
                         if res_k not in batch_result_dict:
                             batch_result_dict[res_k] = []
@@ -149,9 +189,47 @@ class IterationNode(BaseNode):
                 node_type=self.node_type,
             )
 
-    async def _process_single_batch(
+    async def _run_batch_item(
         self,
-        batch_data: Any,
+        index: int,
+        batch_coro: Coroutine[Any, Any, NodeRunResult],
+        span: Span,
+        event_log_node_trace: NodeLog | None,
+    ) -> NodeRunResult | None:
+        """
+        Run a single batch item, record its timing and apply the error strategy.
+
+        :param index: Position of the item in the batch
+        :param batch_coro: Coroutine executing the item
+        :param span: Tracing span for monitoring and debugging
+        :param event_log_node_trace: Optional node-level event logging
+        :return: Result of the item, None if it failed and failures are skipped
+        :raises Exception: If the item failed and the strategy is fail fast
+        """
+        start_time = time.time()
+        try:
+            res = await batch_coro
+        except Exception as err:
+            cost_time = int((time.time() - start_time) * 1000)
+            if event_log_node_trace:
+                event_log_node_trace.add_error_log(
+                    f"iteration item {index} failed in {cost_time} ms: {err}"
+                )
+            if self.itemErrorStrategy != IterationErrorStrategy.Continue.value:
+                raise
+            span.record_exception(err)
+            return None
+
+        cost_time = int((time.time() - start_time) * 1000)
+        if event_log_node_trace:
+            event_log_node_trace.add_info_log(
+                f"iteration item {index} succeeded in {cost_time} ms"
+            )
+        return res
+
+    async def _process_parallel_batches(
+        self,
+        batch_datas: list,
         temp_variable_pool: VariablePool,
         source_iteration_chains: Chains,
         span: Span,
@@ -159,31 +237,185 @@ class IterationNode(BaseNode):
         variable_pool: VariablePool,
         callbacks: ChatCallBacks,
         event_log_trace: WorkflowLog,
-    ) -> NodeRunResult:
+        event_log_node_trace: NodeLog | None,
+    ) -> List[NodeRunResult | None]:
         """
-        Process a single batch item through the iteration workflow.
+        Process all batch items concurrently with at most parallelCount in flight.
 
-        This method sets up a fresh execution environment for each batch item,
-        runs the complete iteration workflow, and returns the results.
+        Every item runs on its own engine copy with its own variable pool,
+        chains and node running status. With the fail fast strategy the first
+        failure cancels all remaining items.
 
-        :param batch_data: Single item from the batch to be processed
-        :param temp_variable_pool: Temporary variable pool for this iteration
+        :param batch_datas: Items of the batch to be processed
+        :param temp_variable_pool: Variable pool every item starts from
         :param source_iteration_chains: Source chains configuration for iteration
         :param span: Tracing span for monitoring and debugging
-        :param iteration_one_engine: Workflow engine instance for this iteration
+        :param iteration_one_engine: Workflow engine template for the iteration
         :param variable_pool: Original variable pool containing history and context
         :param callbacks: Callback handlers for the workflow execution
         :param event_log_trace: Event logging trace for the workflow
-        :return: NodeRunResult containing the execution results for this batch item
+        :param event_log_node_trace: Optional node-level event logging
+        :return: Results of all items in input order
         """
-        cur_batch_data_dict = {self.input_identifier[0]: batch_data}
+        nested_iterations = [
+            node_id
+            for node_id in source_iteration_chains.node_ids
+            if node_id.split(":")[0] == NodeType.ITERATION.value
+        ]
+        if nested_iterations:
+            # Nested iteration engines are shared and reset between their items
+            raise CustomException(
+                CodeEnum.ITERATION_EXECUTION_ERROR,
+                err_msg="Parallel iteration does not support nested iteration "
+                f"nodes: {', '.join(nested_iterations)}",
+            )
+        semaphore = asyncio.Semaphore(self.parallelCount)
+
+        async def run_item(index: int, batch_data: Any) -> NodeRunResult | None:
+            async with semaphore:
+                item_engine = self._clone_iteration_engine(
+                    iteration_one_engine,
+                    temp_variable_pool.overlay(),
+                    copy.deepcopy(source_iteration_chains),
+                )
+                return await self._run_batch_item(
+                    index,
+                    self._run_iteration_engine(
+                        batch_data,
+                        item_engine,
+                        span,
+                        variable_pool,
+                        callbacks,
+                        event_log_trace,
+                    ),
+                    span,
+                    event_log_node_trace,
+                )
 
-        # Prepare execution environment for this iteration
-        new_variable_pool = copy.deepcopy(temp_variable_pool)
-        iteration_chains = copy.deepcopy(source_iteration_chains)
+        tasks = [
+            asyncio.create_task(run_item(index, batch_data))
+            for index, batch_data in enumerate(batch_datas)
+        ]
+        if not tasks:
+            return []
+        pending: Set[asyncio.Task[NodeRunResult | None]] = set()
+        try:
+            _, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            # Re-raise the failure that stopped the batch
+            for task in tasks:
+                if task.done() and not task.cancelled() and task.exception():
+                    raise task.exception()  # type: ignore[misc]
+        return [task.result() for task in tasks]
+
+    def _clone_iteration_engine(
+        self,
+        iteration_one_engine: Any,
+        new_variable_pool: VariablePool,
+        iteration_chains: Chains,
+    ) -> Any:
+        """
+        Create an isolated engine copy for a single batch item.
 
-        iteration_one_engine.engine_ctx.variable_pool = new_variable_pool
-        iteration_one_engine.engine_ctx.chains = iteration_chains
+        Nodes of the iteration body are copied with their own node instance and
+        node log, and everything that changes during a run is private to the copy.
+
+        :param iteration_one_engine: Workflow engine template for the iteration
+        :param new_variable_pool: Variable pool of the batch item
+        :param iteration_chains: Chains of the batch item
+        :return: Workflow engine copy for the batch item
+        """
+        engine_ctx = iteration_one_engine.engine_ctx
+        node_run_status = dict(engine_ctx.node_run_status)
+        for node_id in iteration_chains.node_ids:
+            node_run_status[node_id] = NodeRunningStatus()
+        item_nodes = self._clone_iteration_nodes(
+            engine_ctx.built_nodes, iteration_chains.node_ids
+        )
+        item_engine_ctx = engine_ctx.model_copy(
+            update={
+                "variable_pool": new_variable_pool,
+                "chains": iteration_chains,
+                "node_run_status": node_run_status,
+                "built_nodes": {**engine_ctx.built_nodes, **item_nodes},
+                "end_complete": asyncio.Event(),
+                "responses": [],
+                "dfs_tasks": [],
+            }
+        )
+        start_node = iteration_one_engine.sparkflow_engine_node
+        return iteration_one_engine.model_copy(
+            update={
+                "engine_ctx": item_engine_ctx,
+                "sparkflow_engine_node": item_nodes.get(start_node.id, start_node),
+            }
+        )
+
+    @staticmethod
+    def _clone_iteration_nodes(
+        built_nodes: Dict[str, SparkFlowEngineNode], node_ids: List[str]
+    ) -> Dict[str, SparkFlowEngineNode]:
+        """
+        Copy the nodes of the iteration body for a single batch item.
+
+        The copies are linked to each other instead of the template nodes, so
+        that a run never reaches a node shared with another batch item.
+
+        :param built_nodes: Built nodes of the workflow
+        :param node_ids: IDs of the nodes in the iteration body
+        :return: Node copies keyed by node ID
+        """
+        item_nodes = {
+            node_id: built_nodes[node_id].model_copy(
+                update={
+                    "node_instance": built_nodes[node_id].node_instance.model_copy(),
+                    "node_log": NodeLog(
+                        node_id=node_id,
+                        node_name=built_nodes[node_id].node_alias_name,
+                        node_type=built_nodes[node_id].node_type,
+                        sid="",
+                    ),
+                }
+            )
+            for node_id in node_ids
+            if node_id in built_nodes
+        }
+
+        def relink(nodes: List[SparkFlowEngineNode]) -> List[SparkFlowEngineNode]:
+            return [item_nodes.get(node.id, node) for node in nodes]
+
+        for node in item_nodes.values():
+            node.next_nodes = relink(node.next_nodes)
+            node.fail_nodes = relink(node.fail_nodes)
+            node.pre_nodes = relink(node.pre_nodes)
+        return item_nodes
+
+    async def _run_iteration_engine(
+        self,
+        batch_data: Any,
+        iteration_engine: Any,
+        span: Span,
+        variable_pool: VariablePool,
+        callbacks: ChatCallBacks,
+        event_log_trace: WorkflowLog,
+    ) -> NodeRunResult:
+        """
+        Run the iteration workflow for a single batch item.
+
+        :param batch_data: Single item from the batch to be processed
+        :param iteration_engine: Workflow engine prepared for this item
+        :param span: Tracing span for monitoring and debugging
+        :param variable_pool: Original variable pool containing history and context
+        :param callbacks: Callback handlers for the workflow execution
+        :param event_log_trace: Event logging trace for the workflow
+        :return: NodeRunResult containing the execution results for this batch item
+        """
+        cur_batch_data_dict = {self.input_identifier[0]: batch_data}
 
         # Convert legacy history format for compatibility
         history = []
@@ -195,7 +427,7 @@ class IterationNode(BaseNode):
         history_v2 = []
         if variable_pool.history_v2:
             history_v2 = variable_pool.history_v2.origin_history
-        res = await iteration_one_engine.async_run(
+        return await iteration_engine.async_run(
             inputs=cur_batch_data_dict,
             span=span,
             callback=callbacks,
@@ -204,13 +436,57 @@ class IterationNode(BaseNode):
             event_log_trace=event_log_trace,
         )
 
-        # Reset node running status after each iteration execution
-        self._init_iteration_node(
-            iteration_one_engine.engine_ctx.node_run_status,
-            iteration_chains,
-            variable_pool,
-        )
-        iteration_one_engine.engine_ctx.end_complete = asyncio.Event()
+    async def _process_single_batch(
+        self,
+        batch_data: Any,
+        temp_variable_pool: VariablePool,
+        source_iteration_chains: Chains,
+        span: Span,
+        iteration_one_engine: Any,
+        variable_pool: VariablePool,
+        callbacks: ChatCallBacks,
+        event_log_trace: WorkflowLog,
+    ) -> NodeRunResult:
+        """
+        Process a single batch item through the iteration workflow.
+
+        This method sets up a fresh execution environment for each batch item,
+        runs the complete iteration workflow, and returns the results.
+
+        :param batch_data: Single item from the batch to be processed
+        :param temp_variable_pool: Temporary variable pool for this iteration
+        :param source_iteration_chains: Source chains configuration for iteration
+        :param span: Tracing span for monitoring and debugging
+        :param iteration_one_engine: Workflow engine instance for this iteration
+        :param variable_pool: Original variable pool containing history and context
+        :param callbacks: Callback handlers for the workflow execution
+        :param event_log_trace: Event logging trace for the workflow
+        :return: NodeRunResult containing the execution results for this batch item
+        """
+        # Prepare execution environment for this iteration
+        new_variable_pool = temp_variable_pool.overlay()
+        iteration_chains = copy.deepcopy(source_iteration_chains)
+
+        iteration_one_engine.engine_ctx.variable_pool = new_variable_pool
+        iteration_one_engine.engine_ctx.chains = iteration_chains
+
+        try:
+            res = await self._run_iteration_engine(
+                batch_data,
+                iteration_one_engine,
+                span,
+                variable_pool,
+                callbacks,
+                event_log_trace,
+            )
+        finally:
+            # Reset node running status after each iteration execution
+            self._init_iteration_node(
+                iteration_one_engine.engine_ctx.node_run_status,
+                iteration_chains,
+                variable_pool,
+            )
+            iteration_one_engine.engine_ctx.end_complete = asyncio.Event()
         return res
 
     def _init_iteration_node(
@@ -230,22 +506,21 @@ class IterationNode(BaseNode):
         :param variable_pool: Variable pool containing stream data to be reset
         """
         try:
-            for master_chain in chains.master_chains:
-                for node_id in master_chain.node_id_list:
-                    node_run_status[node_id].processing.clear()
-                    node_run_status[node_id].complete.clear()
-                    node_run_status[node_id].start_with_thread.clear()
-                    node_run_status[node_id].pre_processing.clear()
-                    node_run_status[node_id].not_run.clear()
-                    # Reset stream data for message and end nodes within iteration
-                    if node_id.split(":")[0] in [
-                        NodeType.MESSAGE.value,
-                        NodeType.ITERATION_END.value,
-                    ]:
-                        if node_id not in variable_pool.stream_data:
-                            continue
-                        for k, _ in variable_pool.stream_data[node_id].items():
-                            variable_pool.stream_data[node_id][k] = asyncio.Queue()
+            for node_id in chains.node_ids:
+                node_run_status[node_id].processing.clear()
+                node_run_status[node_id].complete.clear()
+                node_run_status[node_id].start_with_thread.clear()
+                node_run_status[node_id].pre_processing.clear()
+                node_run_status[node_id].not_run.clear()
+                # Reset stream data for message and end nodes within iteration
+                if node_id.split(":")[0] in [
+                    NodeType.MESSAGE.value,
+                    NodeType.ITERATION_END.value,
+                ]:
+                    if node_id not in variable_pool.stream_data:
+                        continue
+                    for k, _ in variable_pool.stream_data[node_id].items():
+                        variable_pool.stream_data[node_id][k] = asyncio.Queue()
         except Exception as e:
             raise e
 
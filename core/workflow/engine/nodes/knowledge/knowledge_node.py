@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 from enum import Enum
@@ -22,6 +23,10 @@ from workflow.engine.nodes.knowledge.knowledge_client import (
     KnowledgeClient,
     KnowledgeConfig,
 )
+from workflow.engine.nodes.knowledge.speculation_stats import (
+    SpeculationOutcome,
+    record_speculation,
+)
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.otlp.log_trace.node_log import NodeLog
@@ -87,6 +92,8 @@ class KnowledgeNode(BaseLLMNode):
     )
     repos: list[RepositoryInfo] = Field(default_factory=list)
     search_mode: Literal["direct", "adaptive"] = Field(default=SearchMode.DIRECT.value)
+    # Start retrieval together with the adaptive decision instead of after it
+    speculativeRetrieval: bool = Field(default=False)
     domain: str = Field(default="")
     appId: str = Field(default="")
     source: str = Field(default=ModelProviderEnum.OPENAI.value)
@@ -244,6 +251,130 @@ class KnowledgeNode(BaseLLMNode):
             return RepoAndDocIds(repo_ids=repo_ids, doc_ids=doc_ids)
         return RepoAndDocIds(repo_ids=self.repoId, doc_ids=self.docIds)
 
+    async def _retrieve(
+        self,
+        query: str,
+        history: list,
+        variable_pool: VariablePool,
+        span: Span,
+        event_log_node_trace: NodeLog | None,
+    ) -> str:
+        """
+        Perform the knowledge base search.
+
+        :param query: User query
+        :param history: Chat history sent along with the query
+        :param variable_pool: Variable pool for accessing system parameters
+        :param span: Span object for tracing and logging
+        :param event_log_node_trace: Optional node log trace object
+        :return: Raw search result
+        """
+        # Get repository and document IDs
+        repo_and_doc_ids = self._get_repo_and_doc_ids()
+
+        # Get knowledge base URL from environment variables
+        knowledge_base_url = os.getenv("KNOWLEDGE_BASE_URL")
+        if not knowledge_base_url:
+            raise CustomException(
+                err_code=CodeEnum.KNOWLEDGE_NODE_EXECUTION_ERROR,
+                err_msg="Knowledge base URL is not set",
+                cause_error="Knowledge base URL is not set",
+            )
+        knowledge_recall_url = f"{knowledge_base_url}/knowledge/v1/chunk/query"
+        flow_id: str = variable_pool.system_params.get(ParamKey.FlowId)
+        knowledge_config = KnowledgeConfig(
+            top_n=self.topN,
+            rag_type=self.ragType,
+            repo_id=repo_and_doc_ids.repo_ids,
+            url=knowledge_recall_url,
+            query=str(query),
+            flow_id=flow_id,
+            doc_ids=repo_and_doc_ids.doc_ids,
+            threshold=self.score,
+            history=history,
+        )
+        # Perform knowledge base search
+        return await KnowledgeClient(config=knowledge_config).top_k(
+            request_span=span, event_log_node_trace=event_log_node_trace
+        )
+
+    async def _decide_adaptive(
+        self,
+        query: str,
+        history: list,
+        variable_pool: VariablePool,
+        span: Span,
+        event_log_node_trace: NodeLog | None = None,
+    ) -> tuple[bool, dict[str, int], str | None]:
+        """
+        Decide whether to use the knowledge base in adaptive mode.
+
+        With speculativeRetrieval enabled, the search runs while the LLM decides.
+
+        :param query: Search query
+        :param history: Chat history for context
+        :param variable_pool: Variable pool for accessing system parameters
+        :param span: Span object for tracing and logging
+        :param event_log_node_trace: Optional node log trace object
+        :return: Decision, token usage of the decision and the speculative
+                 search result, None when no usable search was made
+        """
+        retrieval = None
+        if self.speculativeRetrieval:
+            retrieval = asyncio.create_task(
+                self._retrieve(
+                    query, history, variable_pool, span, event_log_node_trace
+                )
+            )
+        try:
+            should_use, token_usage = await self._should_use_knowledge(
+                query, span, variable_pool
+            )
+        except BaseException:
+            if retrieval is not None:
+                retrieval.cancel()
+            raise
+        search_result = None
+        if retrieval is not None:
+            search_result = await self._settle_speculation(
+                retrieval, should_use, variable_pool, span
+            )
+        return should_use, token_usage, search_result
+
+    async def _settle_speculation(
+        self,
+        retrieval: "asyncio.Task[str]",
+        should_use: bool,
+        variable_pool: VariablePool,
+        span: Span,
+    ) -> str | None:
+        """
+        Use or drop a retrieval started before the adaptive decision.
+
+        :param retrieval: Speculative retrieval task
+        :param should_use: Adaptive decision
+        :param variable_pool: Variable pool for accessing system parameters
+        :param span: Span object for tracing and logging
+        :return: Raw search result if the decision is to use the knowledge base
+        """
+        flow_id = variable_pool.system_params.get(ParamKey.FlowId, default="")
+        if should_use:
+            outcome = SpeculationOutcome.USED
+        elif retrieval.done():
+            outcome = SpeculationOutcome.DISCARDED
+        else:
+            outcome = SpeculationOutcome.CANCELLED
+            retrieval.cancel()
+        record_speculation(flow_id, outcome)
+        span.add_info_events({"speculative_retrieval": outcome.value})
+
+        if should_use:
+            return await retrieval
+        if not retrieval.cancelled() and retrieval.done():
+            # The result is dropped, but do not leave its error unretrieved
+            retrieval.exception()
+        return None
+
     async def execute(
         self, variable_pool: VariablePool, span: Span, **kwargs: Any
     ) -> NodeRunResult:
@@ -251,7 +382,9 @@ class KnowledgeNode(BaseLLMNode):
         Execute the knowledge base search operation.
 
         Retrieves the query from the variable pool, performs a knowledge base search,
-        and returns the results in a NodeRunResult object.
+        and returns the results in a NodeRunResult object. In adaptive mode with
+        speculativeRetrieval enabled, the search runs concurrently with the LLM
+        decision and is dropped when the decision is not to use the knowledge base.
 
         :param variable_pool: Pool containing workflow variables
         :param span: Span object for tracing and logging
@@ -280,9 +413,10 @@ class KnowledgeNode(BaseLLMNode):
             # Process chat history if enabled
             history = self._get_chat_history(variable_pool)
 
+            search_result: str | None = None
             if self.search_mode == SearchMode.ADAPTIVE.value:
-                should_use, token_usage = await self._should_use_knowledge(
-                    query, span, variable_pool
+                should_use, token_usage, search_result = await self._decide_adaptive(
+                    query, history, variable_pool, span, event_log_node_trace
                 )
                 if not should_use:
                     outputs = {self.output_identifier[0]: []}
@@ -293,34 +427,10 @@ class KnowledgeNode(BaseLLMNode):
                         token_usage=token_usage,
                     )
 
-            # Get repository and document IDs
-            repo_and_doc_ids = self._get_repo_and_doc_ids()
-
-            # Get knowledge base URL from environment variables
-            knowledge_base_url = os.getenv("KNOWLEDGE_BASE_URL")
-            if not knowledge_base_url:
-                raise CustomException(
-                    err_code=CodeEnum.KNOWLEDGE_NODE_EXECUTION_ERROR,
-                    err_msg="Knowledge base URL is not set",
-                    cause_error="Knowledge base URL is not set",
+            if search_result is None:
+                search_result = await self._retrieve(
+                    query, history, variable_pool, span, event_log_node_trace
                 )
-            knowledge_recall_url = f"{knowledge_base_url}/knowledge/v1/chunk/query"
-            flow_id: str = variable_pool.system_params.get(ParamKey.FlowId)
-            knowledge_config = KnowledgeConfig(
-                top_n=self.topN,
-                rag_type=self.ragType,
-                repo_id=repo_and_doc_ids.repo_ids,
-                url=knowledge_recall_url,
-                query=str(query),
-                flow_id=flow_id,
-                doc_ids=repo_and_doc_ids.doc_ids,
-                threshold=self.score,
-                history=history,
-            )
-            # Perform knowledge base search
-            search_result = await KnowledgeClient(config=knowledge_config).top_k(
-                request_span=span, event_log_node_trace=event_log_node_trace
-            )
             result_dict = json.loads(search_result)["results"]
             outputs = {self.output_identifier[0]: result_dict}
 
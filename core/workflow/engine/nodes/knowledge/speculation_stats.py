@@ -0,0 +1,43 @@
+from enum import Enum
+
+from loguru import logger
+
+from workflow.extensions.otlp.metric import metric
+
+SPECULATION_COUNTER = "knowledge_speculative_retrieval_total"
+
+
+class SpeculationOutcome(str, Enum):
+    """
+    Fate of a retrieval started before the adaptive search decision
+    """
+
+    USED = "used"
+    # Retrieval finished but the decision was to skip the knowledge base
+    DISCARDED = "discarded"
+    # Retrieval still running when the decision was to skip, it was cancelled
+    CANCELLED = "cancelled"
+
+
+def record_speculation(flow_id: str, outcome: SpeculationOutcome) -> None:
+    """
+    Count the outcome of a speculative retrieval on the OTLP meter.
+
+    The waste rate of a flow is its discarded plus cancelled count over the
+    count of all outcomes.
+
+    :param flow_id: Flow ID of the knowledge node
+    :param outcome: Outcome of the retrieval
+    :return: None
+    """
+    try:
+        speculation_counter = metric.get_counter(
+            SPECULATION_COUNTER, "Speculative knowledge retrievals by outcome"
+        )
+        if speculation_counter is None:
+            return
+        speculation_counter.add(
+            1, {"flow_id": str(flow_id or ""), "outcome": outcome.value}
+        )
+    except Exception as e:
+        logger.warning(f"Failed to report speculative retrieval metric: {e}")
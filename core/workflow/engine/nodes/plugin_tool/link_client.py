@@ -1,7 +1,9 @@
+import asyncio
 import json
+import os
 import time
 from base64 import b64encode
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from workflow.exception.e import CustomException
 from workflow.exception.errors.code_convert import CodeConvert
@@ -319,6 +321,173 @@ class Tool:
                 return json.loads(tool_response_text)
 
 
+class ToolSchemaResolver:
+    """
+    Asynchronous resolver of tool schemas from the Link system.
+
+    Resolved schemas are cached in process memory for a TTL, keyed by
+    (tool_id, version, app_id). Concurrent lookups of the same key share a
+    single in-flight request to the Link system.
+    """
+
+    const_headers = {"Content-Type": "application/json"}
+
+    def __init__(self, ttl: Optional[float] = None) -> None:
+        """
+        Initialize the schema resolver.
+
+        :param ttl: Schema lifetime in seconds, 0 disables caching,
+                    None reads PLUGIN_SCHEMA_CACHE_TTL
+        """
+        self._ttl = ttl
+        self._schemas: Dict[Tuple[str, str, str], Tuple[float, Dict[str, Any]]] = {}
+        self._pending: Dict[Tuple[str, str, str], asyncio.Task] = {}
+
+    @property
+    def ttl(self) -> float:
+        """
+        Lifetime of a cached tool schema in seconds.
+
+        Resolved lazily because the configuration is loaded after import.
+
+        :return: Schema lifetime
+        """
+        if self._ttl is None:
+            self._ttl = float(os.getenv("PLUGIN_SCHEMA_CACHE_TTL", "300"))
+        return self._ttl
+
+    async def resolve(
+        self, get_url: str, app_id: str, tool_ids: List[str], version: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Resolve the schemas of several tools of the same version.
+
+        Cached schemas are returned directly, tools already being fetched are
+        awaited, and the remaining tools are fetched with a single request.
+
+        :param get_url: URL for retrieving tool schema information
+        :param app_id: Application identifier
+        :param tool_ids: Tool identifiers to resolve
+        :param version: Tool version
+        :return: Tool schema dictionaries in the order of tool_ids, tools
+                 unknown to the Link system are omitted
+        :raises CustomException: When the Link system request fails
+        """
+        schemas: Dict[str, Dict[str, Any]] = {}
+        waits: Set[asyncio.Task] = set()
+        missing: List[str] = []
+        now = time.monotonic()
+        for tool_id in dict.fromkeys(tool_ids):
+            key = (tool_id, version, app_id)
+            cached = self._schemas.get(key)
+            if cached and cached[0] > now:
+                schemas[tool_id] = cached[1]
+            elif key in self._pending:
+                waits.add(self._pending[key])
+            else:
+                missing.append(tool_id)
+
+        if missing:
+            task = asyncio.create_task(self._fetch(get_url, app_id, missing, version))
+            keys = [(tool_id, version, app_id) for tool_id in missing]
+            for key in keys:
+                self._pending[key] = task
+            task.add_done_callback(lambda t: self._drop_pending(keys, t))
+            waits.add(task)
+
+        # Shield the shared requests so a cancelled caller does not cancel
+        # the lookups of the other callers
+        for fetched in await asyncio.gather(*(asyncio.shield(t) for t in waits)):
+            schemas.update(fetched)
+        return [schemas[tool_id] for tool_id in tool_ids if tool_id in schemas]
+
+    def _drop_pending(
+        self, keys: List[Tuple[str, str, str]], task: asyncio.Task
+    ) -> None:
+        """
+        Forget a finished request.
+
+        :param keys: Keys the request was fetching
+        :param task: Finished request task
+        """
+        for key in keys:
+            if self._pending.get(key) is task:
+                del self._pending[key]
+
+    async def _fetch(
+        self, get_url: str, app_id: str, tool_ids: List[str], version: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Query tool schemas from the Link system and cache them.
+
+        :param get_url: URL for retrieving tool schema information
+        :param app_id: Application identifier
+        :param tool_ids: Tool identifiers to fetch
+        :param version: Tool version
+        :return: Tool schema dictionaries by tool identifier
+        :raises CustomException: When the Link system request fails
+        """
+        # The Link system expects one version per requested tool
+        params = [("tool_ids", tool_id) for tool_id in tool_ids]
+        params += [("versions", version) for _ in tool_ids]
+        params.append(("app_id", app_id))
+        response_json = await self._request(get_url, params)
+
+        code = response_json.get("code", 0)
+        if code != 0:
+            raise CustomException(
+                err_code=CodeConvert.sparkLinkCode(code),
+                err_msg=response_json.get("message", ""),
+                cause_error=json.dumps(response_json, ensure_ascii=False),
+            )
+
+        schemas = {
+            str(tool_schema.get("id")): tool_schema
+            for tool_schema in response_json.get("data", {}).get("tools", [])
+        }
+        if self.ttl > 0:
+            expire_at = time.monotonic() + self.ttl
+            for tool_id, tool_schema in schemas.items():
+                self._schemas[(tool_id, version, app_id)] = (expire_at, tool_schema)
+        return schemas
+
+    async def _request(
+        self, get_url: str, params: List[Tuple[str, str]]
+    ) -> Dict[str, Any]:
+        """
+        Send a tool schema query to the Link system.
+
+        :param get_url: URL for retrieving tool schema information
+        :param params: Query parameters
+        :return: Response JSON of the Link system
+        :raises CustomException: When the Link system cannot be reached
+        """
+        from aiohttp import ClientConnectionError, ClientSession
+
+        try:
+            async with ClientSession() as session:
+                async with session.get(
+                    get_url, headers=self.const_headers, params=params
+                ) as response:
+                    return await response.json(content_type=None)
+        except ClientConnectionError as e:
+            raise CustomException(
+                CodeEnum.SPARK_LINK_CONNECTION_ERROR,
+                err_msg="Tool schema request failed, connection error",
+                cause_error="Tool schema request failed, connection error",
+            ) from e
+
+    def clear(self) -> None:
+        """
+        Drop all cached tool schemas.
+        """
+        self._schemas.clear()
+
+
+# Process-wide tool schema resolver
+tool_schema_resolver = ToolSchemaResolver()
+
+
 class Link:
     """
     Link system client for managing and executing plugin tools.
@@ -337,6 +506,7 @@ class Link:
         get_url: str,
         run_url: str,
         version: str = "V1.0",
+        open_api_schema_list: Optional[List[Dict[str, Any]]] = None,
     ):
         """
         Initialize Link client instance.
@@ -346,6 +516,8 @@ class Link:
         :param get_url: URL for retrieving tool schema information
         :param run_url: URL for executing tool operations
         :param version: Tool version (default: "V1.0")
+        :param open_api_schema_list: Already resolved tool schemas, queried
+                                     synchronously from the Link system if None
         """
         self.app_id = app_id
         self.tool_ids = tool_ids
@@ -353,11 +525,48 @@ class Link:
         self.run_url = run_url
         self.version = version
         # Retrieve OpenAPI schema list from Spark Link system
-        self.open_api_schema_list = self.tool_schema_list()
+        self.open_api_schema_list = (
+            open_api_schema_list
+            if open_api_schema_list is not None
+            else self.tool_schema_list()
+        )
         self.tools: List[Tool] = []  # List of Tool instances
         # Parse schemas and create Tool instances
         self.parse_react_schema_list()
 
+    @classmethod
+    async def create(
+        cls,
+        app_id: str,
+        tool_ids: list[str],
+        get_url: str,
+        run_url: str,
+        version: str = "V1.0",
+    ) -> "Link":
+        """
+        Create a Link client without blocking the event loop.
+
+        Tool schemas are resolved through the shared schema resolver.
+
+        :param app_id: Application identifier
+        :param tool_ids: List of tool identifiers to manage
+        :param get_url: URL for retrieving tool schema information
+        :param run_url: URL for executing tool operations
+        :param version: Tool version (default: "V1.0")
+        :return: Link client with parsed tools
+        """
+        open_api_schema_list = await tool_schema_resolver.resolve(
+            get_url, app_id, tool_ids, version
+        )
+        return cls(
+            app_id=app_id,
+            tool_ids=tool_ids,
+            get_url=get_url,
+            run_url=run_url,
+            version=version,
+            open_api_schema_list=open_api_schema_list,
+        )
+
     def tool_schema_list(self) -> List[Dict[str, Any]]:
         """
         Query tool schema list from Spark Link subsystem.
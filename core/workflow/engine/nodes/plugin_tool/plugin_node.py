@@ -1,5 +1,6 @@
+import asyncio
 import os
-from typing import Any
+from typing import Any, Dict, Iterable, List, Tuple
 
 from pydantic import Field
 
@@ -13,13 +14,23 @@ from workflow.engine.nodes.entities.node_run_result import (
     NodeRunResult,
     WorkflowNodeExecutionStatus,
 )
-from workflow.engine.nodes.plugin_tool.link_client import Link
+from workflow.engine.nodes.plugin_tool.link_client import Link, tool_schema_resolver
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.otlp.log_trace.node_log import NodeLog
 from workflow.extensions.otlp.trace.span import Span
 
 
+def _link_urls() -> Tuple[str, str]:
+    """
+    Get the Link system endpoints for tool schemas and tool execution.
+
+    :return: Tuple containing (get_url, run_url)
+    """
+    base_url = os.getenv("PLUGIN_BASE_URL")
+    return f"{base_url}/api/v1/tools/versions", f"{base_url}/api/v1/tools/http_run"
+
+
 class PluginNode(BaseNode):
     """
     Plugin node for executing external tools through the Link system.
@@ -121,11 +132,12 @@ class PluginNode(BaseNode):
         try:
             event_log_node_trace = kwargs.get("event_log_node_trace")
             # Initialize Link client for tool communication
-            link = Link(
+            get_url, run_url = _link_urls()
+            link = await Link.create(
                 app_id=self.appId,
                 tool_ids=[self.pluginId],
-                get_url=f"{os.getenv('PLUGIN_BASE_URL')}/api/v1/tools/versions",
-                run_url=f"{os.getenv('PLUGIN_BASE_URL')}/api/v1/tools/http_run",
+                get_url=get_url,
+                run_url=run_url,
                 version=self.version,
             )
             action_inputs = {}
@@ -247,3 +259,36 @@ class PluginNode(BaseNode):
                 event_log_node_trace=event_log_node_trace,
                 **kwargs,
             )
+
+
+async def prefetch_tool_schemas(nodes: Iterable[Any], span: Span) -> None:
+    """
+    Resolve the tool schemas of all plugin nodes of an engine in parallel.
+
+    Tools sharing an application and version are fetched with one request.
+    Failures are only recorded, the affected nodes resolve their schema again
+    when they run and report the error there.
+
+    :param nodes: Node instances of a built workflow engine
+    :param span: Tracing span for monitoring execution
+    """
+    groups: Dict[Tuple[str, str], List[str]] = {}
+    for node in nodes:
+        if isinstance(node, PluginNode):
+            groups.setdefault((node.appId, node.version), []).append(node.pluginId)
+    if not groups:
+        return
+
+    get_url, _ = _link_urls()
+    results = await asyncio.gather(
+        *(
+            tool_schema_resolver.resolve(get_url, app_id, tool_ids, version)
+            for (app_id, version), tool_ids in groups.items()
+        ),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            await span.add_info_events_async(
+                {"plugin_schema_prefetch_error": str(result)}
+            )
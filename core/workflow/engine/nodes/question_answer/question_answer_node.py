@@ -318,7 +318,7 @@ class QuestionAnswerNode(BaseLLMNode):
         :raises CustomException: When specific errors occur
         """
         try:
-            event = EventRegistry().get_event(event_id=self.event_id)
+            event = await EventRegistry().get_event_async(event_id=self.event_id)
             if event is None:
                 raise CustomException(
                     err_code=CodeEnum.EVENT_REGISTRY_NOT_FOUND_ERROR,
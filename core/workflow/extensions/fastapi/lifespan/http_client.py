@@ -1,7 +1,12 @@
+import importlib.util
 import os
-from typing import Optional
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+from urllib.parse import urlsplit
 
 import aiohttp
+import httpx
 from loguru import logger
 
 
@@ -53,3 +58,189 @@ class HttpClient:
         if cls._session is None or cls._session.closed:
             return aiohttp.ClientSession()
         return cls._session
+
+
+class LLMHttpClient:
+    """
+    Process-wide registry of pooled LLM provider clients.
+
+    Clients are keyed by (provider, base_url, api_key) and keep their
+    connections alive across requests, so LLM nodes do not pay a TCP and TLS
+    handshake per execution. Clients idle for longer than
+    LLM_CLIENT_IDLE_TIMEOUT seconds are closed, all clients are closed when
+    the application stops.
+    """
+
+    _clients: Dict[Tuple[str, str, str], Any] = {}
+    _active: Dict[Tuple[str, str, str], int] = {}
+    _last_used: Dict[Tuple[str, str, str], float] = {}
+
+    @staticmethod
+    def _limits() -> httpx.Limits:
+        """
+        Build the connection pool limits from the environment.
+
+        :return: Connection pool limits for a single client
+        """
+        return httpx.Limits(
+            max_connections=int(os.getenv("LLM_CLIENT_MAX_CONNECTIONS", "200")),
+            max_keepalive_connections=int(
+                os.getenv("LLM_CLIENT_MAX_KEEPALIVE_CONNECTIONS", "50")
+            ),
+            keepalive_expiry=float(os.getenv("LLM_CLIENT_KEEPALIVE_EXPIRY", "30")),
+        )
+
+    @staticmethod
+    def _http2_enabled() -> bool:
+        """
+        Check whether HTTP/2 should be negotiated.
+
+        HTTP/2 needs the optional h2 package, without it HTTP/1.1 is used.
+
+        :return: True if HTTP/2 is enabled and available, False otherwise
+        """
+        if not bool(int(os.getenv("LLM_CLIENT_HTTP2_ENABLE", "1"))):
+            return False
+        return importlib.util.find_spec("h2") is not None
+
+    @classmethod
+    def _new_httpx_client(cls) -> httpx.AsyncClient:
+        """
+        Create a pooled httpx client, timeouts are set per request.
+
+        :return: New httpx async client
+        """
+        return httpx.AsyncClient(
+            limits=cls._limits(), http2=cls._http2_enabled(), timeout=None
+        )
+
+    @classmethod
+    def _new_client(cls, provider: str, base_url: str, api_key: str) -> Any:
+        """
+        Create a client for a provider.
+
+        :param provider: Provider name, "openai" creates an AsyncOpenAI client
+        :param base_url: Base URL of the provider
+        :param api_key: API key of the provider
+        :return: New client instance
+        """
+        if provider == "openai":
+            from openai import AsyncOpenAI  # type: ignore
+
+            return AsyncOpenAI(
+                api_key=api_key, base_url=base_url, http_client=cls._new_httpx_client()
+            )
+        return cls._new_httpx_client()
+
+    @staticmethod
+    def _is_closed(client: Any) -> bool:
+        """
+        Check whether a pooled client has been closed.
+
+        :param client: AsyncOpenAI or httpx client
+        :return: True if the client is closed, False otherwise
+        """
+        if isinstance(client, httpx.AsyncClient):
+            return client.is_closed
+        return client.is_closed()
+
+    @classmethod
+    @asynccontextmanager
+    async def acquire(
+        cls, provider: str, base_url: str, api_key: str = ""
+    ) -> AsyncIterator[Any]:
+        """
+        Borrow the pooled client of a provider endpoint.
+
+        The client must not be closed by the caller and is never evicted
+        while borrowed.
+
+        :param provider: Provider name, e.g. openai, anthropic or google
+        :param base_url: Base URL of the provider, for httpx clients any URL of
+                         the provider origin
+        :param api_key: API key of the provider
+        :return: AsyncOpenAI client for openai, httpx.AsyncClient otherwise
+        """
+        await cls.evict_idle()
+        if provider != "openai":
+            # Plain HTTP clients are shared by every path of an origin
+            parsed = urlsplit(base_url)
+            base_url = f"{parsed.scheme}://{parsed.netloc}"
+        key = (provider, base_url, api_key)
+        client = cls._clients.get(key)
+        if client is None or cls._is_closed(client):
+            client = cls._new_client(provider, base_url, api_key)
+            cls._clients[key] = client
+        cls._active[key] = cls._active.get(key, 0) + 1
+        try:
+            yield client
+        finally:
+            # The registry may have been closed while the client was borrowed
+            remaining = cls._active.get(key, 0) - 1
+            if remaining > 0:
+                cls._active[key] = remaining
+            else:
+                cls._active.pop(key, None)
+            if cls._clients.get(key) is client:
+                cls._last_used[key] = time.monotonic()
+
+    @classmethod
+    async def evict_idle(cls) -> None:
+        """
+        Close clients that have not been used for the idle timeout.
+
+        Idle clients are removed from the registry before the first await, so
+        a concurrent acquire creates a new client instead of borrowing one
+        that is being closed.
+        """
+        idle_timeout = float(os.getenv("LLM_CLIENT_IDLE_TIMEOUT", "600"))
+        now = time.monotonic()
+        idle_keys = [
+            key
+            for key in cls._clients
+            if not cls._active.get(key)
+            and now - cls._last_used.get(key, now) > idle_timeout
+        ]
+        detached = [(key, cls._detach(key)) for key in idle_keys]
+        for key, client in detached:
+            await cls._close_client(key, client)
+
+    @classmethod
+    def _detach(cls, key: Tuple[str, str, str]) -> Any:
+        """
+        Remove a client from the registry without closing it.
+
+        :param key: Registry key of the client
+        :return: Removed client, None if there was none
+        """
+        cls._last_used.pop(key, None)
+        return cls._clients.pop(key, None)
+
+    @staticmethod
+    async def _close_client(key: Tuple[str, str, str], client: Any) -> None:
+        """
+        Close a client removed from the registry.
+
+        :param key: Registry key of the client
+        :param client: Client to close
+        """
+        if client is None:
+            return
+        try:
+            if isinstance(client, httpx.AsyncClient):
+                await client.aclose()
+            else:
+                await client.close()
+        except Exception as e:
+            logger.warning(f"Failed to close LLM client {key[:2]}: {e}")
+
+    @classmethod
+    async def close(cls) -> None:
+        """
+        Close all pooled LLM clients.
+        This method is called when the application closes.
+        """
+        detached = [(key, cls._detach(key)) for key in list(cls._clients)]
+        for key, client in detached:
+            await cls._close_client(key, client)
+        logger.info("✅ LLM HTTP clients closed successfully")
@@ -1,4 +1,3 @@
-import asyncio
 import json
 import os
 from typing import Any
@@ -9,6 +8,7 @@ from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
+from workflow.cache.local import local_cache
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.fastapi.base import (
@@ -16,9 +16,15 @@ from workflow.extensions.fastapi.base import (
     CHAT_OPEN_API_PATHS,
     JSONResponseBase,
 )
-from workflow.extensions.middleware.getters import get_cache_service
+from workflow.extensions.middleware.getters import (
+    get_async_cache_service,
+    get_cache_service,
+)
 from workflow.extensions.otlp.trace.span import Span
 
+# Redis key prefix for the app ID of an API key
+API_KEY_CACHE_HEAD = "workflow:app:api_key"
+
 
 class AuthMiddleware(BaseHTTPMiddleware):
     """
@@ -131,7 +137,10 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 err_msg="authorization header is invalid",
             )
 
-        app_id = await asyncio.to_thread(self._get_app_id_with_cache, api_key)
+        app_id = await local_cache.get_async(
+            f"{API_KEY_CACHE_HEAD}:{api_key}",
+            lambda: self._get_app_id_with_cache(api_key),
+        )
         if app_id:
             return app_id
 
@@ -173,7 +182,10 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 err_msg="appid is null",
                 cause_error=json.dumps(resp.json(), ensure_ascii=False),
             )
-        await asyncio.to_thread(self._set_app_id_with_cache, api_key, app_id)
+        await get_async_cache_service().run(
+            self._set_app_id_with_cache, api_key, app_id
+        )
+        local_cache.set(f"{API_KEY_CACHE_HEAD}:{api_key}", app_id)
         return app_id
 
     def _get_app_id_with_cache(self, api_key: str) -> str:
@@ -184,7 +196,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
         :return: The app id
         """
         cache_service = get_cache_service()
-        app_id: str = cache_service[f"workflow:app:api_key:{api_key}"]
+        app_id: str = cache_service[f"{API_KEY_CACHE_HEAD}:{api_key}"]
         return app_id
 
     def _set_app_id_with_cache(self, api_key: str, app_id: str) -> None:
@@ -195,4 +207,4 @@ class AuthMiddleware(BaseHTTPMiddleware):
         :param app_id: The app id
         """
         cache_service = get_cache_service()
-        cache_service[f"workflow:app:api_key:{api_key}"] = app_id
+        cache_service[f"{API_KEY_CACHE_HEAD}:{api_key}"] = app_id
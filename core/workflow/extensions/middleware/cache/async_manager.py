@@ -0,0 +1,337 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar
+
+from loguru import logger
+
+from workflow.extensions.middleware.cache.base import BaseCacheService
+
+T = TypeVar("T")
+
+
+class AsyncCacheService:
+    """
+    Asyncio facade of the cache service.
+
+    Short commands run on a small executor dedicated to Redis, so they neither
+    occupy nor wait for the default executor threads. Blocking list pops do
+    not hold any thread while waiting: writers publish the list key on a
+    notification channel, a single listener thread wakes the waiting
+    coroutines, which then pop without blocking. A periodic re-check covers
+    notifications published while the listener was reconnecting.
+    """
+
+    def __init__(
+        self,
+        cache_getter: Callable[[], BaseCacheService],
+        pool_size: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        channel: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the asyncio cache service.
+
+        :param cache_getter: Function returning the synchronous cache service
+        :param pool_size: Number of threads executing cache commands,
+                          None reads REDIS_ASYNC_POOL_SIZE
+        :param poll_interval: Seconds between re-checks of a waited list,
+                              None reads REDIS_LIST_POLL_INTERVAL
+        :param channel: Channel carrying the keys of lists pushed to,
+                        None reads REDIS_LIST_PUSH_CHANNEL
+        """
+        self._cache_getter = cache_getter
+        self._pool_size = pool_size
+        self._poll_interval = poll_interval
+        self._channel = channel
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._waiters: Dict[str, Set[Tuple[asyncio.AbstractEventLoop, Any]]] = {}
+        self._lock = threading.Lock()
+        self._listener: Optional[threading.Thread] = None
+        self._pubsub: Any = None
+        self._stopped = threading.Event()
+
+    @property
+    def _cache(self) -> BaseCacheService:
+        """
+        Synchronous cache service executing the commands.
+
+        Resolved on use because the services are initialized after import.
+
+        :return: Cache service
+        """
+        return self._cache_getter()
+
+    @property
+    def poll_interval(self) -> float:
+        """
+        Seconds between re-checks of a waited list.
+
+        :return: Re-check interval
+        """
+        if self._poll_interval is None:
+            self._poll_interval = float(os.getenv("REDIS_LIST_POLL_INTERVAL", "5"))
+        return self._poll_interval
+
+    @property
+    def channel(self) -> str:
+        """
+        Channel carrying the keys of lists pushed to.
+
+        :return: Channel name
+        """
+        if self._channel is None:
+            self._channel = os.getenv(
+                "REDIS_LIST_PUSH_CHANNEL", "workflow:cache:list_push"
+            )
+        return self._channel
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Executor dedicated to cache commands.
+
+        :return: Thread pool executor
+        """
+        with self._lock:
+            if self._executor is None:
+                if self._pool_size is None:
+                    self._pool_size = int(os.getenv("REDIS_ASYNC_POOL_SIZE", "16"))
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._pool_size, thread_name_prefix="workflow-cache"
+                )
+            return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a synchronous cache call on the cache executor.
+
+        :param func: Callable issuing cache commands
+        :param args: Positional arguments of the callable
+        :param kwargs: Keyword arguments of the callable
+        :return: Result of the callable
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, lambda: func(*args, **kwargs))
+
+    async def get(self, key: str) -> Any:
+        """
+        Retrieve an item from the cache.
+
+        :param key: The key of the item to retrieve
+        :return: The value associated with the key, or None if not found
+        """
+        return await self.run(self._cache.get, key)
+
+    async def set(self, key: str, value: Any) -> None:
+        """
+        Add an item to the cache.
+
+        :param key: The key of the item
+        :param value: The value to cache
+        """
+        await self.run(self._cache.set, key, value)
+
+    async def set_ex(self, key: str, value: Any, expire_time: int) -> None:
+        """
+        Set a key with a specific expiration time.
+
+        :param key: The key of the item
+        :param value: The value to cache
+        :param expire_time: Expiration time in seconds
+        """
+        await self.run(self._cache.set_ex, key, value, expire_time)
+
+    async def delete(self, key: str) -> None:
+        """
+        Remove an item from the cache.
+
+        :param key: The key of the item to remove
+        """
+        await self.run(self._cache.delete, key)
+
+    async def hgetall_str(self, name: str) -> Dict[str, str]:
+        """
+        Get all hash fields and values as strings.
+
+        :param name: The hash key name
+        :return: Dictionary with string keys and values
+        """
+        return await self.run(self._cache.hgetall_str, name)
+
+    async def pipeline(self, build: Callable[[Any], None]) -> List[Any]:
+        """
+        Queue commands on a pipeline and execute them in one round trip.
+
+        :param build: Callable queuing the commands on the given pipeline
+        :return: Results of the queued commands
+        """
+
+        def execute() -> List[Any]:
+            with self._cache.pipeline() as pipe:
+                build(pipe)
+                return pipe.execute()
+
+        return await self.run(execute)
+
+    async def notify(self, key: str) -> None:
+        """
+        Wake up the coroutines of every worker waiting on a list.
+
+        :param key: Key of the list that has been pushed to
+        """
+        try:
+            await self.run(self._cache.publish, self.channel, key)
+        except Exception as e:
+            # Waiters still find the item on their next re-check
+            logger.warning(f"Failed to publish list push of {key}: {e}")
+
+    async def blpop(self, key: str, timeout: int) -> Optional[Tuple[bytes, bytes]]:
+        """
+        Pop the first element of a list, waiting until one is pushed.
+
+        :param key: The list key to pop from
+        :param timeout: Maximum time to wait in seconds, 0 waits forever
+        :return: Tuple of list key and popped element, None on timeout
+        """
+        self._start_listener()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout else None
+        while True:
+            # Register before popping, a push in between must not be missed
+            waiter = self._add_waiter(key, loop)
+            try:
+                value = await self.run(self._cache.lpop, key)
+                if value is not None:
+                    return key.encode(), value
+                wait = self.poll_interval
+                if deadline is not None:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        return None
+                    wait = min(wait, remaining)
+                try:
+                    await asyncio.wait_for(waiter, wait)
+                except asyncio.TimeoutError:
+                    pass
+            finally:
+                self._remove_waiter(key, loop, waiter)
+
+    def _add_waiter(self, key: str, loop: asyncio.AbstractEventLoop) -> Any:
+        """
+        Register a future resolved when the list is pushed to.
+
+        :param key: List key
+        :param loop: Event loop of the waiting coroutine
+        :return: Future to await
+        """
+        waiter = loop.create_future()
+        with self._lock:
+            self._waiters.setdefault(key, set()).add((loop, waiter))
+        return waiter
+
+    def _remove_waiter(
+        self, key: str, loop: asyncio.AbstractEventLoop, waiter: Any
+    ) -> None:
+        """
+        Unregister a future of a waiting coroutine.
+
+        :param key: List key
+        :param loop: Event loop of the waiting coroutine
+        :param waiter: Future registered by _add_waiter
+        """
+        with self._lock:
+            waiters = self._waiters.get(key)
+            if waiters is None:
+                return
+            waiters.discard((loop, waiter))
+            if not waiters:
+                del self._waiters[key]
+
+    def _wake(self, key: str) -> None:
+        """
+        Resolve the futures of all coroutines waiting on a list.
+
+        :param key: List key
+        """
+        with self._lock:
+            waiters = list(self._waiters.get(key, ()))
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve, waiter)
+            except RuntimeError:
+                # The loop of the waiter has been closed
+                pass
+
+    def _wake_all(self) -> None:
+        """
+        Resolve the futures of all waiting coroutines.
+        """
+        with self._lock:
+            keys = list(self._waiters)
+        for key in keys:
+            self._wake(key)
+
+    def _start_listener(self) -> None:
+        """
+        Start listening for list pushes if not done yet.
+        """
+        if self._listener is not None:
+            return
+        with self._lock:
+            if self._listener is not None:
+                return
+            self._stopped.clear()
+            self._listener = threading.Thread(
+                target=self._listen, name="workflow-cache-list-push", daemon=True
+            )
+            self._listener.start()
+
+    def _listen(self) -> None:
+        """
+        Wake the waiters of the keys received on the channel until stopped.
+        """
+        while not self._stopped.is_set():
+            try:
+                self._pubsub = self._cache.subscribe(self.channel)
+                # Pushes may have been missed while (re)connecting
+                self._wake_all()
+                for message in self._pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    key = message.get("data")
+                    if isinstance(key, bytes):
+                        key = key.decode("utf-8")
+                    self._wake(key)
+            except Exception as e:
+                if not self._stopped.is_set():
+                    logger.warning(f"Cache list push listener error: {e}")
+            self._stopped.wait(1)
+
+    def close(self) -> None:
+        """
+        Stop the listener and the cache executor.
+        """
+        self._stopped.set()
+        pubsub, self._pubsub = self._pubsub, None
+        if pubsub is not None:
+            try:
+                pubsub.close()
+            except Exception:
+                pass
+        self._listener = None
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def _resolve(waiter: Any) -> None:
+    """
+    Resolve a waiter future unless it is already done or cancelled.
+
+    :param waiter: Future to resolve
+    """
+    if not waiter.done():
+        waiter.set_result(None)
@@ -128,6 +128,15 @@ class BaseCacheService(abc.ABC):
         :return: The popped element or None if timeout.
         """
 
+    @abc.abstractmethod
+    def lpop(self, key: str) -> Any:
+        """
+        Pop the first element of a list without blocking.
+
+        :param key: The list key to pop from.
+        :return: The popped element or None if the list is empty.
+        """
+
     @abc.abstractmethod
     def hgetall_str(self, name: str) -> Dict[str, str]:
         """
@@ -213,3 +222,25 @@ class BaseCacheService(abc.ABC):
         Returns:
             True if the key was set, False if the key already exists.
         """
+
+    @abc.abstractmethod
+    def publish(self, channel: str, message: str) -> None:
+        """
+        Publish a message on a channel.
+
+        Args:
+            channel: The channel name.
+            message: The message to publish.
+        """
+
+    @abc.abstractmethod
+    def subscribe(self, channel: str) -> Any:
+        """
+        Subscribe to a channel.
+
+        Args:
+            channel: The channel name.
+
+        Returns:
+            A pub/sub object whose listen() yields the received messages.
+        """
@@ -317,6 +317,35 @@ class RedisCache(BaseCacheService, Service):
         """
         return self._client.blpop(key, timeout=timeout)
 
+    def publish(self, channel: str, message: str) -> None:
+        """
+        Publish a message on a channel.
+
+        :param channel: The channel name
+        :param message: The message to publish
+        """
+        self._client.publish(channel, message)
+
+    def subscribe(self, channel: str) -> Any:
+        """
+        Subscribe to a channel.
+
+        :param channel: The channel name
+        :return: Pub/sub object whose listen() yields the received messages
+        """
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(channel)
+        return pubsub
+
+    def lpop(self, key: str) -> Any:
+        """
+        Pop the first element of a list without blocking.
+
+        :param key: The list key to pop from
+        :return: The popped element or None if the list is empty
+        """
+        return self._client.lpop(key)
+
     def hgetall_str(self, name: str) -> Dict[str, str]:
         """
         Get all hash fields and values as strings.
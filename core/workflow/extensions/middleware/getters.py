@@ -14,6 +14,7 @@ from workflow.extensions.middleware.asynchronous.base import (
     AsyncTaskService,  # type: ignore
 )
 from workflow.extensions.middleware.base import ServiceType
+from workflow.extensions.middleware.cache.async_manager import AsyncCacheService
 from workflow.extensions.middleware.cache.base import BaseCacheService
 from workflow.extensions.middleware.database.manager import DatabaseService
 from workflow.extensions.middleware.kafka.manager import KafkaProducerService
@@ -55,6 +56,19 @@ def get_cache_service() -> "BaseCacheService":
     return cast(BaseCacheService, service_manager.get(ServiceType.CACHE_SERVICE))
 
 
+# Process-wide asyncio facade of the cache service
+_async_cache_service = AsyncCacheService(get_cache_service)
+
+
+def get_async_cache_service() -> "AsyncCacheService":
+    """
+    Get the asyncio cache service instance.
+
+    :return: The asyncio cache service instance
+    """
+    return _async_cache_service
+
+
 def get_kafka_producer_service() -> "KafkaProducerService":
     """
     Get the Kafka producer service instance.
@@ -1,9 +1,10 @@
 import json
 import os
+from typing import Dict, Optional
 
 from loguru import logger
 from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
-from opentelemetry.metrics import get_meter_provider, set_meter_provider
+from opentelemetry.metrics import Counter, get_meter_provider, set_meter_provider
 from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.resources import SERVICE_NAME, Resource
@@ -28,6 +29,8 @@ from workflow.extensions.otlp.metric.consts import (
 counter = None
 histogram = None
 meter = None
+# Counters created by get_counter, keyed by name
+named_counters: Dict[str, Counter] = {}
 
 
 def init_metric(
@@ -53,6 +56,7 @@ def init_metric(
     """
 
     global counter, histogram, meter
+    named_counters.clear()
 
     if os.getenv("OTLP_ENABLE", "1") == "1":
         assert endpoint is not None, "endpoint is None"
@@ -98,3 +102,21 @@ def init_metric(
         SERVER_REQUEST_TIME_MICROSECONDS, description=SERVER_REQUEST_TIME_DESC
     )
     logger.debug("✅ Metric initialized successfully")
+
+
+def get_counter(name: str, description: str = "") -> Optional[Counter]:
+    """
+    Get a counter of its own, not counted as a service request.
+
+    :param name: Counter name
+    :param description: Counter description
+    :return: Counter, None when metrics are not initialized
+    """
+    if meter is None:
+        return None
+    instrument = named_counters.get(name)
+    if instrument is None:
+        instrument = named_counters[name] = meter.create_counter(
+            name, description=description
+        )
+    return instrument
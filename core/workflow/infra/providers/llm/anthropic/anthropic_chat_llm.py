@@ -16,9 +16,11 @@ from workflow.consts.engine.chat_status import ChatStatus
 from workflow.engine.nodes.entities.llm_response import LLMResponse
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
+from workflow.extensions.fastapi.lifespan.http_client import LLMHttpClient
 from workflow.extensions.otlp.log_trace.node_log import NodeLog
 from workflow.extensions.otlp.trace.span import Span
 from workflow.infra.providers.llm.chat_ai import ChatAI
+from workflow.infra.providers.llm.stream_trace import LLMStreamTrace
 
 
 class AnthropicChatAI(ChatAI):
@@ -169,6 +171,7 @@ class AnthropicChatAI(ChatAI):
         user_message: list,
         extra_params: dict,
         span: Span,
+        trace: LLMStreamTrace,
         timeout: float | None = None,
     ) -> AsyncIterator[LLMResponse]:
         payload = self.assemble_payload(user_message)
@@ -180,9 +183,13 @@ class AnthropicChatAI(ChatAI):
         }
         request_timeout = httpx.Timeout(timeout) if timeout else None
 
-        async with httpx.AsyncClient(timeout=request_timeout) as client:
+        async with LLMHttpClient.acquire("anthropic", url, self.api_key) as client:
             async with client.stream(
-                "POST", url, headers=self._build_headers(), json=payload
+                "POST",
+                url,
+                headers=self._build_headers(),
+                json=payload,
+                timeout=request_timeout,
             ) as response:
                 response.raise_for_status()
                 event_type = ""
@@ -206,9 +213,7 @@ class AnthropicChatAI(ChatAI):
                         if normalized is None:
                             continue
                         last_frame = normalized
-                        await span.add_info_events_async(
-                            {"recv": json.dumps(normalized, ensure_ascii=False)}
-                        )
+                        await trace.record(normalized)
                         yield LLMResponse(msg=normalized)
                         continue
 
@@ -242,6 +247,7 @@ class AnthropicChatAI(ChatAI):
             {"extra_params": json.dumps(extra_params, ensure_ascii=False)}
         )
 
+        trace = LLMStreamTrace(span, event_log_node_trace)
         try:
             if event_log_node_trace:
                 event_log_node_trace.append_config_data(
@@ -254,12 +260,9 @@ class AnthropicChatAI(ChatAI):
                 )
 
             async for msg in self._recv_messages(
-                url, user_message, extra_params, span, timeout
+                url, user_message, extra_params, span, trace, timeout
             ):
-                if event_log_node_trace:
-                    event_log_node_trace.add_info_log(
-                        json.dumps(msg.msg, ensure_ascii=False)
-                    )
+                trace.log_frame(msg.msg)
                 yield msg
         except httpx.TimeoutException as e:
             raise CustomException(
@@ -282,3 +285,5 @@ class AnthropicChatAI(ChatAI):
                 err_msg=str(e),
                 cause_error=str(e),
             ) from e
+        finally:
+            await trace.finish()
@@ -16,9 +16,11 @@ from workflow.consts.engine.chat_status import ChatStatus
 from workflow.engine.nodes.entities.llm_response import LLMResponse
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
+from workflow.extensions.fastapi.lifespan.http_client import LLMHttpClient
 from workflow.extensions.otlp.log_trace.node_log import NodeLog
 from workflow.extensions.otlp.trace.span import Span
 from workflow.infra.providers.llm.chat_ai import ChatAI
+from workflow.infra.providers.llm.stream_trace import LLMStreamTrace
 
 
 class GoogleChatAI(ChatAI):
@@ -218,6 +220,7 @@ class GoogleChatAI(ChatAI):
         user_message: list,
         extra_params: dict,
         span: Span,
+        trace: LLMStreamTrace,
         timeout: float | None = None,
     ) -> AsyncIterator[LLMResponse]:
         payload = self._merge_extra_params(
@@ -229,9 +232,13 @@ class GoogleChatAI(ChatAI):
         }
         request_timeout = httpx.Timeout(timeout) if timeout else None
 
-        async with httpx.AsyncClient(timeout=request_timeout) as client:
+        async with LLMHttpClient.acquire("google", url, self.api_key) as client:
             async with client.stream(
-                "POST", url, headers=self._build_headers(), json=payload
+                "POST",
+                url,
+                headers=self._build_headers(),
+                json=payload,
+                timeout=request_timeout,
             ) as response:
                 response.raise_for_status()
                 data_lines: List[str] = []
@@ -246,9 +253,7 @@ class GoogleChatAI(ChatAI):
                             break
                         normalized = self._normalize_chunk(json.loads(raw_data))
                         last_frame = normalized
-                        await span.add_info_events_async(
-                            {"recv": json.dumps(normalized, ensure_ascii=False)}
-                        )
+                        await trace.record(normalized)
                         yield LLMResponse(msg=normalized)
                         continue
 
@@ -283,6 +288,7 @@ class GoogleChatAI(ChatAI):
             {"extra_params": json.dumps(extra_params, ensure_ascii=False)}
         )
 
+        trace = LLMStreamTrace(span, event_log_node_trace)
         try:
             if event_log_node_trace:
                 event_log_node_trace.append_config_data(
@@ -295,12 +301,9 @@ class GoogleChatAI(ChatAI):
                 )
 
             async for msg in self._recv_messages(
-                url, user_message, extra_params, span, timeout
+                url, user_message, extra_params, span, trace, timeout
             ):
-                if event_log_node_trace:
-                    event_log_node_trace.add_info_log(
-                        json.dumps(msg.msg, ensure_ascii=False)
-                    )
+                trace.log_frame(msg.msg)
                 yield msg
         except CustomException as e:
             raise e
@@ -311,3 +314,5 @@ class GoogleChatAI(ChatAI):
                 err_msg=str(e),
                 cause_error=str(e),
             )
+        finally:
+            await trace.finish()
@@ -23,6 +23,7 @@ from workflow.extensions.otlp.trace.span import Span
 from workflow.infra.providers.llm.chat_ai import ChatAI
 from workflow.infra.providers.llm.iflytek_spark.const import RETRY_CNT
 from workflow.infra.providers.llm.iflytek_spark.spark_chat_auth import SparkChatHmacAuth
+from workflow.infra.providers.llm.stream_trace import LLMStreamTrace, spark_frame_parts
 
 
 @retry(
@@ -227,6 +228,7 @@ class SparkChatAi(ChatAI):
             event_log_node_trace.append_config_data(json.loads(payload))
         await span.add_info_events_async({"payload": payload})
         llm_first_token_cost: float = -1
+        trace = LLMStreamTrace(span, event_log_node_trace, spark_frame_parts)
         try:
             # TODO: Timeout set to 60s to solve the issue of slow first frame response from LLM
             async with websockets.connect(
@@ -237,6 +239,7 @@ class SparkChatAi(ChatAI):
                 close_timeout=1,
             ) as ws_handle:
                 start_time = time.time()
+                trace.restart()
                 await ws_handle.send(payload)
                 async for msg_json in self._recv_messages(ws_handle, timeout):
                     msg = json.loads(msg_json)
@@ -249,13 +252,8 @@ class SparkChatAi(ChatAI):
                             event_log_node_trace.set_node_first_cost_time(
                                 llm_first_token_cost
                             )
-                    await span.add_info_events_async(
-                        {"recv": json.dumps(msg, ensure_ascii=False)}
-                    )
-                    if event_log_node_trace:
-                        event_log_node_trace.add_info_log(
-                            json.dumps(msg, ensure_ascii=False)
-                        )
+                    await trace.record(msg)
+                    trace.log_frame(msg)
                     yield LLMResponse(msg=msg)
         except websockets.ConnectionClosedError as conn_err:
             span.add_error_event(f"WebSocket connection error: {conn_err}")
@@ -276,6 +274,8 @@ class SparkChatAi(ChatAI):
         except Exception as e:
             span.record_exception(e)
             raise e
+        finally:
+            await trace.finish()
 
     async def _handle_quickly_think_req_body(self, flow_id: str, body: str) -> str:
         """
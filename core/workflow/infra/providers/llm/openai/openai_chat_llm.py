@@ -13,9 +13,11 @@ from workflow.consts.engine.chat_status import ChatStatus
 from workflow.engine.nodes.entities.llm_response import LLMResponse
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
+from workflow.extensions.fastapi.lifespan.http_client import LLMHttpClient
 from workflow.extensions.otlp.log_trace.node_log import NodeLog
 from workflow.extensions.otlp.trace.span import Span
 from workflow.infra.providers.llm.chat_ai import ChatAI
+from workflow.infra.providers.llm.stream_trace import LLMStreamTrace
 
 
 class OpenAIChatAI(ChatAI):
@@ -94,6 +96,7 @@ class OpenAIChatAI(ChatAI):
         user_message: list,
         extra_params: dict,
         span: Span,
+        trace: LLMStreamTrace,
         timeout: float | None = None,
     ) -> AsyncIterator[LLMResponse]:
         """
@@ -103,51 +106,42 @@ class OpenAIChatAI(ChatAI):
         :param user_message: List of messages to send
         :param extra_params: Additional parameters for the API request
         :param span: Tracing span for logging
+        :param trace: Trace of the streamed response
         :param timeout: Optional timeout for frame processing
         :return: Async iterator of LLMResponse objects
         :raises CustomException: If request times out or fails
         """
-        # Initialize OpenAI async client
-        from openai import AsyncOpenAI  # type: ignore
-
-        aclient = AsyncOpenAI(
-            api_key=self.api_key,
-            base_url=url,
-        )
-        stream = None
-        try:
-            # Create streaming chat completion
-            stream = await aclient.chat.completions.create(
-                model=self.model_name,
-                messages=user_message,
-                stream=True,
-                **extra_params,
-            )
-
-            async for response in self._process_stream(stream, span, timeout):
-                yield response
+        # Borrow the pooled OpenAI async client of this endpoint
+        async with LLMHttpClient.acquire("openai", url, self.api_key) as aclient:
+            stream = None
+            try:
+                # Create streaming chat completion
+                stream = await aclient.chat.completions.create(
+                    model=self.model_name,
+                    messages=user_message,
+                    stream=True,
+                    **extra_params,
+                )
 
-        finally:
-            if stream:
-                try:
-                    await stream.aclose()
-                except Exception:
-                    span.add_error_events(
-                        {"stream_close_error": "Failed to close stream"}
-                    )
-
-            if aclient:
-                try:
-                    await aclient.close()
-                except Exception:
-                    span.add_error_events(
-                        {"client_close_error": "Failed to close client"}
-                    )
+                async for response in self._process_stream(
+                    stream, span, trace, timeout
+                ):
+                    yield response
+
+            finally:
+                if stream:
+                    try:
+                        await stream.aclose()
+                    except Exception:
+                        span.add_error_events(
+                            {"stream_close_error": "Failed to close stream"}
+                        )
 
     async def _process_stream(
         self,
         stream: Any,
         span: Span,
+        trace: LLMStreamTrace,
         timeout: float | None = None,
     ) -> AsyncIterator[LLMResponse]:
         last_frame_data = {}
@@ -173,13 +167,9 @@ class OpenAIChatAI(ChatAI):
                             {"llm first token cost": first_frame_cost}
                         )
 
-                # Log received chunk data
-                await span.add_info_events_async(
-                    {"recv": json.dumps(chunk.dict(), ensure_ascii=False)}
-                )
-
-                # Update last frame data and yield response
+                # Update last frame data, trace it and yield response
                 last_frame_data = chunk.dict()
+                await trace.record(last_frame_data)
                 yield LLMResponse(
                     msg=last_frame_data,
                 )
@@ -235,6 +225,7 @@ class OpenAIChatAI(ChatAI):
             {"extra_params": json.dumps(extra_params, ensure_ascii=False)}
         )
 
+        trace = LLMStreamTrace(span, event_log_node_trace)
         try:
 
             # Log configuration data if trace logger is provided
@@ -250,13 +241,9 @@ class OpenAIChatAI(ChatAI):
 
             # Process streaming messages and yield responses
             async for msg in self._recv_messages(
-                url, user_message, extra_params, span, timeout
+                url, user_message, extra_params, span, trace, timeout
             ):
-                # Log message data if trace logger is provided
-                if event_log_node_trace:
-                    event_log_node_trace.add_info_log(
-                        json.dumps(msg.msg, ensure_ascii=False)
-                    )
+                trace.log_frame(msg.msg)
                 yield msg
         except CustomException as e:
             # Re-raise custom exceptions as-is
@@ -269,3 +256,5 @@ class OpenAIChatAI(ChatAI):
                 err_msg=str(e),
                 cause_error=str(e),
             )
+        finally:
+            await trace.finish()
@@ -0,0 +1,215 @@
+"""
+Tracing of streamed LLM responses.
+
+Logging every streamed chunk costs a JSON serialization, a log line and a
+span event per token. In the aggregate mode chunks are accumulated in memory
+and reported once at the end of the stream, raw chunks being only sampled.
+"""
+
+import json
+import os
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from workflow.extensions.otlp.log_trace.node_log import NodeLog
+from workflow.extensions.otlp.trace.span import Span
+
+# (content, reasoning_content, token_usage) carried by a frame
+FrameParts = Tuple[str, str, Dict[str, Any]]
+
+TRACE_MODE_CHUNK = "chunk"
+TRACE_MODE_AGGREGATE = "aggregate"
+
+INTER_TOKEN_PERCENTILES = (50, 90, 99)
+
+
+def openai_frame_parts(frame: Dict[str, Any]) -> FrameParts:
+    """
+    Extract the generated text and token usage of an OpenAI style frame.
+
+    :param frame: Frame with choices[0].delta and usage
+    :return: Tuple of content, reasoning content and token usage
+    """
+    choices = frame.get("choices") or [{}]
+    delta = choices[0].get("delta") or {}
+    return (
+        delta.get("content") or "",
+        delta.get("reasoning_content") or "",
+        frame.get("usage") or {},
+    )
+
+
+def spark_frame_parts(frame: Dict[str, Any]) -> FrameParts:
+    """
+    Extract the generated text and token usage of a Spark frame.
+
+    :param frame: Frame with payload.choices.text and payload.usage.text
+    :return: Tuple of content, reasoning content and token usage
+    """
+    payload = frame.get("payload") or {}
+    text = (payload.get("choices") or {}).get("text") or [{}]
+    return (
+        text[0].get("content") or "",
+        text[0].get("reasoning_content") or "",
+        (payload.get("usage") or {}).get("text") or {},
+    )
+
+
+def _percentile(sorted_values: List[float], percent: int) -> float:
+    """
+    Nearest-rank percentile of sorted values.
+
+    :param sorted_values: Values in ascending order, not empty
+    :param percent: Percentile between 0 and 100
+    :return: Percentile value
+    """
+    rank = max(int(round(percent / 100 * len(sorted_values))) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class LLMStreamTrace:
+    """
+    Trace of one streamed LLM response.
+
+    In the chunk mode every received frame is recorded on the span, and every
+    yielded frame on the node log. In the aggregate mode a fraction of the
+    frames is recorded on the span, and a single summary carrying the content,
+    the token usage, the first token latency and the inter-token latency
+    percentiles is recorded on both when the stream ends.
+    """
+
+    def __init__(
+        self,
+        span: Span,
+        node_log: Optional[NodeLog] = None,
+        frame_parts: Callable[[Dict[str, Any]], FrameParts] = openai_frame_parts,
+        mode: Optional[str] = None,
+        sample_rate: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the trace and start the latency clock.
+
+        :param span: Tracing span of the LLM request
+        :param node_log: Optional node trace logger
+        :param frame_parts: Function extracting the text and usage of a frame
+        :param mode: Trace mode, chunk or aggregate,
+                     None reads WORKFLOW_LLM_TRACE_MODE
+        :param sample_rate: Fraction of frames recorded raw in the aggregate mode,
+                            None reads WORKFLOW_LLM_TRACE_SAMPLE_RATE
+        """
+        self.span = span
+        self.node_log = node_log
+        self.frame_parts = frame_parts
+        self.mode = (
+            mode
+            if mode is not None
+            else os.getenv("WORKFLOW_LLM_TRACE_MODE", TRACE_MODE_AGGREGATE)
+        )
+        self.sample_rate = (
+            sample_rate
+            if sample_rate is not None
+            else float(os.getenv("WORKFLOW_LLM_TRACE_SAMPLE_RATE", "0"))
+        )
+        self.start_time = time.perf_counter()
+        self.first_token_cost: Optional[float] = None
+        self.last_frame_time: Optional[float] = None
+        self.inter_token_costs: List[float] = []
+        self.frames = 0
+        self.content: List[str] = []
+        self.reasoning_content: List[str] = []
+        self.token_usage: Dict[str, Any] = {}
+        self.finished = False
+
+    @property
+    def aggregate(self) -> bool:
+        """
+        Whether frames are summarized instead of recorded one by one.
+
+        :return: True in the aggregate mode
+        """
+        return self.mode != TRACE_MODE_CHUNK
+
+    def restart(self) -> None:
+        """
+        Restart the latency clock, e.g. once the request has been sent.
+        """
+        self.start_time = time.perf_counter()
+
+    async def record(self, frame: Dict[str, Any]) -> None:
+        """
+        Record a received frame.
+
+        :param frame: Decoded frame
+        """
+        now = time.perf_counter()
+        if self.last_frame_time is None:
+            self.first_token_cost = now - self.start_time
+        else:
+            self.inter_token_costs.append(now - self.last_frame_time)
+        self.last_frame_time = now
+        self.frames += 1
+
+        if not self.aggregate:
+            await self.span.add_info_events_async(
+                {"recv": json.dumps(frame, ensure_ascii=False)}
+            )
+            return
+
+        content, reasoning_content, token_usage = self.frame_parts(frame)
+        if content:
+            self.content.append(content)
+        if reasoning_content:
+            self.reasoning_content.append(reasoning_content)
+        if token_usage:
+            self.token_usage = token_usage
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            await self.span.add_info_events_async(
+                {"recv": json.dumps(frame, ensure_ascii=False)}
+            )
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize the recorded frames.
+
+        :return: Content, token usage and latencies in seconds of the stream
+        """
+        costs = sorted(self.inter_token_costs)
+        inter_token_cost: Dict[str, float] = {}
+        if costs:
+            for percent in INTER_TOKEN_PERCENTILES:
+                inter_token_cost[f"p{percent}"] = round(_percentile(costs, percent), 4)
+            inter_token_cost["max"] = round(costs[-1], 4)
+        return {
+            "frames": self.frames,
+            "content": "".join(self.content),
+            "reasoning_content": "".join(self.reasoning_content),
+            "token_usage": self.token_usage,
+            "first_token_cost": (
+                round(self.first_token_cost, 4)
+                if self.first_token_cost is not None
+                else None
+            ),
+            "inter_token_cost": inter_token_cost,
+        }
+
+    def log_frame(self, frame: Dict[str, Any]) -> None:
+        """
+        Record a frame yielded to the caller on the node log in the chunk mode.
+
+        :param frame: Yielded frame
+        """
+        if self.node_log and not self.aggregate:
+            self.node_log.add_info_log(json.dumps(frame, ensure_ascii=False))
+
+    async def finish(self) -> None:
+        """
+        Record the summary of the stream in the aggregate mode, once.
+        """
+        if self.finished or not self.aggregate:
+            return
+        self.finished = True
+        summary = json.dumps(self.summary(), ensure_ascii=False)
+        await self.span.add_info_events_async({"recv_summary": summary})
+        if self.node_log:
+            self.node_log.add_info_log(summary)
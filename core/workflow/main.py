@@ -19,16 +19,18 @@ from starlette.middleware.cors import CORSMiddleware
 
 from workflow.api.v1.router import old_auth_router, sparkflow_router, workflow_router
 from workflow.cache.event_registry import EventRegistry
+from workflow.cache.local import local_cache
 from workflow.extensions.fastapi.handler.validation import validation_exception_handler
 from workflow.extensions.fastapi.lifespan.database_migration import (
     run_database_migration,
 )
-from workflow.extensions.fastapi.lifespan.http_client import HttpClient
+from workflow.extensions.fastapi.lifespan.http_client import HttpClient, LLMHttpClient
 from workflow.extensions.fastapi.lifespan.utils import print_routes
 from workflow.extensions.fastapi.middleware.auth import AuthMiddleware
 from workflow.extensions.fastapi.middleware.otlp import OtlpMiddleware
 from workflow.extensions.graceful_shutdown.graceful_shutdown import GracefulShutdown
 from workflow.extensions.middleware.base import FactoryConfig, ServiceType
+from workflow.extensions.middleware.getters import get_async_cache_service
 from workflow.extensions.middleware.initialize import initialize_services
 from workflow.utils.system_workers import worker_count
 
@@ -61,6 +63,9 @@ def create_app() -> FastAPI:
             ]
         )
 
+        # Drop locally cached entries invalidated by other workers
+        local_cache.start_listener()
+
         # Run database migration before starting the service
         run_database_migration()
 
@@ -73,8 +78,10 @@ def create_app() -> FastAPI:
 
         yield
 
-        # Destroy the http connection pool when the service stops
+        # Destroy the http connection pools when the service stops
         await HttpClient.close()
+        await LLMHttpClient.close()
+        local_cache.stop_listener()
 
         # Exit gracefully
         async def do_final_shutdown_logic() -> None:
@@ -86,6 +93,9 @@ def create_app() -> FastAPI:
             timeout=int(os.getenv("SHUTDOWN_TIMEOUT", "180")),
         ).run(shutdown_callback=do_final_shutdown_logic)
 
+        # Stop the cache executor once in-flight events are done
+        get_async_cache_service().close()
+
     # Create the FastAPI application instance
     app = FastAPI(lifespan=lifespan)
 
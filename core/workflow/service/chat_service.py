@@ -4,9 +4,21 @@ import json
 import os
 import time
 from asyncio import Queue
+from contextlib import aclosing
 from datetime import datetime
-from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, cast
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
 
+from common.utils.snowfake import get_id
 from loguru import logger
 
 from workflow.consts.runtime_env import RuntimeEnv
@@ -18,7 +30,8 @@ try:
 except ImportError:
     from sqlalchemy.orm import Session  # type: ignore[assignment]
 
-from workflow.cache.event_registry import Event, EventRegistry
+from workflow.cache.engine import EngineCacheKey, engine_cache, gen_engine_cache_key
+from workflow.cache.event_registry import Event, EventRegistry, ResumeStreamWriter
 from workflow.consts.app_audit import AppAuditPolicy
 from workflow.consts.engine.chat_status import ChatStatus
 from workflow.consts.engine.model_provider import ModelProviderEnum
@@ -41,8 +54,10 @@ from workflow.engine.entities.node_entities import NodeType
 from workflow.engine.entities.variable_pool import ParamKey, VariablePool
 from workflow.engine.entities.workflow_dsl import WorkflowDSL
 from workflow.engine.nodes.entities.node_run_result import NodeRunResult
+from workflow.engine.nodes.plugin_tool.plugin_node import prefetch_tool_schemas
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
+from workflow.extensions.middleware.database.utils import session_getter
 from workflow.extensions.otlp.log_trace.workflow_log import WorkflowLog
 from workflow.extensions.otlp.metric.meter import Meter
 from workflow.extensions.otlp.trace.span import Span
@@ -53,7 +68,7 @@ from workflow.infra.audit_system.strategy.base_strategy import AuditStrategy
 from workflow.infra.audit_system.strategy.text_strategy import TextAuditStrategy
 from workflow.service import app_service, audit_service, flow_service
 from workflow.service.flow_service import set_flow_node_output_mode
-from workflow.service.history_service import get_history
+from workflow.service.history_service import get_history_async
 from workflow.service.ops_service import kafka_report
 
 
@@ -112,6 +127,68 @@ async def event_stream(
     )
 
 
+async def subflow_frames(
+    app_alias_id: str, chat_vo: ChatVo, span: Span
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    Run a published flow of this deployment in-process for a flow node.
+
+    The flow goes through the same validation, engine cache and execution as a
+    chat completions request, but the response frames are handed over as
+    dictionaries instead of being serialized into server-sent events.
+
+    :param app_alias_id: Application alias ID the flow is called with
+    :param chat_vo: Chat value object of the nested flow
+    :param span: Distributed tracing span of the calling node
+    :return: AsyncGenerator yielding response frame dictionaries
+    :raises CustomException: When the flow is not found, not published or
+                             not authorized for the application
+    """
+    with session_getter(auto_commit=False) as db_session:
+        db_flow, app_audit_policy = await get_and_validate_published_flow(
+            chat_vo=chat_vo,
+            app_id=app_alias_id,
+            span=span,
+            db_session=db_session,
+        )
+
+    event = Event(
+        flow_id=chat_vo.flow_id,
+        app_id=app_alias_id,
+        event_id=str(get_id()),
+        uid=chat_vo.uid,
+        chat_id=chat_vo.chat_id,
+        is_stream=True,
+    )
+    await EventRegistry().init_event_async(event)
+
+    response_queue: Queue = Queue()
+    task = asyncio.create_task(
+        _run(
+            app_alias_id,
+            event.event_id,
+            db_flow.release_data,
+            db_flow.update_at,
+            chat_vo,
+            True,
+            app_audit_policy,
+            response_queue,
+            span,
+        )
+    )
+
+    return _chat_response_frames(
+        response_queue,
+        chat_vo.flow_id,
+        app_audit_policy,
+        event.event_id,
+        True,
+        True,
+        span,
+        task,
+    )
+
+
 def _init_workflow_trace(
     app_alias_id: str, chat_vo: ChatVo, is_release: bool, span_context: Span
 ) -> WorkflowLog:
@@ -141,7 +218,10 @@ def _init_workflow_trace(
 
 async def _get_or_build_workflow_engine(
     is_release: bool,
+    chat_vo: ChatVo,
+    app_alias_id: str,
     workflow_dsl: Dict,
+    workflow_dsl_update_time: Optional[datetime],
     span_context: Span,
 ) -> WorkflowEngine:
     """
@@ -160,6 +240,28 @@ async def _get_or_build_workflow_engine(
     """
     sparkflow_engine: WorkflowEngine
     start_time = time.time() * 1000
+
+    # Without a DSL version a cached engine could never be invalidated safely
+    cache_key: Optional[EngineCacheKey] = None
+    if workflow_dsl_update_time:
+        cache_key = gen_engine_cache_key(
+            flow_id=chat_vo.flow_id,
+            version=chat_vo.version,
+            app_id=app_alias_id,
+            is_release=is_release,
+            dsl_update_time=workflow_dsl_update_time,
+        )
+        cached_engine = engine_cache.get(cache_key, span_context)
+        if cached_engine:
+            await span_context.add_info_events_async(
+                {
+                    "clone_sparkflow_engine_cache_obj": f"{time.time() * 1000 - start_time}"
+                }
+            )
+            return cached_engine
+
+    build_meter = Meter(app_id=app_alias_id, func="workflow_engine_build")
+    build_meter.set_label("flow_id", chat_vo.flow_id)
     sparkflow_engine = WorkflowEngineFactory.create_engine(
         WorkflowDSL.model_validate(workflow_dsl.get("data", {})), span_context
     )
@@ -180,8 +282,23 @@ async def _get_or_build_workflow_engine(
         ParamKey.IsRelease, is_release
     )
 
+    build_time = time.time() * 1000 - start_time
+    build_meter.in_success_count()
+    if cache_key:
+        # Store the engine before it runs so clones never carry run state
+        engine_cache.set(cache_key, sparkflow_engine, build_time, span_context)
+
     await span_context.add_info_events_async(
-        {"rebuild_sparkflow_engine_cache_obj": f"{time.time() * 1000 - start_time}"}
+        {"rebuild_sparkflow_engine_cache_obj": f"{build_time}"}
+    )
+
+    # Resolve the tool schemas of all plugin nodes in parallel ahead of the run
+    await prefetch_tool_schemas(
+        [
+            node.node_instance
+            for node in sparkflow_engine.engine_ctx.built_nodes.values()
+        ],
+        span_context,
     )
 
     return sparkflow_engine
@@ -336,7 +453,7 @@ async def _get_chat_history(
 
     if nodes_need_history:
         start_time = time.time() * 1000
-        history = get_history(
+        history = await get_history_async(
             flow_id=chat_vo.flow_id,
             uid=uid,
             node_max_token=sparkflow_engine.node_max_token,
@@ -478,7 +595,12 @@ async def _run(
 
             # Get or build workflow engine
             sparkflow_engine = await _get_or_build_workflow_engine(
-                is_release, workflow_dsl, span_context
+                is_release,
+                chat_vo,
+                app_alias_id,
+                workflow_dsl,
+                workflow_dsl_update_time,
+                span_context,
             )
             # Initialize streaming processing components
             need_order_stream_result_q: asyncio.Queue[Any] = asyncio.Queue()
@@ -868,6 +990,44 @@ async def _chat_response_stream(
     """
     Process chat response streaming queue and generate streaming output.
 
+    :param response_queue: Queue containing workflow execution responses
+    :param flow_id: Workflow identifier for tracking
+    :param app_audit_policy: Application audit policy for content moderation
+    :param event_id: Unique event identifier for tracking
+    :param is_stream: Whether to enable streaming mode
+    :param is_release: Whether running in production release environment
+    :param span: Distributed tracing span for monitoring
+    :return: AsyncIterator yielding streaming response strings
+    """
+    async with aclosing(
+        _chat_response_frames(
+            response_queue,
+            flow_id,
+            app_audit_policy,
+            event_id,
+            is_stream,
+            is_release,
+            span,
+            engine_task,
+        )
+    ) as frames:
+        async for frame in frames:
+            yield Streaming.generate_data(frame)
+
+
+async def _chat_response_frames(
+    response_queue: Queue,
+    flow_id: str,
+    app_audit_policy: AppAuditPolicy,
+    event_id: str,
+    is_stream: bool,
+    is_release: bool,
+    span: Span,
+    engine_task: asyncio.Task,
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    Process chat response queue and generate response frames.
+
     This function handles the streaming response processing, including audit
     integration, response filtering, and error handling.
 
@@ -878,7 +1038,7 @@ async def _chat_response_stream(
     :param is_stream: Whether to enable streaming mode
     :param is_release: Whether running in production release environment
     :param span: Distributed tracing span for monitoring
-    :return: AsyncIterator yielding streaming response strings
+    :return: AsyncGenerator yielding response frame dictionaries
     """
 
     message_cache: List[str] = []
@@ -948,13 +1108,11 @@ async def _chat_response_stream(
                         )
                     }
                 )
-                yield Streaming.generate_data(response.model_dump(exclude_none=True))
+                yield response.model_dump(exclude_none=True)
 
                 if response.choices[0].finish_reason == ChatStatus.FINISH_REASON.value:
                     # Exit condition met
-                    await asyncio.to_thread(
-                        EventRegistry().on_finished, event_id=event_id
-                    )
+                    await EventRegistry().on_finished_async(event_id=event_id)
                     return
 
         except asyncio.TimeoutError:
@@ -970,7 +1128,7 @@ async def _chat_response_stream(
                     )
                 }
             )
-            yield Streaming.generate_data(llm_resp.model_dump(exclude_none=True))
+            yield llm_resp.model_dump(exclude_none=True)
             return
         except CustomException as e:
             llm_resp = LLMGenerate.workflow_end_open_error(
@@ -985,7 +1143,7 @@ async def _chat_response_stream(
                     )
                 }
             )
-            yield Streaming.generate_data(llm_resp.model_dump(exclude_none=True))
+            yield llm_resp.model_dump(exclude_none=True)
             return
         except Exception as err:
             span_context.record_exception(err)
@@ -1001,7 +1159,7 @@ async def _chat_response_stream(
                     )
                 }
             )
-            yield Streaming.generate_data(llm_resp.model_dump(exclude_none=True))
+            yield llm_resp.model_dump(exclude_none=True)
             return
         finally:
             tasks: List[asyncio.Task | None] = [task]
@@ -1085,6 +1243,7 @@ async def _forward_queue_messages(
     :param span: Span
     """
     last_response: LLMGenerate | None = None
+    writer = ResumeStreamWriter(event_id)
     try:
         while True:
             response = await _get_response(
@@ -1095,19 +1254,25 @@ async def _forward_queue_messages(
             )
             if node:
                 last_response = response
-            event = await asyncio.to_thread(EventRegistry().get_event, event_id)
+            if response.event_data:
+                # Interrupt nodes update the event timeout before pausing
+                writer.reload_event()
             data = json.dumps(response.dict(), ensure_ascii=False)
-            await EventRegistry().write_resume_data(
-                queue_name=event.get_workflow_q_name(),
-                data=data,
-                expire_time=event.timeout,
+            finished = (
+                response.choices[0].finish_reason == ChatStatus.FINISH_REASON.value
             )
-            if response.choices[0].finish_reason == ChatStatus.FINISH_REASON.value:
+            # The reader waits for interrupt and final frames, push them at once
+            await writer.write(data, flush=finished or bool(response.event_data))
+            if finished:
                 return
     except Exception as e:
         span.record_exception(e)
         raise e
     finally:
+        try:
+            await writer.close()
+        except Exception as e:
+            span.record_exception(e)
         await _cancel_task_gracefully([engine_task])
 
 
@@ -1116,7 +1281,7 @@ async def _del_response_resume_data(
     response: LLMGenerate,
     is_stream: bool,
     event_id: str,
-) -> str:
+) -> Dict[str, Any]:
     """
     Handle response resume data delivery for interrupted workflows.
 
@@ -1127,14 +1292,14 @@ async def _del_response_resume_data(
     :param response: LLMGenerate response object
     :param is_stream: Whether streaming mode is enabled
     :param event_id: Unique event identifier
-    :return: Streaming data string
+    :return: Response frame dictionary
     :raises CustomException: When audit policy doesn't support QA nodes
     """
     # Question-answer nodes currently don't support audit
     if app_audit_policy == AppAuditPolicy.AGENT_PLATFORM:
         raise CustomException(CodeEnum.AUDIT_QA_ERROR)
-    EventRegistry().on_interrupt(event_id=event_id)
-    return Streaming.generate_data(response.model_dump(exclude_none=True))
+    await EventRegistry().on_interrupt_async(event_id=event_id)
+    return response.model_dump(exclude_none=True)
 
 
 async def _init_audit_policy(
@@ -1182,7 +1347,7 @@ async def chat_resume_response_stream(
     """
     with span.start() as span_context:
         try:
-            event = EventRegistry().get_event(event_id=event_id)
+            event = await EventRegistry().get_event_async(event_id=event_id)
 
             message_cache: List[str] = []
             reasoning_content_cache: List[str] = []
@@ -1220,7 +1385,7 @@ async def chat_resume_response_stream(
                     continue
 
                 if response and response.event_data:
-                    EventRegistry().on_interrupt(event_id=event_id)
+                    await EventRegistry().on_interrupt_async(event_id=event_id)
                     response.id = span_context.sid
                     yield Streaming.generate_data(
                         response.model_dump(exclude_none=True)
@@ -1247,7 +1412,7 @@ async def chat_resume_response_stream(
                         f"final_reasoning_content: {final_reasoning_content}"
                     )
                     # Exit condition met
-                    EventRegistry().on_finished(event_id=event_id)
+                    await EventRegistry().on_finished_async(event_id=event_id)
                     return
 
         except (Exception, asyncio.TimeoutError, CustomException) as e:
@@ -1269,7 +1434,7 @@ async def chat_resume_response_stream(
                     )
                 }
             )
-            EventRegistry().on_finished(event_id=event_id)
+            await EventRegistry().on_finished_async(event_id=event_id)
             llm_resp.id = span_context.sid
             yield Streaming.generate_data(llm_resp.model_dump(exclude_none=True))
             return
@@ -13,6 +13,7 @@ from common.utils.snowfake import get_id
 from sqlmodel import Session  # type: ignore
 
 from workflow.cache import flow as flow_cache
+from workflow.cache.engine import del_engine_by_flow_id
 from workflow.domain.entities.flow import FlowUpdate
 from workflow.domain.entities.node_debug_vo import NodeDebugRespVo
 from workflow.domain.models.ai_app import App
@@ -97,6 +98,11 @@ def update(
         session.add(db_flow)
         session.commit()
 
+        # Drop the cached flow on every worker and the compiled engines
+        # built from the previous DSL
+        flow_cache.del_flow_by_id(flow_id)
+        del_engine_by_flow_id(flow_id)
+
     except Exception as e:
         current_span.record_exception(e)
         session.rollback()
@@ -384,6 +390,7 @@ def build(
         # Clear existing cache for the flow
         if flow_id in cache_service:
             cache_service.delete(flow_id)
+        del_engine_by_flow_id(flow_id)
 
         # Retrieve flow definition from database
         flow = get(flow_id=flow_id, session=session, span=span)
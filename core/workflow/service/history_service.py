@@ -4,12 +4,14 @@ This module provides functionality to store and retrieve conversation history
 for workflow nodes, with support for token limits and database constraints.
 """
 
+import asyncio
 import json
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import desc
-from sqlmodel import select  # type: ignore
+from sqlalchemy import desc, func
+from sqlmodel import Session, select  # type: ignore
 
+from workflow.cache.history import HistoryCache, HistoryRecord
 from workflow.domain.models.history import History
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
@@ -22,6 +24,9 @@ TOKEN_LIMIT = 8192 * 0.95
 # Database row length limit (95% of mediumText max length 16MB for safety margin)
 DB_ROW_LENGTH_LIMIT = 16777215 * 0.95
 
+# Process-wide cache of the most recent history records per (flow, user)
+history_cache = HistoryCache(depth=MAX_HISTORY_SIZE)
+
 
 def add_history(
     flow_id: str,
@@ -73,6 +78,7 @@ def add_history(
                 chat_id=chat_id,
             )
             session.add(db_history)
+        history_cache.append(flow_id, uid, node_id, (question_str, answer_str))
     except Exception as e:
         raise CustomException(
             CodeEnum.ENG_RUN_ERROR,
@@ -82,6 +88,97 @@ def add_history(
         ) from e
 
 
+def _fetch_history_records(
+    session: Session, flow_id: str, uid: str, history_size: int
+) -> Dict[str, List[HistoryRecord]]:
+    """Load the most recent history records of every node in one query.
+
+    :param session: Database session
+    :param flow_id: Unique identifier for the workflow flow
+    :param uid: User identifier
+    :param history_size: Maximum number of history records to retrieve per node
+    :return: Records per node ID, newest first
+    """
+    # Rank the records of each node by recency on their IDs only, then join
+    # back to load the question and answer of the top history_size records
+    row_num = (
+        func.row_number()
+        .over(partition_by=History.node_id, order_by=desc(History.create_time))
+        .label("row_num")
+    )
+    ranked = (
+        select(History.id, row_num)
+        .where(History.flow_id == flow_id, History.uid == uid)
+        .subquery()
+    )
+    query = (
+        select(History.node_id, History.raw_question, History.raw_answer)
+        .join(ranked, ranked.c.id == History.id)
+        .where(ranked.c.row_num <= history_size)
+        .order_by(History.node_id, ranked.c.row_num)
+    )
+    records: Dict[str, List[HistoryRecord]] = {}
+    for node_id, raw_question, raw_answer in session.exec(query).all():
+        records.setdefault(node_id, []).append((raw_question, raw_answer))
+    return records
+
+
+def _format_history(
+    records: Dict[str, List[HistoryRecord]],
+    node_max_token: Optional[Dict[str, int]],
+) -> List[Dict]:
+    """Format history records into chat histories within the token limits.
+
+    :param records: Records per node ID, newest first
+    :param node_max_token: Optional dictionary mapping node IDs to token limits
+    :return: List of dictionaries containing node history with chat records
+    """
+    history: List[Dict[str, Any]] = []
+    node_history_dict: Dict[str, List[Dict[str, Any]]] = {}
+    current_utf8_length = 0
+
+    for node_id in sorted(records):
+        node_history_dict[node_id] = []
+
+        # Process each history record for the current node
+        for raw_question, raw_answer in records[node_id]:
+            # Check token limits and break if exceeded
+            current_utf8_length += len(raw_question.encode("utf-8")) + len(
+                raw_answer.encode("utf-8")
+            )
+            max_token: Optional[float] = None
+            if node_max_token is not None:
+                # Use 80% of the specified token limit for safety margin
+                max_token = float(node_max_token.get(node_id, int(TOKEN_LIMIT))) * 0.8
+
+            if max_token is not None and current_utf8_length > max_token:
+                break
+
+            # Parse JSON strings back to dictionaries
+            question_dict = json.loads(raw_question)
+            answer_dict = json.loads(raw_answer)
+
+            # Add answer and question to history in chronological order
+            node_history_dict[node_id].append(
+                {
+                    "role": answer_dict.get("role"),
+                    "content": answer_dict.get("content"),
+                }
+            )
+            node_history_dict[node_id].append(
+                {
+                    "role": question_dict.get("role"),
+                    "content": question_dict.get("content"),
+                }
+            )
+    # Format final history structure
+    for node_id, chat_history in node_history_dict.items():
+        # Reverse to get chronological order (oldest first)
+        chat_history.reverse()
+        history.append({"nodeID": node_id, "chat_history": chat_history})
+    return history
+
+
 def get_history(
     flow_id: str,
     uid: str,
@@ -90,6 +187,9 @@ def get_history(
 ) -> List[Dict]:
     """Retrieve conversation history for a specific flow and user.
 
+    The recent records of all nodes are loaded in a single query, or served
+    from the history cache when it is enabled.
+
     :param flow_id: Unique identifier for the workflow flow
     :param uid: User identifier
     :param node_max_token: Optional dictionary mapping node IDs to token limits
@@ -98,80 +198,25 @@ def get_history(
     :raises CustomException: If database operation fails
     """
     try:
-        with session_getter(auto_commit=False) as session:
-            # Get all unique node IDs for the specified flow
-            node_id_query = (
-                select(History.node_id)
-                .where(History.flow_id == flow_id, History.uid == uid)
-                .distinct()
-            )
-            node_ids = session.exec(node_id_query).all()
-            results: Dict[str, List[Any]] = {}
-
-            # Retrieve recent history records for each node
-            for node_id in node_ids:
-                # Get only the most recent MAX_HISTORY_SIZE records for each node_id
-                query = (
-                    select(History.raw_question, History.raw_answer)
-                    .where(
-                        History.flow_id == flow_id,
-                        History.node_id == node_id,
-                        History.uid == uid,
-                    )
-                    .order_by(desc("create_time"))
-                    .limit(history_size)
+        use_cache = history_cache.enabled and history_size <= history_cache.depth
+        records = history_cache.get(flow_id, uid) if use_cache else None
+        if records is None:
+            with session_getter(auto_commit=False) as session:
+                records = _fetch_history_records(
+                    session,
+                    flow_id,
+                    uid,
+                    history_cache.depth if use_cache else history_size,
                 )
-                query_results = session.exec(query).all()
-                results[node_id] = list(query_results)
+            if use_cache:
+                history_cache.set(flow_id, uid, records)
+        if use_cache:
+            records = {
+                node_id: rows[:history_size] for node_id, rows in records.items()
+            }
 
         # Process and format history data with token limits (no session needed)
-        history: List[Dict[str, Any]] = []
-        node_history_dict: Dict[str, List[Dict[str, Any]]] = {}
-        current_utf8_length = 0
-
-        for node_id, results_content in results.items():
-            if node_id not in node_history_dict:
-                node_history_dict[node_id] = []
-
-            # Process each history record for the current node
-            for raw_question, raw_answer in results_content:
-                # Check token limits and break if exceeded
-                current_utf8_length += len(raw_question.encode("utf-8")) + len(
-                    raw_answer.encode("utf-8")
-                )
-                max_token: Optional[float] = None
-                if node_max_token is not None:
-                    # Use 80% of the specified token limit for safety margin
-                    max_token = (
-                        float(node_max_token.get(node_id, int(TOKEN_LIMIT))) * 0.8
-                    )
-
-                if max_token is not None and current_utf8_length > max_token:
-                    break
-
-                # Parse JSON strings back to dictionaries
-                question_dict = json.loads(raw_question)
-                answer_dict = json.loads(raw_answer)
-
-                # Add answer and question to history in chronological order
-                node_history_dict[node_id].append(
-                    {
-                        "role": answer_dict.get("role"),
-                        "content": answer_dict.get("content"),
-                    }
-                )
-                node_history_dict[node_id].append(
-                    {
-                        "role": question_dict.get("role"),
-                        "content": question_dict.get("content"),
-                    }
-                )
-        # Format final history structure
-        for node_id, chat_history in node_history_dict.items():
-            # Reverse to get chronological order (oldest first)
-            chat_history.reverse()
-            history.append({"nodeID": node_id, "chat_history": chat_history})
-        return history
+        return _format_history(records, node_max_token)
     except Exception as e:
         raise CustomException(
             CodeEnum.ENG_RUN_ERROR,
@@ -180,3 +225,23 @@ def get_history(
             f"message: get_history method failed "
             f"to retrieve LLM history; {e}",
         ) from e
+
+
+async def get_history_async(
+    flow_id: str,
+    uid: str,
+    node_max_token: Optional[Dict[str, int]] = None,
+    history_size: int = MAX_HISTORY_SIZE,
+) -> List[Dict]:
+    """Retrieve conversation history without blocking the event loop.
+
+    :param flow_id: Unique identifier for the workflow flow
+    :param uid: User identifier
+    :param node_max_token: Optional dictionary mapping node IDs to token limits
+    :param history_size: Maximum number of history records to retrieve per node
+    :return: List of dictionaries containing node history with chat records
+    :raises CustomException: If database operation fails
+    """
+    return await asyncio.to_thread(
+        get_history, flow_id, uid, node_max_token, history_size
+    )
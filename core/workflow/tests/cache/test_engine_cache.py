@@ -0,0 +1,94 @@
+import json
+from datetime import datetime
+
+from workflow.cache.engine import (
+    EngineCacheKey,
+    WorkflowEngineCache,
+    gen_engine_cache_key,
+)
+from workflow.engine.dsl_engine import WorkflowEngine, WorkflowEngineFactory
+from workflow.engine.entities.workflow_dsl import WorkflowDSL
+from workflow.extensions.otlp.trace.span import Span
+from workflow.tests.engine.dsl.base import BASE_DSL_SCHEMA
+
+
+def _build_engine(span: Span) -> WorkflowEngine:
+    """Build a real engine from the base test DSL."""
+    dsl = json.loads(BASE_DSL_SCHEMA)
+    return WorkflowEngineFactory.create_engine(
+        WorkflowDSL.model_validate(dsl["data"]), span
+    )
+
+
+def _key(flow_id: str, update_time: datetime = datetime(2025, 1, 1)) -> EngineCacheKey:
+    """Build an engine cache key for a flow."""
+    return gen_engine_cache_key(
+        flow_id=flow_id,
+        version="",
+        app_id="app",
+        is_release=True,
+        dsl_update_time=update_time,
+    )
+
+
+class TestWorkflowEngineCache:
+    """Test cases for the compiled workflow engine cache."""
+
+    def test_miss_then_hit_returns_independent_clones(self) -> None:
+        """Test that each hit returns a fresh clone with its own run state."""
+        span = Span()
+        cache = WorkflowEngineCache(max_size=4)
+        key = _key("1")
+
+        assert cache.get(key, span) is None
+        cache.set(key, _build_engine(span), 3.0, span)
+
+        first = cache.get(key, span)
+        second = cache.get(key, span)
+        assert first is not None and second is not None
+        assert first is not second
+        assert first.engine_ctx.variable_pool is not second.engine_ctx.variable_pool
+
+        node_id = first.sparkflow_engine_node.node_id
+        first.engine_ctx.node_run_status[node_id].complete.set()
+        assert not second.engine_ctx.node_run_status[node_id].complete.is_set()
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.builds) == (2, 1, 1)
+        assert stats.hit_rate == 2 / 3
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used template is evicted first."""
+        span = Span()
+        cache = WorkflowEngineCache(max_size=2)
+        engine = _build_engine(span)
+        for flow_id in ("1", "2"):
+            cache.set(_key(flow_id), engine, 1.0, span)
+
+        assert cache.get(_key("1"), span) is not None
+        cache.set(_key("3"), engine, 1.0, span)
+
+        assert cache.get(_key("2"), span) is None
+        assert cache.get(_key("1"), span) is not None
+        assert cache.stats().evictions == 1
+
+    def test_dsl_version_and_flow_invalidation(self) -> None:
+        """Test that new DSL versions miss and flow invalidation drops entries."""
+        span = Span()
+        cache = WorkflowEngineCache(max_size=4)
+        cache.set(_key("1"), _build_engine(span), 1.0, span)
+
+        assert cache.get(_key("1", datetime(2025, 2, 1)), span) is None
+
+        cache.delete_by_flow_id("1")
+        assert cache.get(_key("1"), span) is None
+        assert cache.stats().size == 0
+
+    def test_disabled_cache_stores_nothing(self) -> None:
+        """Test that a zero sized cache only records build statistics."""
+        span = Span()
+        cache = WorkflowEngineCache(max_size=0)
+        cache.set(_key("1"), _build_engine(span), 1.0, span)
+
+        assert cache.get(_key("1"), span) is None
+        assert cache.stats().builds == 1
@@ -0,0 +1,137 @@
+import asyncio
+from typing import Any, Dict, Iterator, List
+from unittest.mock import patch
+
+import pytest
+
+from workflow.cache.event_registry import Event, EventRegistry, ResumeStreamWriter
+from workflow.extensions.middleware.cache.async_manager import AsyncCacheService
+
+
+class FakePipeline:
+    """Pipeline applying the queued commands to the fake cache."""
+
+    def __init__(self, cache: "FakeCache") -> None:
+        self.cache = cache
+        self.commands: List[Any] = []
+
+    def __enter__(self) -> "FakePipeline":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        return None
+
+    def __getattr__(self, name: str) -> Any:
+        return lambda *args: self.commands.append((name, args))
+
+    def execute(self) -> List[Any]:
+        self.cache.round_trips += 1
+        for name, args in self.commands:
+            if name == "hsetnx":
+                self.cache.hashes.setdefault(args[0], {}).setdefault(args[1], args[2])
+            elif name == "hincrby":
+                fields = self.cache.hashes.setdefault(args[0], {})
+                fields[args[1]] = int(fields.get(args[1], 0)) + args[2]
+            elif name == "hset":
+                self.cache.hashes.setdefault(args[0], {})[args[1]] = args[2]
+            elif name == "rpush":
+                self.cache.lists.setdefault(args[0], []).extend(args[1:])
+            elif name == "expire":
+                self.cache.expires[args[0]] = args[1]
+        return [True] * len(self.commands)
+
+
+class FakeCache:
+    """Synchronous cache holding events, hashes and lists."""
+
+    def __init__(self) -> None:
+        self.data: Dict[str, Any] = {}
+        self.hashes: Dict[str, Dict[str, Any]] = {}
+        self.lists: Dict[str, List[str]] = {}
+        self.expires: Dict[str, int] = {}
+        self.round_trips = 0
+        self.event_reads = 0
+
+    def get(self, key: str) -> Any:
+        self.event_reads += 1
+        return self.data.get(key)
+
+    def pipeline(self) -> FakePipeline:
+        return FakePipeline(self)
+
+    def publish(self, channel: str, message: str) -> None:
+        return None
+
+
+@pytest.fixture
+def cache() -> Iterator[FakeCache]:
+    """Patch the asyncio cache service used by the event registry."""
+    cache = FakeCache()
+    service = AsyncCacheService(lambda: cache, pool_size=1)  # type: ignore
+    with patch(
+        "workflow.cache.event_registry.get_async_cache_service", return_value=service
+    ):
+        yield cache
+    service.close()
+
+
+def _save_event(cache: FakeCache, event_id: str, timeout: int = 180) -> Event:
+    """Store an event the way EventRegistry.save_event does."""
+    event = Event(event_id=event_id, timeout=timeout)
+    cache.data[EventRegistry._event_key(event_id)] = EventRegistry._encode(event)
+    return event
+
+
+class TestResumeData:
+    """Test cases for writing resume queues."""
+
+    @pytest.mark.asyncio
+    async def test_retries_match_single_writes(self, cache: FakeCache) -> None:
+        """Test that batched pushes count retries like one write per entry."""
+        await EventRegistry.write_resume_data("q", "a", expire_time=60)
+        assert cache.hashes["q:metadata"]["retries"] == 0
+        await EventRegistry.write_resume_data("q", "b", expire_time=60)
+        assert cache.hashes["q:metadata"]["retries"] == 1
+
+        await EventRegistry.push_resume_data("q", ["c", "d", "e"], expire_time=60)
+
+        assert cache.hashes["q:metadata"]["retries"] == 4
+        assert cache.lists["q"] == ["a", "b", "c", "d", "e"]
+        assert cache.expires == {"q": 60, "q:metadata": 60}
+        assert cache.round_trips == 3
+
+    @pytest.mark.asyncio
+    async def test_writer_batches_frames_in_order(self, cache: FakeCache) -> None:
+        """Test that frames are pushed in batches with the event loaded once."""
+        event = _save_event(cache, "e1", timeout=120)
+        writer = ResumeStreamWriter("e1", linger=10, batch_size=4)
+
+        for i in range(10):
+            await writer.write(str(i))
+        await writer.close()
+
+        queue = event.get_workflow_q_name()
+        assert cache.lists[queue] == [str(i) for i in range(10)]
+        assert cache.round_trips == 3
+        assert cache.event_reads == 1
+        assert cache.expires[queue] == 120
+
+    @pytest.mark.asyncio
+    async def test_writer_flushes_after_linger_and_on_demand(
+        self, cache: FakeCache
+    ) -> None:
+        """Test that frames are pushed after the linger window or at once."""
+        event = _save_event(cache, "e2")
+        queue = event.get_workflow_q_name()
+        writer = ResumeStreamWriter("e2", linger=0.01, batch_size=64)
+
+        await writer.write("first")
+        assert queue not in cache.lists
+        await asyncio.sleep(0.1)
+        assert cache.lists[queue] == ["first"]
+
+        writer.reload_event()
+        await writer.write("last", flush=True)
+        assert cache.lists[queue] == ["first", "last"]
+        assert cache.event_reads == 2
+        await writer.close()
@@ -0,0 +1,145 @@
+import queue
+import time
+from typing import Any, Dict, Iterator, List
+from unittest.mock import patch
+
+import pytest
+
+from workflow.cache.local import LocalCache
+from workflow.extensions.middleware.cache.async_manager import AsyncCacheService
+
+
+class FakePubSub:
+    """In-memory pub/sub connection fed by FakeCacheService.publish."""
+
+    def __init__(self) -> None:
+        self.messages: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self.closed = False
+
+    def listen(self) -> Iterator[Dict[str, Any]]:
+        while not self.closed:
+            try:
+                yield self.messages.get(timeout=0.05)
+            except queue.Empty:
+                continue
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeCacheService:
+    """Shared cache recording reads and broadcasting published keys."""
+
+    def __init__(self) -> None:
+        self.data: Dict[str, Any] = {}
+        self.reads = 0
+        self.subscribers: List[FakePubSub] = []
+
+    def __getitem__(self, key: str) -> Any:
+        self.reads += 1
+        return self.data.get(key)
+
+    def publish(self, channel: str, message: str) -> None:
+        for pubsub in self.subscribers:
+            pubsub.messages.put({"type": "message", "data": message.encode()})
+
+    def subscribe(self, channel: str) -> FakePubSub:
+        pubsub = FakePubSub()
+        self.subscribers.append(pubsub)
+        return pubsub
+
+
+@pytest.fixture
+def cache_service() -> Iterator[FakeCacheService]:
+    """Patch the shared cache service used by the local cache."""
+    service = FakeCacheService()
+    with patch("workflow.cache.local.get_cache_service", return_value=service):
+        yield service
+
+
+class TestLocalCache:
+    """Test cases for the in-process cache in front of Redis."""
+
+    def test_hit_avoids_shared_cache_and_returns_copies(
+        self, cache_service: FakeCacheService
+    ) -> None:
+        """Test that memory hits skip Redis and never share mutable objects."""
+        cache = LocalCache(max_size=4, ttl=60)
+        cache_service.data["workflow:flow_info:1"] = {"name": "flow"}
+
+        first = cache.get(
+            "workflow:flow_info:1", lambda: cache_service["workflow:flow_info:1"]
+        )
+        first["name"] = "changed"
+        second = cache.get(
+            "workflow:flow_info:1", lambda: cache_service["workflow:flow_info:1"]
+        )
+
+        assert second == {"name": "flow"}
+        assert cache_service.reads == 1
+        assert cache.stats()["l1_hits"] == 1
+        assert cache.stats()["l2_hits"] == 1
+
+    def test_ttl_lru_and_misses(self, cache_service: FakeCacheService) -> None:
+        """Test that expired, evicted and missing keys fall back to Redis."""
+        cache = LocalCache(max_size=2, ttl=60)
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+
+        assert cache.get_local("a") is None
+        assert cache.get_local("c") == "c"
+        assert cache.get("missing", lambda: None) is None
+        assert cache.stats()["misses"] == 1
+
+        expiring = LocalCache(max_size=2, ttl=0)
+        expiring.set("a", "a")
+        time.sleep(0.01)
+        assert expiring.get_local("a") is None
+
+    def test_disabled_cache_stores_nothing(self) -> None:
+        """Test that a zero size disables memory caching."""
+        cache = LocalCache(max_size=0, ttl=60)
+        cache.set("a", "a")
+
+        assert cache.get_local("a") is None
+
+    @pytest.mark.asyncio
+    async def test_get_async(self, cache_service: FakeCacheService) -> None:
+        """Test that async lookups fill and then serve the memory layer."""
+        cache = LocalCache(max_size=4, ttl=60)
+        cache_service.data["k"] = "v"
+        async_cache = AsyncCacheService(lambda: cache_service, pool_size=1)  # type: ignore
+
+        with patch(
+            "workflow.cache.local.get_async_cache_service", return_value=async_cache
+        ):
+            assert await cache.get_async("k", lambda: cache_service["k"]) == "v"
+            assert await cache.get_async("k", lambda: cache_service["k"]) == "v"
+        async_cache.close()
+
+        assert cache_service.reads == 1
+
+    def test_invalidation_reaches_other_workers(
+        self, cache_service: FakeCacheService
+    ) -> None:
+        """Test that an invalidation drops the key from every listening cache."""
+        worker = LocalCache(max_size=4, ttl=60, channel="ch")
+        other = LocalCache(max_size=4, ttl=60, channel="ch")
+        worker.set("k", "v")
+        other.set("k", "v")
+        other.set("kept", "v")
+
+        other.start_listener()
+        try:
+            deadline = time.monotonic() + 2
+            while not cache_service.subscribers and time.monotonic() < deadline:
+                time.sleep(0.01)
+            worker.invalidate("k")
+            while other.get_local("k") is not None and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            other.stop_listener()
+
+        assert worker.get_local("k") is None
+        assert other.get_local("k") is None
+        assert other.get_local("kept") == "v"
@@ -20,7 +20,7 @@ from workflow.engine.callbacks.callback_handler import (
     StructuredConsumer,
 )
 from workflow.engine.callbacks.openai_types_sse import GenerateUsage, LLMGenerate
-from workflow.engine.entities.chains import Chains, SimplePath
+from workflow.engine.entities.chains import Chains
 from workflow.engine.entities.output_mode import EndNodeOutputModeEnum
 from workflow.engine.nodes.entities.node_run_result import NodeRunResult
 from workflow.exception.e import CustomException
@@ -79,21 +79,13 @@ class TestChatCallBacks:
     @pytest.fixture
     def mock_chains(self) -> Chains:
         """Create mock chains for testing."""
-        # Create mock simple path
-        simple_path1 = Mock(spec=SimplePath)
-        simple_path1.inactive = Mock()
-        simple_path1.inactive.is_set.return_value = False
-        simple_path1.node_id_list = ["node1", "node2", "node3"]
-        simple_path1.every_node_index = {"node1": 1, "node2": 2, "node3": 3}
-
-        simple_path2 = Mock(spec=SimplePath)
-        simple_path2.inactive = Mock()
-        simple_path2.inactive.is_set.return_value = False
-        simple_path2.node_id_list = ["node4", "node5"]
-        simple_path2.every_node_index = {"node4": 1, "node5": 2}
+        # Two active paths: node1 -> node2 -> node3 and node4 -> node5
+        completed_node_cnt = {"node2": 2, "node4": 1}
 
         chains = Mock(spec=Chains)
-        chains.master_chains = [simple_path1, simple_path2]
+        chains.get_completed_node_cnt.side_effect = (
+            lambda node_id: completed_node_cnt.get(node_id, 0)
+        )
         chains.get_all_simple_paths_node_cnt.return_value = 5
 
         return chains
@@ -178,8 +170,10 @@ class TestChatCallBacks:
         self, callback_handler: ChatCallBacks
     ) -> None:
         """Test progress calculation with inactive path."""
-        # Make first path inactive
-        callback_handler.chains.master_chains[0].inactive.is_set.return_value = True  # type: ignore
+        # Make first path inactive, its 3 nodes count as completed
+        callback_handler.chains.get_completed_node_cnt.side_effect = (  # type: ignore
+            lambda node_id: 3 + {"node4": 1}.get(node_id, 0)
+        )
 
         progress = callback_handler._get_node_progress("node4")
 
@@ -1135,14 +1129,12 @@ class TestCallbackHandlerIntegration:
     @pytest.fixture
     def mock_chains(self) -> Chains:
         """Create mock chains for integration testing."""
-        simple_path = Mock(spec=SimplePath)
-        simple_path.inactive = Mock()
-        simple_path.inactive.is_set.return_value = False
-        simple_path.node_id_list = ["node1", "node2"]
-        simple_path.every_node_index = {"node1": 1, "node2": 2}
+        completed_node_cnt = {"node1": 1, "node2": 2}
 
         chains = Mock(spec=Chains)
-        chains.master_chains = [simple_path]
+        chains.get_completed_node_cnt.side_effect = (
+            lambda node_id: completed_node_cnt.get(node_id, 0)
+        )
         chains.get_all_simple_paths_node_cnt.return_value = 2
 
         return chains
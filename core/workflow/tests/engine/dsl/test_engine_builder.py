@@ -299,7 +299,7 @@ class TestWorkflowEngineBuilderAdvanced:
     def test_iteration_chain_has_message_true(self) -> None:
         """Test checking if iteration chain contains message nodes."""
         mock_chain = Mock()
-        mock_chain.master_chains = [Mock(node_id_list=["message::test", "other::test"])]
+        mock_chain.node_ids = ["message::test", "other::test"]
 
         self.builder.chains = Mock()
         self.builder.chains.iteration_chains = {"test_node": mock_chain}
@@ -310,7 +310,7 @@ class TestWorkflowEngineBuilderAdvanced:
     def test_iteration_chain_has_message_false(self) -> None:
         """Test checking if iteration chain does not contain message nodes."""
         mock_chain = Mock()
-        mock_chain.master_chains = [Mock(node_id_list=["other::test", "another::test"])]
+        mock_chain.node_ids = ["other::test", "another::test"]
 
         self.builder.chains = Mock()
         self.builder.chains.iteration_chains = {"test_node": mock_chain}
@@ -0,0 +1,145 @@
+import copy
+from typing import Dict, List, Set, Tuple
+
+import pytest
+
+from workflow.engine.entities.chains import Chains
+from workflow.engine.entities.workflow_dsl import Edge, WorkflowDSL
+
+START = "node-start::1"
+END = "node-end::1"
+
+# Two consecutive if-else diamonds sharing the end node
+EDGES = [
+    (START, "if-else::1"),
+    ("if-else::1", "llm::1"),
+    ("if-else::1", "llm::2"),
+    ("llm::1", "if-else::2"),
+    ("llm::2", "if-else::2"),
+    ("if-else::2", "message::1"),
+    ("if-else::2", END),
+    ("message::1", END),
+]
+
+
+def _build_chains(edges: List[Tuple[str, str]]) -> Chains:
+    """Build chains from a list of edges."""
+    chains = Chains(
+        workflow_schema=WorkflowDSL(
+            nodes=[],
+            edges=[Edge(sourceNodeId=s, targetNodeId=t) for s, t in edges],
+        )
+    )
+    chains.gen()
+    return chains
+
+
+def _all_paths(edge_dict: Dict[str, List[str]], node_id: str) -> List[List[str]]:
+    """Enumerate all simple paths from a node, the previous chains format."""
+    next_node_ids = edge_dict.get(node_id, [])
+    if not next_node_ids:
+        return [[node_id]]
+    return [
+        [node_id, *path]
+        for next_node_id in next_node_ids
+        for path in _all_paths(edge_dict, next_node_id)
+    ]
+
+
+def _is_active(path: List[str], inactive: Set[Tuple[str, str]]) -> bool:
+    """Check whether a path avoids all inactive edges."""
+    return not any((path[i], path[i + 1]) in inactive for i in range(len(path) - 1))
+
+
+class TestChains:
+    """Test cases for the chains graph index."""
+
+    @pytest.mark.parametrize(
+        "inactive",
+        [
+            [],
+            [("if-else::1", "llm::1")],
+            [("if-else::2", END)],
+            [("if-else::1", "llm::2"), ("if-else::2", "message::1")],
+            [("if-else::1", "llm::1"), ("if-else::1", "llm::2")],
+        ],
+    )
+    def test_matches_path_enumeration(self, inactive: List[Tuple[str, str]]) -> None:
+        """Test that the index answers like enumerating every simple path."""
+        chains = _build_chains(EDGES)
+        for edge in inactive:
+            assert chains.deactivate_branch(*edge)
+            assert not chains.deactivate_branch(*edge)
+
+        paths = _all_paths(chains.edge_dict, START)
+        active_paths = [p for p in paths if _is_active(p, set(inactive))]
+        total = sum(len(p) for p in paths)
+        assert chains.get_all_simple_paths_node_cnt() == total
+
+        for node_id in chains.node_ids:
+            assert chains.has_active_path(node_id) == any(
+                node_id in p for p in active_paths
+            )
+            completed = sum(len(p) for p in paths if p not in active_paths) + sum(
+                p.index(node_id) for p in active_paths if node_id in p
+            )
+            assert chains.get_completed_node_cnt(node_id) == completed
+            for pre_node_id in chains.get_predecessors(node_id):
+                assert chains.is_edge_active(pre_node_id, node_id) == any(
+                    pre_node_id in p and p[p.index(pre_node_id) + 1] == node_id
+                    for p in active_paths
+                )
+
+    def test_ancestors_in_topological_order(self) -> None:
+        """Test that ancestors cover every node before a node on any path."""
+        chains = _build_chains(EDGES)
+
+        assert chains.node_ids[0] == START
+        assert chains.node_ids[-1] == END
+        assert chains.get_ancestors("message::1") == [
+            START,
+            "if-else::1",
+            *sorted(["llm::1", "llm::2"], key=chains.node_ids.index),
+            "if-else::2",
+        ]
+        assert chains.get_ancestors(START) == []
+
+    def test_deepcopy_keeps_activity_independent(self) -> None:
+        """Test that copies deactivate branches without affecting the source."""
+        chains = _build_chains(EDGES)
+        chains_copy = copy.deepcopy(chains)
+
+        chains_copy.deactivate_branch("if-else::1", "llm::1")
+
+        assert not chains_copy.has_active_path("llm::1")
+        assert chains.has_active_path("llm::1")
+        assert chains_copy.node_ids is chains.node_ids
+
+    def test_cycle_raises(self) -> None:
+        """Test that a cyclic workflow is rejected."""
+        with pytest.raises(ValueError):
+            _build_chains(
+                [(START, "llm::1"), ("llm::1", "llm::2"), ("llm::2", "llm::1")]
+            )
+
+    def test_many_branches_scale(self) -> None:
+        """Test that sequential branches do not enumerate exponentially many paths."""
+        edges = []
+        pre_node_id = START
+        for i in range(60):
+            branch_id = f"if-else::{i}"
+            edges += [
+                (pre_node_id, branch_id),
+                (branch_id, f"llm::{i}-a"),
+                (branch_id, f"llm::{i}-b"),
+            ]
+            pre_node_id = f"text-joiner::{i}"
+            edges += [(f"llm::{i}-a", pre_node_id), (f"llm::{i}-b", pre_node_id)]
+        edges.append((pre_node_id, END))
+
+        chains = _build_chains(edges)
+        chains.deactivate_branch("if-else::0", "llm::0-a")
+
+        assert chains.get_all_simple_paths_node_cnt() == 2**60 * 182
+        assert not chains.has_active_path("llm::0-a")
+        assert chains.has_active_path(END)
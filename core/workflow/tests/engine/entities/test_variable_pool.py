@@ -0,0 +1,112 @@
+import json
+from collections import ChainMap
+
+import pytest
+
+from workflow.engine.entities.variable_pool import VariablePool
+from workflow.engine.entities.workflow_dsl import WorkflowDSL
+from workflow.engine.nodes.entities.node_run_result import (
+    NodeRunResult,
+    WorkflowNodeExecutionStatus,
+)
+from workflow.extensions.otlp.trace.span import Span
+from workflow.tests.engine.dsl.base import BASE_DSL_SCHEMA
+
+START_NODE_ID = "node-start::d61b0f71-87ee-475e-93ba-f1607f0ce783"
+END_NODE_ID = "node-end::cda617af-551e-462e-b3b8-3bb9a041bf88"
+JOINER_NODE_ID = "text-joiner::5804eefe-94fd-48a8-9873-b4bf6213c34d"
+
+
+def _build_pool() -> VariablePool:
+    """Create a variable pool from the base test DSL with a start input."""
+    dsl = WorkflowDSL.model_validate(json.loads(BASE_DSL_SCHEMA)["data"])
+    pool = VariablePool(dsl.nodes)
+    pool.add_init_variable(
+        START_NODE_ID, ["AGENT_USER_INPUT"], {"AGENT_USER_INPUT": "parent"}, Span()
+    )
+    return pool
+
+
+def _run_result(node_id: str, outputs: dict) -> NodeRunResult:
+    """Create a successful node run result."""
+    return NodeRunResult(
+        status=WorkflowNodeExecutionStatus.SUCCEEDED,
+        outputs=outputs,
+        node_id=node_id,
+        alias_name="",
+        node_type=node_id.split("::")[0],
+    )
+
+
+class TestVariablePoolOverlay:
+    """Test cases for copy-on-write variable pool overlays."""
+
+    def test_overlay_reads_through_to_parent(self) -> None:
+        """Test that an overlay sees the variables of its parent."""
+        pool = _build_pool()
+        child = pool.overlay()
+
+        assert child.get_variable(START_NODE_ID, "AGENT_USER_INPUT", Span()) == "parent"
+        assert child.nodes is pool.nodes
+        assert set(child.output_variable_mapping) == set(pool.output_variable_mapping)
+
+    @pytest.mark.asyncio
+    async def test_overlay_writes_stay_in_child(self) -> None:
+        """Test that writes to nested overlays never reach their parents."""
+        pool = _build_pool()
+        child = pool.overlay()
+        grandchild = child.overlay()
+
+        child.add_init_variable(
+            START_NODE_ID, ["AGENT_USER_INPUT"], {"AGENT_USER_INPUT": "child"}, Span()
+        )
+        await grandchild.add_variable(
+            JOINER_NODE_ID,
+            ["output"],
+            _run_result(JOINER_NODE_ID, {"output": "x"}),
+            Span(),
+        )
+        grandchild.add_end_node_variable(
+            END_NODE_ID, ["output"], _run_result(END_NODE_ID, {"output": "end"})
+        )
+
+        span = Span()
+        assert pool.get_variable(START_NODE_ID, "AGENT_USER_INPUT", span) == "parent"
+        assert child.get_variable(START_NODE_ID, "AGENT_USER_INPUT", span) == "child"
+        assert (
+            grandchild.get_variable(START_NODE_ID, "AGENT_USER_INPUT", span) == "child"
+        )
+        assert grandchild.get_variable(JOINER_NODE_ID, "output", span) == "x"
+        assert child.get_variable(JOINER_NODE_ID, "output", span) == ""
+        assert (
+            pool.input_variable_mapping[f"{END_NODE_ID}-output"].get("value") != "end"
+        )
+        assert isinstance(grandchild.output_variable_mapping, ChainMap)
+        assert len(grandchild.output_variable_mapping.maps) == 3
+
+    def test_deepcopy_of_overlay_is_flat(self) -> None:
+        """Test that a deep copy of an overlay is an independent plain pool."""
+        pool = _build_pool()
+        child = pool.overlay()
+
+        copied = VariablePool.deepcopy(child)
+
+        assert isinstance(copied.output_variable_mapping, dict)
+        assert (
+            copied.get_variable(START_NODE_ID, "AGENT_USER_INPUT", Span()) == "parent"
+        )
+
+    def test_overlay_reads_copy_mutable_values(self) -> None:
+        """Test that mutating a value read from an overlay leaves the parent intact."""
+        pool = _build_pool()
+        pool.output_variable_mapping[f"{JOINER_NODE_ID}-output"]["value"] = {
+            "items": [1]
+        }
+        child = pool.overlay()
+
+        value = child.get_variable(JOINER_NODE_ID, "output", Span())
+        value["items"].append(2)
+
+        parent_value = pool.get_variable(JOINER_NODE_ID, "output", Span())
+        assert parent_value == {"items": [1]}
+        assert parent_value is pool.get_variable(JOINER_NODE_ID, "output", Span())
@@ -0,0 +1,156 @@
+import asyncio
+from typing import Any, AsyncIterator, Dict, Iterator, List
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from workflow.engine.entities.output_mode import EndNodeOutputModeEnum
+from workflow.engine.entities.variable_pool import ParamKey
+from workflow.engine.nodes.entities.node_run_result import WorkflowNodeExecutionStatus
+from workflow.engine.nodes.flow.flow_node import FlowNode
+from workflow.exception.e import CustomException
+from workflow.exception.errors.err_code import CodeEnum
+from workflow.extensions.otlp.trace.span import Span
+from workflow.service import chat_service
+
+FLOW_NODE_ID = "flow::1"
+
+
+class FakeSystemParams:
+    """System parameters holding the output mode of the nested flow."""
+
+    def get(self, key: ParamKey, node_id: str = "", default: Any = None) -> Any:
+        if key == ParamKey.FlowOutputMode:
+            return EndNodeOutputModeEnum.VARIABLE_MODE.value
+        return default
+
+
+class FakeVariablePool:
+    """Variable pool providing the inputs of the flow node."""
+
+    history_v2 = None
+    system_params = FakeSystemParams()
+
+    def get_variable(self, node_id: str, key_name: str, span: Span) -> Any:
+        return "hello"
+
+
+@pytest.fixture(autouse=True)
+def _app() -> Iterator[AsyncMock]:
+    """Let the app of the nested flow be found without a database."""
+    with patch.object(
+        FlowNode, "_get_app_authorization", AsyncMock(return_value="Bearer k:s")
+    ) as get_app:
+        yield get_app
+
+
+def _build_node() -> FlowNode:
+    """Create a flow node calling a nested flow."""
+    return FlowNode(
+        node_id=FLOW_NODE_ID,
+        node_type="flow",
+        input_identifier=["query"],
+        output_identifier=["answer"],
+        flowId="child",
+        appId="app",
+    )
+
+
+def _frames(frames: List[Dict[str, Any]], state: dict) -> AsyncIterator[dict]:
+    """Create in-process response frames recording whether they were closed."""
+
+    async def generate() -> AsyncIterator[dict]:
+        try:
+            for frame in frames:
+                yield frame
+            await asyncio.sleep(10)
+        finally:
+            state["closed"] = True
+
+    return generate()
+
+
+def _frame(content: str, finish_reason: str = "") -> dict:
+    """Create a chat completions response frame."""
+    return {
+        "code": 0,
+        "choices": [{"delta": {"content": content}, "finish_reason": finish_reason}],
+        "usage": {"total_tokens": 3},
+    }
+
+
+class TestFlowNodeLocalExecution:
+    """Test cases for in-process nested flow execution."""
+
+    @pytest.mark.asyncio
+    async def test_local_frames_are_consumed_without_http(self) -> None:
+        """Test that local frames produce outputs and stop the nested run."""
+        state: dict = {}
+        frames = _frames([_frame('{"answer": '), _frame('"hi"}', "stop")], state)
+        with patch.object(
+            chat_service, "subflow_frames", AsyncMock(return_value=frames)
+        ) as subflow, patch.object(
+            FlowNode, "req_flow_api_with_see", AsyncMock()
+        ) as http:
+            result = await _build_node().async_execute(
+                FakeVariablePool(), Span()  # type: ignore[arg-type]
+            )
+
+        assert result.status == WorkflowNodeExecutionStatus.SUCCEEDED
+        assert result.outputs == {"answer": "hi"}
+        assert result.token_cost.total_tokens == 3
+        assert subflow.await_args is not None
+        assert subflow.await_args.args[1].parameters == {"query": "hello"}
+        assert state["closed"]
+        http.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unknown_flow_falls_back_to_http(self) -> None:
+        """Test that flows of other deployments are called over HTTP."""
+        with patch.object(
+            chat_service,
+            "subflow_frames",
+            AsyncMock(side_effect=CustomException(CodeEnum.FLOW_NOT_FOUND_ERROR)),
+        ), patch.object(
+            FlowNode,
+            "req_flow_api_with_see",
+            AsyncMock(return_value=({"answer": "remote"}, {})),
+        ) as http:
+            result = await _build_node().async_execute(
+                FakeVariablePool(), Span()  # type: ignore[arg-type]
+            )
+
+        assert result.outputs == {"answer": "remote"}
+        assert http.await_args is not None
+        assert http.await_args.args[1] == {"query": "hello"}
+
+    @pytest.mark.asyncio
+    async def test_unknown_app_fails_before_local_run(self, _app: AsyncMock) -> None:
+        """Test that the local path checks the app like the HTTP path does."""
+        _app.side_effect = CustomException(CodeEnum.APP_NOT_FOUND_ERROR)
+        with patch.object(chat_service, "subflow_frames", AsyncMock()) as subflow:
+            result = await _build_node().async_execute(
+                FakeVariablePool(), Span()  # type: ignore[arg-type]
+            )
+
+        assert result.status == WorkflowNodeExecutionStatus.FAILED
+        assert result.error.code == CodeEnum.APP_NOT_FOUND_ERROR.code
+        subflow.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_frame_timeout_fails_node(self) -> None:
+        """Test that a stalled nested flow fails the node and is stopped."""
+        state: dict = {}
+        node = _build_node()
+        node._private_config.timeout = 0.05
+        frames = _frames([_frame("partial")], state)
+        with patch.object(
+            chat_service, "subflow_frames", AsyncMock(return_value=frames)
+        ):
+            result = await node.async_execute(
+                FakeVariablePool(), Span()  # type: ignore[arg-type]
+            )
+
+        assert result.status == WorkflowNodeExecutionStatus.FAILED
+        assert "timeout" in result.error.message
+        assert state["closed"]
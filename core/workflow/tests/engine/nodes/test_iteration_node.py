@@ -0,0 +1,195 @@
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Any, List
+from unittest.mock import Mock, patch
+
+import pytest
+
+from workflow.consts.engine.error_handler import IterationErrorStrategy
+from workflow.engine.dsl_engine import WorkflowEngineFactory
+from workflow.engine.entities.node_running_status import NodeRunningStatus
+from workflow.engine.entities.workflow_dsl import WorkflowDSL
+from workflow.engine.nodes.entities.node_run_result import (
+    NodeRunResult,
+    WorkflowNodeExecutionStatus,
+)
+from workflow.engine.nodes.iteration.iteration_node import IterationNode
+from workflow.exception.errors.err_code import CodeEnum
+from workflow.extensions.otlp.log_trace.node_log import NodeLog
+from workflow.extensions.otlp.trace.span import Span
+from workflow.tests.engine.dsl.base import BASE_DSL_SCHEMA
+
+ITERATION_NODE_ID = "iteration::1"
+ITERATION_START_NODE_ID = "iteration-node-start::1"
+
+
+class FakeVariablePool:
+    """Variable pool providing the batch input of the iteration node."""
+
+    history_v2 = None
+
+    def __init__(self, batch: List[Any]) -> None:
+        self.batch = batch
+
+    def get_variable(self, node_id: str, key_name: str, span: Span) -> Any:
+        return self.batch
+
+    def get_history(self, node_id: str) -> list:
+        return []
+
+    def overlay(self) -> "FakeVariablePool":
+        return self
+
+
+class FakeEngine:
+    """Iteration engine doubling the item after a per-item delay."""
+
+    def __init__(self, stats: dict) -> None:
+        self.stats = stats
+
+    async def async_run(self, inputs: dict, **kwargs: Any) -> NodeRunResult:
+        item = inputs["input"]
+        self.stats["running"] += 1
+        self.stats["max_running"] = max(
+            self.stats["max_running"], self.stats["running"]
+        )
+        try:
+            # Later items finish first to check the result order
+            await asyncio.sleep(0.01 * (5 - item))
+            if item == 3:
+                raise ValueError("item failed")
+            return NodeRunResult(
+                status=WorkflowNodeExecutionStatus.SUCCEEDED,
+                outputs={"output": item * 2},
+                node_id=ITERATION_START_NODE_ID,
+                alias_name="",
+                node_type="iteration-node-start",
+            )
+        finally:
+            self.stats["running"] -= 1
+
+
+def _build_node(**kwargs: Any) -> IterationNode:
+    """Create a parallel iteration node."""
+    return IterationNode(
+        input_identifier=["input"],
+        output_identifier=["output"],
+        node_id=ITERATION_NODE_ID,
+        node_type="iteration",
+        IterationStartNodeId=ITERATION_START_NODE_ID,
+        isParallel=True,
+        **kwargs,
+    )
+
+
+async def _execute(
+    node: IterationNode, batch: List[Any], stats: dict, body: List[str] | None = None
+) -> tuple:
+    """Execute the node with fake engines and return the result and node log."""
+    template = Mock()
+    template.engine_ctx.chains.iteration_chains = {
+        ITERATION_NODE_ID: SimpleNamespace(node_ids=body or [ITERATION_START_NODE_ID])
+    }
+    node_log = NodeLog(sid="sid", func_id=ITERATION_NODE_ID, func_name="iteration")
+    with patch.object(
+        IterationNode,
+        "_clone_iteration_engine",
+        side_effect=lambda *args: FakeEngine(stats),
+    ):
+        result = await node.async_execute(
+            FakeVariablePool(batch),  # type: ignore[arg-type]
+            Span(),
+            node_log,
+            iteration_engine={ITERATION_START_NODE_ID: template},
+            node_run_status={ITERATION_NODE_ID: NodeRunningStatus()},
+        )
+    return result, node_log
+
+
+class TestIterationNodeParallel:
+    """Test cases for parallel iteration execution."""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order_with_bounded_concurrency(self) -> None:
+        """Test that parallel results follow the input order within the limit."""
+        stats = {"running": 0, "max_running": 0}
+
+        result, node_log = await _execute(
+            _build_node(parallelCount=2), [0, 1, 2, 4], stats
+        )
+
+        assert result.status == WorkflowNodeExecutionStatus.SUCCEEDED
+        assert result.outputs == {"output": [0, 2, 4, 8]}
+        assert stats["max_running"] == 2
+        assert len(node_log.logs) == 4
+
+    @pytest.mark.asyncio
+    async def test_fail_fast_fails_node(self) -> None:
+        """Test that a failed item fails the whole node by default."""
+        stats = {"running": 0, "max_running": 0}
+
+        result, _ = await _execute(_build_node(parallelCount=4), [1, 2, 3, 4], stats)
+
+        assert result.status == WorkflowNodeExecutionStatus.FAILED
+        assert result.error.code == CodeEnum.ITERATION_EXECUTION_ERROR.code
+        assert stats["running"] == 0
+
+    @pytest.mark.asyncio
+    async def test_continue_on_error_keeps_positions(self) -> None:
+        """Test that failed items yield empty outputs when errors are skipped."""
+        stats = {"running": 0, "max_running": 0}
+
+        result, node_log = await _execute(
+            _build_node(
+                parallelCount=4,
+                itemErrorStrategy=IterationErrorStrategy.Continue.value,
+            ),
+            [1, 2, 3, 4],
+            stats,
+        )
+
+        assert result.status == WorkflowNodeExecutionStatus.SUCCEEDED
+        assert result.outputs == {"output": [2, 4, None, 8]}
+        assert any("iteration item 2 failed" in log for log in node_log.logs)
+
+    @pytest.mark.asyncio
+    async def test_nested_iteration_is_refused(self) -> None:
+        """Test that a parallel iteration containing an iteration node fails."""
+        stats = {"running": 0, "max_running": 0}
+
+        result, _ = await _execute(
+            _build_node(), [1, 2], stats, [ITERATION_START_NODE_ID, "iteration::2"]
+        )
+
+        assert result.status == WorkflowNodeExecutionStatus.FAILED
+        assert result.error.code == CodeEnum.ITERATION_EXECUTION_ERROR.code
+        assert "iteration::2" in result.error.message
+        assert stats["max_running"] == 0
+
+    def test_clone_isolates_run_state(self) -> None:
+        """Test that item engines get their own body nodes and run state."""
+        engine = WorkflowEngineFactory.create_engine(
+            WorkflowDSL.model_validate(json.loads(BASE_DSL_SCHEMA)["data"]), Span()
+        )
+        chains = engine.engine_ctx.chains
+        item_engine = _build_node()._clone_iteration_engine(
+            engine, engine.engine_ctx.variable_pool, chains
+        )
+
+        node_id = chains.node_ids[0]
+        item_engine.engine_ctx.node_run_status[node_id].complete.set()
+        assert not engine.engine_ctx.node_run_status[node_id].complete.is_set()
+        assert item_engine.engine_ctx.responses is not engine.engine_ctx.responses
+
+        built_nodes = engine.engine_ctx.built_nodes
+        item_nodes = item_engine.engine_ctx.built_nodes
+        assert item_nodes is not built_nodes
+        assert item_engine.sparkflow_engine_node is item_nodes[chains.node_ids[0]]
+        for node_id in chains.node_ids:
+            item_node, node = item_nodes[node_id], built_nodes[node_id]
+            assert item_node is not node
+            assert item_node.node_log is not node.node_log
+            assert item_node.node_instance is not node.node_instance
+            assert all(n is item_nodes[n.id] for n in item_node.next_nodes)
+            assert all(n is item_nodes[n.id] for n in item_node.pre_nodes)
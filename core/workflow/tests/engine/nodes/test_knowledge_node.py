@@ -0,0 +1,170 @@
+import asyncio
+import json
+import os
+from typing import Any, Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from workflow.engine.entities.variable_pool import ParamKey
+from workflow.engine.nodes.entities.node_run_result import WorkflowNodeExecutionStatus
+from workflow.engine.nodes.knowledge.knowledge_client import KnowledgeClient
+from workflow.engine.nodes.knowledge.knowledge_node import KnowledgeNode
+from workflow.engine.nodes.knowledge.speculation_stats import SPECULATION_COUNTER
+from workflow.extensions.otlp.metric import metric
+from workflow.extensions.otlp.trace.span import Span
+
+SEARCH_RESULT = json.dumps({"results": [{"content": "chunk"}]})
+
+
+class FakeSystemParams:
+    """System parameters holding the flow ID."""
+
+    def get(self, key: ParamKey, node_id: str = "", default: Any = None) -> Any:
+        if key == ParamKey.FlowId:
+            return "flow-1"
+        return default
+
+
+class FakeVariablePool:
+    """Variable pool providing the query of the knowledge node."""
+
+    history_v2 = None
+    system_params = FakeSystemParams()
+
+    def get_variable(self, node_id: str, key_name: str, span: Span) -> Any:
+        return "what is the refund policy"
+
+
+def _build_node(speculative: bool = True) -> KnowledgeNode:
+    """Create an adaptive knowledge node."""
+    return KnowledgeNode(
+        node_id="knowledge::1",
+        node_type="knowledge",
+        input_identifier=["query"],
+        output_identifier=["results"],
+        repoId=["repo"],
+        search_mode="adaptive",
+        speculativeRetrieval=speculative,
+    )
+
+
+@pytest.fixture(autouse=True)
+def meter() -> Iterator[MagicMock]:
+    """Provide the knowledge base URL and a meter recording the counters."""
+    fake_meter = MagicMock()
+    with patch.dict(os.environ, {"KNOWLEDGE_BASE_URL": "http://knowledge"}):
+        with patch.object(KnowledgeNode, "_load_llm_config"):
+            with patch.object(metric, "meter", fake_meter):
+                with patch.dict(metric.named_counters, clear=True):
+                    yield fake_meter
+
+
+def _outcomes(meter: MagicMock) -> list[tuple[str, str]]:
+    """Get the (flow_id, outcome) labels counted on the speculation counter."""
+    if not meter.create_counter.called:
+        return []
+    assert meter.create_counter.call_args.args == (SPECULATION_COUNTER,)
+    return [
+        (call.args[1]["flow_id"], call.args[1]["outcome"])
+        for call in meter.create_counter.return_value.add.call_args_list
+    ]
+
+
+class TestKnowledgeNodeSpeculativeRetrieval:
+    """Test cases for speculative retrieval in adaptive mode."""
+
+    @pytest.mark.asyncio
+    async def test_retrieval_overlaps_decision_and_is_used(
+        self, meter: MagicMock
+    ) -> None:
+        """Test that retrieval starts before the decision completes."""
+        events: list[str] = []
+
+        async def decide(*args: Any, **kwargs: Any) -> tuple[bool, dict]:
+            events.append("decision started")
+            await asyncio.sleep(0.01)
+            events.append("decision done")
+            return True, {"total_tokens": 5}
+
+        async def top_k(*args: Any, **kwargs: Any) -> str:
+            events.append("retrieval started")
+            return SEARCH_RESULT
+
+        with patch.object(KnowledgeNode, "_should_use_knowledge", side_effect=decide):
+            with patch.object(KnowledgeClient, "top_k", side_effect=top_k) as search:
+                result = await _build_node().execute(FakeVariablePool(), MagicMock())
+
+        assert result.status == WorkflowNodeExecutionStatus.SUCCEEDED
+        assert result.outputs == {"results": [{"content": "chunk"}]}
+        assert result.token_cost.total_tokens == 5
+        assert search.call_count == 1
+        assert events.index("retrieval started") < events.index("decision done")
+        assert _outcomes(meter) == [("flow-1", "used")]
+
+    @pytest.mark.asyncio
+    async def test_running_retrieval_is_cancelled_when_not_needed(
+        self, meter: MagicMock
+    ) -> None:
+        """Test that a pending retrieval is cancelled and counted as wasted."""
+        cancelled = asyncio.Event()
+
+        async def top_k(*args: Any, **kwargs: Any) -> str:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return SEARCH_RESULT
+
+        async def decide(*args: Any, **kwargs: Any) -> tuple[bool, dict]:
+            await asyncio.sleep(0)
+            return False, {}
+
+        with patch.object(KnowledgeNode, "_should_use_knowledge", side_effect=decide):
+            with patch.object(KnowledgeClient, "top_k", side_effect=top_k):
+                result = await _build_node().execute(FakeVariablePool(), MagicMock())
+                await asyncio.wait_for(cancelled.wait(), 1)
+
+        assert result.outputs == {"results": []}
+        assert _outcomes(meter) == [("flow-1", "cancelled")]
+
+    @pytest.mark.asyncio
+    async def test_finished_retrieval_is_discarded_with_its_error(
+        self, meter: MagicMock
+    ) -> None:
+        """Test that a finished retrieval, even a failed one, is dropped."""
+
+        async def top_k(*args: Any, **kwargs: Any) -> str:
+            raise ValueError("backend down")
+
+        async def decide(*args: Any, **kwargs: Any) -> tuple[bool, dict]:
+            await asyncio.sleep(0.01)
+            return False, {}
+
+        with patch.object(KnowledgeNode, "_should_use_knowledge", side_effect=decide):
+            with patch.object(KnowledgeClient, "top_k", side_effect=top_k):
+                result = await _build_node().execute(FakeVariablePool(), MagicMock())
+
+        assert result.status == WorkflowNodeExecutionStatus.SUCCEEDED
+        assert result.outputs == {"results": []}
+        assert _outcomes(meter) == [("flow-1", "discarded")]
+
+    @pytest.mark.asyncio
+    async def test_without_speculation_retrieval_follows_decision(
+        self, meter: MagicMock
+    ) -> None:
+        """Test that the default mode only retrieves after a positive decision."""
+
+        async def decide(*args: Any, **kwargs: Any) -> tuple[bool, dict]:
+            return False, {}
+
+        with patch.object(KnowledgeNode, "_should_use_knowledge", side_effect=decide):
+            with patch.object(KnowledgeClient, "top_k") as search:
+                result = await _build_node(speculative=False).execute(
+                    FakeVariablePool(), MagicMock()
+                )
+
+        assert result.outputs == {"results": []}
+        search.assert_not_called()
+        assert _outcomes(meter) == []
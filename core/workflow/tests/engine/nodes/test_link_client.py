@@ -0,0 +1,109 @@
+import asyncio
+import json
+from typing import Any, Dict, List, Tuple
+from unittest.mock import patch
+
+import pytest
+
+from workflow.engine.nodes.plugin_tool import plugin_node
+from workflow.engine.nodes.plugin_tool.link_client import Link, ToolSchemaResolver
+from workflow.engine.nodes.plugin_tool.plugin_node import (
+    PluginNode,
+    prefetch_tool_schemas,
+)
+from workflow.exception.e import CustomException
+from workflow.extensions.otlp.trace.span import Span
+
+GET_URL = "http://link/api/v1/tools/versions"
+
+
+def _tool_schema(tool_id: str) -> Dict[str, Any]:
+    """Create a Link tool schema with a single operation."""
+    schema = {"paths": {"/run": {"post": {"operationId": f"{tool_id}-op"}}}}
+    return {"id": tool_id, "schema": json.dumps(schema)}
+
+
+class FakeLink:
+    """Link system answering tool schema queries after a short delay."""
+
+    def __init__(self) -> None:
+        self.requests: List[List[Tuple[str, str]]] = []
+
+    async def request(self, get_url: str, params: List[Tuple[str, str]]) -> dict:
+        self.requests.append(params)
+        await asyncio.sleep(0.01)
+        tool_ids = [value for name, value in params if name == "tool_ids"]
+        if "broken" in tool_ids:
+            return {"code": 30001, "message": "tool not found"}
+        return {"code": 0, "data": {"tools": [_tool_schema(t) for t in tool_ids]}}
+
+
+@pytest.fixture
+def link() -> Any:
+    """Patch a fresh resolver onto a fake Link system."""
+    fake = FakeLink()
+    resolver = ToolSchemaResolver(ttl=60)
+    with patch.object(resolver, "_request", side_effect=fake.request), patch(
+        "workflow.engine.nodes.plugin_tool.link_client.tool_schema_resolver",
+        resolver,
+    ), patch.object(plugin_node, "tool_schema_resolver", resolver):
+        yield fake
+
+
+class TestToolSchemaResolver:
+    """Test cases for asynchronous tool schema resolution."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_request(self, link: FakeLink) -> None:
+        """Test that concurrent lookups of a tool are coalesced and cached."""
+        links = await asyncio.gather(
+            *(Link.create("app", ["tool-a"], GET_URL, "run", "V1.0") for _ in range(5))
+        )
+        await Link.create("app", ["tool-a"], GET_URL, "run", "V1.0")
+
+        assert len(link.requests) == 1
+        assert all(lk.tools[0].operation_id == "tool-a-op" for lk in links)
+
+    @pytest.mark.asyncio
+    async def test_keys_include_version_and_app(self, link: FakeLink) -> None:
+        """Test that versions and applications are resolved separately."""
+        await Link.create("app", ["tool-a"], GET_URL, "run", "V1.0")
+        await Link.create("app", ["tool-a"], GET_URL, "run", "V2.0")
+        await Link.create("other", ["tool-a"], GET_URL, "run", "V1.0")
+
+        assert len(link.requests) == 3
+        assert ("versions", "V2.0") in link.requests[1]
+        assert ("app_id", "other") in link.requests[2]
+
+    @pytest.mark.asyncio
+    async def test_link_errors_are_raised_and_not_cached(self, link: FakeLink) -> None:
+        """Test that failed lookups raise and are retried later."""
+        for _ in range(2):
+            with pytest.raises(CustomException):
+                await Link.create("app", ["broken"], GET_URL, "run", "V1.0")
+
+        assert len(link.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_prefetch_batches_plugin_nodes(self, link: FakeLink) -> None:
+        """Test that plugin nodes sharing app and version use one request."""
+        nodes = [
+            PluginNode(
+                node_id=f"plugin::{tool_id}",
+                node_type="plugin",
+                input_identifier=[],
+                output_identifier=[],
+                pluginId=tool_id,
+                operationId=f"{tool_id}-op",
+                appId="app",
+            )
+            for tool_id in ("tool-a", "tool-b", "broken")
+        ]
+
+        await prefetch_tool_schemas(nodes[:2], Span())
+        await prefetch_tool_schemas(nodes[2:], Span())
+        link_b = await Link.create("app", ["tool-b"], GET_URL, "run", "V1.0")
+
+        assert len(link.requests) == 2
+        assert link.requests[0].count(("versions", "V1.0")) == 2
+        assert link_b.tools[0].tool_id == "tool-b"
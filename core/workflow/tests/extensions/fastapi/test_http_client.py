@@ -0,0 +1,112 @@
+import asyncio
+import os
+from typing import AsyncIterator
+from unittest.mock import patch
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from workflow.extensions.fastapi.lifespan.http_client import LLMHttpClient
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clean_registry() -> AsyncIterator[None]:
+    """Start and end every test with an empty client registry."""
+    await LLMHttpClient.close()
+    yield
+    await LLMHttpClient.close()
+
+
+class TestLLMHttpClient:
+    """Test cases for the pooled LLM client registry."""
+
+    @pytest.mark.asyncio
+    async def test_clients_are_reused_per_key(self) -> None:
+        """Test that one client is shared per provider origin and api key."""
+        async with LLMHttpClient.acquire(
+            "anthropic", "https://api.test/v1/messages", "k1"
+        ) as first:
+            pass
+        async with LLMHttpClient.acquire(
+            "anthropic", "https://api.test/v1/other", "k1"
+        ) as second:
+            pass
+        async with LLMHttpClient.acquire(
+            "anthropic", "https://api.test/v1/messages", "k2"
+        ) as third:
+            pass
+
+        assert isinstance(first, httpx.AsyncClient)
+        assert first is second
+        assert first is not third
+        assert not first.is_closed
+
+    @pytest.mark.asyncio
+    async def test_openai_client_uses_pooled_transport(self) -> None:
+        """Test that OpenAI clients are cached with their own httpx pool."""
+        async with LLMHttpClient.acquire("openai", "https://api.test/v1", "k") as a:
+            pass
+        async with LLMHttpClient.acquire("openai", "https://api.test/v1", "k") as b:
+            pass
+
+        assert a is b
+        assert not a.is_closed()
+
+    @pytest.mark.asyncio
+    async def test_idle_clients_are_evicted_unless_borrowed(self) -> None:
+        """Test that idle eviction skips clients that are still in use."""
+        with patch.dict(os.environ, {"LLM_CLIENT_IDLE_TIMEOUT": "-1"}):
+            async with LLMHttpClient.acquire("google", "https://g.test/a", "k") as c:
+                await LLMHttpClient.evict_idle()
+                assert not c.is_closed
+
+            await LLMHttpClient.evict_idle()
+
+        assert c.is_closed
+
+    @pytest.mark.asyncio
+    async def test_close_closes_all_clients(self) -> None:
+        """Test that shutting down closes every pooled client."""
+        async with LLMHttpClient.acquire("google", "https://g.test/a", "k") as c:
+            pass
+
+        await LLMHttpClient.close()
+
+        assert c.is_closed
+
+    @pytest.mark.asyncio
+    async def test_close_while_borrowed_releases_cleanly(self) -> None:
+        """Test that a client closed while borrowed is released without error."""
+        async with LLMHttpClient.acquire("google", "https://g.test/a", "k") as c:
+            await LLMHttpClient.close()
+
+        assert c.is_closed
+        assert LLMHttpClient._active == {}
+        assert LLMHttpClient._last_used == {}
+
+    @pytest.mark.asyncio
+    async def test_acquire_during_eviction_gets_open_client(self) -> None:
+        """Test that an acquire racing an eviction never gets a closing client."""
+        async with LLMHttpClient.acquire("google", "https://g.test/a", "k") as old:
+            pass
+        closing = asyncio.Event()
+        release = asyncio.Event()
+        aclose = old.aclose
+
+        async def slow_aclose() -> None:
+            closing.set()
+            await release.wait()
+            await aclose()
+
+        with patch.object(old, "aclose", side_effect=slow_aclose):
+            with patch.dict(os.environ, {"LLM_CLIENT_IDLE_TIMEOUT": "-1"}):
+                eviction = asyncio.create_task(LLMHttpClient.evict_idle())
+                await closing.wait()
+            async with LLMHttpClient.acquire("google", "https://g.test/a", "k") as c:
+                assert c is not old
+                release.set()
+                await eviction
+                assert not c.is_closed
+
+        assert old.is_closed
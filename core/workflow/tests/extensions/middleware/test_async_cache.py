@@ -0,0 +1,144 @@
+import asyncio
+import queue
+import threading
+from typing import Any, Dict, Iterator, List, Optional
+
+import pytest
+
+from workflow.extensions.middleware.cache.async_manager import AsyncCacheService
+
+
+class FakePubSub:
+    """In-memory pub/sub connection fed by FakeCache.publish."""
+
+    def __init__(self) -> None:
+        self.messages: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self.closed = False
+
+    def listen(self) -> Iterator[Dict[str, Any]]:
+        while not self.closed:
+            try:
+                yield self.messages.get(timeout=0.05)
+            except queue.Empty:
+                continue
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakePipeline:
+    """Pipeline recording the queued list pushes."""
+
+    def __init__(self, cache: "FakeCache") -> None:
+        self.cache = cache
+        self.commands: List[Any] = []
+
+    def __enter__(self) -> "FakePipeline":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        return None
+
+    def rpush(self, key: str, value: str) -> None:
+        self.commands.append((key, value))
+
+    def execute(self) -> List[Any]:
+        for key, value in self.commands:
+            self.cache.lists.setdefault(key, []).append(value.encode())
+        return [True] * len(self.commands)
+
+
+class FakeCache:
+    """Synchronous cache with lists and pub/sub."""
+
+    def __init__(self) -> None:
+        self.lists: Dict[str, List[bytes]] = {}
+        self.subscribers: List[FakePubSub] = []
+        self.pops = 0
+
+    def lpop(self, key: str) -> Optional[bytes]:
+        self.pops += 1
+        values = self.lists.get(key)
+        return values.pop(0) if values else None
+
+    def pipeline(self) -> FakePipeline:
+        return FakePipeline(self)
+
+    def publish(self, channel: str, message: str) -> None:
+        for pubsub in self.subscribers:
+            pubsub.messages.put({"type": "message", "data": message.encode()})
+
+    def subscribe(self, channel: str) -> FakePubSub:
+        pubsub = FakePubSub()
+        self.subscribers.append(pubsub)
+        return pubsub
+
+
+async def _push(service: AsyncCacheService, key: str, value: str) -> None:
+    """Push a value the way EventRegistry.write_resume_data does."""
+    await service.pipeline(lambda pipe: pipe.rpush(key, value))
+    await service.notify(key)
+
+
+@pytest.fixture
+def cache() -> FakeCache:
+    """Create the synchronous cache."""
+    return FakeCache()
+
+
+@pytest.fixture
+def service(cache: FakeCache) -> Iterator[AsyncCacheService]:
+    """Create the asyncio cache service with a long re-check interval."""
+    service = AsyncCacheService(lambda: cache, pool_size=2, poll_interval=30)  # type: ignore
+    yield service
+    service.close()
+
+
+class TestAsyncCacheService:
+    """Test cases for the asyncio cache service."""
+
+    @pytest.mark.asyncio
+    async def test_blpop_woken_by_notification(
+        self, cache: FakeCache, service: AsyncCacheService
+    ) -> None:
+        """Test that a waiting pop returns as soon as the list is pushed to."""
+        waiter = asyncio.create_task(service.blpop("q", timeout=10))
+        while not cache.subscribers:
+            await asyncio.sleep(0.01)
+
+        await _push(service, "q", "resume")
+        result = await asyncio.wait_for(waiter, 2)
+
+        assert result == (b"q", b"resume")
+
+    @pytest.mark.asyncio
+    async def test_blpop_returns_pending_item_and_times_out(
+        self, cache: FakeCache, service: AsyncCacheService
+    ) -> None:
+        """Test that queued items are popped at once and empty lists time out."""
+        cache.lists["q"] = [b"queued"]
+
+        assert await service.blpop("q", timeout=1) == (b"q", b"queued")
+        assert await service.blpop("q", timeout=0.1) is None  # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_waiters_hold_no_threads(
+        self, cache: FakeCache, service: AsyncCacheService
+    ) -> None:
+        """Test that many waiting pops do not occupy a thread each."""
+        threads = threading.active_count()
+        waiters = [
+            asyncio.create_task(service.blpop(f"q{i}", timeout=10)) for i in range(50)
+        ]
+        while not cache.subscribers:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.1)
+
+        # Listener and executor threads only
+        assert threading.active_count() <= threads + 3
+
+        for i in range(50):
+            await _push(service, f"q{i}", str(i))
+        results = await asyncio.wait_for(asyncio.gather(*waiters), 5)
+
+        assert [value for _, value in results] == [str(i).encode() for i in range(50)]
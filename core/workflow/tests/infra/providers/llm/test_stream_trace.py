@@ -0,0 +1,103 @@
+"""Tests for the streamed LLM response trace."""
+
+import json
+from typing import Any, Dict, List
+
+import pytest
+
+from workflow.infra.providers.llm.stream_trace import LLMStreamTrace, spark_frame_parts
+
+
+class FakeSpan:
+    """Span recording the added events."""
+
+    def __init__(self) -> None:
+        self.events: List[Dict[str, Any]] = []
+
+    async def add_info_events_async(self, attributes: Dict[str, Any]) -> None:
+        self.events.append(attributes)
+
+
+class FakeNodeLog:
+    """Node log recording the added logs."""
+
+    def __init__(self) -> None:
+        self.logs: List[str] = []
+
+    def add_info_log(self, log: str) -> None:
+        self.logs.append(log)
+
+
+def _frame(content: str, usage: Dict[str, Any] | None = None) -> Dict[str, Any]:
+    """Build an OpenAI style frame."""
+    return {
+        "choices": [{"delta": {"content": content}, "finish_reason": None}],
+        "usage": usage,
+    }
+
+
+class TestLLMStreamTrace:
+    """Test cases for LLMStreamTrace."""
+
+    @pytest.mark.asyncio
+    async def test_aggregate_records_one_summary(self) -> None:
+        """Test that frames are summarized in a single span event and log."""
+        span, node_log = FakeSpan(), FakeNodeLog()
+        trace = LLMStreamTrace(span, node_log, mode="aggregate", sample_rate=0)  # type: ignore
+
+        for content in ["Hel", "lo", ""]:
+            await trace.record(_frame(content))
+            trace.log_frame(_frame(content))
+        await trace.record(_frame("", {"total_tokens": 7}))
+        await trace.finish()
+        await trace.finish()
+
+        assert len(span.events) == 1
+        summary = json.loads(span.events[0]["recv_summary"])
+        assert node_log.logs == [span.events[0]["recv_summary"]]
+        assert summary["frames"] == 4
+        assert summary["content"] == "Hello"
+        assert summary["token_usage"] == {"total_tokens": 7}
+        assert summary["first_token_cost"] >= 0
+        assert set(summary["inter_token_cost"]) == {"p50", "p90", "p99", "max"}
+
+    @pytest.mark.asyncio
+    async def test_aggregate_samples_raw_frames(self) -> None:
+        """Test that raw frames are recorded at the sample rate."""
+        span = FakeSpan()
+        trace = LLMStreamTrace(span, mode="aggregate", sample_rate=1)  # type: ignore
+
+        for content in ["a", "b"]:
+            await trace.record(_frame(content))
+
+        assert [json.loads(e["recv"])["choices"][0]["delta"] for e in span.events] == [
+            {"content": "a"},
+            {"content": "b"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_chunk_mode_records_every_frame(self) -> None:
+        """Test that the chunk mode keeps recording frame by frame."""
+        span, node_log = FakeSpan(), FakeNodeLog()
+        trace = LLMStreamTrace(span, node_log, mode="chunk")  # type: ignore
+
+        for content in ["a", "b"]:
+            await trace.record(_frame(content))
+            trace.log_frame(_frame(content))
+        await trace.finish()
+
+        assert [list(e) for e in span.events] == [["recv"], ["recv"]]
+        assert len(node_log.logs) == 2
+
+    def test_spark_frame_parts(self) -> None:
+        """Test that Spark frames are decoded into text and usage."""
+        frame = {
+            "header": {"code": 0, "status": 1},
+            "payload": {
+                "choices": {"text": [{"content": "hi", "reasoning_content": "r"}]},
+                "usage": {"text": {"total_tokens": 3}},
+            },
+        }
+
+        assert spark_frame_parts(frame) == ("hi", "r", {"total_tokens": 3})
+        assert spark_frame_parts({"header": {"code": 0}}) == ("", "", {})
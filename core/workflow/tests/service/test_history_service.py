@@ -0,0 +1,127 @@
+import json
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Iterator
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, create_engine  # type: ignore
+
+from workflow.cache.history import HistoryCache
+from workflow.domain.models.history import History
+from workflow.service import history_service
+
+FLOW_ID = "flow"
+UID = "uid"
+
+
+@pytest.fixture
+def engine() -> Any:
+    """Create an in-memory database holding the history table."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    # SQLite only autoincrements INTEGER primary keys, not BIGINT
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE workflow_node_history ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, node_id VARCHAR(255), "
+                "uid VARCHAR(255), chat_id VARCHAR(255), raw_question TEXT, "
+                "raw_answer TEXT, create_time DATETIME, flow_id VARCHAR(255))"
+            )
+        )
+    return engine
+
+
+@pytest.fixture
+def queries(engine: Any) -> Iterator[list]:
+    """Patch the service onto the test database and record issued queries."""
+    statements: list = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+
+    @contextmanager
+    def session_getter(auto_commit: bool = True) -> Iterator[Session]:
+        with Session(engine) as session:
+            yield session
+            if auto_commit:
+                session.commit()
+
+    with patch.object(history_service, "session_getter", session_getter), patch.object(
+        history_service, "history_cache", HistoryCache(depth=3, max_size=4, ttl=60)
+    ):
+        yield statements
+
+
+def _seed(engine: Any, node_id: str, count: int) -> None:
+    """Insert history records with increasing create times."""
+    base = datetime(2025, 1, 1)
+    with Session(engine) as session:
+        for i in range(count):
+            session.add(
+                History(
+                    flow_id=FLOW_ID,
+                    node_id=node_id,
+                    uid=UID,
+                    raw_question=json.dumps({"role": "user", "content": f"q{i}"}),
+                    raw_answer=json.dumps({"role": "assistant", "content": f"a{i}"}),
+                    create_time=base + timedelta(minutes=i),
+                )
+            )
+        session.commit()
+
+
+def _contents(history: list) -> dict:
+    """Map node IDs to the contents of their chat history."""
+    return {
+        item["nodeID"]: [msg["content"] for msg in item["chat_history"]]
+        for item in history
+    }
+
+
+class TestGetHistory:
+    """Test cases for batched history retrieval."""
+
+    def test_single_query_returns_recent_records_per_node(
+        self, engine: Any, queries: list
+    ) -> None:
+        """Test that all nodes are loaded in one query, oldest first."""
+        _seed(engine, "llm::1", 4)
+        _seed(engine, "llm::2", 1)
+
+        history = history_service.get_history(FLOW_ID, UID, history_size=2)
+
+        assert _contents(history) == {
+            "llm::1": ["q2", "a2", "q3", "a3"],
+            "llm::2": ["q0", "a0"],
+        }
+        assert len([q for q in queries if q.lstrip().upper().startswith("SELECT")]) == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_serves_reads_and_receives_appends(
+        self, engine: Any, queries: list
+    ) -> None:
+        """Test that cached histories include records added afterwards."""
+        _seed(engine, "llm::1", 3)
+
+        await history_service.get_history_async(FLOW_ID, UID, history_size=2)
+        history_service.add_history(
+            FLOW_ID,
+            "llm::1",
+            UID,
+            {"role": "user", "content": "q3"},
+            {"role": "assistant", "content": "a3"},
+        )
+        selects = len([q for q in queries if "SELECT" in q.upper()])
+        history = await history_service.get_history_async(FLOW_ID, UID, history_size=2)
+
+        assert _contents(history) == {"llm::1": ["q2", "a2", "q3", "a3"]}
+        assert len([q for q in queries if "SELECT" in q.upper()]) == selects